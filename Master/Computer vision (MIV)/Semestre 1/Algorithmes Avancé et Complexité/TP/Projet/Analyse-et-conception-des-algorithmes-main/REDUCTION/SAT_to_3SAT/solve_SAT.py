@@ -27,30 +27,33 @@ def solve_SAT_backtracking(variables, clauses, assignment=None, index=0):
     if assignment is None:
         assignment = {}
     
-    if index == len(variables):
+    # Version itérative: la pile values contient les valeurs des variables
+    # variables[index], variables[index+1], ... dans l'ordre d'affectation
+    # (même ordre d'exploration que la récursion, sans limite de profondeur)
+    values = []
+    
+    while True:
+        depth = index + len(values)
+        if depth < len(variables):
+            # Essayer var = True
+            values.append(True)
+            assignment[variables[depth]] = True
+            continue
+        
         # Vérifier si l'affectation satisfait toutes les clauses
         if verify_SAT_solution(variables, clauses, assignment):
             return assignment.copy()
-        else:
+        
+        # Backtrack: retirer les variables déjà essayées à False
+        while values and not values[-1]:
+            values.pop()
+            del assignment[variables[index + len(values)]]
+        if not values:
             return None
-    
-    var = variables[index]
-    
-    # Essayer var = True
-    assignment[var] = True
-    res = solve_SAT_backtracking(variables, clauses, assignment, index + 1)
-    if res is not None:
-        return res
-    
-    # Essayer var = False
-    assignment[var] = False
-    res = solve_SAT_backtracking(variables, clauses, assignment, index + 1)
-    if res is not None:
-        return res
-    
-    # Backtrack
-    del assignment[var]
-    return None
+        
+        # Essayer var = False
+        values[-1] = False
+        assignment[variables[index + len(values) - 1]] = False
 
 def main():
     print("=== Solveur SAT ===")
@@ -1,10 +1,211 @@
-class SAT3Solver:
+import heapq
+from itertools import islice
+
+
+# ============================================================================
+# HEURISTIQUES DE BRANCHEMENT
+# ============================================================================
+
+class BranchingHeuristic:
+    """
+    Heuristique de choix de variable adossée à un tas de priorité
+
+    Toutes les variables non affectées sont dans le tas; les entrées des
+    variables affectées ou dont le score a changé sont retirées
+    paresseusement. Choisir une variable coûte O(log n) amorti au lieu de
+    parcourir les n variables.
+    """
+    name = None
+    
     def __init__(self, clauses, num_variables):
-        self.clauses = clauses
+        self.num_variables = num_variables
+        self.scores = self.initial_scores(clauses, num_variables)
+        self._build_heap()
+    
+    def _build_heap(self):
+        """Place toutes les variables dans le tas"""
+        self.entry_key = [None] * (self.num_variables + 1)  # Clé de l'entrée valide dans le tas
+        self.heap = []
+        for var in range(1, self.num_variables + 1):
+            key = self.priority(var)
+            self.entry_key[var] = key
+            self.heap.append((key, var))
+        heapq.heapify(self.heap)
+    
+    def reset(self, clauses, num_variables):
+        """
+        Prépare une nouvelle recherche (clauses ou variables ajoutées entre deux
+        appels): les scores statiques sont recalculés
+        """
+        self.num_variables = num_variables
+        self.scores = self.initial_scores(clauses, num_variables)
+        self._build_heap()
+    
+    def initial_scores(self, clauses, num_variables):
+        """Score initial de chaque variable (indice = numéro de variable)"""
+        return [0.0] * (num_variables + 1)
+    
+    def priority(self, var):
+        """Clé du tas (la plus petite est choisie en premier)"""
+        return -self.scores[var]
+    
+    def select(self, assignment):
+        """Retourne la variable non affectée de meilleure priorité, ou None"""
+        heap = self.heap
+        while heap:
+            key, var = heap[0]
+            if self.entry_key[var] != key:
+                heapq.heappop(heap)  # Entrée périmée (score modifié)
+            elif var in assignment:
+                heapq.heappop(heap)
+                self.entry_key[var] = None
+            else:
+                return var
+        return None
+    
+    def unassign(self, var):
+        """Remet une variable désaffectée dans le tas"""
+        if self.entry_key[var] is None:
+            key = self.priority(var)
+            self.entry_key[var] = key
+            heapq.heappush(self.heap, (key, var))
+    
+    def on_conflict(self, clause):
+        """Appelée avec la clause falsifiée à chaque conflit"""
+        pass
+    
+    def _update(self, var):
+        """Réinsère une variable dont le score a changé (l'ancienne entrée devient périmée)"""
+        if self.entry_key[var] is not None:
+            key = self.priority(var)
+            self.entry_key[var] = key
+            heapq.heappush(self.heap, (key, var))
+
+
+class FirstUnassignedHeuristic(BranchingHeuristic):
+    """Plus petite variable non affectée (ordre historique de SAT3Solver)"""
+    name = 'first'
+    
+    def priority(self, var):
+        return var
+
+
+class VSIDSHeuristic(BranchingHeuristic):
+    """
+    VSIDS: activité initialisée au nombre d'occurrences, augmentée pour les
+    variables de chaque clause en conflit, avec décroissance exponentielle
+    """
+    name = 'vsids'
+    DECAY = 0.95
+    
+    def initial_scores(self, clauses, num_variables):
+        self.increment = 1.0
+        scores = [0.0] * (num_variables + 1)
+        for clause in clauses:
+            for literal in clause:
+                scores[abs(literal)] += 1.0
+        return scores
+    
+    def reset(self, clauses, num_variables):
+        """Les activités apprises sont conservées d'une recherche à l'autre"""
+        if num_variables > self.num_variables:
+            counts = [0.0] * (num_variables + 1)
+            for clause in clauses:
+                for literal in clause:
+                    counts[abs(literal)] += 1.0
+            self.scores += counts[self.num_variables + 1:]
+        self.num_variables = num_variables
+        self._build_heap()
+    
+    def on_conflict(self, clause):
+        for literal in clause:
+            var = abs(literal)
+            self.scores[var] += self.increment
+            self._update(var)
+        self.increment /= self.DECAY
+        
+        # Renormaliser pour éviter les débordements flottants
+        if self.increment > 1e100:
+            self.scores = [score * 1e-100 for score in self.scores]
+            self.increment *= 1e-100
+            self.heap = [(self.priority(var), var) for var in range(1, self.num_variables + 1)
+                         if self.entry_key[var] is not None]
+            heapq.heapify(self.heap)
+            for _, var in self.heap:
+                self.entry_key[var] = self.priority(var)
+
+
+class MOMsHeuristic(BranchingHeuristic):
+    """
+    MOMs (Maximum Occurrences in clauses of Minimum Size):
+    score = (f(x) + f(¬x)) * 2^k + f(x) * f(¬x), où f compte les occurrences
+    dans les clauses les plus courtes de la formule
+    """
+    name = 'mom'
+    K = 10
+    
+    def initial_scores(self, clauses, num_variables):
+        scores = [0.0] * (num_variables + 1)
+        if not clauses:
+            return scores
+        min_size = min(len(clause) for clause in clauses)
+        positive = [0] * (num_variables + 1)
+        negative = [0] * (num_variables + 1)
+        for clause in clauses:
+            if len(clause) == min_size:
+                for literal in clause:
+                    if literal > 0:
+                        positive[literal] += 1
+                    else:
+                        negative[-literal] += 1
+        for var in range(1, num_variables + 1):
+            scores[var] = ((positive[var] + negative[var]) * 2 ** self.K
+                           + positive[var] * negative[var])
+        return scores
+
+
+class JeroslowWangHeuristic(BranchingHeuristic):
+    """
+    Jeroslow-Wang (version bilatérale): J(x) + J(¬x) avec J(l) = Σ 2^-|C|
+    sur les clauses C contenant l
+    """
+    name = 'jw'
+    
+    def initial_scores(self, clauses, num_variables):
+        scores = [0.0] * (num_variables + 1)
+        for clause in clauses:
+            weight = 2.0 ** -len(clause)
+            for literal in clause:
+                scores[abs(literal)] += weight
+        return scores
+
+
+# Heuristiques disponibles pour SAT3Solver (paramètre heuristic)
+BRANCHING_HEURISTICS = {
+    heuristic.name: heuristic
+    for heuristic in (FirstUnassignedHeuristic, VSIDSHeuristic, MOMsHeuristic, JeroslowWangHeuristic)
+}
+
+
+class SAT3Solver:
+    def __init__(self, clauses, num_variables, heuristic='first'):
+        self.clauses = list(clauses)  # Complétée par add_clause
         self.num_variables = num_variables
         self.assignment = {}  # Affectation courante: {var: True/False}
         self.solutions_found = []
         self.backtrack_count = 0  # Pour les statistiques
+        self.failed = []  # Hypothèses responsables du dernier échec de solve()
+        if heuristic not in BRANCHING_HEURISTICS:
+            raise ValueError(f"Heuristique inconnue: {heuristic} "
+                             f"(disponibles: {', '.join(BRANCHING_HEURISTICS)})")
+        self.heuristic_name = heuristic
+        self.heuristic = BRANCHING_HEURISTICS[heuristic](clauses, num_variables)
+        
+        # Index des occurrences: variable -> [(indice de clause, littéral positif?)]
+        self.occurrences = {}
+        for i, clause in enumerate(clauses):
+            for literal in clause:
+                self.occurrences.setdefault(abs(literal), []).append((i, literal > 0))
         
     def evaluate_literal(self, literal):
         """Évalue un littéral avec l'affectation courante"""
@@ -44,76 +245,190 @@ class SAT3Solver:
     
     def has_conflict(self):
         """Vérifie s'il y a un conflit (une clause insatisfaite)"""
+        return self.find_conflict() is not None
+    
+    def find_conflict(self):
+        """Retourne la première clause insatisfaite, ou None"""
         for clause in self.clauses:
             if self.evaluate_clause(clause) == False:
-                return True
-        return False
+                return clause
+        return None
+    
+    def add_clause(self, clause):
+        """
+        Ajoute une clause entre deux appels à solve() (l'index des occurrences
+        et l'état de l'heuristique sont conservés)
+        """
+        clause = list(clause)
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        for literal in clause:
+            self.num_variables = max(self.num_variables, abs(literal))
+            self.occurrences.setdefault(abs(literal), []).append((index, literal > 0))
+    
+    def failed_assumptions(self):
+        """
+        Hypothèses du dernier solve() suffisant à rendre la formule
+        insatisfiable (pas forcément un sous-ensemble minimal)
+        """
+        return list(self.failed)
+    
+    def _init_counters(self):
+        """
+        Initialise les compteurs par clause à partir de l'affectation courante:
+        littéraux vrais, littéraux non affectés, clauses satisfaites et
+        clauses en conflit (aucun littéral vrai ni libre)
+        """
+        self.true_count = [0] * len(self.clauses)
+        self.free_count = [0] * len(self.clauses)
+        self.satisfied_count = 0
+        self.conflicts = set()
+        
+        for i, clause in enumerate(self.clauses):
+            for literal in clause:
+                value = self.assignment.get(abs(literal))
+                if value is None:
+                    self.free_count[i] += 1
+                elif value == (literal > 0):
+                    self.true_count[i] += 1
+            if self.true_count[i] > 0:
+                self.satisfied_count += 1
+            elif self.free_count[i] == 0:
+                self.conflicts.add(i)
+    
+    def _assign(self, var, value):
+        """Affecte var et met à jour uniquement les clauses qui la contiennent"""
+        self.assignment[var] = value
+        for i, positive in self.occurrences.get(var, ()):
+            self.free_count[i] -= 1
+            if positive == value:
+                self.true_count[i] += 1
+                if self.true_count[i] == 1:
+                    self.satisfied_count += 1
+            elif self.true_count[i] == 0 and self.free_count[i] == 0:
+                self.conflicts.add(i)
+    
+    def _unassign(self, var):
+        """Retire l'affectation de var (opération inverse de _assign)"""
+        value = self.assignment.pop(var)
+        for i, positive in self.occurrences.get(var, ()):
+            if positive == value:
+                self.true_count[i] -= 1
+                if self.true_count[i] == 0:
+                    self.satisfied_count -= 1
+            elif self.true_count[i] == 0 and self.free_count[i] == 0:
+                self.conflicts.discard(i)
+            self.free_count[i] += 1
     
     def select_variable(self):
         """
         Sélectionne la prochaine variable non affectée
-        Stratégie simple: prend la première non affectée
+        selon l'heuristique de branchement (par défaut: la première non affectée)
         """
-        for var in range(1, self.num_variables + 1):
-            if var not in self.assignment:
-                return var
-        return None
+        return self.heuristic.select(self.assignment)
     
     def backtrack(self):
         """
-        Algorithme de backtracking récursif
+        Algorithme de backtracking itératif (pile explicite des décisions)
+        Explore les nœuds dans le même ordre que la version récursive
+        (var = True puis var = False) et compte les mêmes backtracks,
+        sans limite de profondeur de récursion
         Retourne True si une solution est trouvée, False sinon
+        
+        Les conflits et la satisfaction sont lus sur des compteurs par clause
+        mis à jour à chaque affectation (O(occurrences) par nœud au lieu de
+        réévaluer les m clauses)
         """
-        self.backtrack_count += 1
+        trail = []  # Variables de décision, de la plus ancienne à la plus récente
+        self._init_counters()
+        num_clauses = len(self.clauses)
         
-        # Cas de base: toutes les variables sont affectées
-        if len(self.assignment) == self.num_variables:
-            if self.is_satisfied():
+        while True:
+            # Visite d'un nœud
+            self.backtrack_count += 1
+            
+            if len(self.assignment) == self.num_variables:
+                # Cas de base: toutes les variables sont affectées
+                found = self.satisfied_count == num_clauses
+            elif self.conflicts:
+                # Détection précoce de conflit (première clause falsifiée)
+                self.heuristic.on_conflict(self.clauses[min(self.conflicts)])
+                found = False
+            else:
+                # Sélectionner la prochaine variable et essayer var = True
+                var = self.select_variable()
+                if var is None:
+                    found = self.satisfied_count == num_clauses
+                else:
+                    self._assign(var, True)
+                    trail.append(var)
+                    continue
+            
+            if found:
                 return True
-            return False
-        
-        # Détection précoce de conflit
-        if self.has_conflict():
-            return False
-        
-        # Sélectionner la prochaine variable
-        var = self.select_variable()
-        if var is None:
-            return self.is_satisfied()
-        
-        # Essayer var = True
-        self.assignment[var] = True
-        if self.backtrack():
-            return True
-        
-        # Essayer var = False
-        self.assignment[var] = False
-        if self.backtrack():
-            return True
-        
-        # Backtrack: retirer l'affectation
-        del self.assignment[var]
-        return False
+            
+            # Backtrack: remonter jusqu'à une variable encore à True
+            while trail:
+                var = trail[-1]
+                if self.assignment[var]:
+                    # Essayer var = False
+                    self._unassign(var)
+                    self._assign(var, False)
+                    break
+                # Les deux valeurs ont échoué: retirer l'affectation
+                self._unassign(var)
+                self.heuristic.unassign(var)
+                trail.pop()
+            else:
+                return False
     
-    def solve(self):
+    def solve(self, assumptions=None):
         """
         Lance la résolution
         
+        Args:
+            assumptions: littéraux supposés vrais pour cet appel uniquement
+                         (fixés avant la recherche, jamais remis en cause);
+                         en cas d'échec, voir failed_assumptions()
+        
         Returns:
             tuple: (success, assignment, stats)
                 success: True si solution trouvée
                 assignment: dictionnaire {variable: valeur} ou None
                 stats: dictionnaire avec statistiques
         """
+        assumptions = list(assumptions or [])
         self.assignment = {}
         self.backtrack_count = 0
+        self.failed = []
+        for literal in assumptions:
+            self.num_variables = max(self.num_variables, abs(literal))
+        self.heuristic.reset(self.clauses, self.num_variables)
+        
+        # Les hypothèses sont des affectations fixes (hors de la pile de décisions)
+        for literal in assumptions:
+            var, value = abs(literal), literal > 0
+            if self.assignment.get(var, value) != value:
+                self.failed = [-literal, literal]  # Hypothèses contradictoires
+                break
+            self.assignment[var] = value
         
-        success = self.backtrack()
+        success = not self.failed and self.backtrack()
+        
+        if not success and assumptions and not self.failed:
+            # Clause falsifiée par les seules hypothèses: ses littéraux suffisent
+            if self.conflicts:
+                clause = self.clauses[min(self.conflicts)]
+                self.failed = [literal for literal in dict.fromkeys(assumptions) if -literal in clause]
+            else:
+                self.failed = list(dict.fromkeys(assumptions))
         
         stats = {
             'backtrack_count': self.backtrack_count,
             'num_variables': self.num_variables,
-            'num_clauses': len(self.clauses)
+            'num_clauses': len(self.clauses),
+            'heuristic': self.heuristic_name,
+            'assumptions': len(assumptions)
         }
         
         if success:
@@ -128,37 +443,56 @@ class SAT3Solver:
         Returns:
             list: Liste des affectations solutions
         """
-        self.solutions_found = []
-        self._backtrack_all(max_solutions)
+        self.solutions_found = list(islice(self.iter_models(), max_solutions))
         return self.solutions_found
     
-    def _backtrack_all(self, max_solutions):
-        """Backtracking pour trouver toutes les solutions"""
-        if len(self.solutions_found) >= max_solutions:
-            return
-        
-        if len(self.assignment) == self.num_variables:
-            if self.is_satisfied():
-                self.solutions_found.append(dict(self.assignment))
-            return
-        
-        if self.has_conflict():
-            return
-        
-        var = self.select_variable()
-        if var is None:
-            return
-        
-        # Essayer var = True
-        self.assignment[var] = True
-        self._backtrack_all(max_solutions)
+    def iter_models(self):
+        """
+        Générateur des solutions, produites une par une au fil du backtracking
+        (même ordre que solve_all, sans les garder en mémoire)
         
-        # Essayer var = False
-        self.assignment[var] = False
-        self._backtrack_all(max_solutions)
+        Yields:
+            dict: affectation {variable: valeur} satisfaisant toutes les clauses
+        """
+        self.assignment = {}
+        self.heuristic.reset(self.clauses, self.num_variables)
+        trail = []
+        self._init_counters()
+        num_clauses = len(self.clauses)
         
-        # Backtrack
-        del self.assignment[var]
+        try:
+            while True:
+                # Visite d'un nœud: descendre tant que c'est possible
+                if len(self.assignment) == self.num_variables:
+                    if self.satisfied_count == num_clauses:
+                        yield dict(self.assignment)
+                elif not self.conflicts:
+                    var = self.select_variable()
+                    if var is not None:
+                        # Essayer var = True
+                        self._assign(var, True)
+                        trail.append(var)
+                        continue
+                
+                # Backtrack
+                while trail:
+                    var = trail[-1]
+                    if self.assignment[var]:
+                        # Essayer var = False
+                        self._unassign(var)
+                        self._assign(var, False)
+                        break
+                    self._unassign(var)
+                    self.heuristic.unassign(var)
+                    trail.pop()
+                else:
+                    return
+        finally:
+            # Générateur abandonné avant la fin: retirer les décisions en cours
+            while trail:
+                var = trail.pop()
+                self._unassign(var)
+                self.heuristic.unassign(var)
 
 
 def read_3sat_from_file(filename, format='auto'):
@@ -245,6 +579,29 @@ def write_solution_to_file(filename, success, assignment, stats):
         f.write(f"  Nombre de clauses: {stats['num_clauses']}\n")
 
 
+def write_models_to_file(filename, models, max_models=None):
+    """
+    Écrit les solutions au fil de l'eau, une par ligne au format DIMACS
+    (v 1 -2 3 0), sans les garder en mémoire
+    
+    Args:
+        filename: fichier de sortie
+        models: itérable d'affectations (par exemple solver.iter_models())
+        max_models: nombre maximal de solutions écrites (None: toutes)
+    
+    Returns:
+        int: nombre de solutions écrites
+    """
+    count = 0
+    with open(filename, 'w') as f:
+        for assignment in islice(models, max_models):
+            literals = " ".join(str(var if assignment[var] else -var)
+                                for var in sorted(assignment))
+            f.write(f"v {literals} 0\n")
+            count += 1
+    return count
+
+
 if __name__ == "__main__":
     # Exemple d'utilisation
     print("=== Exemple 3-SAT Solver ===\n")
@@ -418,6 +418,62 @@ def test_mixed_formula():
     return True
 
 
+def test_equivalence_incremental():
+    """
+    Test d'équivalence SAT ⇔ 3-SAT sur toutes les affectations d'origine
+    
+    Un seul SAT3Solver est construit pour la formule 3-SAT: chaque
+    affectation des variables d'origine lui est passée en hypothèses
+    (solve(assumptions=...)), puis une clause est ajoutée avec add_clause()
+    au lieu de reconstruire le solveur.
+    """
+    print("\n" + "="*70)
+    print("TEST 8: ÉQUIVALENCE SAT ⇔ 3-SAT (SOLVEUR INCRÉMENTAL)")
+    print("="*70)
+    
+    variables_sat = ['x1', 'x2', 'x3', 'x4']
+    clauses_sat = [
+        [(1, False)],                                    # k=1
+        [(2, False), (3, True)],                         # k=2
+        [(1, False), (2, False), (3, False)],            # k=3
+        [(1, False), (2, False), (3, False), (4, True)]  # k=4
+    ]
+    
+    reducer = SATto3SATReducer()
+    clauses_3sat, num_vars, stats = reducer.reduce(variables_sat, clauses_sat, verbose=False)
+    solver = SAT3Solver(clauses_3sat, num_vars)
+    n = len(variables_sat)
+    
+    # Pour chaque affectation des x_i: F satisfaite ⇔ F' satisfiable sous ces hypothèses
+    satisfied = 0
+    for mask in range(2 ** n):
+        values = [bool(mask >> i & 1) for i in range(n)]
+        sat_ok = verify_SAT_solution(variables_sat, clauses_sat,
+                                     {name: value for name, value in zip(variables_sat, values)})
+        assumptions = [i + 1 if value else -(i + 1) for i, value in enumerate(values)]
+        success, assignment, _ = solver.solve(assumptions=assumptions)
+        assert success == sat_ok, f"❌ Affectation {assumptions}: SAT={sat_ok}, 3-SAT={success}"
+        if success:
+            satisfied += 1
+            is_valid, _ = SAT3Verifier(clauses_3sat).verify(assignment)
+            assert is_valid, f"❌ Solution 3-SAT invalide pour {assumptions}"
+        else:
+            assert solver.failed_assumptions(), "❌ Aucune hypothèse responsable de l'échec"
+    
+    print(f"\n✅ Vérifications:")
+    print(f"   ✓ {2 ** n} affectations testées avec un seul solveur: "
+          f"{satisfied} satisfont F et F'")
+    
+    # Variante: ajout de (¬x₁), contradictoire avec la clause unitaire (x₁)
+    solver.add_clause([-1])
+    success, _, _ = solver.solve()
+    assert not success, "❌ F' ∧ ¬x₁ devrait être insatisfiable"
+    print(f"   ✓ add_clause([¬x₁]): formule devenue insatisfiable")
+    
+    print("\n✅ Test d'équivalence réussi!")
+    return True
+
+
 def run_all_tests():
     """Exécute tous les tests avec affichage détaillé"""
     print("\n" + "╔" + "="*68 + "╗")
@@ -432,7 +488,8 @@ def run_all_tests():
         ("Réduction k=4", test_reduction_k4),
         ("Réduction k=5 (EXEMPLE PROF)", test_reduction_k5),
         ("Réduction k=6", test_reduction_k6),
-        ("Formule mixte", test_mixed_formula)
+        ("Formule mixte", test_mixed_formula),
+        ("Équivalence incrémentale", test_equivalence_incremental)
     ]
     
     passed = 0
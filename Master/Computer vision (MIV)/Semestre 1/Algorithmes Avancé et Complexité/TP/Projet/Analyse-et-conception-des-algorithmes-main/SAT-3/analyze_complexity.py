@@ -1,498 +1,705 @@
-"""
-Analyse de complexité temporelle et spatiale pour 3-SAT
-Génère les graphiques et tableaux pour le rapport
-
-ANALYSES COMPLÈTES:
-1. Complexité vs NOMBRE DE CLAUSES (variables fixes)
-2. Complexité vs NOMBRE DE VARIABLES (clauses fixes)  
-3. Complexité vs TAILLE (ratio fixe)
-4. Verifier linéaire O(m)
-5. Comparaison Solver vs Verifier
-"""
-
-import time
-import sys
-import matplotlib.pyplot as plt
-
-# Imports à adapter selon votre structure
-try:
-    from solver_3sat import SAT3Solver
-    from verifier_3sat import SAT3Verifier
-    from test_3sat import generate_random_3sat
-except ImportError:
-    from core.solver_3sat import SAT3Solver
-    from core.verifier_3sat import SAT3Verifier
-    from tests.test_3sat import generate_random_3sat
-
-# Configuration graphiques
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['font.size'] = 11
-
-
-# ============================================================================
-# ANALYSE 1: COMPLEXITÉ vs NOMBRE DE CLAUSES (Variables FIXES)
-# ============================================================================
-
-def analyze_complexity_vs_clauses():
-    """
-    Teste la complexité en fonction du NOMBRE DE CLAUSES
-    Variables FIXES = 15
-    Clauses VARIABLES = 20, 30, 40, 50, 60, 70, 80, 90, 100, 120
-    
-    Cette analyse montre comment le temps d'exécution AUGMENTE avec m (nombre de clauses)
-    quand n (nombre de variables) reste fixe.
-    
-    Complexité théorique: O(2^n × m)
-    - Le 2^n est constant (n=15 fixe)
-    - Donc la croissance observée est proportionnelle à m
-    """
-    print("\n" + "="*70)
-    print("ANALYSE 1: COMPLEXITÉ vs NOMBRE DE CLAUSES")
-    print("="*70)
-    print("Variables FIXES = 15")
-    print("On observe la croissance en fonction de m (nombre de clauses)\n")
-    
-    num_vars = 15  # FIXE
-    clause_counts = [20, 30, 40, 50, 60, 70, 80, 90, 100, 120]  # VARIABLE
-    
-    times = []
-    backtracks = []
-    satisfiable_counts = []
-    
-    print(f"{'Clauses':>8} | {'Ratio m/n':>10} | {'Temps moyen':>13} | {'Backtracks':>12} | {'SAT':>6}")
-    print("-"*70)
-    
-    for num_clauses in clause_counts:
-        trial_times = []
-        trial_backtracks = []
-        sat_count = 0
-        
-        # 5 essais pour plus de précision
-        for trial in range(5):
-            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
-            
-            start = time.time()
-            solver = SAT3Solver(clauses, num_vars)
-            success, assignment, stats = solver.solve()
-            elapsed = time.time() - start
-            
-            trial_times.append(elapsed)
-            trial_backtracks.append(stats['backtrack_count'])
-            if success:
-                sat_count += 1
-        
-        avg_time = sum(trial_times) / 5
-        avg_backtracks = sum(trial_backtracks) / 5
-        ratio = num_clauses / num_vars
-        
-        times.append(avg_time)
-        backtracks.append(avg_backtracks)
-        satisfiable_counts.append(sat_count)
-        
-        print(f"{num_clauses:>8} | {ratio:>10.2f} | {avg_time:>12.4f}s | {avg_backtracks:>12.0f} | {sat_count}/5")
-    
-    # ANALYSE DE LA COMPLEXITÉ
-    print("\n" + "="*70)
-    print("ANALYSE DE LA COMPLEXITÉ OBSERVÉE:")
-    print("="*70)
-    
-    # Calculer le facteur de croissance moyen
-    time_ratios = []
-    for i in range(1, len(times)):
-        if times[i-1] > 0:
-            ratio = times[i] / times[i-1]
-            clause_increase = clause_counts[i] / clause_counts[i-1]
-            time_ratios.append(ratio)
-            print(f"Clauses: {clause_counts[i-1]:>3} → {clause_counts[i]:>3} "
-                  f"(×{clause_increase:.2f}) | "
-                  f"Temps: {times[i-1]:>8.4f}s → {times[i]:>8.4f}s "
-                  f"(×{ratio:.2f})")
-    
-    avg_ratio = sum(time_ratios) / len(time_ratios) if time_ratios else 0
-    print(f"\nFacteur de croissance moyen du temps: ×{avg_ratio:.2f}")
-    print(f"Interprétation: Quand m augmente de ~33%, le temps augmente de ~{(avg_ratio-1)*100:.0f}%")
-    print(f"\nComplexité observée: Croissance LINÉAIRE en m (car n est fixe)")
-    print(f"Formule: T(m) ≈ k × m, où k dépend de 2^n avec n={num_vars}")
-    
-    # GRAPHIQUE DÉTAILLÉ
-    fig = plt.figure(figsize=(18, 5))
-    
-    # Graphique 1: Temps vs Clauses (échelle normale)
-    ax1 = plt.subplot(1, 3, 1)
-    ax1.plot(clause_counts, times, 'o-', linewidth=2, markersize=8, color='#F18F01')
-    ax1.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Temps d\'exécution (secondes)', fontsize=12, fontweight='bold')
-    ax1.set_title(f'Temps vs Clauses (n={num_vars} fixe)\nCroissance linéaire en m', 
-                  fontsize=13, fontweight='bold')
-    ax1.grid(True, alpha=0.3, linestyle='--')
-    
-    # Marquer le ratio critique
-    critical_clauses = num_vars * 4.2
-    ax1.axvline(x=critical_clauses, color='red', linestyle='--', alpha=0.5, 
-                label=f'Ratio critique 4.2: {critical_clauses:.0f} clauses')
-    ax1.legend()
-    
-    # Graphique 2: Backtracks vs Clauses
-    ax2 = plt.subplot(1, 3, 2)
-    ax2.plot(clause_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
-    ax2.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Nombre de backtracks', fontsize=12, fontweight='bold')
-    ax2.set_title(f'Backtracks vs Clauses (n={num_vars} fixe)', 
-                  fontsize=13, fontweight='bold')
-    ax2.grid(True, alpha=0.3, linestyle='--')
-    ax2.set_yscale('log')
-    
-    # Graphique 3: Taux de satisfiabilité
-    ax3 = plt.subplot(1, 3, 3)
-    sat_percentages = [count/5*100 for count in satisfiable_counts]
-    ax3.plot(clause_counts, sat_percentages, '^-', linewidth=2, markersize=8, color='#06A77D')
-    ax3.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Taux de satisfiabilité (%)', fontsize=12, fontweight='bold')
-    ax3.set_title('Satisfiabilité vs Clauses\n(diminue avec m/n)', 
-                  fontsize=13, fontweight='bold')
-    ax3.grid(True, alpha=0.3, linestyle='--')
-    ax3.set_ylim(0, 105)
-    ax3.axvline(x=critical_clauses, color='red', linestyle='--', alpha=0.5)
-    
-    plt.tight_layout()
-    plt.savefig('graph1_complexite_vs_clauses.png', dpi=300, bbox_inches='tight')
-    print(f"\n✓ Graphique 1 sauvegardé: graph1_complexite_vs_clauses.png")
-    plt.close()
-    
-    return clause_counts, times, backtracks
-
-
-# ============================================================================
-# ANALYSE 2: COMPLEXITÉ vs NOMBRE DE VARIABLES (Clauses FIXES)
-# ============================================================================
-
-def analyze_complexity_vs_variables():
-    """
-    Teste la complexité en fonction du NOMBRE DE VARIABLES
-    Clauses FIXES = 40
-    Variables VARIABLES = 5, 8, 10, 12, 15, 18, 20
-    """
-    print("\n" + "="*70)
-    print("ANALYSE 2: COMPLEXITÉ vs NOMBRE DE VARIABLES")
-    print("="*70)
-    print("Clauses FIXES = 40\n")
-    
-    num_clauses = 40
-    variable_counts = [5, 8, 10, 12, 15, 18, 20]
-    
-    times = []
-    backtracks = []
-    
-    print(f"{'Variables':>10} | {'Ratio m/n':>10} | {'Temps moyen':>13} | {'Backtracks':>12}")
-    print("-"*70)
-    
-    for num_vars in variable_counts:
-        trial_times = []
-        trial_backtracks = []
-        
-        for trial in range(3):
-            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
-            
-            start = time.time()
-            solver = SAT3Solver(clauses, num_vars)
-            success, assignment, stats = solver.solve()
-            elapsed = time.time() - start
-            
-            trial_times.append(elapsed)
-            trial_backtracks.append(stats['backtrack_count'])
-        
-        avg_time = sum(trial_times) / 3
-        avg_backtracks = sum(trial_backtracks) / 3
-        ratio = num_clauses / num_vars
-        
-        times.append(avg_time)
-        backtracks.append(avg_backtracks)
-        
-        print(f"{num_vars:>10} | {ratio:>10.2f} | {avg_time:>12.4f}s | {avg_backtracks:>12.0f}")
-    
-    # Graphique
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
-    ax1.plot(variable_counts, times, 'o-', linewidth=2, markersize=8, color='#2E86AB')
-    ax1.set_xlabel('Nombre de variables (n)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Temps d\'exécution (secondes)', fontsize=12, fontweight='bold')
-    ax1.set_title(f'Complexité temporelle vs Nombre de variables\n(Clauses fixes m={num_clauses})', 
-                  fontsize=13, fontweight='bold')
-    ax1.grid(True, alpha=0.3, linestyle='--')
-    ax1.set_yscale('log')
-    
-    ax2.plot(variable_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
-    ax2.set_xlabel('Nombre de variables (n)', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Nombre de backtracks', fontsize=12, fontweight='bold')
-    ax2.set_title(f'Backtracks vs Nombre de variables\n(Clauses fixes m={num_clauses})', 
-                  fontsize=13, fontweight='bold')
-    ax2.grid(True, alpha=0.3, linestyle='--')
-    ax2.set_yscale('log')
-    
-    plt.tight_layout()
-    plt.savefig('graph2_complexite_vs_variables.png', dpi=300, bbox_inches='tight')
-    print(f"\n✓ Graphique 2 sauvegardé: graph2_complexite_vs_variables.png")
-    plt.close()
-
-
-# ============================================================================
-# ANALYSE 3: COMPLEXITÉ vs TAILLE (Ratio fixe)
-# ============================================================================
-
-def analyze_complexity_vs_size():
-    """
-    Teste la complexité avec ratio FIXE (les deux varient ensemble)
-    Ratio = 4.2 (ratio critique pour 3-SAT)
-    """
-    print("\n" + "="*70)
-    print("ANALYSE 3: COMPLEXITÉ vs TAILLE (ratio fixe 4.2)")
-    print("="*70)
-    
-    variable_counts = [5, 8, 10, 12, 15, 18, 20, 22, 25]
-    times = []
-    backtracks = []
-    memory_kb = []
-    
-    print(f"{'Variables':>10} | {'Clauses':>8} | {'Temps moyen':>13} | {'Backtracks':>12} | {'Mémoire':>10}")
-    print("-"*70)
-    
-    for num_vars in variable_counts:
-        num_clauses = int(num_vars * 4.2)
-        
-        trial_times = []
-        trial_backtracks = []
-        
-        for trial in range(3):
-            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
-            
-            # Mesure mémoire
-            mem_formula = sys.getsizeof(clauses)
-            for clause in clauses:
-                mem_formula += sys.getsizeof(clause)
-            
-            start = time.time()
-            solver = SAT3Solver(clauses, num_vars)
-            success, assignment, stats = solver.solve()
-            elapsed = time.time() - start
-            
-            mem_solution = sys.getsizeof(assignment) if success else 0
-            
-            trial_times.append(elapsed)
-            trial_backtracks.append(stats['backtrack_count'])
-        
-        avg_time = sum(trial_times) / 3
-        avg_backtracks = sum(trial_backtracks) / 3
-        total_mem_kb = (mem_formula + mem_solution) / 1024
-        
-        times.append(avg_time)
-        backtracks.append(avg_backtracks)
-        memory_kb.append(total_mem_kb)
-        
-        print(f"{num_vars:>10} | {num_clauses:>8} | {avg_time:>12.4f}s | "
-              f"{avg_backtracks:>12.0f} | {total_mem_kb:>9.2f} KB")
-    
-    # Graphique triple
-    fig = plt.figure(figsize=(16, 5))
-    
-    ax1 = plt.subplot(1, 3, 1)
-    ax1.plot(variable_counts, times, 'o-', linewidth=2, markersize=8, color='#2E86AB')
-    ax1.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
-    ax1.set_ylabel('Temps (secondes)', fontsize=11, fontweight='bold')
-    ax1.set_title('Temps vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
-    ax1.grid(True, alpha=0.3)
-    ax1.set_yscale('log')
-    
-    ax2 = plt.subplot(1, 3, 2)
-    ax2.plot(variable_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
-    ax2.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
-    ax2.set_ylabel('Backtracks', fontsize=11, fontweight='bold')
-    ax2.set_title('Backtracks vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
-    ax2.grid(True, alpha=0.3)
-    ax2.set_yscale('log')
-    
-    ax3 = plt.subplot(1, 3, 3)
-    ax3.plot(variable_counts, memory_kb, '^-', linewidth=2, markersize=8, color='#06A77D')
-    ax3.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
-    ax3.set_ylabel('Mémoire (KB)', fontsize=11, fontweight='bold')
-    ax3.set_title('Mémoire vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
-    ax3.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('graph3_complexite_vs_taille.png', dpi=300, bbox_inches='tight')
-    print(f"\n✓ Graphique 3 sauvegardé: graph3_complexite_vs_taille.png")
-    plt.close()
-
-
-# ============================================================================
-# ANALYSE 4: VERIFIER (linéaire O(m))
-# ============================================================================
-
-def analyze_verifier():
-    """Analyse du Verifier (doit être linéaire en O(m))"""
-    print("\n" + "="*70)
-    print("ANALYSE 4: COMPLEXITÉ DU VERIFIER")
-    print("="*70)
-    print("Complexité attendue: O(m) linéaire\n")
-    
-    variable_counts = [10, 20, 50, 100, 200, 500]
-    times_ms = []
-    
-    print(f"{'Variables':>10} | {'Clauses':>8} | {'Temps moyen':>18}")
-    print("-"*70)
-    
-    for num_vars in variable_counts:
-        num_clauses = num_vars * 4
-        clauses = generate_random_3sat(num_vars, num_clauses)
-        assignment = {i: True for i in range(1, num_vars + 1)}
-        
-        verifier = SAT3Verifier(clauses)
-        
-        # 1000 vérifications
-        start = time.time()
-        for _ in range(1000):
-            verifier.verify(assignment)
-        elapsed = time.time() - start
-        
-        avg_time_ms = (elapsed / 1000) * 1000
-        times_ms.append(avg_time_ms)
-        
-        print(f"{num_vars:>10} | {num_clauses:>8} | {avg_time_ms:>16.4f} ms")
-    
-    # Graphique
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    clause_counts = [v * 4 for v in variable_counts]
-    ax.plot(clause_counts, times_ms, 'o-', linewidth=2, markersize=8, color='#06A77D')
-    ax.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Temps de vérification (millisecondes)', fontsize=12, fontweight='bold')
-    ax.set_title('Complexité du Verifier: O(m) linéaire', fontsize=13, fontweight='bold')
-    ax.grid(True, alpha=0.3, linestyle='--')
-    
-    plt.tight_layout()
-    plt.savefig('graph4_verifier_lineaire.png', dpi=300, bbox_inches='tight')
-    print(f"\n✓ Graphique 4 sauvegardé: graph4_verifier_lineaire.png")
-    plt.close()
-
-
-# ============================================================================
-# ANALYSE 5: COMPARAISON SOLVER vs VERIFIER
-# ============================================================================
-
-def analyze_solver_vs_verifier():
-    """Comparaison directe Solver vs Verifier"""
-    print("\n" + "="*70)
-    print("ANALYSE 5: COMPARAISON SOLVER vs VERIFIER")
-    print("="*70)
-    
-    variable_counts = [10, 15, 20, 25, 30]
-    solver_times = []
-    verifier_times_scaled = []
-    
-    print(f"{'Variables':>10} | {'Temps Solver':>14} | {'Temps Verifier':>16} | {'Ratio':>10}")
-    print("-"*70)
-    
-    for num_vars in variable_counts:
-        num_clauses = num_vars * 4
-        clauses = generate_random_3sat(num_vars, num_clauses)
-        
-        # Solver
-        start = time.time()
-        solver = SAT3Solver(clauses, num_vars)
-        success, assignment, stats = solver.solve()
-        solver_time = time.time() - start
-        
-        # Verifier
-        if success:
-            verifier = SAT3Verifier(clauses)
-            start = time.time()
-            for _ in range(1000):
-                verifier.verify(assignment)
-            verifier_time = (time.time() - start) / 1000
-        else:
-            verifier_time = 0.0001
-        
-        solver_times.append(solver_time)
-        verifier_times_scaled.append(verifier_time * 1000)
-        
-        ratio = solver_time / verifier_time if verifier_time > 0 else 0
-        
-        print(f"{num_vars:>10} | {solver_time:>13.4f}s | {verifier_time*1000:>14.4f}ms | {ratio:>9.0f}x")
-    
-    # Graphique
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    ax.plot(variable_counts, solver_times, 'o-', linewidth=2, markersize=8, 
-            label='Solver: O(2^n × m)', color='#E63946')
-    ax.plot(variable_counts, verifier_times_scaled, 's-', linewidth=2, markersize=8, 
-            label='Verifier: O(m) ×1000', color='#06A77D')
-    
-    ax.set_xlabel('Nombre de variables', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Temps (secondes)', fontsize=12, fontweight='bold')
-    ax.set_title('Comparaison: Solver O(2^n) vs Verifier O(m)\n(Le Verifier est ~10000× plus rapide)', 
-                 fontsize=13, fontweight='bold')
-    ax.legend(fontsize=11)
-    ax.grid(True, alpha=0.3)
-    ax.set_yscale('log')
-    
-    plt.tight_layout()
-    plt.savefig('graph5_comparaison_solver_verifier.png', dpi=300, bbox_inches='tight')
-    print(f"\n✓ Graphique 5 sauvegardé: graph5_comparaison_solver_verifier.png")
-    plt.close()
-
-
-# ============================================================================
-# MAIN
-# ============================================================================
-
-def generate_all_analyses():
-    """Lance TOUTES les analyses complètes"""
-    print("\n" + "╔" + "="*68 + "╗")
-    print("║" + " "*8 + "ANALYSE COMPLÈTE DE COMPLEXITÉ - 3-SAT" + " "*15 + "║")
-    print("╚" + "="*68 + "╝")
-    
-    try:
-        analyze_complexity_vs_clauses()
-        analyze_complexity_vs_variables()
-        analyze_complexity_vs_size()
-        analyze_verifier()
-        analyze_solver_vs_verifier()
-        
-        print("\n" + "="*70)
-        print("✓ TOUTES LES ANALYSES TERMINÉES")
-        print("="*70)
-        print("\nGraphiques générés (5 au total):")
-        print("  1. graph1_complexite_vs_clauses.png")
-        print("  2. graph2_complexite_vs_variables.png")
-        print("  3. graph3_complexite_vs_taille.png")
-        print("  4. graph4_verifier_lineaire.png")
-        print("  5. graph5_comparaison_solver_verifier.png")
-        print("\n→ Utilisez ces graphiques pour votre rapport!")
-        print("="*70 + "\n")
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Analyse interrompue")
-    except Exception as e:
-        print(f"\n\n⚠️  Erreur: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        option = sys.argv[1]
-        
-        if option == "1":
-            analyze_complexity_vs_clauses()
-        elif option == "2":
-            analyze_complexity_vs_variables()
-        elif option == "3":
-            analyze_complexity_vs_size()
-        elif option == "4":
-            analyze_verifier()
-        elif option == "5":
-            analyze_solver_vs_verifier()
-        else:
-            print(f"Option inconnue: {option}")
-            print("Usage: python analyze_complexity.py [1|2|3|4|5]")
-    else:
+"""
+Analyse de complexité temporelle et spatiale pour 3-SAT
+Génère les graphiques et tableaux pour le rapport
+
+ANALYSES COMPLÈTES:
+1. Complexité vs NOMBRE DE CLAUSES (variables fixes)
+2. Complexité vs NOMBRE DE VARIABLES (clauses fixes)  
+3. Complexité vs TAILLE (ratio fixe)
+4. Verifier linéaire O(m)
+5. Comparaison Solver vs Verifier
+6. Backtracks par HEURISTIQUE DE BRANCHEMENT (ratio fixe)
+7. INSTRUMENTATION: propagations/s et répartition du temps par phase
+"""
+
+import time
+import sys
+import matplotlib.pyplot as plt
+
+from solve_3SAT import create_solver, SOLVER_ENGINES, BRANCHING_HEURISTICS, PROOF_ENGINES
+from verify_3SAT import SAT3Verifier
+from metrics_3SAT import SolverMetrics
+from generate_3SAT import generate_random_3sat
+from result_cache import ResultCache, cached_solve
+
+# Configuration graphiques
+plt.rcParams['figure.figsize'] = (10, 6)
+plt.rcParams['font.size'] = 11
+
+# Moteur de résolution utilisé par les analyses ('backtracking' ou 'cdcl')
+# Modifiable en ligne de commande: python analyze_complexity.py [1-7] --engine cdcl
+ENGINE = 'backtracking'
+
+# Heuristique de branchement du backtracking ('first', 'vsids', 'mom' ou 'jw')
+# Modifiable en ligne de commande: python analyze_complexity.py [1-7] --heuristic vsids
+HEURISTIC = 'first'
+
+# Cache des résultats (instances seed=trial identiques d'une exécution à l'autre)
+# Activable en ligne de commande: python analyze_complexity.py [1-7] --result-cache
+RESULT_CACHE = None
+
+
+def solve_timed(clauses, num_vars, heuristic=None, engine=None):
+    """
+    Résout une instance avec ENGINE / HEURISTIC, via RESULT_CACHE s'il est actif
+    
+    Returns:
+        tuple: (success, assignment, stats, temps de résolution en secondes)
+    """
+    success, assignment, stats = cached_solve(RESULT_CACHE, clauses, num_vars, engine or ENGINE,
+                                              heuristic or HEURISTIC)
+    return success, assignment, stats, stats['time']
+
+
+# ============================================================================
+# ANALYSE 1: COMPLEXITÉ vs NOMBRE DE CLAUSES (Variables FIXES)
+# ============================================================================
+
+def analyze_complexity_vs_clauses():
+    """
+    Teste la complexité en fonction du NOMBRE DE CLAUSES
+    Variables FIXES = 15
+    Clauses VARIABLES = 20, 30, 40, 50, 60, 70, 80, 90, 100, 120
+    
+    Cette analyse montre comment le temps d'exécution AUGMENTE avec m (nombre de clauses)
+    quand n (nombre de variables) reste fixe.
+    
+    Complexité théorique: O(2^n × m)
+    - Le 2^n est constant (n=15 fixe)
+    - Donc la croissance observée est proportionnelle à m
+    """
+    print("\n" + "="*70)
+    print("ANALYSE 1: COMPLEXITÉ vs NOMBRE DE CLAUSES")
+    print("="*70)
+    print("Variables FIXES = 15")
+    print("On observe la croissance en fonction de m (nombre de clauses)\n")
+    
+    num_vars = 15  # FIXE
+    clause_counts = [20, 30, 40, 50, 60, 70, 80, 90, 100, 120]  # VARIABLE
+    
+    times = []
+    backtracks = []
+    satisfiable_counts = []
+    
+    print(f"{'Clauses':>8} | {'Ratio m/n':>10} | {'Temps moyen':>13} | {'Backtracks':>12} | {'SAT':>6}")
+    print("-"*70)
+    
+    for num_clauses in clause_counts:
+        trial_times = []
+        trial_backtracks = []
+        sat_count = 0
+        
+        # 5 essais pour plus de précision
+        for trial in range(5):
+            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
+            
+            success, assignment, stats, elapsed = solve_timed(clauses, num_vars)
+            
+            trial_times.append(elapsed)
+            trial_backtracks.append(stats['backtrack_count'])
+            if success:
+                sat_count += 1
+        
+        avg_time = sum(trial_times) / 5
+        avg_backtracks = sum(trial_backtracks) / 5
+        ratio = num_clauses / num_vars
+        
+        times.append(avg_time)
+        backtracks.append(avg_backtracks)
+        satisfiable_counts.append(sat_count)
+        
+        print(f"{num_clauses:>8} | {ratio:>10.2f} | {avg_time:>12.4f}s | {avg_backtracks:>12.0f} | {sat_count}/5")
+    
+    # ANALYSE DE LA COMPLEXITÉ
+    print("\n" + "="*70)
+    print("ANALYSE DE LA COMPLEXITÉ OBSERVÉE:")
+    print("="*70)
+    
+    # Calculer le facteur de croissance moyen
+    time_ratios = []
+    for i in range(1, len(times)):
+        if times[i-1] > 0:
+            ratio = times[i] / times[i-1]
+            clause_increase = clause_counts[i] / clause_counts[i-1]
+            time_ratios.append(ratio)
+            print(f"Clauses: {clause_counts[i-1]:>3} → {clause_counts[i]:>3} "
+                  f"(×{clause_increase:.2f}) | "
+                  f"Temps: {times[i-1]:>8.4f}s → {times[i]:>8.4f}s "
+                  f"(×{ratio:.2f})")
+    
+    avg_ratio = sum(time_ratios) / len(time_ratios) if time_ratios else 0
+    print(f"\nFacteur de croissance moyen du temps: ×{avg_ratio:.2f}")
+    print(f"Interprétation: Quand m augmente de ~33%, le temps augmente de ~{(avg_ratio-1)*100:.0f}%")
+    print(f"\nComplexité observée: Croissance LINÉAIRE en m (car n est fixe)")
+    print(f"Formule: T(m) ≈ k × m, où k dépend de 2^n avec n={num_vars}")
+    
+    # GRAPHIQUE DÉTAILLÉ
+    fig = plt.figure(figsize=(18, 5))
+    
+    # Graphique 1: Temps vs Clauses (échelle normale)
+    ax1 = plt.subplot(1, 3, 1)
+    ax1.plot(clause_counts, times, 'o-', linewidth=2, markersize=8, color='#F18F01')
+    ax1.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
+    ax1.set_ylabel('Temps d\'exécution (secondes)', fontsize=12, fontweight='bold')
+    ax1.set_title(f'Temps vs Clauses (n={num_vars} fixe)\nCroissance linéaire en m', 
+                  fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3, linestyle='--')
+    
+    # Marquer le ratio critique
+    critical_clauses = num_vars * 4.2
+    ax1.axvline(x=critical_clauses, color='red', linestyle='--', alpha=0.5, 
+                label=f'Ratio critique 4.2: {critical_clauses:.0f} clauses')
+    ax1.legend()
+    
+    # Graphique 2: Backtracks vs Clauses
+    ax2 = plt.subplot(1, 3, 2)
+    ax2.plot(clause_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
+    ax2.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Nombre de backtracks', fontsize=12, fontweight='bold')
+    ax2.set_title(f'Backtracks vs Clauses (n={num_vars} fixe)', 
+                  fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3, linestyle='--')
+    ax2.set_yscale('log')
+    
+    # Graphique 3: Taux de satisfiabilité
+    ax3 = plt.subplot(1, 3, 3)
+    sat_percentages = [count/5*100 for count in satisfiable_counts]
+    ax3.plot(clause_counts, sat_percentages, '^-', linewidth=2, markersize=8, color='#06A77D')
+    ax3.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
+    ax3.set_ylabel('Taux de satisfiabilité (%)', fontsize=12, fontweight='bold')
+    ax3.set_title('Satisfiabilité vs Clauses\n(diminue avec m/n)', 
+                  fontsize=13, fontweight='bold')
+    ax3.grid(True, alpha=0.3, linestyle='--')
+    ax3.set_ylim(0, 105)
+    ax3.axvline(x=critical_clauses, color='red', linestyle='--', alpha=0.5)
+    
+    plt.tight_layout()
+    plt.savefig('graph1_complexite_vs_clauses.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 1 sauvegardé: graph1_complexite_vs_clauses.png")
+    plt.close()
+    
+    return clause_counts, times, backtracks
+
+
+# ============================================================================
+# ANALYSE 2: COMPLEXITÉ vs NOMBRE DE VARIABLES (Clauses FIXES)
+# ============================================================================
+
+def analyze_complexity_vs_variables():
+    """
+    Teste la complexité en fonction du NOMBRE DE VARIABLES
+    Clauses FIXES = 40
+    Variables VARIABLES = 5, 8, 10, 12, 15, 18, 20
+    """
+    print("\n" + "="*70)
+    print("ANALYSE 2: COMPLEXITÉ vs NOMBRE DE VARIABLES")
+    print("="*70)
+    print("Clauses FIXES = 40\n")
+    
+    num_clauses = 40
+    variable_counts = [5, 8, 10, 12, 15, 18, 20]
+    
+    times = []
+    backtracks = []
+    
+    print(f"{'Variables':>10} | {'Ratio m/n':>10} | {'Temps moyen':>13} | {'Backtracks':>12}")
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        trial_times = []
+        trial_backtracks = []
+        
+        for trial in range(3):
+            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
+            
+            success, assignment, stats, elapsed = solve_timed(clauses, num_vars)
+            
+            trial_times.append(elapsed)
+            trial_backtracks.append(stats['backtrack_count'])
+        
+        avg_time = sum(trial_times) / 3
+        avg_backtracks = sum(trial_backtracks) / 3
+        ratio = num_clauses / num_vars
+        
+        times.append(avg_time)
+        backtracks.append(avg_backtracks)
+        
+        print(f"{num_vars:>10} | {ratio:>10.2f} | {avg_time:>12.4f}s | {avg_backtracks:>12.0f}")
+    
+    # Graphique
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    
+    ax1.plot(variable_counts, times, 'o-', linewidth=2, markersize=8, color='#2E86AB')
+    ax1.set_xlabel('Nombre de variables (n)', fontsize=12, fontweight='bold')
+    ax1.set_ylabel('Temps d\'exécution (secondes)', fontsize=12, fontweight='bold')
+    ax1.set_title(f'Complexité temporelle vs Nombre de variables\n(Clauses fixes m={num_clauses})', 
+                  fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3, linestyle='--')
+    ax1.set_yscale('log')
+    
+    ax2.plot(variable_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
+    ax2.set_xlabel('Nombre de variables (n)', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Nombre de backtracks', fontsize=12, fontweight='bold')
+    ax2.set_title(f'Backtracks vs Nombre de variables\n(Clauses fixes m={num_clauses})', 
+                  fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3, linestyle='--')
+    ax2.set_yscale('log')
+    
+    plt.tight_layout()
+    plt.savefig('graph2_complexite_vs_variables.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 2 sauvegardé: graph2_complexite_vs_variables.png")
+    plt.close()
+
+
+# ============================================================================
+# ANALYSE 3: COMPLEXITÉ vs TAILLE (Ratio fixe)
+# ============================================================================
+
+def analyze_complexity_vs_size():
+    """
+    Teste la complexité avec ratio FIXE (les deux varient ensemble)
+    Ratio = 4.2 (ratio critique pour 3-SAT)
+    """
+    print("\n" + "="*70)
+    print("ANALYSE 3: COMPLEXITÉ vs TAILLE (ratio fixe 4.2)")
+    print("="*70)
+    
+    variable_counts = [5, 8, 10, 12, 15, 18, 20, 22, 25]
+    times = []
+    backtracks = []
+    memory_kb = []
+    
+    print(f"{'Variables':>10} | {'Clauses':>8} | {'Temps moyen':>13} | {'Backtracks':>12} | {'Mémoire':>10}")
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        num_clauses = int(num_vars * 4.2)
+        
+        trial_times = []
+        trial_backtracks = []
+        
+        for trial in range(3):
+            clauses = generate_random_3sat(num_vars, num_clauses, seed=trial)
+            
+            # Mesure mémoire
+            mem_formula = sys.getsizeof(clauses)
+            for clause in clauses:
+                mem_formula += sys.getsizeof(clause)
+            
+            success, assignment, stats, elapsed = solve_timed(clauses, num_vars)
+            
+            mem_solution = sys.getsizeof(assignment) if success else 0
+            
+            trial_times.append(elapsed)
+            trial_backtracks.append(stats['backtrack_count'])
+        
+        avg_time = sum(trial_times) / 3
+        avg_backtracks = sum(trial_backtracks) / 3
+        total_mem_kb = (mem_formula + mem_solution) / 1024
+        
+        times.append(avg_time)
+        backtracks.append(avg_backtracks)
+        memory_kb.append(total_mem_kb)
+        
+        print(f"{num_vars:>10} | {num_clauses:>8} | {avg_time:>12.4f}s | "
+              f"{avg_backtracks:>12.0f} | {total_mem_kb:>9.2f} KB")
+    
+    # Graphique triple
+    fig = plt.figure(figsize=(16, 5))
+    
+    ax1 = plt.subplot(1, 3, 1)
+    ax1.plot(variable_counts, times, 'o-', linewidth=2, markersize=8, color='#2E86AB')
+    ax1.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Temps (secondes)', fontsize=11, fontweight='bold')
+    ax1.set_title('Temps vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.set_yscale('log')
+    
+    ax2 = plt.subplot(1, 3, 2)
+    ax2.plot(variable_counts, backtracks, 's-', linewidth=2, markersize=8, color='#A23B72')
+    ax2.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Backtracks', fontsize=11, fontweight='bold')
+    ax2.set_title('Backtracks vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_yscale('log')
+    
+    ax3 = plt.subplot(1, 3, 3)
+    ax3.plot(variable_counts, memory_kb, '^-', linewidth=2, markersize=8, color='#06A77D')
+    ax3.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Mémoire (KB)', fontsize=11, fontweight='bold')
+    ax3.set_title('Mémoire vs Taille\n(ratio 4.2)', fontsize=12, fontweight='bold')
+    ax3.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig('graph3_complexite_vs_taille.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 3 sauvegardé: graph3_complexite_vs_taille.png")
+    plt.close()
+
+
+# ============================================================================
+# ANALYSE 4: VERIFIER (linéaire O(m))
+# ============================================================================
+
+def analyze_verifier():
+    """Analyse du Verifier (doit être linéaire en O(m))"""
+    print("\n" + "="*70)
+    print("ANALYSE 4: COMPLEXITÉ DU VERIFIER")
+    print("="*70)
+    print("Complexité attendue: O(m) linéaire\n")
+    
+    variable_counts = [10, 20, 50, 100, 200, 500]
+    times_ms = []
+    
+    print(f"{'Variables':>10} | {'Clauses':>8} | {'Temps moyen':>18}")
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        num_clauses = num_vars * 4
+        clauses = generate_random_3sat(num_vars, num_clauses)
+        assignment = {i: True for i in range(1, num_vars + 1)}
+        
+        verifier = SAT3Verifier(clauses)
+        
+        # 1000 vérifications
+        start = time.time()
+        for _ in range(1000):
+            verifier.verify(assignment)
+        elapsed = time.time() - start
+        
+        avg_time_ms = (elapsed / 1000) * 1000
+        times_ms.append(avg_time_ms)
+        
+        print(f"{num_vars:>10} | {num_clauses:>8} | {avg_time_ms:>16.4f} ms")
+    
+    # Graphique
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    clause_counts = [v * 4 for v in variable_counts]
+    ax.plot(clause_counts, times_ms, 'o-', linewidth=2, markersize=8, color='#06A77D')
+    ax.set_xlabel('Nombre de clauses (m)', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Temps de vérification (millisecondes)', fontsize=12, fontweight='bold')
+    ax.set_title('Complexité du Verifier: O(m) linéaire', fontsize=13, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--')
+    
+    plt.tight_layout()
+    plt.savefig('graph4_verifier_lineaire.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 4 sauvegardé: graph4_verifier_lineaire.png")
+    plt.close()
+
+
+# ============================================================================
+# ANALYSE 5: COMPARAISON SOLVER vs VERIFIER
+# ============================================================================
+
+def analyze_solver_vs_verifier():
+    """Comparaison directe Solver vs Verifier"""
+    print("\n" + "="*70)
+    print("ANALYSE 5: COMPARAISON SOLVER vs VERIFIER")
+    print("="*70)
+    
+    variable_counts = [10, 15, 20, 25, 30]
+    solver_times = []
+    verifier_times_scaled = []
+    
+    print(f"{'Variables':>10} | {'Temps Solver':>14} | {'Temps Verifier':>16} | {'Ratio':>10}")
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        num_clauses = num_vars * 4
+        clauses = generate_random_3sat(num_vars, num_clauses)
+        
+        # Solver
+        start = time.time()
+        solver = create_solver(clauses, num_vars, ENGINE, HEURISTIC)
+        success, assignment, stats = solver.solve()
+        solver_time = time.time() - start
+        
+        # Verifier
+        if success:
+            verifier = SAT3Verifier(clauses)
+            start = time.time()
+            for _ in range(1000):
+                verifier.verify(assignment)
+            verifier_time = (time.time() - start) / 1000
+        else:
+            verifier_time = 0.0001
+        
+        solver_times.append(solver_time)
+        verifier_times_scaled.append(verifier_time * 1000)
+        
+        ratio = solver_time / verifier_time if verifier_time > 0 else 0
+        
+        print(f"{num_vars:>10} | {solver_time:>13.4f}s | {verifier_time*1000:>14.4f}ms | {ratio:>9.0f}x")
+    
+    # Graphique
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    ax.plot(variable_counts, solver_times, 'o-', linewidth=2, markersize=8, 
+            label='Solver: O(2^n × m)', color='#E63946')
+    ax.plot(variable_counts, verifier_times_scaled, 's-', linewidth=2, markersize=8, 
+            label='Verifier: O(m) ×1000', color='#06A77D')
+    
+    ax.set_xlabel('Nombre de variables', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Temps (secondes)', fontsize=12, fontweight='bold')
+    ax.set_title('Comparaison: Solver O(2^n) vs Verifier O(m)\n(Le Verifier est ~10000× plus rapide)', 
+                 fontsize=13, fontweight='bold')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    ax.set_yscale('log')
+    
+    plt.tight_layout()
+    plt.savefig('graph5_comparaison_solver_verifier.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 5 sauvegardé: graph5_comparaison_solver_verifier.png")
+    plt.close()
+
+
+# ============================================================================
+# ANALYSE 6: BACKTRACKS PAR HEURISTIQUE DE BRANCHEMENT
+# ============================================================================
+
+def analyze_heuristics():
+    """
+    Compare les heuristiques de branchement de SAT3Solver
+    (nombre de backtracks au ratio critique 4.26, mêmes instances pour toutes)
+    """
+    print("\n" + "="*70)
+    print("ANALYSE 6: BACKTRACKS PAR HEURISTIQUE (ratio fixe 4.26)")
+    print("="*70)
+    
+    variable_counts = [10, 15, 20, 25, 30]
+    heuristics = list(BRANCHING_HEURISTICS)
+    backtracks = {heuristic: [] for heuristic in heuristics}
+    times = {heuristic: [] for heuristic in heuristics}
+    
+    print(f"{'Variables':>10} | " + " | ".join(f"{heuristic:>12}" for heuristic in heuristics))
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        num_clauses = round(num_vars * 4.26)
+        instances = [generate_random_3sat(num_vars, num_clauses, seed=trial) for trial in range(3)]
+        
+        for heuristic in heuristics:
+            trial_times = []
+            trial_backtracks = []
+            for clauses in instances:
+                success, assignment, stats, elapsed = solve_timed(clauses, num_vars, heuristic,
+                                                                  'backtracking')
+                trial_times.append(elapsed)
+                trial_backtracks.append(stats['backtrack_count'])
+            
+            backtracks[heuristic].append(sum(trial_backtracks) / len(instances))
+            times[heuristic].append(sum(trial_times) / len(instances))
+        
+        print(f"{num_vars:>10} | " + " | ".join(f"{backtracks[heuristic][-1]:>12.0f}"
+                                                for heuristic in heuristics))
+    
+    # Graphique double
+    fig = plt.figure(figsize=(14, 5))
+    markers = ['o-', 's-', '^-', 'D-']
+    colors = ['#2E86AB', '#A23B72', '#06A77D', '#E63946']
+    
+    ax1 = plt.subplot(1, 2, 1)
+    for i, heuristic in enumerate(heuristics):
+        ax1.plot(variable_counts, backtracks[heuristic], markers[i % 4], linewidth=2,
+                 markersize=8, color=colors[i % 4], label=heuristic)
+    ax1.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Backtracks (moyenne)', fontsize=11, fontweight='bold')
+    ax1.set_title('Backtracks par heuristique\n(ratio 4.26)', fontsize=12, fontweight='bold')
+    ax1.legend(fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_yscale('log')
+    
+    ax2 = plt.subplot(1, 2, 2)
+    for i, heuristic in enumerate(heuristics):
+        ax2.plot(variable_counts, times[heuristic], markers[i % 4], linewidth=2,
+                 markersize=8, color=colors[i % 4], label=heuristic)
+    ax2.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Temps (secondes)', fontsize=11, fontweight='bold')
+    ax2.set_title('Temps par heuristique\n(ratio 4.26)', fontsize=12, fontweight='bold')
+    ax2.legend(fontsize=10)
+    ax2.grid(True, alpha=0.3)
+    ax2.set_yscale('log')
+    
+    plt.tight_layout()
+    plt.savefig('graph6_backtracks_par_heuristique.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 6 sauvegardé: graph6_backtracks_par_heuristique.png")
+    plt.close()
+
+
+# ============================================================================
+# ANALYSE 7: INSTRUMENTATION (OÙ PASSE LE TEMPS)
+# ============================================================================
+
+def analyze_instrumentation():
+    """
+    Mesure les moteurs complets avec SolverMetrics (ratio critique 4.26):
+    débit de propagations, répartition du temps de recherche par phase et
+    histogramme des niveaux de décision
+    """
+    print("\n" + "="*70)
+    print("ANALYSE 7: INSTRUMENTATION DES SOLVEURS (ratio fixe 4.26)")
+    print("="*70)
+    
+    variable_counts = [10, 15, 20, 25, 30]
+    engines = list(PROOF_ENGINES)
+    rates = {engine: [] for engine in engines}
+    phases = {engine: {} for engine in engines}
+    histograms = {}
+    
+    print(f"{'Variables':>10} | " + " | ".join(f"{engine + ' prop/s':>20}" for engine in engines))
+    print("-"*70)
+    
+    for num_vars in variable_counts:
+        num_clauses = round(num_vars * 4.26)
+        instances = [generate_random_3sat(num_vars, num_clauses, seed=trial) for trial in range(3)]
+        
+        for engine in engines:
+            metrics = SolverMetrics(trace=False)
+            for clauses in instances:
+                solver = create_solver(clauses, num_vars, engine, HEURISTIC, metrics=metrics)
+                solver.solve()
+            data = metrics.to_dict()
+            rates[engine].append(data['rates']['propagations_per_second'])
+            search_time = data['phase_time'].get('search', 0.0)
+            detail = {phase: seconds for phase, seconds in data['phase_time'].items()
+                      if phase not in ('solve', 'search', 'init')}
+            detail['autre'] = max(search_time - sum(detail.values()), 0.0)
+            for phase, seconds in detail.items():
+                phases[engine].setdefault(phase, [0.0] * len(variable_counts))
+                phases[engine][phase][len(rates[engine]) - 1] = seconds / len(instances)
+            histograms[engine] = data['level_histogram']
+        
+        print(f"{num_vars:>10} | " + " | ".join(f"{rates[engine][-1]:>20,.0f}" for engine in engines))
+    
+    # Graphique triple
+    fig = plt.figure(figsize=(18, 5))
+    colors = ['#2E86AB', '#A23B72', '#06A77D', '#E63946', '#F4A261']
+    
+    ax1 = plt.subplot(1, 3, 1)
+    for i, engine in enumerate(engines):
+        ax1.plot(variable_counts, rates[engine], 'o-', linewidth=2, markersize=8,
+                 color=colors[i], label=engine)
+    ax1.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Propagations par seconde', fontsize=11, fontweight='bold')
+    ax1.set_title('Débit de propagation\n(ratio 4.26)', fontsize=12, fontweight='bold')
+    ax1.legend(fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    
+    # Temps de recherche CDCL empilé par phase
+    ax2 = plt.subplot(1, 3, 2)
+    bottom = [0.0] * len(variable_counts)
+    for i, (phase, values) in enumerate(sorted(phases['cdcl'].items())):
+        ax2.bar([str(n) for n in variable_counts], values, bottom=bottom,
+                color=colors[i % len(colors)], label=phase)
+        bottom = [b + v for b, v in zip(bottom, values)]
+    ax2.set_xlabel('Nombre de variables (n)', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Temps de recherche (secondes)', fontsize=11, fontweight='bold')
+    ax2.set_title('CDCL: temps par phase\n(moyenne par instance)', fontsize=12, fontweight='bold')
+    ax2.legend(fontsize=10)
+    ax2.grid(True, alpha=0.3, axis='y')
+    
+    ax3 = plt.subplot(1, 3, 3)
+    for i, engine in enumerate(engines):
+        levels = sorted(histograms[engine])
+        ax3.plot(levels, [histograms[engine][level] for level in levels], 'o-',
+                 linewidth=2, markersize=5, color=colors[i], label=engine)
+    ax3.set_xlabel('Niveau de décision', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Nombre de décisions', fontsize=11, fontweight='bold')
+    ax3.set_title(f'Histogramme des niveaux\n(n = {variable_counts[-1]})', fontsize=12, fontweight='bold')
+    ax3.legend(fontsize=10)
+    ax3.grid(True, alpha=0.3)
+    ax3.set_yscale('log')
+    
+    plt.tight_layout()
+    plt.savefig('graph7_instrumentation.png', dpi=300, bbox_inches='tight')
+    print(f"\n✓ Graphique 7 sauvegardé: graph7_instrumentation.png")
+    plt.close()
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def generate_all_analyses():
+    """Lance TOUTES les analyses complètes"""
+    print("\n" + "╔" + "="*68 + "╗")
+    print("║" + " "*8 + "ANALYSE COMPLÈTE DE COMPLEXITÉ - 3-SAT" + " "*15 + "║")
+    print("╚" + "="*68 + "╝")
+    
+    try:
+        analyze_complexity_vs_clauses()
+        analyze_complexity_vs_variables()
+        analyze_complexity_vs_size()
+        analyze_verifier()
+        analyze_solver_vs_verifier()
+        analyze_heuristics()
+        analyze_instrumentation()
+        
+        print("\n" + "="*70)
+        print("✓ TOUTES LES ANALYSES TERMINÉES")
+        print("="*70)
+        print("\nGraphiques générés (7 au total):")
+        print("  1. graph1_complexite_vs_clauses.png")
+        print("  2. graph2_complexite_vs_variables.png")
+        print("  3. graph3_complexite_vs_taille.png")
+        print("  4. graph4_verifier_lineaire.png")
+        print("  5. graph5_comparaison_solver_verifier.png")
+        print("  6. graph6_backtracks_par_heuristique.png")
+        print("  7. graph7_instrumentation.png")
+        print("\n→ Utilisez ces graphiques pour votre rapport!")
+        print("="*70 + "\n")
+        
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Analyse interrompue")
+    except Exception as e:
+        print(f"\n\n⚠️  Erreur: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    if "--engine" in sys.argv:
+        pos = sys.argv.index("--engine")
+        if pos + 1 < len(sys.argv) and sys.argv[pos + 1] in SOLVER_ENGINES:
+            ENGINE = sys.argv[pos + 1]
+            del sys.argv[pos:pos + 2]
+        else:
+            print(f"Usage: python analyze_complexity.py [1|2|3|4|5|6|7] --engine <{'|'.join(SOLVER_ENGINES)}>")
+            sys.exit(1)
+    
+    if "--heuristic" in sys.argv:
+        pos = sys.argv.index("--heuristic")
+        if pos + 1 < len(sys.argv) and sys.argv[pos + 1] in BRANCHING_HEURISTICS:
+            HEURISTIC = sys.argv[pos + 1]
+            del sys.argv[pos:pos + 2]
+        else:
+            print(f"Usage: python analyze_complexity.py [1|2|3|4|5|6|7] --heuristic <{'|'.join(BRANCHING_HEURISTICS)}>")
+            sys.exit(1)
+    
+    if "--result-cache" in sys.argv:
+        sys.argv.remove("--result-cache")
+        RESULT_CACHE = ResultCache()
+    
+    if len(sys.argv) > 1:
+        option = sys.argv[1]
+        
+        if option == "1":
+            analyze_complexity_vs_clauses()
+        elif option == "2":
+            analyze_complexity_vs_variables()
+        elif option == "3":
+            analyze_complexity_vs_size()
+        elif option == "4":
+            analyze_verifier()
+        elif option == "5":
+            analyze_solver_vs_verifier()
+        elif option == "6":
+            analyze_heuristics()
+        elif option == "7":
+            analyze_instrumentation()
+        else:
+            print(f"Option inconnue: {option}")
+            print("Usage: python analyze_complexity.py [1|2|3|4|5|6|7] [--engine cdcl] [--heuristic vsids] "
+                  "[--result-cache]")
+    else:
         generate_all_analyses()
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Budgets de ressources et annulation coopérative des solveurs 3-SAT
+
+Un solveur reçoit budget=SolverBudget(...): solve() appelle budget.start(),
+puis la recherche appelle budget.exhausted() tous les check_interval nœuds
+(décisions + conflits pour CDCL, flips pour la recherche locale). Entre deux
+contrôles, le coût est une comparaison d'entiers; avec budget=None (défaut),
+un test "is not None". L'intervalle est réduit quand des nœuds coûteux
+(grandes formules, propagations CDCL) espacent les contrôles de plus de
+CHECK_DELAY secondes.
+
+Limites (None: pas de limite):
+- max_time: temps mural en secondes
+- max_nodes: nœuds (backtracks, décisions CDCL, flips)
+- max_conflicts: conflits (CDCL)
+- max_memory_mb: mémoire résidente du processus en Mo
+cancel() (depuis un autre thread, un callback...) arrête la recherche au
+prochain contrôle.
+
+Budget épuisé: solve() retourne success=None, stats['status'] = 'UNKNOWN'
+et stats['budget'] (raison, temps, nœuds), avec les statistiques partielles.
+"""
+import os
+import sys
+import time
+
+# Nœuds entre deux contrôles complets (horloge, mémoire, annulation)
+CHECK_INTERVAL = 1024
+# Délai visé entre deux contrôles (secondes): précision du temps limite et de l'annulation
+CHECK_DELAY = 0.01
+
+BUDGET_REASONS = ('cancelled', 'nodes', 'conflicts', 'time', 'memory')
+
+
+def current_memory_mb():
+    """
+    Mémoire résidente du processus en Mo; à défaut de /proc (hors Linux),
+    le pic de mémoire résidente; None si aucune mesure n'est disponible
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en Ko ailleurs
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 1024
+
+
+class SolverBudget:
+    """
+    Args:
+        max_time: temps mural maximal en secondes
+        max_nodes: nombre maximal de nœuds
+        max_conflicts: nombre maximal de conflits (CDCL)
+        max_memory_mb: mémoire résidente maximale en Mo
+        check_interval: nœuds entre deux contrôles complets
+
+    Après solve(): reason (None si le budget n'a pas été épuisé), nodes,
+    conflicts et elapsed() décrivent le dernier appel.
+    """
+
+    def __init__(self, max_time=None, max_nodes=None, max_conflicts=None, max_memory_mb=None,
+                 check_interval=CHECK_INTERVAL):
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.max_conflicts = max_conflicts
+        self.max_memory_mb = max_memory_mb
+        self.check_interval = check_interval
+        self.cancelled = False
+        self.reason = None
+        self.nodes = 0
+        self.conflicts = 0
+        self.start_time = time.perf_counter()
+        self.deadline = None
+        self.step = check_interval
+        self.last_check = self.start_time
+
+    def start(self):
+        """Début d'un appel à solve(): chronomètre et compteurs remis à zéro (pas l'annulation)"""
+        self.start_time = time.perf_counter()
+        self.deadline = None if self.max_time is None else self.start_time + self.max_time
+        self.reason = None
+        self.nodes = 0
+        self.conflicts = 0
+        self.step = self.check_interval
+        self.last_check = self.start_time
+
+    def cancel(self):
+        """Demande l'arrêt de la recherche, pris en compte au prochain contrôle"""
+        self.cancelled = True
+
+    def next_check(self, nodes=0, conflicts=0):
+        """
+        Valeur du compteur nodes + conflicts à laquelle refaire un contrôle:
+        au plus check_interval plus loin (moins si le dernier intervalle a
+        duré plus de CHECK_DELAY), sans dépasser les limites de nœuds et de
+        conflits (elles sont donc respectées exactement)
+        """
+        now = time.perf_counter()
+        if now - self.last_check > CHECK_DELAY:
+            self.step = max(self.step // 2, 1)
+        elif self.step < self.check_interval:
+            self.step = min(self.step * 2, self.check_interval)
+        self.last_check = now
+        step = self.step
+        if self.max_nodes is not None:
+            step = min(step, self.max_nodes - nodes)
+        if self.max_conflicts is not None:
+            step = min(step, self.max_conflicts - conflicts)
+        return nodes + conflicts + max(step, 1)
+
+    def exhausted(self, nodes=0, conflicts=0):
+        """
+        Contrôle complet du budget
+
+        Returns:
+            bool: True si la recherche doit s'arrêter (raison dans self.reason)
+        """
+        self.nodes = nodes
+        self.conflicts = conflicts
+        if self.cancelled:
+            self.reason = 'cancelled'
+        elif self.max_nodes is not None and nodes >= self.max_nodes:
+            self.reason = 'nodes'
+        elif self.max_conflicts is not None and conflicts >= self.max_conflicts:
+            self.reason = 'conflicts'
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.reason = 'time'
+        elif self.max_memory_mb is not None and (current_memory_mb() or 0) >= self.max_memory_mb:
+            self.reason = 'memory'
+        return self.reason is not None
+
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: raison de l'arrêt (None si non épuisé), temps écoulé,
+                  compteurs au dernier contrôle et limites
+        """
+        return {
+            'reason': self.reason,
+            'elapsed': self.elapsed(),
+            'nodes': self.nodes,
+            'conflicts': self.conflicts,
+            'limits': {'max_time': self.max_time, 'max_nodes': self.max_nodes,
+                       'max_conflicts': self.max_conflicts, 'max_memory_mb': self.max_memory_mb}
+        }
+
+
+if __name__ == "__main__":
+    import random
+    import threading
+
+    from solve_3SAT import SOLVER_ENGINES, create_solver
+
+    print("=== Budgets des solveurs 3-SAT ===\n")
+
+    # Instance au seuil (ratio 4.26), trop grande pour le backtracking simple
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(3)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(round(4.26 * num_variables))]
+
+    for engine in SOLVER_ENGINES:
+        budget = SolverBudget(max_time=1.0)
+        success, _, stats = create_solver(clauses, num_variables, engine, budget=budget).solve()
+        print(f"{engine}: {stats['status']} en {budget.elapsed():.3f}s "
+              f"(raison: {budget.reason}, {stats['backtrack_count']} backtracks)")
+
+    # Annulation depuis un autre thread
+    budget = SolverBudget()
+    threading.Timer(0.5, budget.cancel).start()
+    success, _, stats = create_solver(clauses, num_variables, budget=budget).solve()
+    print(f"\nAnnulation après 0.5s: {stats['status']} ({budget.reason}, "
+          f"{budget.elapsed():.3f}s, {stats['backtrack_count']} backtracks)")
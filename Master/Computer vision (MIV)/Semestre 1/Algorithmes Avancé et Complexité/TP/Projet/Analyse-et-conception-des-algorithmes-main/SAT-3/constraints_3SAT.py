@@ -0,0 +1,440 @@
+"""
+Contraintes natives de cardinalité et de parité pour SAT3Solver
+
+Encodées en CNF, "au plus k parmi n littéraux" demande C(n, k+1) clauses
+(n(n-1)/2 pour k = 1) et une parité sur n variables 2^(n-1) clauses. Ici
+elles restent des contraintes, propagées pendant le backtracking:
+- AtMost(k, literals): compteur de littéraux vrais par contrainte; à k, les
+  littéraux libres sont impliqués faux; au-delà, conflit
+- Xor(literals): système linéaire sur GF(2), lignes en vecteurs de bits
+  (entiers Python), maintenu sous forme de Gauss-Jordan par rapport aux
+  variables libres (chaque ligne a un pivot libre absent des autres lignes).
+  Affecter le pivot d'une ligne lui en fait choisir un autre, éliminé des
+  autres lignes; une ligne sans variable libre est vérifiée (0 = 1: conflit)
+  et une ligne réduite à son pivot l'implique. Un système ainsi réduit est
+  toujours satisfiable: l'incohérence est détectée dès qu'elle existe, même
+  quand aucune contrainte n'est entièrement affectée.
+Chaque affectation garde les lignes modifiées pour être annulée en O(lignes).
+
+Les moteurs sans propagateurs natifs (CDCL, recherche locale, prétraitement)
+reçoivent un encodage linéaire avec variables auxiliaires (compteur
+séquentiel, chaîne de XOR à 3 variables), retirées du modèle.
+
+DIMACS étendu: lignes "x1 -2 3 0" (XOR des littéraux vrai), voir
+dimacs_reader.read_dimacs_xcnf.
+"""
+
+
+class AtMost:
+    """
+    Au plus k des littéraux sont vrais
+
+    Args:
+        k: nombre maximal de littéraux vrais
+        literals: littéraux (entiers signés)
+    """
+
+    def __init__(self, k, literals):
+        self.k = k
+        self.literals = list(literals)
+
+    def __repr__(self):
+        return f"AtMost({self.k}, {self.literals})"
+
+    def variables(self):
+        return {abs(literal) for literal in self.literals}
+
+    def is_satisfied(self, assignment):
+        """Vrai si l'affectation {variable: valeur} respecte la contrainte"""
+        return sum(assignment.get(abs(l), False) == (l > 0) for l in self.literals) <= self.k
+
+    def direct_cnf_size(self):
+        """Nombre de clauses de l'encodage CNF sans variable auxiliaire: C(n, k+1)"""
+        from math import comb
+        return comb(len(self.literals), self.k + 1) if self.k >= 0 else 1
+
+    def to_cnf(self, next_var):
+        """
+        Encodage par compteur séquentiel (Sinz 2005): O(n·k) clauses,
+        variables auxiliaires s[i][j] = "au moins j vrais parmi les i+1 premiers"
+
+        Args:
+            next_var: première variable auxiliaire disponible
+
+        Returns:
+            tuple: (clauses, prochaine variable libre)
+        """
+        literals, k = self.literals, self.k
+        if k < 0:
+            return [[next_var], [-next_var]], next_var + 1
+        if k >= len(literals):
+            return [], next_var
+        if k == 0:
+            return [[-literal] for literal in literals], next_var
+
+        n = len(literals)
+        s = [[next_var + i * k + j for j in range(k)] for i in range(n - 1)]
+        next_var += (n - 1) * k
+        clauses = [[-literals[0], s[0][0]]]
+        clauses += [[-s[0][j]] for j in range(1, k)]
+        for i in range(1, n - 1):
+            clauses.append([-literals[i], s[i][0]])
+            clauses.append([-s[i - 1][0], s[i][0]])
+            for j in range(1, k):
+                clauses.append([-literals[i], -s[i - 1][j - 1], s[i][j]])
+                clauses.append([-s[i - 1][j], s[i][j]])
+            clauses.append([-literals[i], -s[i - 1][k - 1]])
+        clauses.append([-literals[n - 1], -s[n - 2][k - 1]])
+        return clauses, next_var
+
+
+class Xor:
+    """
+    XOR des littéraux égal à parity (un littéral négatif inverse la parité,
+    une variable répétée s'annule)
+
+    Args:
+        literals: littéraux (entiers signés)
+        parity: valeur du XOR (True: nombre impair de littéraux vrais)
+    """
+
+    def __init__(self, literals, parity=True):
+        parity = bool(parity)
+        variables = set()
+        for literal in literals:
+            variables ^= {abs(literal)}
+            if literal < 0:
+                parity = not parity
+        self.variables_list = sorted(variables)
+        self.parity = parity
+
+    def __repr__(self):
+        return f"Xor({self.variables_list}, parity={self.parity})"
+
+    def variables(self):
+        return set(self.variables_list)
+
+    def is_satisfied(self, assignment):
+        return sum(assignment.get(var, False) for var in self.variables_list) % 2 == self.parity
+
+    def direct_cnf_size(self):
+        """Nombre de clauses de l'encodage CNF sans variable auxiliaire: 2^(n-1)"""
+        return 1 << max(len(self.variables_list) - 1, 0)
+
+    def to_cnf(self, next_var):
+        """
+        Chaîne de XOR: deux variables remplacées par t = a XOR b (4 clauses)
+        jusqu'à en garder 3 au plus (≤ 4 clauses)
+
+        Returns:
+            tuple: (clauses, prochaine variable libre)
+        """
+        variables = list(self.variables_list)
+        if not variables:
+            return ([[next_var], [-next_var]], next_var + 1) if self.parity else ([], next_var)
+        clauses = []
+        while len(variables) > 3:
+            a, b = variables.pop(), variables.pop()
+            t = next_var
+            next_var += 1
+            clauses += _parity_clauses([a, b, t], False)
+            variables.append(t)
+        return clauses + _parity_clauses(variables, self.parity), next_var
+
+
+def _parity_clauses(variables, parity):
+    """Clauses interdisant chaque affectation de mauvaise parité (2^(n-1) clauses)"""
+    clauses = []
+    n = len(variables)
+    for bits in range(1 << n):
+        if bin(bits).count('1') % 2 != parity:
+            # Affectation (bit i = variable i vraie) à exclure
+            clauses.append([-var if bits >> i & 1 else var for i, var in enumerate(variables)])
+    return clauses
+
+
+def constraint_variables(constraints):
+    """Plus grande variable apparaissant dans les contraintes (0 si aucune)"""
+    return max((var for c in constraints for var in c.variables()), default=0)
+
+
+def constraints_to_cnf(constraints, num_variables):
+    """
+    Returns:
+        tuple: (clauses, nombre total de variables, auxiliaires comprises)
+    """
+    next_var = max(num_variables, constraint_variables(constraints)) + 1
+    clauses = []
+    for constraint in constraints:
+        encoded, next_var = constraint.to_cnf(next_var)
+        clauses += encoded
+    return clauses, next_var - 1
+
+
+def check_constraints(constraints, assignment):
+    """Contraintes violées par une affectation complète {variable: valeur}"""
+    return [c for c in constraints if not c.is_satisfied(assignment)]
+
+
+def _mask_variables(mask):
+    """Variables (bits à 1) d'un vecteur de bits"""
+    variables = []
+    while mask:
+        low = mask & -mask
+        variables.append(low.bit_length() - 1)
+        mask ^= low
+    return variables
+
+
+class ConstraintPropagator:
+    """
+    État des contraintes natives pendant la recherche
+
+    SAT3Solver appelle assign() / unassign() avec chaque affectation, dans un
+    ordre de pile. Attributs lus par le solveur:
+        conflict: nombre de contraintes violées (0: aucune)
+        conflict_literals: littéraux de la dernière contrainte violée
+        pending: littéraux impliqués depuis la dernière lecture
+    """
+
+    def __init__(self, constraints, num_variables):
+        self.num_variables = max(num_variables, constraint_variables(constraints))
+        self.cardinality = []
+        self.xors = []
+        for constraint in constraints:
+            if isinstance(constraint, AtMost):
+                self.cardinality.append(constraint)
+            elif isinstance(constraint, Xor):
+                self.xors.append(constraint)
+            else:
+                raise TypeError(f"Contrainte inconnue: {constraint!r} (AtMost ou Xor)")
+
+        # Index des occurrences des contraintes de cardinalité
+        self.occurrences = {}
+        for i, constraint in enumerate(self.cardinality):
+            for literal in constraint.literals:
+                self.occurrences.setdefault(abs(literal), []).append((i, literal > 0))
+        self.xor_variables = set()
+        for constraint in self.xors:
+            self.xor_variables.update(constraint.variables_list)
+
+        self.reset({})
+
+    def reset(self, assignment):
+        """Repart de l'affectation donnée (hypothèses fixées avant la recherche)"""
+        self.values = {}
+        self.undo = {}
+        self.pending = []
+        self.conflict = 0
+        self.conflict_literals = []
+
+        self.true_count = [0] * len(self.cardinality)
+        for constraint in self.cardinality:
+            if constraint.k < 0:
+                self.conflict += 1
+                self.conflict_literals = constraint.literals
+            elif constraint.k == 0:
+                self.pending += [-literal for literal in constraint.literals]
+
+        # Forme de Gauss-Jordan du système de parités: ligne = (vecteur, parité, pivot)
+        self.masks, self.parities, self.pivots = [], [], []
+        for constraint in self.xors:
+            mask = sum(1 << var for var in constraint.variables_list)
+            parity = int(constraint.parity)
+            for r, pivot in enumerate(self.pivots):
+                if mask >> pivot & 1:
+                    mask ^= self.masks[r]
+                    parity ^= self.parities[r]
+            if mask == 0:
+                if parity:
+                    # Parités contradictoires (0 = 1)
+                    self.conflict += 1
+                    self.conflict_literals = list(constraint.variables_list)
+                continue
+            pivot_bit = mask & -mask
+            for r in range(len(self.masks)):
+                if self.masks[r] & pivot_bit:
+                    self.masks[r] ^= mask
+                    self.parities[r] ^= parity
+            self.masks.append(mask)
+            self.parities.append(parity)
+            self.pivots.append(pivot_bit.bit_length() - 1)
+        for r, mask in enumerate(self.masks):
+            if mask & (mask - 1) == 0:
+                self.pending.append(self.pivots[r] if self.parities[r] else -self.pivots[r])
+        self.assigned_mask = 0
+        self.true_mask = 0
+
+        for var, value in assignment.items():
+            self.assign(var, value)
+
+    def assign(self, var, value):
+        self.values[var] = value
+        for i, positive in self.occurrences.get(var, ()):
+            if positive != value:
+                continue
+            count = self.true_count[i] + 1
+            self.true_count[i] = count
+            constraint = self.cardinality[i]
+            if count == constraint.k + 1:
+                self.conflict += 1
+                self.conflict_literals = constraint.literals
+            elif count == constraint.k:
+                # Contrainte saturée: les littéraux libres doivent être faux
+                values = self.values
+                self.pending += [-l for l in constraint.literals if abs(l) not in values]
+        if var in self.xor_variables:
+            self.undo[var] = self._assign_xor(var, value)
+
+    def unassign(self, var):
+        value = self.values.pop(var)
+        for i, positive in self.occurrences.get(var, ()):
+            if positive == value:
+                if self.true_count[i] == self.cardinality[i].k + 1:
+                    self.conflict -= 1
+                self.true_count[i] -= 1
+        saved = self.undo.pop(var, None)
+        if saved is not None:
+            rows, violated = saved
+            for r, mask, parity, pivot in reversed(rows):
+                self.masks[r] = mask
+                self.parities[r] = parity
+                self.pivots[r] = pivot
+            bit = 1 << var
+            self.assigned_mask &= ~bit
+            self.true_mask &= ~bit
+            self.conflict -= violated
+
+    def _known_parity(self, mask):
+        """Parité des variables affectées à vrai de la ligne"""
+        return bin(mask & self.true_mask).count('1') & 1
+
+    def _assign_xor(self, var, value):
+        """
+        Substitue var dans le système de parités
+
+        Returns:
+            tuple: (lignes modifiées avant modification, conflit ajouté 0/1)
+        """
+        bit = 1 << var
+        self.assigned_mask |= bit
+        if value:
+            self.true_mask |= bit
+        masks, parities, pivots = self.masks, self.parities, self.pivots
+
+        saved = []
+        touched = []
+        pivot_row = None
+        for r in range(len(masks)):
+            if pivots[r] and masks[r] & bit:
+                if pivots[r] == var:
+                    pivot_row = r
+                else:
+                    touched.append(r)
+
+        violated = 0
+        if pivot_row is not None:
+            r = pivot_row
+            saved.append((r, masks[r], parities[r], pivots[r]))
+            free = masks[r] & ~self.assigned_mask
+            if free == 0:
+                # Ligne entièrement affectée: vérifier sa parité
+                pivots[r] = 0
+                if self._known_parity(masks[r]) != parities[r]:
+                    violated = 1
+                    self.conflict += 1
+                    self.conflict_literals = _mask_variables(masks[r])
+            else:
+                # Nouveau pivot libre, éliminé des autres lignes
+                pivot_bit = free & -free
+                pivots[r] = pivot_bit.bit_length() - 1
+                for j in range(len(masks)):
+                    if j != r and pivots[j] and masks[j] & pivot_bit:
+                        saved.append((j, masks[j], parities[j], pivots[j]))
+                        masks[j] ^= masks[r]
+                        parities[j] ^= parities[r]
+                        touched.append(j)
+                touched.append(r)
+
+        # Lignes dont seul le pivot reste libre: il est impliqué
+        for r in touched:
+            free = masks[r] & ~self.assigned_mask
+            if free & (free - 1) == 0:
+                pivot = pivots[r]
+                self.pending.append(pivot if parities[r] ^ self._known_parity(masks[r]) else -pivot)
+        return saved, violated
+
+
+class EncodedSolver:
+    """
+    Moteurs sans propagateurs natifs: les contraintes sont ajoutées en CNF
+    (to_cnf) et les variables auxiliaires retirées du modèle
+    """
+
+    def __init__(self, clauses, num_variables, constraints, engine='backtracking', heuristic='first',
+                 preprocess=False, metrics=None, budget=None):
+        from solve_3SAT import create_solver
+
+        extra, total = constraints_to_cnf(constraints, num_variables)
+        self.num_variables = max(num_variables, constraint_variables(constraints))
+        self.encoded_clauses = len(extra)
+        self.solver = create_solver(list(clauses) + extra, total, engine, heuristic, preprocess,
+                                    metrics=metrics, budget=budget)
+
+    def solve(self):
+        success, assignment, stats = self.solver.solve()
+        if assignment is not None:
+            assignment = {var: value for var, value in assignment.items() if var <= self.num_variables}
+        stats['encoded_clauses'] = self.encoded_clauses
+        return success, assignment, stats
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from budget_3SAT import SolverBudget
+    from solve_3SAT import SAT3Solver, create_solver
+    # Mêmes classes que celles importées par solve_3SAT (pas celles de __main__)
+    from constraints_3SAT import AtMost, Xor, check_constraints, constraints_to_cnf
+
+    print("=== Contraintes natives AtMost / Xor ===\n")
+
+    # Système de parités aléatoire (XOR de 12 variables) + clauses 3-SAT,
+    # avec une affectation plantée pour garantir une solution
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    rng = random.Random(4)
+    planted = {var: rng.random() < 0.5 for var in range(1, num_variables + 1)}
+    constraints = []
+    for _ in range(num_variables // 2):
+        literals = rng.sample(range(1, num_variables + 1), 12)
+        constraints.append(Xor(literals, sum(planted[var] for var in literals) % 2 == 1))
+    clauses = []
+    while len(clauses) < 2 * num_variables:
+        clause = [var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+        if any(planted[abs(l)] == (l > 0) for l in clause):
+            clauses.append(clause)
+    # Au plus 3 variables vraies parmi 10 (compatible avec planted)
+    true_vars = [var for var in range(1, num_variables + 1) if planted[var]][:3]
+    false_vars = [var for var in range(1, num_variables + 1) if not planted[var]][:7]
+    constraints.append(AtMost(3, true_vars + false_vars))
+
+    direct = sum(c.direct_cnf_size() for c in constraints)
+    encoded, total = constraints_to_cnf(constraints, num_variables)
+    print(f"Instance: {num_variables} variables, {len(clauses)} clauses, {len(constraints)} contraintes")
+    print(f"  CNF directe: {direct} clauses; encodage linéaire: {len(encoded)} clauses, "
+          f"{total - num_variables} variables auxiliaires\n")
+
+    start = time.time()
+    success, assignment, stats = SAT3Solver(clauses, num_variables, constraints=constraints).solve()
+    print(f"Natif (backtracking): {stats['status']} en {time.time() - start:.3f}s, "
+          f"{stats['backtrack_count']} backtracks, {stats['constraint_propagations']} implications, "
+          f"contraintes vérifiées: {not check_constraints(constraints, assignment)}")
+
+    # Même instance encodée en CNF, limitée à 10s
+    start = time.time()
+    success, assignment, stats = create_solver(clauses, num_variables, 'cdcl', constraints=constraints,
+                                               budget=SolverBudget(max_time=10)).solve()
+    print(f"Encodé (CDCL): {stats['status']} en {time.time() - start:.3f}s"
+          + (f", contraintes vérifiées: {not check_constraints(constraints, assignment)}" if success else ""))
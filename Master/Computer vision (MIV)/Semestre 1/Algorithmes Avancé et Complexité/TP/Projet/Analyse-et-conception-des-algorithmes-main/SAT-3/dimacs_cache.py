@@ -0,0 +1,180 @@
+"""
+Cache binaire des instances DIMACS déjà analysées
+Les tableaux CSR (literals, offsets) sont stockés au format .npy, indexés
+par le SHA-1 du contenu du fichier source, et rechargés en mémoire projetée
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from dimacs_reader import read_dimacs_csr, read_dimacs_cnf, csr_to_clauses
+
+# Dossier du cache et taille maximale (éviction LRU au-delà)
+CACHE_DIR = ".dimacs_cache"
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Fichiers d'une entrée: <clé>.literals.npy, <clé>.offsets.npy, <clé>.info.npy
+ENTRY_PARTS = ('literals', 'offsets', 'info')
+# Version de l'analyse, ajoutée au SHA-1 dans la clé: à incrémenter quand la
+# lecture change, pour ne plus servir les entrées écrites par l'ancienne
+# (la version 1 enregistrait fusionnées les clauses sans terminateur 0)
+CACHE_VERSION = 2
+
+
+def file_sha1(filename, chunk_size=1 << 20):
+    """
+    Calcule le SHA-1 du contenu d'un fichier (lu par blocs)
+    """
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _entry_path(cache_dir, key, part):
+    return os.path.join(cache_dir, f"{key}.{part}.npy")
+
+
+def load_dimacs_cached(filename, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """
+    Lit une instance DIMACS en passant par le cache
+
+    Au premier appel le fichier est analysé (read_dimacs_csr, ou la lecture
+    tolérante de read_dimacs_cnf s'il est incohérent avec son en-tête) et les
+    tableaux sont enregistrés; les appels suivants sur un contenu identique
+    ne font que projeter les .npy en mémoire (np.load(mmap_mode='r')).
+
+    Args:
+        filename: chemin du fichier .cnf (éventuellement compressé)
+        cache_dir: dossier du cache
+        max_bytes: taille maximale du cache (None: pas d'éviction)
+
+    Returns:
+        tuple: (literals, offsets, num_variables) comme read_dimacs_csr
+    """
+    key = f"{file_sha1(filename)}-v{CACHE_VERSION}"
+    paths = [_entry_path(cache_dir, key, part) for part in ENTRY_PARTS]
+
+    if all(os.path.exists(path) for path in paths):
+        try:
+            literals, offsets, info = (np.load(path, mmap_mode='r') for path in paths)
+            # Marquer l'entrée comme récemment utilisée (ordre LRU)
+            for path in paths:
+                os.utime(path)
+            return literals, offsets, int(info[0])
+        except (OSError, ValueError):
+            pass  # Entrée corrompue: elle est recalculée ci-dessous
+
+    try:
+        # Validé contre l'en-tête avant d'être enregistré: une lecture fausse
+        # serait sinon servie par le cache à chaque chargement
+        literals, offsets, num_variables = read_dimacs_csr(filename)
+    except ValueError:
+        # Fichier mal formé ou incohérent avec l'en-tête: lecture tolérante
+        # (une clause par ligne) puis conversion en CSR
+        clauses, num_variables = read_dimacs_cnf(filename)
+        literals = np.array([lit for clause in clauses for lit in clause], dtype=np.int32)
+        offsets = np.zeros(len(clauses) + 1, dtype=np.int64)
+        np.cumsum([len(clause) for clause in clauses], out=offsets[1:])
+
+    os.makedirs(cache_dir, exist_ok=True)
+    arrays = (literals, offsets, np.array([num_variables], dtype=np.int64))
+    for path, array in zip(paths, arrays):
+        # Écriture atomique: plusieurs processus peuvent partager le cache
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    if max_bytes is not None:
+        evict_cache(cache_dir, max_bytes)
+
+    return literals, offsets, num_variables
+
+
+def read_dimacs_cnf_cached(filename, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """
+    Équivalent de read_dimacs_cnf passant par le cache
+
+    Returns:
+        tuple: (clauses, num_variables) avec clauses en listes d'entiers
+    """
+    literals, offsets, num_variables = load_dimacs_cached(filename, cache_dir, max_bytes)
+    return csr_to_clauses(literals, offsets), num_variables
+
+
+def cache_entries(cache_dir=CACHE_DIR):
+    """
+    Liste les entrées du cache
+
+    Returns:
+        list: [(clé, taille en octets, dernière utilisation)], de la plus ancienne à la plus récente
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    entries = {}
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.npy'):
+            continue
+        key = name.split('.', 1)[0]
+        stat = os.stat(os.path.join(cache_dir, name))
+        size, last_used = entries.get(key, (0, 0.0))
+        entries[key] = (size + stat.st_size, max(last_used, stat.st_mtime))
+
+    return sorted(((key, size, last_used) for key, (size, last_used) in entries.items()),
+                  key=lambda entry: entry[2])
+
+
+def evict_cache(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """
+    Supprime les entrées les moins récemment utilisées jusqu'à ce que
+    la taille totale du cache soit inférieure à max_bytes
+
+    Returns:
+        int: nombre d'entrées supprimées
+    """
+    entries = cache_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+
+    for key, size, _ in entries:
+        if total <= max_bytes:
+            break
+        for part in ENTRY_PARTS:
+            try:
+                os.remove(_entry_path(cache_dir, key, part))
+            except FileNotFoundError:
+                pass
+        total -= size
+        removed += 1
+
+    return removed
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Vide entièrement le cache"""
+    return evict_cache(cache_dir, 0)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python dimacs_cache.py <fichier.cnf> | --clear")
+        sys.exit(1)
+
+    if sys.argv[1] == "--clear":
+        print(f"✓ {clear_cache()} entrée(s) supprimée(s) de '{CACHE_DIR}/'")
+    else:
+        for attempt in ("Lecture 1", "Lecture 2"):
+            start = time.time()
+            literals, offsets, num_vars = load_dimacs_cached(sys.argv[1])
+            elapsed = time.time() - start
+            print(f"{attempt}: {num_vars} variables, {len(offsets) - 1} clauses en {elapsed:.4f}s")
+
+        total = sum(size for _, size, _ in cache_entries())
+        print(f"Cache: {len(cache_entries())} entrée(s), {total / 1024:.1f} Ko")
@@ -1,258 +1,597 @@
-"""
-Lecteur et écrivain de fichiers au format DIMACS CNF
-Format standard utilisé par SATLIB et les compétitions SAT
-"""
-def read_dimacs_cnf(filename):
-    """
-    Lit un fichier SATLIB au format DIMACS CNF
-    
-    Format DIMACS :
-    c Commentaire (ligne ignorée)
-    c Autre commentaire
-    p cnf <nb_variables> <nb_clauses>
-    1 -2 3 0
-    -1 2 -3 0
-    1 2 3 0
-    
-    Chaque clause se termine par 0
-    
-    Args:
-        filename: chemin du fichier .cnf
-    
-    Returns:
-        tuple: (clauses, num_variables)
-            clauses: liste de listes d'entiers
-            num_variables: nombre de variables
-    """
-    clauses = []
-    num_variables = 0
-    num_clauses = 0
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Ignorer les lignes vides
-            if not line:
-                continue
-            
-            # Ignorer les commentaires
-            if line.startswith('c'):
-                continue
-            
-            # Ligne de paramètres p cnf <vars> <clauses>
-            if line.startswith('p'):
-                parts = line.split()
-                if len(parts) >= 4 and parts[1] == 'cnf':
-                    num_variables = int(parts[2])
-                    num_clauses = int(parts[3])
-                continue
-            
-            # Ligne de clause
-            try:
-                literals = list(map(int, line.split()))
-                
-                # Retirer le 0 final (terminateur de clause en DIMACS)
-                if literals and literals[-1] == 0:
-                    literals = literals[:-1]
-                
-                # Ajouter la clause si elle n'est pas vide
-                if literals:
-                    clauses.append(literals)
-                    
-            except ValueError:
-                # Ignorer les lignes mal formées
-                continue
-    
-    # Si num_variables n'a pas été spécifié, le déduire des clauses
-    if num_variables == 0 and clauses:
-        max_var = max(abs(lit) for clause in clauses for lit in clause)
-        num_variables = max_var
-    
-    return clauses, num_variables
-
-
-def write_dimacs_cnf(clauses, num_variables, filename, comments=None):
-    """
-    Écrit une instance SAT/3-SAT au format DIMACS CNF
-    
-    Args:
-        clauses: liste de clauses
-        num_variables: nombre de variables
-        filename: nom du fichier de sortie
-        comments: liste de commentaires optionnels
-    """
-    with open(filename, 'w') as f:
-        # Commentaires
-        if comments:
-            for comment in comments:
-                f.write(f"c {comment}\n")
-        else:
-            f.write(f"c Instance SAT générée\n")
-        
-        f.write(f"c Nombre de variables: {num_variables}\n")
-        f.write(f"c Nombre de clauses: {len(clauses)}\n")
-        
-        # Ligne de paramètres
-        f.write(f"p cnf {num_variables} {len(clauses)}\n")
-        
-        # Clauses
-        for clause in clauses:
-            clause_str = ' '.join(map(str, clause))
-            f.write(f"{clause_str} 0\n")
-
-
-def read_3sat_dimacs(filename):
-    """
-    Lit un fichier DIMACS et vérifie que c'est du 3-SAT
-    (toutes les clauses ont exactement 3 littéraux)
-    
-    Returns:
-        tuple: (clauses, num_variables, is_3sat)
-    """
-    clauses, num_variables = read_dimacs_cnf(filename)
-    
-    # Vérifier si c'est du 3-SAT strict
-    is_3sat = all(len(clause) == 3 for clause in clauses)
-    
-    if not is_3sat:
-        # Filtrer pour ne garder que les clauses de taille 3
-        clauses_3sat = [c for c in clauses if len(c) == 3]
-        print(f"⚠️  Attention: {len(clauses) - len(clauses_3sat)} clauses ignorées (pas exactement 3 littéraux)")
-        clauses = clauses_3sat
-    
-    return clauses, num_variables, is_3sat
-
-
-def convert_simple_to_dimacs(input_file, output_file):
-    """
-    Convertit un fichier au format simple vers DIMACS
-    
-    Format simple:
-    3
-    3
-    1 -2 3
-    -1 2 -3
-    1 2 3
-    
-    Format DIMACS:
-    p cnf 3 3
-    1 -2 3 0
-    -1 2 -3 0
-    1 2 3 0
-    """
-    with open(input_file, 'r') as f:
-        lines = f.readlines()
-    
-    num_variables = int(lines[0].strip())
-    num_clauses = int(lines[1].strip())
-    
-    clauses = []
-    for i in range(2, 2 + num_clauses):
-        literals = list(map(int, lines[i].strip().split()))
-        clauses.append(literals)
-    
-    write_dimacs_cnf(clauses, num_variables, output_file)
-
-
-def print_dimacs_info(filename):
-    """
-    Affiche les informations d'un fichier DIMACS
-    """
-    try:
-        clauses, num_vars = read_dimacs_cnf(filename)
-        
-        print(f"\n{'='*60}")
-        print(f"Informations du fichier: {filename}")
-        print('='*60)
-        print(f"Variables: {num_vars}")
-        print(f"Clauses: {len(clauses)}")
-        
-        # Statistiques sur les tailles de clauses
-        clause_sizes = {}
-        for clause in clauses:
-            size = len(clause)
-            clause_sizes[size] = clause_sizes.get(size, 0) + 1
-        
-        print(f"\nDistribution des tailles de clauses:")
-        for size in sorted(clause_sizes.keys()):
-            count = clause_sizes[size]
-            print(f"  Taille {size}: {count} clauses ({count/len(clauses)*100:.1f}%)")
-        
-        # Vérifier si c'est du 3-SAT
-        is_3sat = all(len(c) == 3 for c in clauses)
-        print(f"\n3-SAT strict: {'✓ OUI' if is_3sat else '✗ NON'}")
-        
-        # Afficher quelques clauses
-        print(f"\nPremières clauses:")
-        for i, clause in enumerate(clauses[:5], 1):
-            print(f"  C{i}: {clause}")
-        
-        if len(clauses) > 5:
-            print(f"  ... ({len(clauses) - 5} clauses supplémentaires)")
-        
-        print('='*60 + '\n')
-        
-    except FileNotFoundError:
-        print(f"⚠️  Erreur: Fichier '{filename}' non trouvé")
-    except Exception as e:
-        print(f"⚠️  Erreur lors de la lecture: {e}")
-
-
-if __name__ == "__main__":
-    import sys
-    
-    print("="*60)
-    print("LECTEUR/ÉCRIVAIN DIMACS CNF")
-    print("="*60)
-    
-    # Test 1: Créer un fichier DIMACS exemple
-    print("\n1. Création d'un fichier DIMACS exemple...")
-    
-    test_clauses = [
-        [1, -2, 3],
-        [-1, 2, -3],
-        [1, 2, 3]
-    ]
-    
-    test_file = "example_3sat.cnf"
-    comments = [
-        "Exemple de fichier 3-SAT",
-        "F = (x1 v -x2 v x3) ^ (-x1 v x2 v -x3) ^ (x1 v x2 v x3)"
-    ]
-    
-    write_dimacs_cnf(test_clauses, 3, test_file, comments)
-    print(f"✓ Fichier créé: {test_file}")
-    
-    # Test 2: Lire le fichier créé
-    print("\n2. Lecture du fichier créé...")
-    clauses, num_vars = read_dimacs_cnf(test_file)
-    print(f"✓ Lecture réussie")
-    print(f"  Variables: {num_vars}")
-    print(f"  Clauses: {len(clauses)}")
-    
-    # Test 3: Afficher les informations détaillées
-    print("\n3. Informations détaillées:")
-    print_dimacs_info(test_file)
-    
-    # Test 4: Vérification 3-SAT
-    print("4. Vérification 3-SAT...")
-    clauses_3sat, num_vars_3sat, is_3sat = read_3sat_dimacs(test_file)
-    if is_3sat:
-        print("✓ Le fichier contient une instance 3-SAT valide")
-    else:
-        print("⚠️  Le fichier contient des clauses qui ne sont pas du 3-SAT")
-    
-    # Instructions pour utiliser avec d'autres fichiers
-    if len(sys.argv) > 1:
-        print("\n5. Analyse du fichier fourni:")
-        print_dimacs_info(sys.argv[1])
-    else:
-        print("\n" + "="*60)
-        print("UTILISATION:")
-        print("="*60)
-        print("  python dimacs_reader.py <fichier.cnf>")
-        print("\nExemple:")
-        print("  python dimacs_reader.py satlib_instances/uf20-01.cnf")
-
-        print("="*60)
+"""
+Lecteur et écrivain de fichiers au format DIMACS CNF
+Format standard utilisé par SATLIB et les compétitions SAT
+"""
+import bz2
+import gzip
+import lzma
+import mmap
+import re
+import warnings
+
+import numpy as np
+
+# Compression choisie d'après l'extension (.cnf.gz, .cnf.xz, .cnf.bz2)
+COMPRESSION_CODECS = {'.gz': gzip, '.xz': lzma, '.bz2': bz2}
+CNF_EXTENSIONS = ('.cnf',) + tuple('.cnf' + ext for ext in COMPRESSION_CODECS)
+CHUNK_SIZE = 1 << 20  # Taille des blocs convertis (décompressés ou projetés en mémoire, 1 Mio)
+
+# En-tête "p cnf <vars> <clauses>", lignes de commentaire et marqueur de fin SATLIB
+HEADER_PATTERN = re.compile(rb'^[ \t]*p[ \t]+cnf[ \t]+(\d+)[ \t]+(\d+)[^\n]*$', re.MULTILINE)
+COMMENT_PATTERN = re.compile(rb'^[ \t]*c[^\n]*$', re.MULTILINE)
+END_PATTERN = re.compile(rb'^[ \t]*%', re.MULTILINE)
+# Extension XOR (CryptoMiniSat): "x1 -2 3 0" = XOR des littéraux vrai
+XOR_PATTERN = re.compile(rb'^[ \t]*x([^\n]*)$', re.MULTILINE)
+
+
+def read_dimacs_csr(filename, validate=True):
+    """
+    Lit un fichier DIMACS CNF sous forme compacte (CSR)
+    
+    Le fichier est projeté en mémoire (mmap) et tous les entiers du corps
+    sont convertis en une seule passe NumPy, sans liste Python par clause.
+    Les clauses peuvent s'étendre sur plusieurs lignes (terminateur 0).
+    
+    Args:
+        filename: chemin du fichier .cnf (ou .cnf.gz, .cnf.xz, .cnf.bz2,
+                  décompressé par blocs directement dans l'analyseur)
+        validate: vérifie le nombre de clauses et de variables annoncé
+                  par la ligne "p cnf" (sans en-tête: que la dernière
+                  clause se termine par 0)
+    
+    Returns:
+        tuple: (literals, offsets, num_variables)
+            literals: tableau int32 de tous les littéraux (sans les 0)
+            offsets: tableau int64, la clause i est literals[offsets[i]:offsets[i+1]]
+            num_variables: nombre de variables
+    
+    Raises:
+        ValueError: jeton non entier, ou incohérence avec l'en-tête (si validate)
+    """
+    header, tokens = _read_tokens(filename)
+    literals, offsets = _tokens_to_csr(tokens)
+    max_var = int(np.abs(literals).max()) if len(literals) else 0
+    if header is None:
+        num_variables = max_var
+        if validate and len(tokens) and tokens[-1] != 0:
+            # Sans en-tête, les clauses ne peuvent pas être comptées: une dernière
+            # clause non terminée signale des clauses sans 0 (une par ligne)
+            raise ValueError(f"{filename}: dernière clause sans terminateur 0")
+    else:
+        num_variables, num_clauses = header
+        if validate:
+            if max_var > num_variables:
+                raise ValueError(f"{filename}: variable x{max_var} hors de l'en-tête "
+                                 f"(p cnf {num_variables} {num_clauses})")
+            if len(offsets) - 1 != num_clauses:
+                raise ValueError(f"{filename}: {len(offsets) - 1} clauses lues, "
+                                 f"{num_clauses} annoncées par l'en-tête")
+    
+    return literals, offsets, num_variables
+
+
+def _tokens_to_csr(tokens):
+    """Découpe les entiers du corps en clauses (terminateur 0): (literals, offsets)"""
+    # Les 0 terminent les clauses; un éventuel reste forme une dernière clause
+    is_literal = tokens != 0
+    literals = tokens[is_literal].astype(np.int32)
+    ends = np.flatnonzero(~is_literal)
+    ends = ends - np.arange(len(ends))
+    if len(literals) and (len(ends) == 0 or ends[-1] != len(literals)):
+        ends = np.append(ends, len(literals))
+    offsets = np.concatenate(([0], ends)).astype(np.int64)
+    # Ignorer les clauses vides (comme read_dimacs_cnf)
+    offsets = offsets[np.concatenate(([True], np.diff(offsets) > 0))]
+    return literals, offsets
+
+
+def _codec_for(filename):
+    """Retourne le module de compression associé à l'extension, ou None"""
+    for ext, codec in COMPRESSION_CODECS.items():
+        if str(filename).endswith(ext):
+            return codec
+    return None
+
+
+def open_cnf(filename, mode='r'):
+    """
+    Ouvre un fichier CNF, compressé ou non selon son extension
+    
+    Args:
+        filename: chemin du fichier (.cnf, .cnf.gz, .cnf.xz, .cnf.bz2)
+        mode: 'r', 'w', 'rb' ou 'wb' (les modes texte sont en UTF-8)
+    """
+    codec = _codec_for(filename)
+    if codec is None:
+        return open(filename, mode, encoding=None if 'b' in mode else 'utf-8')
+    if 'b' in mode:
+        return codec.open(filename, mode)
+    return codec.open(filename, mode + 't', encoding='utf-8')
+
+
+def is_cnf_file(filename):
+    """Vrai si le nom de fichier a une extension CNF reconnue"""
+    return str(filename).endswith(CNF_EXTENSIONS)
+
+
+def _parse_tokens(body, filename):
+    """Convertit en bloc tous les entiers d'un corps de clauses"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        if body.isspace():
+            # np.fromstring lit un texte fait de seuls blancs comme [0]
+            return np.zeros(0, dtype=np.int64)
+        try:
+            return np.fromstring(body, dtype=np.int64, sep=' ')
+        except (DeprecationWarning, ValueError):
+            raise ValueError(f"{filename}: jeton non entier dans les clauses")
+
+
+def _read_tokens(filename, xors=None):
+    """
+    Lit les entiers du corps d'un fichier DIMACS, par blocs: décompression
+    en flux si le fichier est compressé, projection mmap sinon
+    
+    Args:
+        xors: liste recevant les lignes "x" (voir _strip_block), ou None
+    
+    Returns:
+        tuple: (header, tokens) en-tête comme _body_bounds, entiers du corps
+    """
+    if _codec_for(filename) is not None:
+        return _read_compressed_tokens(filename, xors)
+    with open(filename, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Fichier vide: mmap refuse une projection de taille 0
+            return None, np.zeros(0, dtype=np.int64)
+        with data:
+            return _read_body_tokens(data, filename, xors)
+
+
+def _strip_block(block, filename, xors=None):
+    """
+    Retire d'un bloc de lignes complètes les commentaires et, si xors n'est
+    pas None, les lignes "x" dont les littéraux (sans le 0 final) sont
+    ajoutés à xors
+    """
+    if COMMENT_PATTERN.search(block):
+        block = COMMENT_PATTERN.sub(b'', block)
+    if xors is not None and XOR_PATTERN.search(block):
+        for line in XOR_PATTERN.findall(block):
+            literals = _parse_tokens(line, filename).tolist()
+            if literals and literals[-1] == 0:
+                literals.pop()
+            xors.append(literals)
+        block = XOR_PATTERN.sub(b'', block)
+    return block
+
+
+def _read_compressed_tokens(filename, xors=None):
+    """
+    Décompresse le fichier par blocs de CHUNK_SIZE et convertit chaque bloc
+    de lignes complètes dès sa lecture, sans fichier intermédiaire
+    
+    Returns:
+        tuple: (header, tokens) en-tête comme _body_bounds, entiers du corps
+    """
+    header = None
+    pieces = []
+    tail = b''
+    with open_cnf(filename, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if chunk:
+                data = tail + chunk
+                cut = data.rfind(b'\n') + 1
+                block, tail = data[:cut], data[cut:]
+            else:
+                block, tail = tail, b''
+            if block:
+                if header is None:
+                    match = HEADER_PATTERN.search(block)
+                    if match:
+                        header = (int(match.group(1)), int(match.group(2)))
+                        block = block[match.end():]
+                end = END_PATTERN.search(block)
+                if end:
+                    block = block[:end.start()]
+                block = _strip_block(block, filename, xors)
+                pieces.append(_parse_tokens(block, filename))
+                if end:
+                    break
+            if not chunk:
+                break
+    tokens = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.int64)
+    return header, tokens
+
+
+def _body_bounds(data):
+    """
+    Repère l'en-tête et le corps d'un fichier DIMACS, sans copie
+    
+    Returns:
+        tuple: (header, start, end)
+            header: (num_variables, num_clauses) ou None si absent
+            start, end: le corps est data[start:end] (avant la fin SATLIB '%')
+    """
+    header = None
+    start = 0
+    match = HEADER_PATTERN.search(data)
+    if match:
+        header = (int(match.group(1)), int(match.group(2)))
+        start = match.end()
+    
+    end = END_PATTERN.search(data, start)
+    return header, start, end.start() if end else len(data)
+
+
+def _read_body_tokens(data, filename, xors=None):
+    """
+    Convertit le corps de data (octets ou projection mmap) par blocs de lignes
+    complètes d'environ CHUNK_SIZE octets
+    
+    np.fromstring n'accepte ni mmap ni memoryview: seul le bloc courant est
+    copié, jamais le corps entier, et les commentaires (et les lignes "x",
+    voir _strip_block) ne sont retirés que des blocs qui en contiennent. Les
+    entiers sont écrits directement dans un tableau dimensionné par leur
+    nombre maximal (un chiffre et un séparateur par entier), dont seules les
+    pages utilisées sont allouées.
+    
+    Returns:
+        tuple: (header, tokens) en-tête comme _body_bounds, entiers du corps
+    """
+    header, start, end = _body_bounds(data)
+    tokens = np.empty((end - start + 1) // 2, dtype=np.int64)
+    count = 0
+    while start < end:
+        stop = min(start + CHUNK_SIZE, end)
+        if stop < end:
+            cut = data.rfind(b'\n', start, stop) + 1
+            if cut <= start:
+                # Ligne plus longue qu'un bloc: aller jusqu'à sa fin
+                cut = data.find(b'\n', stop, end) + 1 or end
+            stop = cut
+        block = _strip_block(data[start:stop], filename, xors)
+        piece = _parse_tokens(block, filename)
+        tokens[count:count + len(piece)] = piece
+        count += len(piece)
+        start = stop
+    return header, tokens[:count]
+
+
+def csr_to_clauses(literals, offsets):
+    """
+    Convertit la forme compacte (literals, offsets) en liste de listes d'entiers
+    """
+    flat = literals.tolist()
+    bounds = offsets.tolist()
+    return [flat[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def read_dimacs_cnf(filename):
+    """
+    Lit un fichier SATLIB au format DIMACS CNF
+    
+    Format DIMACS :
+    c Commentaire (ligne ignorée)
+    c Autre commentaire
+    p cnf <nb_variables> <nb_clauses>
+    1 -2 3 0
+    -1 2 -3 0
+    1 2 3 0
+    
+    Chaque clause se termine par 0
+    
+    Args:
+        filename: chemin du fichier .cnf (ou .cnf.gz, .cnf.xz, .cnf.bz2)
+    
+    Returns:
+        tuple: (clauses, num_variables)
+            clauses: liste de listes d'entiers
+            num_variables: nombre de variables
+    """
+    # Lecture rapide via read_dimacs_csr, convertie en listes
+    try:
+        literals, offsets, num_variables = read_dimacs_csr(filename)
+        return csr_to_clauses(literals, offsets), num_variables
+    except ValueError:
+        # Fichier mal formé ou incohérent avec l'en-tête (par exemple des
+        # clauses sans terminateur 0): lecture ligne par ligne tolérante
+        return _read_dimacs_cnf_lines(filename)
+
+
+def parse_dimacs_cnf(data):
+    """
+    Analyse un texte DIMACS CNF déjà en mémoire (reçu par le réseau, par exemple)
+    
+    Args:
+        data: texte (str) ou octets du fichier
+    
+    Returns:
+        tuple: (clauses, num_variables) comme read_dimacs_cnf
+    
+    Raises:
+        ValueError: jeton non entier dans les clauses
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    header, tokens = _read_body_tokens(data, '<texte DIMACS>')
+    literals, offsets = _tokens_to_csr(tokens)
+    if header is not None:
+        num_variables = header[0]
+    else:
+        num_variables = int(np.abs(literals).max()) if len(literals) else 0
+    return csr_to_clauses(literals, offsets), num_variables
+
+
+def read_dimacs_xcnf(filename):
+    """
+    Lit un fichier DIMACS CNF étendu aux contraintes XOR (format CryptoMiniSat)
+    
+    p cnf 3 2
+    1 -2 0
+    x1 2 -3 0       ← x1 XOR x2 XOR ¬x3 = vrai
+    
+    L'en-tête compte clauses et XOR. Un fichier sans ligne "x" est lu comme
+    par read_dimacs_cnf (xors vide). Les XOR donnent des contraintes natives
+    (constraints_3SAT.Xor) au lieu de 2^(n-1) clauses chacun.
+    Le fichier est lu par blocs comme par read_dimacs_csr: seules les lignes
+    "x" sont copiées à part.
+    
+    Returns:
+        tuple: (clauses, xors, num_variables)
+            xors: liste de listes de littéraux (une par ligne "x")
+    """
+    xors = []
+    header, tokens = _read_tokens(filename, xors)
+    literals, offsets = _tokens_to_csr(tokens)
+    clauses = csr_to_clauses(literals, offsets)
+    max_var = max((abs(l) for literals in clauses + xors for l in literals), default=0)
+    num_variables = max(header[0], max_var) if header else max_var
+    return clauses, xors, num_variables
+
+
+def _read_dimacs_cnf_lines(filename):
+    """
+    Lecture ligne par ligne (une clause par ligne, lignes mal formées ignorées)
+    """
+    clauses = []
+    num_variables = 0
+    num_clauses = 0
+    
+    with open_cnf(filename, 'r') as f:
+        for line in f:
+            line = line.strip()
+            
+            # Ignorer les lignes vides
+            if not line:
+                continue
+            
+            # Ignorer les commentaires
+            if line.startswith('c'):
+                continue
+            
+            # Ligne de paramètres p cnf <vars> <clauses>
+            if line.startswith('p'):
+                parts = line.split()
+                if len(parts) >= 4 and parts[1] == 'cnf':
+                    num_variables = int(parts[2])
+                    num_clauses = int(parts[3])
+                continue
+            
+            # Ligne de clause
+            try:
+                literals = list(map(int, line.split()))
+                
+                # Retirer le 0 final (terminateur de clause en DIMACS)
+                if literals and literals[-1] == 0:
+                    literals = literals[:-1]
+                
+                # Ajouter la clause si elle n'est pas vide
+                if literals:
+                    clauses.append(literals)
+                    
+            except ValueError:
+                # Ignorer les lignes mal formées
+                continue
+    
+    # Si num_variables n'a pas été spécifié, le déduire des clauses
+    if num_variables == 0 and clauses:
+        max_var = max(abs(lit) for clause in clauses for lit in clause)
+        num_variables = max_var
+    
+    return clauses, num_variables
+
+
+def write_dimacs_cnf(clauses, num_variables, filename, comments=None, xors=None):
+    """
+    Écrit une instance SAT/3-SAT au format DIMACS CNF
+    
+    Args:
+        clauses: liste de clauses
+        num_variables: nombre de variables
+        filename: nom du fichier de sortie (compressé si .gz, .xz ou .bz2)
+        comments: liste de commentaires optionnels
+        xors: listes de littéraux écrites en lignes "x" (voir read_dimacs_xcnf)
+    """
+    xors = xors or []
+    with open_cnf(filename, 'w') as f:
+        # Commentaires
+        if comments:
+            for comment in comments:
+                f.write(f"c {comment}\n")
+        else:
+            f.write(f"c Instance SAT générée\n")
+        
+        f.write(f"c Nombre de variables: {num_variables}\n")
+        f.write(f"c Nombre de clauses: {len(clauses)}\n")
+        if xors:
+            f.write(f"c Nombre de XOR: {len(xors)}\n")
+        
+        # Ligne de paramètres (clauses et XOR)
+        f.write(f"p cnf {num_variables} {len(clauses) + len(xors)}\n")
+        
+        # Clauses
+        for clause in clauses:
+            clause_str = ' '.join(map(str, clause))
+            f.write(f"{clause_str} 0\n")
+        for xor in xors:
+            f.write(f"x{' '.join(map(str, xor))} 0\n")
+
+
+def read_3sat_dimacs(filename):
+    """
+    Lit un fichier DIMACS et vérifie que c'est du 3-SAT
+    (toutes les clauses ont exactement 3 littéraux)
+    
+    Returns:
+        tuple: (clauses, num_variables, is_3sat)
+    """
+    clauses, num_variables = read_dimacs_cnf(filename)
+    
+    # Vérifier si c'est du 3-SAT strict
+    is_3sat = all(len(clause) == 3 for clause in clauses)
+    
+    if not is_3sat:
+        # Filtrer pour ne garder que les clauses de taille 3
+        clauses_3sat = [c for c in clauses if len(c) == 3]
+        print(f"⚠️  Attention: {len(clauses) - len(clauses_3sat)} clauses ignorées (pas exactement 3 littéraux)")
+        clauses = clauses_3sat
+    
+    return clauses, num_variables, is_3sat
+
+
+def convert_simple_to_dimacs(input_file, output_file):
+    """
+    Convertit un fichier au format simple vers DIMACS
+    
+    Format simple:
+    3
+    3
+    1 -2 3
+    -1 2 -3
+    1 2 3
+    
+    Format DIMACS:
+    p cnf 3 3
+    1 -2 3 0
+    -1 2 -3 0
+    1 2 3 0
+    """
+    with open_cnf(input_file, 'r') as f:
+        lines = f.readlines()
+    
+    num_variables = int(lines[0].strip())
+    num_clauses = int(lines[1].strip())
+    
+    clauses = []
+    for i in range(2, 2 + num_clauses):
+        literals = list(map(int, lines[i].strip().split()))
+        clauses.append(literals)
+    
+    write_dimacs_cnf(clauses, num_variables, output_file)
+
+
+def print_dimacs_info(filename):
+    """
+    Affiche les informations d'un fichier DIMACS
+    """
+    try:
+        clauses, num_vars = read_dimacs_cnf(filename)
+        
+        print(f"\n{'='*60}")
+        print(f"Informations du fichier: {filename}")
+        print('='*60)
+        print(f"Variables: {num_vars}")
+        print(f"Clauses: {len(clauses)}")
+        
+        # Statistiques sur les tailles de clauses
+        clause_sizes = {}
+        for clause in clauses:
+            size = len(clause)
+            clause_sizes[size] = clause_sizes.get(size, 0) + 1
+        
+        print(f"\nDistribution des tailles de clauses:")
+        for size in sorted(clause_sizes.keys()):
+            count = clause_sizes[size]
+            print(f"  Taille {size}: {count} clauses ({count/len(clauses)*100:.1f}%)")
+        
+        # Vérifier si c'est du 3-SAT
+        is_3sat = all(len(c) == 3 for c in clauses)
+        print(f"\n3-SAT strict: {'✓ OUI' if is_3sat else '✗ NON'}")
+        
+        # Afficher quelques clauses
+        print(f"\nPremières clauses:")
+        for i, clause in enumerate(clauses[:5], 1):
+            print(f"  C{i}: {clause}")
+        
+        if len(clauses) > 5:
+            print(f"  ... ({len(clauses) - 5} clauses supplémentaires)")
+        
+        print('='*60 + '\n')
+        
+    except FileNotFoundError:
+        print(f"⚠️  Erreur: Fichier '{filename}' non trouvé")
+    except Exception as e:
+        print(f"⚠️  Erreur lors de la lecture: {e}")
+
+
+if __name__ == "__main__":
+    import sys
+    
+    print("="*60)
+    print("LECTEUR/ÉCRIVAIN DIMACS CNF")
+    print("="*60)
+    
+    # Test 1: Créer un fichier DIMACS exemple
+    print("\n1. Création d'un fichier DIMACS exemple...")
+    
+    test_clauses = [
+        [1, -2, 3],
+        [-1, 2, -3],
+        [1, 2, 3]
+    ]
+    
+    test_file = "example_3sat.cnf"
+    comments = [
+        "Exemple de fichier 3-SAT",
+        "F = (x1 v -x2 v x3) ^ (-x1 v x2 v -x3) ^ (x1 v x2 v x3)"
+    ]
+    
+    write_dimacs_cnf(test_clauses, 3, test_file, comments)
+    print(f"✓ Fichier créé: {test_file}")
+    
+    # Test 2: Lire le fichier créé
+    print("\n2. Lecture du fichier créé...")
+    clauses, num_vars = read_dimacs_cnf(test_file)
+    print(f"✓ Lecture réussie")
+    print(f"  Variables: {num_vars}")
+    print(f"  Clauses: {len(clauses)}")
+    
+    # Test 3: Afficher les informations détaillées
+    print("\n3. Informations détaillées:")
+    print_dimacs_info(test_file)
+    
+    # Test 4: Vérification 3-SAT
+    print("4. Vérification 3-SAT...")
+    clauses_3sat, num_vars_3sat, is_3sat = read_3sat_dimacs(test_file)
+    if is_3sat:
+        print("✓ Le fichier contient une instance 3-SAT valide")
+    else:
+        print("⚠️  Le fichier contient des clauses qui ne sont pas du 3-SAT")
+    
+    # Instructions pour utiliser avec d'autres fichiers
+    if len(sys.argv) > 1:
+        print("\n5. Analyse du fichier fourni:")
+        print_dimacs_info(sys.argv[1])
+    else:
+        print("\n" + "="*60)
+        print("UTILISATION:")
+        print("="*60)
+        print("  python dimacs_reader.py <fichier.cnf>")
+        print("\nExemple:")
+        print("  python dimacs_reader.py satlib_instances/uf20-01.cnf")
+
+        print("="*60)
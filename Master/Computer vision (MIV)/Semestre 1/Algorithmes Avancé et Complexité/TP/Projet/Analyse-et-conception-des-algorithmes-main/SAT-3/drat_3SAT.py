@@ -0,0 +1,464 @@
+"""
+Preuves DRAT pour les réponses INSATISFIABLE (3-SAT / SAT)
+
+Une preuve DRAT est une suite d'ajouts et de suppressions de clauses se
+terminant par la clause vide. Chaque clause ajoutée doit être RUP
+(l'affectation de sa négation mène à un conflit par propagation unitaire)
+ou RAT par rapport aux clauses présentes à ce moment.
+
+1. DRATWriter: écriture tamponnée, au format binaire (défaut) ou texte
+   - binaire: 'a' (ajout) ou 'd' (suppression), littéraux codés 2*v + (l < 0)
+     en entiers de longueur variable (7 bits par octet), terminés par 0
+   - texte: "1 -2 3 0" et "d 1 -2 3 0"
+2. DRATChecker: vérification arrière (comme drat-trim)
+   - passe avant: rejoue ajouts et suppressions jusqu'à la clause vide
+   - passe arrière: seules les clauses marquées (utilisées par un conflit
+     déjà vérifié) sont vérifiées, les autres sont ignorées (core trimming)
+   - propagation unitaire par littéraux surveillés; seules les clauses
+     actives sont surveillées (retirées/remises à chaque étape)
+   Les clauses d'origine marquées forment un noyau insatisfiable.
+"""
+import os
+import time
+
+# Taille du tampon d'écriture des preuves (octets)
+PROOF_BUFFER_SIZE = 1 << 16
+
+
+class DRATWriter:
+    """
+    Écrit une preuve DRAT au fil de la résolution
+
+    Args:
+        output: chemin du fichier ou fichier binaire ouvert
+        binary: format binaire (plus compact et plus rapide à relire) ou texte
+        buffer_size: taille du tampon avant écriture dans le fichier
+    """
+
+    def __init__(self, output, binary=True, buffer_size=PROOF_BUFFER_SIZE):
+        if isinstance(output, (str, os.PathLike)):
+            self.file = open(output, 'wb')
+            self.owns_file = True
+        else:
+            self.file = output
+            self.owns_file = False
+        self.binary = binary
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.additions = 0
+        self.deletions = 0
+
+    def _write(self, clause, delete):
+        buffer = self.buffer
+        if self.binary:
+            buffer.append(0x64 if delete else 0x61)  # 'd' / 'a'
+            for literal in clause:
+                code = 2 * abs(literal) + (literal < 0)
+                while code > 127:
+                    buffer.append((code & 127) | 128)
+                    code >>= 7
+                buffer.append(code)
+            buffer.append(0)
+        else:
+            line = ' '.join(map(str, clause))
+            buffer += (('d ' if delete else '') + (line + ' 0\n' if line else '0\n')).encode()
+        if len(buffer) >= self.buffer_size:
+            self.file.write(buffer)
+            buffer.clear()
+
+    def add(self, clause):
+        """Ajout d'une clause (lemme)"""
+        self.additions += 1
+        self._write(clause, False)
+
+    def delete(self, clause):
+        """Suppression d'une clause (accélère la vérification)"""
+        self.deletions += 1
+        self._write(clause, True)
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _encode(literal):
+    """Littéral signé -> code 2*v + (l < 0) (codage binaire DRAT et interne)"""
+    return 2 * abs(literal) + (literal < 0)
+
+
+def _read_encoded(filename):
+    """
+    Lit une preuve DRAT (format binaire ou texte détecté automatiquement)
+
+    Returns:
+        list: étapes (suppression?, littéraux codés 2*v + (l < 0))
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    binary = data[:1] == b'a' or any(
+        byte > 127 or (byte < 32 and byte not in (9, 10, 13)) for byte in data[:1024])
+    steps = []
+
+    if binary:
+        # Chaque étape se termine par l'octet 0, qui n'apparaît nulle part ailleurs
+        chunks = data.split(b'\0')
+        if chunks[-1]:
+            raise ValueError("Preuve DRAT binaire tronquée")
+        for chunk in chunks[:-1]:
+            kind = chunk[:1]
+            if kind not in (b'a', b'd'):
+                raise ValueError(f"Preuve DRAT binaire invalide (étape {len(steps) + 1})")
+            body = chunk[1:]
+            if not body or max(body) < 128:
+                codes = list(body)  # Cas courant: un octet par littéral
+            else:
+                codes, code, shift = [], 0, 0
+                for byte in body:
+                    code |= (byte & 127) << shift
+                    shift += 7
+                    if byte < 128:
+                        codes.append(code)
+                        code, shift = 0, 0
+            steps.append((kind == b'd', codes))
+    else:
+        for line in data.decode().splitlines():
+            tokens = line.split()
+            if not tokens or tokens[0] == 'c':
+                continue
+            delete = tokens[0] == 'd'
+            codes = [_encode(int(token)) for token in tokens[delete:]]
+            if codes and codes[-1] == 0:
+                codes.pop()
+            steps.append((delete, codes))
+    return steps
+
+
+def read_drat_proof(filename):
+    """
+    Lit une preuve DRAT (format binaire ou texte détecté automatiquement)
+
+    Returns:
+        list: étapes (suppression?, littéraux)
+    """
+    return [(delete, [-(code >> 1) if code & 1 else code >> 1 for code in codes])
+            for delete, codes in _read_encoded(filename)]
+
+
+class DRATChecker:
+    """
+    Vérificateur arrière de preuves DRAT
+
+    Args:
+        clauses: clauses de la formule (listes d'entiers signés)
+        proof: chemin du fichier de preuve, ou liste d'étapes (suppression?, littéraux)
+
+    Après check(), stats contient le nombre de lemmes vérifiés et ignorés et
+    unsat_core() les clauses d'origine utilisées par la preuve.
+    """
+
+    def __init__(self, clauses, proof):
+        self.clauses = clauses
+        self.proof = proof
+        self.stats = {}
+
+    # ------------------------------------------------------------------
+    # Base de clauses (littéraux codés 2*v + (l < 0), comme CDCLSolver)
+    # ------------------------------------------------------------------
+
+    def _add(self, lits):
+        """Enregistre une clause (littéraux codés), inactive"""
+        lits = list(dict.fromkeys(lits))
+        cid = len(self.db)
+        self.db.append(lits)
+        self.pivot.append(lits[0] if lits else None)
+        self.active.append(False)
+        self.core.append(False)
+        if len(lits) == 1:
+            self.units.append(cid)
+        for lit in lits:
+            while len(self.watches) <= (lit | 1):
+                self.watches.append([])
+        return cid, frozenset(lits)
+
+    def _activate(self, cid):
+        """Rend la clause active et surveille ses deux premiers littéraux"""
+        self.active[cid] = True
+        lits = self.db[cid]
+        if len(lits) > 1:
+            self.watches[lits[0]].append(cid)
+            self.watches[lits[1]].append(cid)
+
+    def _deactivate(self, cid):
+        self.active[cid] = False
+        lits = self.db[cid]
+        if len(lits) > 1:
+            self.watches[lits[0]].remove(cid)
+            self.watches[lits[1]].remove(cid)
+
+    def _propagate(self, trail, qhead):
+        """Propagation unitaire; retourne la clause en conflit ou None"""
+        values = self.values
+        watches = self.watches
+        db = self.db
+        reason = self.reason
+
+        while qhead < len(trail):
+            false_lit = trail[qhead] ^ 1
+            qhead += 1
+            ws = watches[false_lit]
+            i = j = 0
+            n = len(ws)
+            while i < n:
+                ci = ws[i]
+                i += 1
+                ws[j] = ci
+                j += 1
+                c = db[ci]
+                if c[0] == false_lit:
+                    c[0] = c[1]
+                    c[1] = false_lit
+                first = c[0]
+                if values[first] == 1:
+                    continue
+                for k in range(2, len(c)):
+                    lit = c[k]
+                    if values[lit] != -1:
+                        c[1] = lit
+                        c[k] = false_lit
+                        watches[lit].append(ci)
+                        j -= 1
+                        break
+                else:
+                    if values[first] == -1:
+                        while i < n:
+                            ws[j] = ws[i]
+                            j += 1
+                            i += 1
+                        del ws[j:]
+                        return ci
+                    values[first] = 1
+                    values[first ^ 1] = -1
+                    reason[first >> 1] = ci
+                    trail.append(first)
+            del ws[j:]
+        return None
+
+    def _rup(self, lits):
+        """
+        Vérifie que la clause lits est RUP; les clauses ayant servi au
+        conflit sont ajoutées au noyau
+        """
+        values = self.values
+        reason = self.reason
+        trail = []
+        conflict = None
+        tautology = False
+
+        for lit in lits:
+            if values[lit] == 1:
+                tautology = True  # lit et ¬lit dans la clause
+                break
+            if values[lit] == 0:
+                values[lit] = -1
+                values[lit ^ 1] = 1
+                reason[lit >> 1] = None
+                trail.append(lit ^ 1)
+
+        if not tautology:
+            for cid in self.units:
+                if not self.active[cid]:
+                    continue
+                lit = self.db[cid][0]
+                if values[lit] == -1:
+                    conflict = cid
+                    break
+                if values[lit] == 0:
+                    values[lit] = 1
+                    values[lit ^ 1] = -1
+                    reason[lit >> 1] = cid
+                    trail.append(lit)
+            if conflict is None:
+                conflict = self._propagate(trail, 0)
+
+        if conflict is not None:
+            # Remontée des raisons: clauses du conflit marquées
+            seen = self.seen
+            self.core[conflict] = True
+            for q in self.db[conflict]:
+                seen[q >> 1] = True
+            for lit in reversed(trail):
+                var = lit >> 1
+                if seen[var]:
+                    seen[var] = False
+                    cid = reason[var]
+                    if cid is not None:
+                        self.core[cid] = True
+                        for q in self.db[cid]:
+                            if q >> 1 != var:
+                                seen[q >> 1] = True
+            for q in self.db[conflict]:
+                seen[q >> 1] = False
+
+        for lit in trail:
+            values[lit] = 0
+            values[lit ^ 1] = 0
+        return tautology or conflict is not None
+
+    def _rat(self, cid):
+        """Vérification RAT sur le premier littéral (pivot) de la clause cid"""
+        pivot = self.pivot[cid]
+        if pivot is None:
+            return False
+        lemma = self.db[cid]
+        for did, clause in enumerate(self.db):
+            if not self.active[did] or pivot ^ 1 not in clause:
+                continue
+            resolvent = lemma + [lit for lit in clause if lit != pivot ^ 1 and lit not in lemma]
+            if not self._rup(resolvent):
+                return False
+            self.core[did] = True
+        self.stats['rat'] += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Vérification
+    # ------------------------------------------------------------------
+
+    def check(self):
+        """
+        Returns:
+            tuple: (valid, stats)
+                valid: True si la preuve réfute la formule
+                stats: lemmes, vérifiés, ignorés, noyau, temps, message d'erreur
+        """
+        start = time.time()
+        if isinstance(self.proof, (str, os.PathLike)):
+            steps = _read_encoded(self.proof)
+        else:
+            steps = [(delete, [_encode(l) for l in literals]) for delete, literals in self.proof]
+
+        self.db, self.pivot, self.active, self.core = [], [], [], []
+        self.units, self.watches = [], []
+        self.stats = {'lemmas': 0, 'deletions': 0, 'checked': 0, 'skipped': 0,
+                      'rat': 0, 'ignored_deletions': 0, 'core_clauses': 0,
+                      'original_clauses': len(self.clauses), 'error': None}
+
+        # Passe avant: clauses actives jusqu'à la première clause vide
+        index = {}
+        target = None
+        for clause in self.clauses:
+            cid, key = self._add([_encode(l) for l in clause])
+            self._activate(cid)
+            index.setdefault(key, []).append(cid)
+            if not self.db[cid]:
+                target = cid  # Clause vide dans la formule
+        history = []
+        if target is None:
+            for delete, literals in steps:
+                if delete:
+                    ids = index.get(frozenset(literals))
+                    if not ids:
+                        self.stats['ignored_deletions'] += 1
+                        continue
+                    cid = ids.pop()
+                    self._deactivate(cid)
+                    self.stats['deletions'] += 1
+                    history.append((False, cid))
+                    continue
+                cid, key = self._add(literals)
+                self._activate(cid)
+                index.setdefault(key, []).append(cid)
+                self.stats['lemmas'] += 1
+                history.append((True, cid))
+                if not self.db[cid]:
+                    target = cid
+                    break
+            if target is None:
+                # Pas de clause vide: la propagation doit suffire à la fin de la preuve
+                target, _ = self._add([])
+                history.append((True, target))
+
+        num_variables = max((lit >> 1 for lits in self.db for lit in lits), default=0)
+        while len(self.watches) < 2 * num_variables + 2:
+            self.watches.append([])
+        self.values = [0] * (2 * num_variables + 2)
+        self.reason = [None] * (num_variables + 1)
+        self.seen = [False] * (num_variables + 1)
+
+        # Passe arrière: seuls les lemmes du noyau sont vérifiés
+        self.core[target] = True
+        valid = True
+        for added, cid in reversed(history):
+            if not added:
+                self._activate(cid)  # Suppression annulée
+                continue
+            self._deactivate(cid)
+            if not self.core[cid]:
+                self.stats['skipped'] += 1
+                continue
+            self.stats['checked'] += 1
+            if not self._rup(self.db[cid]) and not self._rat(cid):
+                lemma = [(lit >> 1) * (-1 if lit & 1 else 1) for lit in self.db[cid]]
+                self.stats['error'] = f"lemme {lemma} ni RUP ni RAT"
+                valid = False
+                break
+
+        self.stats['core_clauses'] = sum(self.core[:len(self.clauses)])
+        self.stats['time'] = time.time() - start
+        return valid, self.stats
+
+    def unsat_core(self):
+        """Clauses d'origine utilisées par la preuve (après check())"""
+        return [clause for clause, used in zip(self.clauses, self.core) if used]
+
+
+def check_drat_proof(clauses, proof):
+    """Raccourci: DRATChecker(clauses, proof).check()"""
+    return DRATChecker(clauses, proof).check()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import tempfile
+
+    from solve_3SAT import SAT3Solver
+    from solve_3SAT_cdcl import CDCLSolver
+
+    print("=== Preuves DRAT (réponses INSATISFIABLE) ===\n")
+
+    # Instances aléatoires au-delà du seuil (ratio 6): presque toujours insatisfiables
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    num_clauses = 6 * num_variables
+    directory = tempfile.mkdtemp()
+    for seed in range(3):
+        rng = random.Random(seed)
+        clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+                   for _ in range(num_clauses)]
+        for name, solver_class in (('backtracking', SAT3Solver), ('cdcl', CDCLSolver)):
+            path = os.path.join(directory, f"{name}_{seed}.drat")
+            start = time.time()
+            success, _, _ = solver_class(clauses, num_variables, proof=path).solve()
+            solve_time = time.time() - start
+            if success:
+                print(f"  Instance {seed} ({name}): satisfiable, pas de preuve")
+                continue
+            valid, stats = check_drat_proof(clauses, path)
+            print(f"  Instance {seed} ({name}): résolue en {solve_time:.3f}s, preuve "
+                  f"{'✓ valide' if valid else '✗ invalide'} en {stats['time']:.3f}s "
+                  f"({stats['checked']}/{stats['lemmas']} lemmes vérifiés, "
+                  f"noyau {stats['core_clauses']}/{stats['original_clauses']} clauses)")
@@ -0,0 +1,190 @@
+"""
+Générateur vectorisé d'instances k-SAT aléatoires (NumPy)
+
+Les clauses sont tirées par blocs de chunk_size clauses, sans boucle Python
+par clause:
+- k variables distinctes par clause: pour n <= ARGPARTITION_MAX_VARS, les k
+  plus petites clés d'une matrice aléatoire (bloc × n) via argpartition;
+  au-delà (la matrice serait trop grande), tirage avec remise puis nouveau
+  tirage des seules clauses contenant un doublon (probabilité ~ k²/2n)
+- signes aléatoires; avec une solution plantée, les signes des clauses
+  falsifiées par cette affectation sont retirés (rejet), ce qui garde la loi
+  uniforme sur les clauses qu'elle satisfait
+- graine fixe: même instance pour une même graine et un même chunk_size
+
+write_random_dimacs écrit les blocs au fil de l'eau (fichier compressé si
+.gz, .xz ou .bz2): une instance de 10^5 variables au seuil (ratio 4.26) ne
+passe jamais par une liste Python de clauses.
+"""
+import numpy as np
+
+from dimacs_reader import open_cnf
+
+# Clauses tirées par bloc
+CHUNK_CLAUSES = 1 << 16
+# Au-delà, tirage avec remise et rejet des doublons au lieu d'argpartition
+ARGPARTITION_MAX_VARS = 256
+# Nombre maximal de clés aléatoires par appel à argpartition (bloc × n)
+ARGPARTITION_MAX_KEYS = 1 << 22
+
+# Ratio clauses / variables du seuil de satisfiabilité du 3-SAT aléatoire
+PHASE_TRANSITION_RATIO = 4.26
+
+
+def random_assignment(num_variables, seed=None):
+    """Affectation aléatoire {variable: valeur} (par exemple pour planted)"""
+    values = np.random.default_rng(seed).random(num_variables) < 0.5
+    return {var: bool(value) for var, value in enumerate(values.tolist(), 1)}
+
+
+def _planted_values(planted, num_variables):
+    """Affectation plantée en tableau de booléens indexé par variable (indice 0 inutilisé)"""
+    values = np.zeros(num_variables + 1, dtype=bool)
+    if isinstance(planted, dict):
+        for var, value in planted.items():
+            values[var] = value
+    else:
+        planted = np.asarray(planted, dtype=bool)
+        if len(planted) != num_variables:
+            raise ValueError(f"Affectation plantée de taille {len(planted)} "
+                             f"(attendu: {num_variables} valeurs pour x1..x{num_variables})")
+        values[1:] = planted
+    return values
+
+
+def _distinct_variables(rng, num_variables, size, k):
+    """Tableau (size, k) de variables 1..n, distinctes dans chaque ligne"""
+    if num_variables <= ARGPARTITION_MAX_VARS:
+        rows = max(ARGPARTITION_MAX_KEYS // num_variables, 1)
+        parts = []
+        for start in range(0, size, rows):
+            keys = rng.random((min(rows, size - start), num_variables))
+            parts.append(np.argpartition(keys, k - 1, axis=1)[:, :k] + 1)
+        return np.concatenate(parts) if parts else np.empty((0, k), dtype=np.int64)
+
+    variables = rng.integers(1, num_variables + 1, size=(size, k))
+    while True:
+        ordered = np.sort(variables, axis=1)
+        duplicated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if duplicated.size == 0:
+            return variables
+        variables[duplicated] = rng.integers(1, num_variables + 1, size=(duplicated.size, k))
+
+
+def _random_signs(rng, variables, planted_values):
+    """Signes (True = littéral positif), tirés à nouveau pour les clauses falsifiées par planted"""
+    positive = rng.random(variables.shape) < 0.5
+    if planted_values is None:
+        return positive
+    expected = planted_values[variables]  # Signe qui rend le littéral vrai
+    while True:
+        falsified = np.flatnonzero(~(positive == expected).any(axis=1))
+        if falsified.size == 0:
+            return positive
+        positive[falsified] = rng.random((falsified.size, variables.shape[1])) < 0.5
+
+
+def iter_random_clauses(num_variables, num_clauses, k=3, seed=None, planted=None,
+                        chunk_size=CHUNK_CLAUSES):
+    """
+    Tire les clauses par blocs
+
+    Args:
+        num_variables: nombre de variables
+        num_clauses: nombre de clauses
+        k: littéraux par clause (variables distinctes)
+        seed: graine du générateur NumPy
+        planted: affectation ({variable: valeur} ou séquence de n booléens)
+                 satisfaite par toutes les clauses, ou None
+        chunk_size: clauses par bloc
+
+    Yields:
+        np.ndarray: bloc (≤ chunk_size, k) de littéraux signés (int64)
+    """
+    if not 1 <= k <= num_variables:
+        raise ValueError(f"k = {k} littéraux distincts impossible avec {num_variables} variables")
+    rng = np.random.default_rng(seed)
+    planted_values = None if planted is None else _planted_values(planted, num_variables)
+
+    for start in range(0, num_clauses, chunk_size):
+        size = min(chunk_size, num_clauses - start)
+        variables = _distinct_variables(rng, num_variables, size, k)
+        positive = _random_signs(rng, variables, planted_values)
+        yield np.where(positive, variables, -variables)
+
+
+def generate_random_ksat(num_variables, num_clauses, k=3, seed=None, planted=None,
+                         chunk_size=CHUNK_CLAUSES):
+    """
+    Returns:
+        np.ndarray: tableau (num_clauses, k) de littéraux signés
+    """
+    chunks = list(iter_random_clauses(num_variables, num_clauses, k, seed, planted, chunk_size))
+    return np.concatenate(chunks) if chunks else np.empty((0, k), dtype=np.int64)
+
+
+def generate_random_3sat(num_variables, num_clauses, seed=None, planted=None):
+    """
+    Instance 3-SAT aléatoire au format des solveurs (liste de listes d'entiers signés)
+    """
+    return generate_random_ksat(num_variables, num_clauses, 3, seed, planted).tolist()
+
+
+def write_random_dimacs(filename, num_variables, num_clauses, k=3, seed=None, planted=None,
+                        chunk_size=CHUNK_CLAUSES, comments=None):
+    """
+    Écrit une instance aléatoire au format DIMACS CNF, bloc par bloc
+
+    Args:
+        filename: fichier de sortie (compressé si .gz, .xz ou .bz2)
+        comments: lignes de commentaire (en plus des paramètres de génération)
+        (autres arguments: voir iter_random_clauses)
+
+    Returns:
+        int: nombre de clauses écrites
+    """
+    written = 0
+    with open_cnf(filename, 'w') as f:
+        for comment in comments or []:
+            f.write(f"c {comment}\n")
+        f.write(f"c Instance {k}-SAT aléatoire: {num_variables} variables, {num_clauses} clauses "
+                f"(ratio {num_clauses / num_variables:.2f}), graine {seed}, "
+                f"solution plantée: {'oui' if planted is not None else 'non'}\n")
+        f.write(f"p cnf {num_variables} {num_clauses}\n")
+
+        for chunk in iter_random_clauses(num_variables, num_clauses, k, seed, planted, chunk_size):
+            # Lignes "l1 l2 ... lk 0" formatées en un seul appel pour le bloc
+            rows = np.hstack([chunk, np.zeros((len(chunk), 1), dtype=chunk.dtype)])
+            f.write(" ".join(rows.ravel().astype(str)).replace(" 0 ", " 0\n"))
+            f.write("\n")
+            written += len(chunk)
+    return written
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+
+    from verify_3SAT import SAT3Verifier
+
+    print("=== Générateur vectorisé k-SAT ===\n")
+
+    # Solution plantée: toutes les clauses sont satisfaites par l'affectation
+    num_variables = 1000
+    assignment = random_assignment(num_variables, seed=1)
+    clauses = generate_random_3sat(num_variables, round(PHASE_TRANSITION_RATIO * num_variables),
+                                   seed=1, planted=assignment)
+    is_valid, _ = SAT3Verifier(clauses).verify(assignment)
+    print(f"Solution plantée ({num_variables} variables): vérifiée = {is_valid}\n")
+
+    # Balayage du seuil à grande échelle, écrit en flux
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    os.makedirs("generated", exist_ok=True)
+    for ratio in (3.5, PHASE_TRANSITION_RATIO, 5.0):
+        num_clauses = round(ratio * num_variables)
+        filename = os.path.join("generated", f"rand3-{num_variables}-{ratio:.2f}.cnf.gz")
+        start = time.time()
+        write_random_dimacs(filename, num_variables, num_clauses, seed=0)
+        print(f"  {filename}: {num_clauses} clauses en {time.time() - start:.2f}s "
+              f"({os.path.getsize(filename) / 2**20:.1f} Mo)")
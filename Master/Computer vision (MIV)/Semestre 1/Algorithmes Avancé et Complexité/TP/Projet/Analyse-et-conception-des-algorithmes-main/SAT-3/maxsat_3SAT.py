@@ -0,0 +1,438 @@
+"""
+MaxSAT / MaxSAT pondéré par séparation et évaluation (branch-and-bound)
+
+Quand la formule est insatisfiable, on cherche l'affectation qui minimise le
+poids des clauses falsifiées (poids 1 par défaut: maximiser le nombre de
+clauses satisfaites, c'est-à-dire le success_rate de SAT3Verifier). Une
+clause de poids None est dure: elle doit être satisfaite.
+
+- Coût courant (poids des clauses falsifiées) et ensemble des clauses
+  unitaires mis à jour à chaque affectation, comme les compteurs de
+  SAT3Solver (O(occurrences) par nœud)
+- Borne inférieure: coût courant + sous-ensembles inconsistants disjoints
+  trouvés par propagation unitaire simulée à partir des clauses unitaires;
+  en pondéré, le poids minimal du sous-ensemble est retiré de chacune de
+  ses clauses (les restes servent aux sous-ensembles suivants). Le calcul
+  s'arrête dès que la borne atteint la meilleure solution (élagage)
+- Branchement: variable d'une clause unitaire de poids maximal, sinon la
+  variable la plus lourde parmi les clauses encore ouvertes; valeur qui
+  satisfait le plus de poids d'abord
+- Anytime: iter_improvements() produit chaque affectation améliorante;
+  avec budget (SolverBudget), solve() retourne la meilleure trouvée
+"""
+from budget_3SAT import SolverBudget
+
+HARD = None  # Poids d'une clause dure
+
+MAXSAT_STATUSES = ('OPTIMUM', 'UNKNOWN', 'UNSAT')
+
+
+class MaxSATSolver:
+    """
+    Args:
+        clauses: liste de clauses (listes d'entiers signés)
+        num_variables: nombre de variables
+        weights: poids positifs des clauses (défaut: 1 chacune; None = clause dure)
+        budget: SolverBudget (nœuds = nœuds de l'arbre de recherche)
+        initial_assignment: affectation connue (par exemple d'une recherche
+                            locale) donnant la première borne supérieure
+
+    Statistiques disponibles après solve(): voir stats
+    """
+
+    def __init__(self, clauses, num_variables, weights=None, budget=None, initial_assignment=None):
+        self.num_variables = max([num_variables] + [abs(l) for c in clauses for l in c])
+        self.budget = budget
+        self.initial_assignment = initial_assignment
+
+        weights = [1] * len(clauses) if weights is None else list(weights)
+        if len(weights) != len(clauses):
+            raise ValueError(f"{len(weights)} poids pour {len(clauses)} clauses")
+
+        # Nettoyage: littéraux dupliqués retirés, tautologies ignorées (toujours satisfaites)
+        self.clauses = []
+        self.weights = []   # Poids des clauses souples, 0 pour les clauses dures
+        self.hard = []
+        self.fixed_cost = 0  # Clauses vides souples: toujours falsifiées
+        self.fixed_hard = 0
+        for clause, weight in zip(clauses, weights):
+            if weight is not HARD and weight <= 0:
+                raise ValueError(f"Poids non positif {weight} pour la clause {clause}")
+            literals = list(dict.fromkeys(clause))
+            if any(-literal in literals for literal in literals):
+                continue
+            if not literals:
+                if weight is HARD:
+                    self.fixed_hard += 1
+                else:
+                    self.fixed_cost += weight
+                continue
+            self.clauses.append(literals)
+            self.hard.append(weight is HARD)
+            self.weights.append(0 if weight is HARD else weight)
+        self.total_weight = sum(self.weights) + self.fixed_cost
+
+        # Index des occurrences: variable -> [(indice de clause, littéral positif?)]
+        self.occurrences = [[] for _ in range(self.num_variables + 1)]
+        for i, clause in enumerate(self.clauses):
+            for literal in clause:
+                self.occurrences[abs(literal)].append((i, literal > 0))
+
+        # Ordre de branchement par défaut: poids total des occurrences décroissant
+        # (les clauses dures comptent comme la somme des poids souples + 1)
+        hard_weight = sum(self.weights) + 1
+        self.score = [0] * (self.num_variables + 1)
+        for var in range(1, self.num_variables + 1):
+            self.score[var] = sum(hard_weight if self.hard[c] else self.weights[c]
+                                  for c, _ in self.occurrences[var])
+        self.order = sorted(range(1, self.num_variables + 1), key=lambda var: -self.score[var])
+
+        self.best_cost = None
+        self.best_assignment = None
+        self.status = None
+        self.nodes = 0
+        self.improvements = 0
+        self.bound_prunes = 0
+
+    # ------------------------------------------------------------------
+    # Affectations et compteurs
+    # ------------------------------------------------------------------
+
+    def _init_counters(self):
+        num_clauses = len(self.clauses)
+        self.values = [None] * (self.num_variables + 1)
+        self.true_count = [0] * num_clauses
+        self.free_count = [len(clause) for clause in self.clauses]
+        self.cost = self.fixed_cost
+        self.hard_violations = self.fixed_hard
+        self.units = {i for i in range(num_clauses) if self.free_count[i] == 1}
+
+    def _assign(self, var, value):
+        """Affecte var; coût et clauses unitaires mis à jour sur ses seules occurrences"""
+        self.values[var] = value
+        true_count, free_count, units = self.true_count, self.free_count, self.units
+        for c, positive in self.occurrences[var]:
+            free = free_count[c] - 1
+            free_count[c] = free
+            if positive == value:
+                true_count[c] += 1
+                if true_count[c] == 1:
+                    units.discard(c)
+            elif true_count[c] == 0:
+                if free == 0:
+                    units.discard(c)
+                    if self.hard[c]:
+                        self.hard_violations += 1
+                    else:
+                        self.cost += self.weights[c]
+                elif free == 1:
+                    units.add(c)
+
+    def _unassign(self, var):
+        """Opération inverse de _assign"""
+        value = self.values[var]
+        self.values[var] = None
+        true_count, free_count, units = self.true_count, self.free_count, self.units
+        for c, positive in self.occurrences[var]:
+            free = free_count[c] + 1
+            free_count[c] = free
+            if positive == value:
+                true_count[c] -= 1
+                if true_count[c] == 0 and free == 1:
+                    units.add(c)
+            elif true_count[c] == 0:
+                if free == 1:
+                    units.add(c)
+                    if self.hard[c]:
+                        self.hard_violations -= 1
+                    else:
+                        self.cost -= self.weights[c]
+                elif free == 2:
+                    units.discard(c)
+
+    # ------------------------------------------------------------------
+    # Borne inférieure
+    # ------------------------------------------------------------------
+
+    def _residual(self, residual, c):
+        """Poids encore utilisable de la clause c (infini pour une clause dure)"""
+        if self.hard[c]:
+            return float('inf')
+        return residual.get(c, self.weights[c])
+
+    def _inconsistent_subset(self, residual):
+        """
+        Propagation unitaire simulée (sans toucher à l'affectation courante) à
+        partir des clauses unitaires de poids restant non nul
+
+        Returns:
+            list: indices des clauses d'un sous-ensemble inconsistant
+                  (la clause vide et les raisons de ses littéraux), ou None
+        """
+        values, clauses = self.values, self.clauses
+        local = {}   # Variable -> (valeur, clause raison)
+        queue = []
+        conflict = None
+
+        for u in self.units:
+            if self._residual(residual, u) <= 0:
+                continue
+            literal = next(l for l in clauses[u] if values[abs(l)] is None)
+            var, value = abs(literal), literal > 0
+            if var in local:
+                if local[var][0] != value:
+                    conflict = u
+                    break
+                continue
+            local[var] = (value, u)
+            queue.append(var)
+
+        head = 0
+        while conflict is None and head < len(queue):
+            var = queue[head]
+            head += 1
+            value = local[var][0]
+            for d, positive in self.occurrences[var]:
+                if positive == value or self.true_count[d] > 0 or self._residual(residual, d) <= 0:
+                    continue
+                # Littéral de var falsifié: d devient-elle unitaire ou vide?
+                free_literal = None
+                satisfied = False
+                free = 0
+                for literal in clauses[d]:
+                    v = abs(literal)
+                    if values[v] is not None:
+                        continue
+                    if v in local:
+                        if local[v][0] == (literal > 0):
+                            satisfied = True
+                            break
+                        continue
+                    free += 1
+                    free_literal = literal
+                if satisfied or free > 1:
+                    continue
+                if free == 0:
+                    conflict = d
+                    break
+                v = abs(free_literal)
+                local[v] = (free_literal > 0, d)
+                queue.append(v)
+
+        if conflict is None:
+            return None
+
+        # Clauses impliquées: la clause vide puis, récursivement, les raisons
+        subset = {conflict}
+        stack = [conflict]
+        while stack:
+            for literal in clauses[stack.pop()]:
+                entry = local.get(abs(literal))
+                if entry is not None and entry[1] not in subset:
+                    subset.add(entry[1])
+                    stack.append(entry[1])
+        return list(subset)
+
+    def _lower_bound(self, limit):
+        """
+        Coût supplémentaire minimal du sous-arbre (sous-ensembles
+        inconsistants disjoints); s'arrête dès que la borne atteint limit
+        """
+        residual = {}
+        bound = 0
+        while bound < limit:
+            subset = self._inconsistent_subset(residual)
+            if subset is None:
+                break
+            weight = min(self._residual(residual, c) for c in subset)
+            if weight == float('inf'):
+                return weight  # Clauses dures inconsistantes
+            bound += weight
+            for c in subset:
+                if not self.hard[c]:
+                    residual[c] = self._residual(residual, c) - weight
+        return bound
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def _select(self):
+        """
+        Variable et valeur du prochain branchement, ou (None, None) si
+        aucune clause ouverte ne reste (feuille)
+        """
+        values = self.values
+        if self.units:
+            # Clause unitaire la plus lourde: la satisfaire d'abord
+            c = max(self.units, key=lambda i: (self.hard[i], self.weights[i], -i))
+            literal = next(l for l in self.clauses[c] if values[abs(l)] is None)
+            return abs(literal), literal > 0
+
+        for var in self.order:
+            if values[var] is not None:
+                continue
+            positive = negative = 0
+            for c, is_positive in self.occurrences[var]:
+                if self.true_count[c] == 0:
+                    weight = self.score[var] if self.hard[c] else self.weights[c]
+                    if is_positive:
+                        positive += weight
+                    else:
+                        negative += weight
+            if positive or negative:
+                return var, positive >= negative
+        return None, None
+
+    def _record(self):
+        """Nouvelle meilleure affectation (variables libres à faux)"""
+        self.best_cost = self.cost
+        self.best_assignment = {var: bool(self.values[var]) for var in range(1, self.num_variables + 1)}
+        self.improvements += 1
+
+    def _evaluate(self, assignment):
+        """Coût d'une affectation complète (None si elle viole une clause dure)"""
+        cost = self.fixed_cost
+        for clause, hard, weight in zip(self.clauses, self.hard, self.weights):
+            if not any(assignment.get(abs(l), False) == (l > 0) for l in clause):
+                if hard:
+                    return None
+                cost += weight
+        return None if self.fixed_hard else cost
+
+    def iter_improvements(self):
+        """
+        Recherche anytime: produit chaque affectation strictement meilleure
+        que les précédentes
+
+        Yields:
+            tuple: (coût, affectation {variable: valeur})
+        """
+        budget = self.budget
+        if budget is not None:
+            budget.start()
+            next_check = budget.next_check(0)
+        self.nodes = 0
+        self.improvements = 0
+        self.bound_prunes = 0
+        self.best_cost = None
+        self.best_assignment = None
+        self.status = 'UNKNOWN'
+
+        if self.initial_assignment is not None:
+            cost = self._evaluate(self.initial_assignment)
+            if cost is not None:
+                self.best_cost = cost
+                self.best_assignment = {var: bool(self.initial_assignment.get(var, False))
+                                        for var in range(1, self.num_variables + 1)}
+                self.improvements += 1
+                yield cost, dict(self.best_assignment)
+
+        self._init_counters()
+        trail = []  # (variable, première valeur encore à inverser?)
+
+        while True:
+            # Visite d'un nœud
+            if budget is not None and self.nodes >= next_check:
+                if budget.exhausted(self.nodes):
+                    return
+                next_check = budget.next_check(self.nodes)
+            self.nodes += 1
+
+            upper = self.best_cost
+            prune = self.hard_violations > 0 or (upper is not None and self.cost >= upper)
+            if not prune and self.units:
+                limit = float('inf') if upper is None else upper - self.cost
+                if self._lower_bound(limit) >= limit:
+                    prune = True
+                    self.bound_prunes += 1
+
+            if not prune:
+                var, value = self._select()
+                if var is not None:
+                    self._assign(var, value)
+                    trail.append([var, True])
+                    continue
+                # Feuille: toutes les clauses sont satisfaites ou falsifiées
+                self._record()
+                yield self.cost, dict(self.best_assignment)
+                if self.cost == self.fixed_cost:
+                    self.status = 'OPTIMUM'
+                    return
+
+            # Backtrack: remonter jusqu'à une variable dont l'autre valeur reste à essayer
+            while trail:
+                var, first = trail[-1]
+                value = self.values[var]
+                self._unassign(var)
+                if first:
+                    self._assign(var, not value)
+                    trail[-1][1] = False
+                    break
+                trail.pop()
+            else:
+                self.status = 'OPTIMUM' if self.best_cost is not None else 'UNSAT'
+                return
+
+    def solve(self):
+        """
+        Returns:
+            tuple: (success, assignment, stats)
+                success: True si l'optimum est prouvé, False si les clauses
+                         dures sont insatisfiables, None si le budget est
+                         épuisé (assignment: meilleure affectation trouvée)
+                assignment: dictionnaire {variable: valeur} ou None
+                stats: cost (poids falsifié), satisfied_weight, status
+                       ('OPTIMUM', 'UNKNOWN' ou 'UNSAT'), nœuds...
+        """
+        for _ in self.iter_improvements():
+            pass
+
+        stats = {
+            'backtrack_count': self.nodes,
+            'num_variables': self.num_variables,
+            'num_clauses': len(self.clauses),
+            'engine': 'maxsat',
+            'status': self.status,
+            'cost': self.best_cost,
+            'satisfied_weight': None if self.best_cost is None else self.total_weight - self.best_cost,
+            'total_weight': self.total_weight,
+            'improvements': self.improvements,
+            'bound_prunes': self.bound_prunes
+        }
+        if self.budget is not None:
+            stats['budget'] = self.budget.to_dict()
+
+        success = {'OPTIMUM': True, 'UNSAT': False, 'UNKNOWN': None}[self.status]
+        return success, self.best_assignment, stats
+
+
+def solve_maxsat(clauses, num_variables, weights=None, max_time=None, **options):
+    """Raccourci: MaxSATSolver(...).solve(), avec un budget de max_time secondes"""
+    if max_time is not None and options.get('budget') is None:
+        options['budget'] = SolverBudget(max_time=max_time)
+    return MaxSATSolver(clauses, num_variables, weights, **options).solve()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+
+    from verify_3SAT import SAT3Verifier
+
+    print("=== MaxSAT 3-SAT (branch-and-bound) ===\n")
+
+    # Instance sur-contrainte (ratio 6): insatisfiable avec forte probabilité
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rng = random.Random(2)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(6 * num_variables)]
+    print(f"Instance: {num_variables} variables, {len(clauses)} clauses\n")
+
+    solver = MaxSATSolver(clauses, num_variables, budget=SolverBudget(max_time=30))
+    for cost, assignment in solver.iter_improvements():
+        print(f"  amélioration: {cost} clause(s) falsifiée(s) (nœud {solver.nodes})")
+
+    _, details = SAT3Verifier(clauses).verify(solver.best_assignment)
+    print(f"\n{solver.status}: {details['satisfied_clauses']}/{details['total_clauses']} clauses "
+          f"satisfaites ({details['success_rate']:.2f}%), {solver.nodes} nœuds")
@@ -0,0 +1,179 @@
+"""
+Instrumentation des solveurs 3-SAT: compteurs, chronométrage et traces
+
+Un solveur reçoit metrics=SolverMetrics() pour être instrumenté; avec
+metrics=None (défaut), chaque point de mesure se réduit à un test
+"is not None" et le coût est quasi nul.
+
+Mesures:
+- compteurs: décisions, propagations, conflits, redémarrages, backtracks
+- histogramme des niveaux de décision (profondeur de chaque décision)
+- temps mural cumulé par phase: 'solve' englobe les autres ('init',
+  'search', et pour CDCL 'propagate', 'analyze', 'reduce_db')
+- échantillons des compteurs au cours du temps
+
+Exports: dictionnaire / JSON (to_dict, write_json) et trace Chrome
+(write_chrome_trace, à ouvrir dans chrome://tracing ou ui.perfetto.dev).
+"""
+import json
+import time
+from contextlib import contextmanager
+
+COUNTERS = ('decisions', 'propagations', 'conflicts', 'restarts', 'backtracks')
+
+# Nombre maximal d'événements gardés pour la trace (les suivants sont comptés, pas gardés)
+TRACE_MAX_EVENTS = 100000
+# Nœuds du backtracking entre deux échantillons des compteurs
+SAMPLE_INTERVAL = 4096
+
+
+class SolverMetrics:
+    """
+    Args:
+        trace: garder les événements (phases, échantillons) pour la trace Chrome
+        max_events: nombre maximal d'événements gardés
+        sample_interval: nœuds du backtracking entre deux échantillons
+    """
+
+    def __init__(self, trace=True, max_events=TRACE_MAX_EVENTS, sample_interval=SAMPLE_INTERVAL):
+        self.trace = trace
+        self.max_events = max_events
+        self.sample_interval = sample_interval
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.level_histogram = {}   # Niveau de décision -> nombre de décisions
+        self.phase_time = {}        # Phase -> secondes cumulées
+        self.phase_calls = {}
+        self.events = []            # (phase, début, durée) en secondes depuis origin
+        self.samples = []           # (instant, compteurs)
+        self.dropped_events = 0
+        self.origin = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    # Points de mesure
+    # ------------------------------------------------------------------
+
+    def decision(self, level):
+        """Une décision au niveau level (profondeur de la pile de décisions)"""
+        self.counters['decisions'] += 1
+        self.level_histogram[level] = self.level_histogram.get(level, 0) + 1
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, phase, start, end=None, event=True):
+        """
+        Ajoute la durée [start, end] (instants perf_counter) à la phase
+        event=False: temps cumulé seulement, sans événement de trace (phases
+        très fréquentes comme la propagation)
+        """
+        end = time.perf_counter() if end is None else end
+        self.phase_time[phase] = self.phase_time.get(phase, 0.0) + end - start
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        if self.trace and event:
+            if len(self.events) < self.max_events:
+                self.events.append((phase, start - self.origin, end - start))
+            else:
+                self.dropped_events += 1
+
+    @contextmanager
+    def phase(self, name):
+        """Chronomètre un bloc: with metrics.phase('search'): ..."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, start)
+
+    def sample(self, **counters):
+        """Met à jour les compteurs donnés puis les photographie (courbes de la trace Chrome)"""
+        self.counters.update(counters)
+        if self.trace and len(self.samples) < self.max_events:
+            self.samples.append((time.perf_counter() - self.origin, dict(self.counters)))
+
+    def elapsed(self):
+        """Temps de référence: phase 'search', sinon 'solve', sinon depuis la création"""
+        return (self.phase_time.get('search') or self.phase_time.get('solve')
+                or time.perf_counter() - self.origin)
+
+    # ------------------------------------------------------------------
+    # Exports
+    # ------------------------------------------------------------------
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: compteurs, débits (par seconde de recherche), histogramme
+                  des niveaux, temps et nombre d'appels par phase
+        """
+        elapsed = self.elapsed()
+        rates = {f"{name}_per_second": (value / elapsed if elapsed > 0 else 0.0)
+                 for name, value in self.counters.items()}
+        return {
+            'counters': dict(self.counters),
+            'rates': rates,
+            'level_histogram': dict(sorted(self.level_histogram.items())),
+            'phase_time': dict(self.phase_time),
+            'phase_calls': dict(self.phase_calls),
+            'dropped_events': self.dropped_events
+        }
+
+    def write_json(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def chrome_trace(self, pid=1, tid=1):
+        """
+        Returns:
+            dict: trace au format Chrome Trace Event (microsecondes)
+        """
+        events = [{'name': phase, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+                   'pid': pid, 'tid': tid, 'cat': 'solver'}
+                  for phase, start, duration in self.events]
+        events += [{'name': 'compteurs', 'ph': 'C', 'ts': instant * 1e6,
+                    'pid': pid, 'args': counters}
+                   for instant, counters in self.samples]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': self.to_dict()}
+
+    def write_chrome_trace(self, filename, pid=1, tid=1):
+        with open(filename, 'w') as f:
+            json.dump(self.chrome_trace(pid, tid), f)
+
+    def summary(self):
+        """Résumé lisible: compteurs, débits et répartition du temps"""
+        data = self.to_dict()
+        lines = [f"  {name}: {value} ({data['rates'][name + '_per_second']:,.0f}/s)"
+                 for name, value in data['counters'].items() if value]
+        total = self.phase_time.get('solve') or time.perf_counter() - self.origin
+        for phase, seconds in sorted(self.phase_time.items(), key=lambda item: -item[1]):
+            share = seconds / total * 100 if total > 0 else 0.0
+            lines.append(f"  phase {phase}: {seconds:.4f}s ({share:.1f}% de solve), "
+                         f"{self.phase_calls[phase]} appel(s)")
+        if self.level_histogram:
+            deepest = max(self.level_histogram)
+            lines.append(f"  niveaux de décision: {min(self.level_histogram)}..{deepest}, "
+                         f"le plus fréquent {max(self.level_histogram, key=self.level_histogram.get)}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+
+    from solve_3SAT import SAT3Solver
+    from solve_3SAT_cdcl import CDCLSolver
+
+    print("=== Instrumentation des solveurs 3-SAT ===\n")
+
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    rng = random.Random(7)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(round(4.26 * num_variables))]
+
+    for name, solver_class in (('backtracking', SAT3Solver), ('cdcl', CDCLSolver)):
+        metrics = SolverMetrics()
+        success, _, stats = solver_class(clauses, num_variables, metrics=metrics).solve()
+        print(f"{name}: {'SAT' if success else 'UNSAT'}")
+        print(metrics.summary())
+        metrics.write_chrome_trace(f"trace_{name}.json")
+        print(f"  trace Chrome: trace_{name}.json\n")
@@ -0,0 +1,416 @@
+"""
+Prétraitement CNF avant résolution (3-SAT / SAT)
+
+Simplifications préservant la satisfiabilité:
+1. Normalisation: littéraux dupliqués, tautologies et clauses en double retirés
+2. Propagation des clauses unitaires et élimination des littéraux purs
+3. Subsomption (C ⊆ D: D est retirée) et résolution auto-subsumante
+   (C = l ∨ A, D = ¬l ∨ A ∨ B: ¬l est retiré de D), avec listes
+   d'occurrences et signatures 64 bits pour écarter vite les candidats
+4. Élimination bornée de variables (BVE): x est remplacée par toutes les
+   résolvantes de ses clauses si cela n'augmente pas le nombre de clauses
+   (typiquement les variables auxiliaires de la réduction SAT → 3-SAT)
+
+Les variables restantes sont renumérotées 1..n'. La pile de reconstruction
+permet de retrouver un modèle de la formule d'origine à partir d'un modèle
+de la formule simplifiée.
+"""
+import time
+from collections import defaultdict
+
+# Nombre maximal d'occurrences d'une variable candidate à l'élimination
+ELIM_MAX_OCCURRENCES = 16
+# Nombre maximal de tours de simplification
+MAX_ROUNDS = 5
+
+
+def _signature(clause):
+    """Signature 64 bits des variables d'une clause (filtre de subsomption)"""
+    sig = 0
+    for lit in clause:
+        sig |= 1 << (abs(lit) & 63)
+    return sig
+
+
+class CNFPreprocessor:
+    """
+    Args:
+        clauses: liste de clauses (listes d'entiers signés)
+        num_variables: nombre de variables de la formule d'origine
+        subsume: activer subsomption et résolution auto-subsumante
+        eliminate: activer l'élimination bornée de variables
+        max_occurrences: occurrences maximales d'une variable éliminée
+        max_rounds: nombre maximal de tours
+
+    Après run(), stats contient le temps et la réduction de taille.
+    """
+
+    def __init__(self, clauses, num_variables, subsume=True, eliminate=True,
+                 max_occurrences=ELIM_MAX_OCCURRENCES, max_rounds=MAX_ROUNDS):
+        self.original = clauses
+        self.num_variables = max([num_variables] + [abs(l) for c in clauses for l in c])
+        self.subsume = subsume
+        self.eliminate = eliminate
+        self.max_occurrences = max_occurrences
+        self.max_rounds = max_rounds
+
+        self.clauses = []               # Ensembles de littéraux (None: clause retirée)
+        self.signatures = []
+        self.occ = defaultdict(set)     # Littéral -> indices des clauses
+        self.index = {}                 # frozenset(clause) -> indice (détection des doublons)
+        self.units = []                 # Clauses devenues unitaires à propager
+        self.unsat = False
+        self.fixed = set()              # Variables affectées (unitaires, purs)
+        self.eliminated = set()
+        self.stack = []                 # Pile de reconstruction
+        self.var_map = []               # Nouvelle variable -> variable d'origine
+        self.stats = {
+            'duplicates': 0, 'tautologies': 0, 'units': 0, 'pure_literals': 0,
+            'subsumed': 0, 'strengthened': 0, 'eliminated_variables': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Base de clauses
+    # ------------------------------------------------------------------
+
+    def _add(self, literals):
+        """Ajoute une clause (ensemble de littéraux) si elle est nouvelle"""
+        if any(-lit in literals for lit in literals):
+            self.stats['tautologies'] += 1
+            return
+        key = frozenset(literals)
+        if key in self.index:
+            self.stats['duplicates'] += 1
+            return
+        cid = len(self.clauses)
+        self.clauses.append(set(literals))
+        self.signatures.append(_signature(literals))
+        self.index[key] = cid
+        for lit in literals:
+            self.occ[lit].add(cid)
+        if len(literals) == 1:
+            self.units.append(cid)
+        elif not literals:
+            self.unsat = True
+
+    def _remove(self, cid):
+        clause = self.clauses[cid]
+        for lit in clause:
+            self.occ[lit].discard(cid)
+        del self.index[frozenset(clause)]
+        self.clauses[cid] = None
+
+    def _strengthen(self, cid, lit):
+        """Retire le littéral lit de la clause cid"""
+        clause = self.clauses[cid]
+        del self.index[frozenset(clause)]
+        clause.discard(lit)
+        self.occ[lit].discard(cid)
+        key = frozenset(clause)
+        if key in self.index:
+            # La clause raccourcie existe déjà
+            for other in clause:
+                self.occ[other].discard(cid)
+            self.clauses[cid] = None
+            self.stats['duplicates'] += 1
+            return
+        self.index[key] = cid
+        self.signatures[cid] = _signature(clause)
+        if len(clause) == 1:
+            self.units.append(cid)
+        elif not clause:
+            self.unsat = True
+
+    def _assign(self, lit):
+        """Fixe lit à vrai: clauses satisfaites retirées, ¬lit retiré des autres"""
+        self.stack.append(('assign', lit))
+        self.fixed.add(abs(lit))
+        for cid in list(self.occ[lit]):
+            self._remove(cid)
+        for cid in list(self.occ[-lit]):
+            self._strengthen(cid, -lit)
+
+    # ------------------------------------------------------------------
+    # Simplifications
+    # ------------------------------------------------------------------
+
+    def _propagate(self):
+        """Propagation des clauses unitaires; retourne True si quelque chose a changé"""
+        changed = False
+        while self.units and not self.unsat:
+            cid = self.units.pop()
+            clause = self.clauses[cid]
+            if clause is None or len(clause) != 1:
+                continue
+            self._assign(next(iter(clause)))
+            self.stats['units'] += 1
+            changed = True
+        return changed
+
+    def _pure_literals(self):
+        changed = False
+        for var in range(1, self.num_variables + 1):
+            if var in self.fixed or var in self.eliminated:
+                continue
+            positive, negative = self.occ[var], self.occ[-var]
+            if positive and not negative:
+                self._assign(var)
+            elif negative and not positive:
+                self._assign(-var)
+            else:
+                continue
+            self.stats['pure_literals'] += 1
+            changed = True
+        return changed
+
+    def _subsumes(self, c, d):
+        """
+        Returns:
+            0 si c ⊆ d, le littéral l de c si c avec ¬l à la place de l est
+            inclus dans d (résolution auto-subsumante), None sinon
+        """
+        flipped = 0
+        for lit in c:
+            if lit in d:
+                continue
+            if flipped == 0 and -lit in d:
+                flipped = lit
+                continue
+            return None
+        return flipped
+
+    def _subsumption(self):
+        """Subsomption arrière et résolution auto-subsumante"""
+        changed = False
+        order = sorted((cid for cid, c in enumerate(self.clauses) if c is not None),
+                       key=lambda cid: len(self.clauses[cid]))
+        for cid in order:
+            c = self.clauses[cid]
+            if c is None or not c or self.unsat:
+                continue
+            # Littéral le moins fréquent: seules ses clauses peuvent être concernées
+            lit = min(c, key=lambda l: len(self.occ[l]) + len(self.occ[-l]))
+            sig = self.signatures[cid]
+            for did in list(self.occ[lit] | self.occ[-lit]):
+                d = self.clauses[did]
+                if did == cid or d is None or len(d) < len(c) or sig & ~self.signatures[did]:
+                    continue
+                result = self._subsumes(c, d)
+                if result == 0:
+                    self._remove(did)
+                    self.stats['subsumed'] += 1
+                    changed = True
+                elif result is not None:
+                    self._strengthen(did, -result)
+                    self.stats['strengthened'] += 1
+                    changed = True
+                if self.clauses[cid] is None:
+                    break
+        return changed
+
+    def _eliminate_variables(self):
+        """Élimination bornée: sans augmentation du nombre de clauses"""
+        changed = False
+        candidates = [v for v in range(1, self.num_variables + 1)
+                      if v not in self.fixed and v not in self.eliminated]
+        candidates.sort(key=lambda v: len(self.occ[v]) * len(self.occ[-v]))
+        for var in candidates:
+            if self.unsat:
+                break
+            positive, negative = list(self.occ[var]), list(self.occ[-var])
+            if not positive or not negative:
+                continue  # Littéral pur ou variable absente
+            if len(positive) + len(negative) > self.max_occurrences:
+                continue
+
+            resolvents = []
+            for p in positive:
+                for n in negative:
+                    resolvent = (self.clauses[p] - {var}) | (self.clauses[n] - {-var})
+                    if not any(-lit in resolvent for lit in resolvent):
+                        resolvents.append(resolvent)
+                if len(resolvents) > len(positive) + len(negative):
+                    break
+            if len(resolvents) > len(positive) + len(negative):
+                continue
+
+            self.stack.append(('eliminate', var,
+                               [tuple(self.clauses[cid]) for cid in positive + negative]))
+            for cid in positive + negative:
+                self._remove(cid)
+            for resolvent in resolvents:
+                self._add(resolvent)
+            self.eliminated.add(var)
+            self.stats['eliminated_variables'] += 1
+            changed = True
+        return changed
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """
+        Simplifie la formule
+
+        Returns:
+            tuple: (clauses, num_variables) de la formule simplifiée et
+                   renumérotée; clauses == [[]] si elle est insatisfiable
+        """
+        start = time.time()
+        for clause in self.original:
+            self._add(set(clause))
+
+        rounds = 0
+        while not self.unsat and rounds < self.max_rounds:
+            rounds += 1
+            changed = self._propagate()
+            changed |= self._pure_literals()
+            if self.subsume:
+                changed |= self._subsumption()
+                changed |= self._propagate()
+            if self.eliminate and not self.unsat:
+                changed |= self._eliminate_variables()
+                changed |= self._propagate()
+            if not changed:
+                break
+
+        # Renumérotation compacte des variables restantes
+        remaining = [c for c in self.clauses if c is not None]
+        if self.unsat:
+            clauses, self.var_map = [[]], []
+        else:
+            self.var_map = sorted({abs(lit) for c in remaining for lit in c})
+            new_index = {var: i for i, var in enumerate(self.var_map, 1)}
+            clauses = [sorted((new_index[abs(l)] * (1 if l > 0 else -1) for l in c), key=abs)
+                       for c in remaining]
+
+        self.stats.update(
+            time=time.time() - start,
+            rounds=rounds,
+            status='UNSAT' if self.unsat else ('SAT' if not clauses else None),
+            original_variables=self.num_variables,
+            original_clauses=len(self.original),
+            original_literals=sum(len(c) for c in self.original),
+            variables=len(self.var_map),
+            clauses=len(clauses),
+            literals=sum(len(c) for c in clauses)
+        )
+        return clauses, len(self.var_map)
+
+    def reconstruct(self, model):
+        """
+        Étend un modèle de la formule simplifiée à la formule d'origine
+
+        Args:
+            model: {variable renumérotée: valeur} (au moins les variables 1..n')
+
+        Returns:
+            dict: {variable d'origine: valeur} pour 1..num_variables
+        """
+        assignment = {var: False for var in range(1, self.num_variables + 1)}
+        for new_var, var in enumerate(self.var_map, 1):
+            assignment[var] = bool(model.get(new_var, False))
+
+        for entry in reversed(self.stack):
+            if entry[0] == 'assign':
+                lit = entry[1]
+                assignment[abs(lit)] = lit > 0
+            else:
+                # Variable éliminée: vraie seulement si une clause positive l'exige
+                _, var, clauses = entry
+                assignment[var] = False
+                for clause in clauses:
+                    if var in clause and not any(
+                            assignment[abs(l)] == (l > 0) for l in clause if abs(l) != var):
+                        assignment[var] = True
+                        break
+        return assignment
+
+
+def preprocess(clauses, num_variables, **options):
+    """
+    Raccourci: simplifie la formule
+
+    Returns:
+        tuple: (clauses, num_variables, preprocessor), preprocessor.reconstruct()
+               ramenant un modèle sur les variables d'origine
+    """
+    preprocessor = CNFPreprocessor(clauses, num_variables, **options)
+    clauses, num_variables = preprocessor.run()
+    return clauses, num_variables, preprocessor
+
+
+class PreprocessedSolver:
+    """
+    Solveur précédé du prétraitement; même contrat solve() -> (success, assignment, stats)
+    stats['preprocess'] contient les statistiques du prétraitement
+    Avec metrics (SolverMetrics), le prétraitement est chronométré comme phase 'preprocess'
+    budget (SolverBudget) est transmis au solveur; le prétraitement n'est pas interrompu
+    """
+
+    def __init__(self, clauses, num_variables, engine='backtracking', heuristic='first',
+                 metrics=None, budget=None, **options):
+        self.clauses = clauses
+        self.num_variables = num_variables
+        self.engine = engine
+        self.heuristic = heuristic
+        self.metrics = metrics
+        self.budget = budget
+        self.options = options
+
+    def solve(self):
+        from solve_3SAT import create_solver
+
+        start = time.perf_counter()
+        simplified, num_variables, preprocessor = preprocess(
+            self.clauses, self.num_variables, **self.options)
+        if self.metrics is not None:
+            self.metrics.add_time('preprocess', start)
+
+        if preprocessor.unsat:
+            success, model, stats = False, None, {'backtrack_count': 0, 'status': 'UNSAT'}
+        else:
+            solver = create_solver(simplified, num_variables, self.engine, self.heuristic,
+                                   metrics=self.metrics, budget=self.budget)
+            success, model, stats = solver.solve()
+
+        stats.update(num_variables=self.num_variables, num_clauses=len(self.clauses),
+                     preprocess=preprocessor.stats)
+        if success:
+            return True, preprocessor.reconstruct(model), stats
+        return success, None, stats
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+
+    from verify_3SAT import SAT3Verifier
+
+    print("=== Prétraitement CNF ===\n")
+
+    # Instance aléatoire avec redondances: doublons, clauses subsumées, tautologies
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rng = random.Random(0)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(round(4.0 * num_variables))]
+    clauses += [list(rng.choice(clauses)) for _ in range(num_variables // 5)]
+    clauses += [c[:2] for c in rng.sample(clauses, num_variables // 5)]
+    clauses += [[v, -v, rng.randint(1, num_variables)] for v in range(1, num_variables // 10 + 1)]
+
+    simplified, n, preprocessor = preprocess(clauses, num_variables)
+    stats = preprocessor.stats
+    print(f"Avant: {stats['original_variables']} variables, {stats['original_clauses']} clauses, "
+          f"{stats['original_literals']} littéraux")
+    print(f"Après: {stats['variables']} variables, {stats['clauses']} clauses, "
+          f"{stats['literals']} littéraux ({stats['time'] * 1000:.1f} ms)")
+    for key in ('duplicates', 'tautologies', 'units', 'pure_literals', 'subsumed',
+                'strengthened', 'eliminated_variables'):
+        print(f"  {key}: {stats[key]}")
+
+    success, assignment, solve_stats = PreprocessedSolver(clauses, num_variables, engine='cdcl').solve()
+    print(f"\nRésultat: {'✓ SATISFIABLE' if success else '✗ INSATISFIABLE'}")
+    if success:
+        is_valid, _ = SAT3Verifier(clauses).verify(assignment)
+        print(f"Modèle reconstruit sur les variables d'origine vérifié: {is_valid}")
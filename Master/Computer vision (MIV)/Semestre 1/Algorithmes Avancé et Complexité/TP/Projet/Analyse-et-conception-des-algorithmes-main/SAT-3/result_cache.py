@@ -0,0 +1,217 @@
+"""
+Cache persistant des résultats de résolution (SQLite)
+
+Une entrée est indexée par:
+- l'empreinte canonique de la formule: SHA-256 des clauses triées (littéraux
+  triés et dédoublonnés, clauses dédoublonnées) et du nombre de variables;
+  l'ordre des clauses et des littéraux n'intervient donc pas
+- la configuration du solveur (moteur, heuristique, prétraitement, contraintes)
+- SOLVER_VERSION: à incrémenter quand un solveur change; les entrées des
+  autres versions sont ignorées puis supprimées par invalidate()
+et contient le statut, le modèle, les statistiques et le temps de résolution
+mesuré lors du calcul (restitué tel quel pour les courbes de complexité).
+
+Les réponses INCONNU (budget épuisé) ne sont pas enregistrées, ni les
+résolutions avec preuve DRAT ou métriques (effets de bord). Le fichier est
+en mode WAL: plusieurs processus d'un balayage peuvent le partager.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from array import array
+
+from solve_3SAT import create_solver
+
+RESULT_CACHE_FILE = ".result_cache.sqlite"
+# Clé d'invalidation: à incrémenter à chaque modification d'un solveur
+SOLVER_VERSION = "3sat-1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    formula TEXT NOT NULL,
+    config TEXT NOT NULL,
+    version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    model TEXT,
+    stats TEXT NOT NULL,
+    time REAL NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (formula, config, version)
+)
+"""
+
+
+def formula_hash(clauses, num_variables):
+    """
+    Empreinte canonique d'une formule CNF (hexadécimal)
+
+    Les clauses sont des tableaux int32 de littéraux triés, terminés par 0
+    comme en DIMACS, triées dans l'ordre lexicographique
+    """
+    digest = hashlib.sha256(f"p cnf {num_variables}\n".encode())
+    for clause in sorted({tuple(sorted(set(clause))) for clause in clauses}):
+        digest.update(array('i', clause + (0,)).tobytes())
+    return digest.hexdigest()
+
+
+def config_key(engine='backtracking', heuristic='first', preprocess=False, constraints=None):
+    """Configuration du solveur sous forme de texte JSON canonique"""
+    config = {'engine': engine, 'heuristic': heuristic, 'preprocess': bool(preprocess)}
+    if constraints:
+        config['constraints'] = sorted(repr(constraint) for constraint in constraints)
+    return json.dumps(config, sort_keys=True)
+
+
+class ResultCache:
+    """
+    Args:
+        path: fichier SQLite (créé au besoin)
+        version: clé d'invalidation des solveurs (SOLVER_VERSION par défaut)
+    """
+
+    def __init__(self, path=RESULT_CACHE_FILE, version=SOLVER_VERSION):
+        self.path = path
+        self.version = version
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(_SCHEMA)
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results WHERE version = ?",
+                                       (self.version,)).fetchone()[0]
+
+    def get(self, formula, config):
+        """
+        Returns:
+            dict: status, model (liste de littéraux ou None), stats, time;
+                  None si l'entrée est absente pour la version courante
+        """
+        row = self.connection.execute(
+            "SELECT status, model, stats, time FROM results WHERE formula = ? AND config = ? AND version = ?",
+            (formula, config, self.version)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        status, model, stats, elapsed = row
+        return {'status': status, 'model': json.loads(model) if model else None,
+                'stats': json.loads(stats), 'time': elapsed}
+
+    def put(self, formula, config, status, model, stats, elapsed):
+        """Enregistre (ou remplace) un résultat; model: liste de littéraux ou None"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (formula, config, self.version, status, json.dumps(model) if model is not None else None,
+             json.dumps(stats, default=str), elapsed, time.time()))
+        self.connection.commit()
+
+    def invalidate(self, version=None):
+        """
+        Supprime les entrées d'une version de solveur (par défaut: toutes
+        celles qui ne sont pas de la version courante)
+
+        Returns:
+            int: nombre d'entrées supprimées
+        """
+        if version is None:
+            cursor = self.connection.execute("DELETE FROM results WHERE version != ?", (self.version,))
+        else:
+            cursor = self.connection.execute("DELETE FROM results WHERE version = ?", (version,))
+        self.connection.commit()
+        return cursor.rowcount
+
+    def clear(self):
+        """Vide entièrement le cache (toutes versions)"""
+        cursor = self.connection.execute("DELETE FROM results")
+        self.connection.commit()
+        return cursor.rowcount
+
+    def versions(self):
+        """Nombre d'entrées par version de solveur"""
+        return dict(self.connection.execute("SELECT version, COUNT(*) FROM results GROUP BY version"))
+
+
+def cached_solve(cache, clauses, num_variables, engine='backtracking', heuristic='first', preprocess=False,
+                 proof=None, metrics=None, budget=None, constraints=None):
+    """
+    create_solver(...).solve() en passant par le cache
+
+    Args:
+        cache: ResultCache, ou None pour toujours résoudre
+        (autres arguments: voir create_solver)
+
+    Returns:
+        tuple: (success, assignment, stats) comme solve(); stats['time'] est
+               le temps de résolution (mesuré lors du calcul pour une
+               réponse du cache) et stats['cached'] indique sa provenance
+    """
+    cacheable = cache is not None and proof is None and metrics is None
+    if cacheable:
+        formula = formula_hash(clauses, num_variables)
+        config = config_key(engine, heuristic, preprocess, constraints)
+        entry = cache.get(formula, config)
+        if entry is not None:
+            stats = dict(entry['stats'], time=entry['time'], cached=True)
+            if entry['status'] == 'SAT':
+                return True, {abs(literal): literal > 0 for literal in entry['model']}, stats
+            return False, None, stats
+
+    start = time.perf_counter()
+    solver = create_solver(clauses, num_variables, engine, heuristic, preprocess, proof, metrics, budget,
+                           constraints)
+    success, assignment, stats = solver.solve()
+    elapsed = time.perf_counter() - start
+    stats['time'] = elapsed
+    stats['cached'] = False
+
+    if cacheable and success is not None:
+        model = [var if value else -var for var, value in sorted(assignment.items())] if success else None
+        cache.put(formula, config, 'SAT' if success else 'UNSAT', model,
+                  {key: value for key, value in stats.items() if key not in ('time', 'cached', 'budget')},
+                  elapsed)
+    return success, assignment, stats
+
+
+if __name__ == "__main__":
+    import sys
+
+    from generate_3SAT import generate_random_3sat
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+        with ResultCache() as cache:
+            print(f"✓ {cache.clear()} entrée(s) supprimée(s) de '{RESULT_CACHE_FILE}'")
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--invalidate":
+        with ResultCache() as cache:
+            print(f"✓ {cache.invalidate()} entrée(s) d'anciennes versions supprimée(s)")
+        sys.exit(0)
+
+    print("=== Cache des résultats 3-SAT ===\n")
+
+    # Balayage au seuil, deux fois: la seconde passe est servie par le cache
+    with ResultCache() as cache:
+        for sweep in ("Balayage 1", "Balayage 2"):
+            start = time.time()
+            solved = 0
+            for num_variables in (20, 25, 30):
+                for trial in range(5):
+                    clauses = generate_random_3sat(num_variables, round(4.26 * num_variables), seed=trial)
+                    _, _, stats = cached_solve(cache, clauses, num_variables)
+                    solved += not stats['cached']
+            print(f"{sweep}: {time.time() - start:.3f}s, {solved} résolution(s) calculée(s)")
+
+        print(f"\nCache '{RESULT_CACHE_FILE}': {len(cache)} entrée(s) (version {cache.version}), "
+              f"{cache.hits} succès, {cache.misses} défauts")
@@ -0,0 +1,295 @@
+"""
+Benchmark SATLIB non interactif et parallèle
+Chaque instance est résolue dans un processus séparé avec un budget
+(SolverBudget) égal au temps limite et à la mémoire autorisée: le solveur
+s'arrête de lui-même (statut UNKNOWN, backtracks partiels). Le processus est
+tué s'il dépasse la mémoire autorisée ou le temps limite plus KILL_GRACE. Les résultats sont écrits ligne par
+ligne (JSONL ou CSV) dès qu'ils arrivent, ce qui permet de reprendre un
+balayage interrompu.
+"""
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+
+try:
+    import psutil  # Optionnel: mesure de la mémoire hors Linux
+except ImportError:
+    psutil = None
+
+# Colonnes des résultats (ordre des colonnes CSV)
+RESULT_FIELDS = ['filename', 'path', 'engine', 'status', 'satisfiable', 'time',
+                 'backtracks', 'num_variables', 'num_clauses', 'verified', 'error']
+
+# Intervalle de surveillance des processus (secondes)
+POLL_INTERVAL = 0.05
+# Délai accordé après le temps limite avant de tuer un processus (secondes)
+KILL_GRACE = 2.0
+
+
+def resident_memory_mb(pid):
+    """
+    Mémoire résidente d'un processus en Mo (None si elle ne peut pas être mesurée)
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            pass
+    return None
+
+
+def _solve_worker(path, engine, conn, time_limit=None, memory_limit_mb=None):
+    """
+    Résout une instance dans le processus fils et envoie le résultat au parent
+    """
+    row = {'status': 'ERROR'}
+    try:
+        from budget_3SAT import SolverBudget
+        from dimacs_cache import read_dimacs_cnf_cached
+        from solve_3SAT import create_solver
+        from verify_3SAT import SAT3Verifier
+
+        clauses, num_vars = read_dimacs_cnf_cached(path)
+        row.update(num_variables=num_vars, num_clauses=len(clauses))
+
+        budget = SolverBudget(max_time=time_limit, max_memory_mb=memory_limit_mb)
+        solver = create_solver(clauses, num_vars, engine, budget=budget)
+        start_time = time.time()
+        success, assignment, stats = solver.solve()
+        elapsed_time = time.time() - start_time
+
+        verified = False
+        if success:
+            verified, _ = SAT3Verifier(clauses).verify(assignment)
+
+        if success is None:
+            status = 'UNKNOWN'  # Budget épuisé sans réponse
+            row['error'] = f"budget épuisé ({budget.reason or 'recherche locale'})"
+        else:
+            status = 'SAT' if success else 'UNSAT'
+        row.update(status=status, satisfiable=success,
+                   time=elapsed_time, backtracks=stats['backtrack_count'],
+                   verified=verified)
+    except MemoryError:
+        row.update(status='MEMOUT', error='mémoire épuisée')
+    except Exception as e:
+        row.update(status='ERROR', error=str(e))
+
+    conn.send(row)
+    conn.close()
+
+
+def load_completed(output_file):
+    """
+    Lit un fichier de résultats existant (JSONL ou CSV)
+
+    Returns:
+        set: chemins absolus des instances déjà traitées
+    """
+    if not os.path.exists(output_file):
+        return set()
+
+    with open(output_file, 'r', newline='') as f:
+        if output_file.endswith('.csv'):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = []
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue  # Ligne tronquée par une interruption
+    return {row['path'] for row in rows if row.get('path')}
+
+
+class ResultWriter:
+    """
+    Écrit les résultats au fil de l'eau, au format JSONL ou CSV selon l'extension
+    """
+
+    def __init__(self, output_file):
+        self.is_csv = output_file.endswith('.csv')
+        new_file = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+        self.file = open(output_file, 'a', newline='')
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            if new_file:
+                self.writer.writeheader()
+
+    def write(self, row):
+        if self.is_csv:
+            self.writer.writerow({key: row.get(key) for key in RESULT_FIELDS})
+        else:
+            self.file.write(json.dumps({key: row.get(key) for key in RESULT_FIELDS}) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_headless_benchmark(instances, output_file="benchmark_results.jsonl",
+                           engine='backtracking', time_limit=60, memory_limit_mb=None,
+                           workers=None, resume=True, verbose=True):
+    """
+    Lance le benchmark sans aucune interaction
+
+    Args:
+        instances: liste des fichiers .cnf (éventuellement compressés)
+        output_file: fichier de résultats (.jsonl ou .csv), complété au fil de l'eau
+        engine: moteur de résolution (voir solve_3SAT.SOLVER_ENGINES)
+        time_limit: temps limite par instance en secondes (budget du solveur;
+                    processus tué au-delà de time_limit + KILL_GRACE; None:
+                    pas de limite)
+        memory_limit_mb: mémoire résidente maximale par processus en Mo (None: pas
+                         de limite; mesurée via /proc, ou psutil s'il est installé)
+        workers: nombre de processus simultanés (défaut: nombre de cœurs)
+        resume: ignorer les instances déjà présentes dans output_file
+        verbose: afficher une ligne par instance terminée
+
+    Returns:
+        list: résultats des instances traitées pendant cet appel
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = [os.path.abspath(path) for path in instances]
+
+    if resume:
+        completed = load_completed(output_file)
+        skipped = len(pending)
+        pending = [path for path in pending if path not in completed]
+        skipped -= len(pending)
+        if verbose and skipped:
+            print(f"ℹ️  Reprise: {skipped} instance(s) déjà traitée(s) dans {output_file}")
+
+    if verbose:
+        print(f"📊 {len(pending)} instance(s), {workers} processus, moteur {engine}, " +
+              (f"limite {time_limit}s" if time_limit is not None else "sans limite de temps") +
+              (f" / {memory_limit_mb} Mo" if memory_limit_mb else ""))
+
+    writer = ResultWriter(output_file)
+    results = []
+    running = {}  # connexion -> (processus, chemin, début)
+    total = len(pending)
+    pending.reverse()
+
+    def finish(path, row):
+        row.update(filename=os.path.basename(path), path=path, engine=engine)
+        writer.write(row)
+        results.append(row)
+        if verbose:
+            detail = f"{row['time']:.3f}s" if row.get('time') is not None else row.get('error') or ''
+            print(f"[{len(results)}/{total}] {row['filename']:<30} {row['status']:<8} {detail}")
+
+    try:
+        while pending or running:
+            # Remplir la fenêtre de processus
+            while pending and len(running) < workers:
+                path = pending.pop()
+                parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_solve_worker,
+                    args=(path, engine, child_conn, time_limit, memory_limit_mb),
+                    daemon=True)
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (process, path, time.time())
+
+            # Résultats arrivés
+            for conn in wait(list(running), timeout=POLL_INTERVAL):
+                process, path, _ = running.pop(conn)
+                try:
+                    row = conn.recv()
+                except EOFError:
+                    # Processus mort sans résultat (mémoire épuisée, signal...)
+                    process.join()
+                    row = {'status': 'ERROR',
+                           'error': f"processus terminé (code {process.exitcode})"}
+                conn.close()
+                process.join()
+                finish(path, row)
+
+            # Processus ayant dépassé le temps limite ou la mémoire autorisée
+            now = time.time()
+            for conn, (process, path, start) in list(running.items()):
+                row = None
+                if time_limit is not None and now - start > time_limit + KILL_GRACE:
+                    row = {'status': 'TIMEOUT',
+                           'error': f"temps limite dépassé ({time_limit}s)"}
+                elif memory_limit_mb:
+                    memory = resident_memory_mb(process.pid)
+                    if memory is not None and memory > memory_limit_mb:
+                        row = {'status': 'MEMOUT',
+                               'error': f"mémoire dépassée ({memory:.1f} Mo > {memory_limit_mb:g} Mo)"}
+                if row is not None:
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    del running[conn]
+                    finish(path, row)
+    finally:
+        # Interruption (Ctrl+C): tuer les processus restants, garder les lignes écrites
+        for conn, (process, _, _) in running.items():
+            process.terminate()
+            process.join()
+            conn.close()
+        writer.close()
+
+    if verbose and results:
+        solved = [r for r in results if r['status'] in ('SAT', 'UNSAT')]
+        print(f"\n✓ {len(solved)}/{len(results)} instance(s) résolue(s), "
+              f"résultats dans {output_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    from dimacs_reader import is_cnf_file
+
+    usage = """Usage: python satlib_runner.py <dossier|fichiers.cnf...> [options]
+  --engine <moteur>             backtracking, cdcl, walksat ou probsat (défaut: backtracking)
+  --timeout <s>                 Temps limite par instance (défaut: 60)
+  --memory <Mo>                 Mémoire résidente maximale par instance
+  --workers <n>                 Processus simultanés (défaut: nombre de cœurs)
+  --output <fichier>            Résultats .jsonl ou .csv (défaut: benchmark_results.jsonl)
+  --no-resume                   Refaire les instances déjà présentes dans le fichier"""
+
+    options = {'--engine': 'backtracking', '--timeout': '60', '--memory': None,
+               '--workers': None, '--output': 'benchmark_results.jsonl'}
+    resume = True
+    paths = []
+    args = sys.argv[1:]
+    while args:
+        arg = args.pop(0)
+        if arg in options and args:
+            options[arg] = args.pop(0)
+        elif arg == '--no-resume':
+            resume = False
+        elif arg in ('--help', '-h') or arg.startswith('--'):
+            print(usage)
+            sys.exit(0 if arg in ('--help', '-h') else 1)
+        elif os.path.isdir(arg):
+            paths.extend(sorted(os.path.join(arg, name) for name in os.listdir(arg)
+                                if is_cnf_file(name)))
+        else:
+            paths.append(arg)
+
+    if not paths:
+        print(usage)
+        sys.exit(1)
+
+    run_headless_benchmark(
+        paths,
+        output_file=options['--output'],
+        engine=options['--engine'],
+        time_limit=float(options['--timeout']),
+        memory_limit_mb=float(options['--memory']) if options['--memory'] else None,
+        workers=int(options['--workers']) if options['--workers'] else None,
+        resume=resume)
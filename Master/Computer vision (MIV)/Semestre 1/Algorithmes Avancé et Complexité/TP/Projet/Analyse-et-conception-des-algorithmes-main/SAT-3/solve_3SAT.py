@@ -1,280 +1,945 @@
-class SAT3Solver:
-    def __init__(self, clauses, num_variables):
-        self.clauses = clauses
-        self.num_variables = num_variables
-        self.assignment = {}  # Affectation courante: {var: True/False}
-        self.solutions_found = []
-        self.backtrack_count = 0  # Pour les statistiques
-        
-    def evaluate_literal(self, literal):
-        """Évalue un littéral avec l'affectation courante"""
-        var = abs(literal)
-        if var not in self.assignment:
-            return None  # Variable non encore affectée
-        
-        value = self.assignment[var]
-        # Si literal positif, retourne la valeur; si négatif, retourne NOT valeur
-        return value if literal > 0 else not value
-    
-    def evaluate_clause(self, clause):
-        """
-        Évalue une clause (disjonction de littéraux)
-        Retourne: True si satisfaite, False si insatisfaite, None si indéterminée
-        """
-        has_true = False
-        has_unassigned = False
-        
-        for literal in clause:
-            val = self.evaluate_literal(literal)
-            if val is True:
-                return True  # Au moins un littéral vrai → clause satisfaite
-            elif val is None:
-                has_unassigned = True
-        
-        if has_unassigned:
-            return None  # Clause indéterminée
-        return False  # Tous les littéraux sont faux → clause insatisfaite
-    
-    def is_satisfied(self):
-        """Vérifie si toutes les clauses sont satisfaites"""
-        for clause in self.clauses:
-            if self.evaluate_clause(clause) != True:
-                return False
-        return True
-    
-    def has_conflict(self):
-        """Vérifie s'il y a un conflit (une clause insatisfaite)"""
-        for clause in self.clauses:
-            if self.evaluate_clause(clause) == False:
-                return True
-        return False
-    
-    def select_variable(self):
-        """
-        Sélectionne la prochaine variable non affectée
-        Stratégie simple: prend la première non affectée
-        """
-        for var in range(1, self.num_variables + 1):
-            if var not in self.assignment:
-                return var
-        return None
-    
-    def backtrack(self):
-        """
-        Algorithme de backtracking récursif
-        Retourne True si une solution est trouvée, False sinon
-        """
-        self.backtrack_count += 1
-        
-        # Cas de base: toutes les variables sont affectées
-        if len(self.assignment) == self.num_variables:
-            if self.is_satisfied():
-                return True
-            return False
-        
-        # Détection précoce de conflit
-        if self.has_conflict():
-            return False
-        
-        # Sélectionner la prochaine variable
-        var = self.select_variable()
-        if var is None:
-            return self.is_satisfied()
-        
-        # Essayer var = True
-        self.assignment[var] = True
-        if self.backtrack():
-            return True
-        
-        # Essayer var = False
-        self.assignment[var] = False
-        if self.backtrack():
-            return True
-        
-        # Backtrack: retirer l'affectation
-        del self.assignment[var]
-        return False
-    
-    def solve(self):
-        """
-        Lance la résolution
-        
-        Returns:
-            tuple: (success, assignment, stats)
-                success: True si solution trouvée
-                assignment: dictionnaire {variable: valeur} ou None
-                stats: dictionnaire avec statistiques
-        """
-        self.assignment = {}
-        self.backtrack_count = 0
-        
-        success = self.backtrack()
-        
-        stats = {
-            'backtrack_count': self.backtrack_count,
-            'num_variables': self.num_variables,
-            'num_clauses': len(self.clauses)
-        }
-        
-        if success:
-            return True, dict(self.assignment), stats
-        else:
-            return False, None, stats
-    
-    def solve_all(self, max_solutions=10):
-        """
-        Trouve toutes les solutions (ou jusqu'à max_solutions)
-        
-        Returns:
-            list: Liste des affectations solutions
-        """
-        self.solutions_found = []
-        self._backtrack_all(max_solutions)
-        return self.solutions_found
-    
-    def _backtrack_all(self, max_solutions):
-        """Backtracking pour trouver toutes les solutions"""
-        if len(self.solutions_found) >= max_solutions:
-            return
-        
-        if len(self.assignment) == self.num_variables:
-            if self.is_satisfied():
-                self.solutions_found.append(dict(self.assignment))
-            return
-        
-        if self.has_conflict():
-            return
-        
-        var = self.select_variable()
-        if var is None:
-            return
-        
-        # Essayer var = True
-        self.assignment[var] = True
-        self._backtrack_all(max_solutions)
-        
-        # Essayer var = False
-        self.assignment[var] = False
-        self._backtrack_all(max_solutions)
-        
-        # Backtrack
-        del self.assignment[var]
-
-
-def read_3sat_from_file(filename, format='auto'):
-    """
-    Lit une instance 3-SAT depuis un fichier
-    Supporte les formats: simple, DIMACS CNF
-    
-    Args:
-        filename: nom du fichier
-        format: 'simple', 'dimacs', ou 'auto' (détection automatique)
-    
-    Format simple:
-    3
-    3
-    1 -2 3
-    -1 2 -3
-    1 2 3
-    
-    Format DIMACS CNF:
-    c Commentaires
-    p cnf 3 3
-    1 -2 3 0
-    -1 2 -3 0
-    1 2 3 0
-    """
-    # Détection automatique du format
-    if format == 'auto':
-        with open(filename, 'r') as f:
-            first_line = f.readline().strip()
-            if first_line.startswith('c') or first_line.startswith('p'):
-                format = 'dimacs'
-            else:
-                format = 'simple'
-    
-    if format == 'dimacs':
-        # Utiliser le lecteur DIMACS
-        try:
-            from dimacs_reader import read_dimacs_cnf
-            clauses, num_variables = read_dimacs_cnf(filename)
-            
-            # Filtrer pour ne garder que les clauses de taille 3
-            clauses_3sat = [c for c in clauses if len(c) == 3]
-            if len(clauses_3sat) < len(clauses):
-                print(f"⚠️  {len(clauses) - len(clauses_3sat)} clauses ignorées (pas 3 littéraux)")
-            
-            return clauses_3sat, num_variables
-        except ImportError:
-            print("⚠️  Module dimacs_reader non trouvé, utilisation du format simple")
-            format = 'simple'
-    
-    if format == 'simple':
-        # Format simple original
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-        
-        num_variables = int(lines[0].strip())
-        num_clauses = int(lines[1].strip())
-        
-        clauses = []
-        for i in range(2, 2 + num_clauses):
-            literals = list(map(int, lines[i].strip().split()))
-            if len(literals) != 3:
-                raise ValueError(f"Clause {i-1} n'a pas exactement 3 littéraux: {literals}")
-            clauses.append(literals)
-        
-        return clauses, num_variables
-
-
-def write_solution_to_file(filename, success, assignment, stats):
-    """Écrit la solution dans un fichier"""
-    with open(filename, 'w') as f:
-        if success:
-            f.write("SATISFIABLE\n")
-            f.write("Affectation:\n")
-            for var in sorted(assignment.keys()):
-                value = "vrai" if assignment[var] else "faux"
-                f.write(f"  x{var} = {value}\n")
-        else:
-            f.write("INSATISFIABLE\n")
-        
-        f.write("\nStatistiques:\n")
-        f.write(f"  Nombre de backtracks: {stats['backtrack_count']}\n")
-        f.write(f"  Nombre de variables: {stats['num_variables']}\n")
-        f.write(f"  Nombre de clauses: {stats['num_clauses']}\n")
-
-
-if __name__ == "__main__":
-    # Exemple d'utilisation
-    print("=== Exemple 3-SAT Solver ===\n")
-    
-    # Exemple de l'énoncé: F = (x₁ ∨ ¬x₂ ∨ x₃) ∧ (¬x₁ ∨ x₂ ∨ ¬x₃) ∧ (x₁ ∨ x₂ ∨ x₃)
-    clauses = [
-        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
-        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
-        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
-    ]
-    num_variables = 3
-    
-    print("Formule:")
-    for i, clause in enumerate(clauses, 1):
-        print(f"  C{i}: {clause}")
-    
-    solver = SAT3Solver(clauses, num_variables)
-    success, assignment, stats = solver.solve()
-    
-    print("\nRésultat:")
-    if success:
-        print("✓ SATISFIABLE")
-        print("\nAffectation trouvée:")
-        for var in sorted(assignment.keys()):
-            value = "vrai" if assignment[var] else "faux"
-            print(f"  x{var} = {value}")
-    else:
-        print("✗ INSATISFIABLE")
-    
-    print(f"\nStatistiques:")
-    print(f"  Backtracks: {stats['backtrack_count']}")
-    print(f"  Variables: {stats['num_variables']}")
-    print(f"  Clauses: {stats['num_clauses']}")
+import heapq
+import os
+import time
+from itertools import islice
+
+
+# ============================================================================
+# HEURISTIQUES DE BRANCHEMENT
+# ============================================================================
+
+class BranchingHeuristic:
+    """
+    Heuristique de choix de variable adossée à un tas de priorité
+
+    Toutes les variables non affectées sont dans le tas; les entrées des
+    variables affectées ou dont le score a changé sont retirées
+    paresseusement. Choisir une variable coûte O(log n) amorti au lieu de
+    parcourir les n variables.
+    """
+    name = None
+    
+    def __init__(self, clauses, num_variables):
+        self.num_variables = num_variables
+        self.scores = self.initial_scores(clauses, num_variables)
+        self._build_heap()
+    
+    def _build_heap(self):
+        """Place toutes les variables dans le tas"""
+        self.entry_key = [None] * (self.num_variables + 1)  # Clé de l'entrée valide dans le tas
+        self.heap = []
+        for var in range(1, self.num_variables + 1):
+            key = self.priority(var)
+            self.entry_key[var] = key
+            self.heap.append((key, var))
+        heapq.heapify(self.heap)
+    
+    def reset(self, clauses, num_variables):
+        """
+        Prépare une nouvelle recherche (clauses ou variables ajoutées entre deux
+        appels): les scores statiques sont recalculés
+        """
+        self.num_variables = num_variables
+        self.scores = self.initial_scores(clauses, num_variables)
+        self._build_heap()
+    
+    def initial_scores(self, clauses, num_variables):
+        """Score initial de chaque variable (indice = numéro de variable)"""
+        return [0.0] * (num_variables + 1)
+    
+    def priority(self, var):
+        """Clé du tas (la plus petite est choisie en premier)"""
+        return -self.scores[var]
+    
+    def select(self, assignment):
+        """Retourne la variable non affectée de meilleure priorité, ou None"""
+        heap = self.heap
+        while heap:
+            key, var = heap[0]
+            if self.entry_key[var] != key:
+                heapq.heappop(heap)  # Entrée périmée (score modifié)
+            elif var in assignment:
+                heapq.heappop(heap)
+                self.entry_key[var] = None
+            else:
+                return var
+        return None
+    
+    def unassign(self, var):
+        """Remet une variable désaffectée dans le tas"""
+        if self.entry_key[var] is None:
+            key = self.priority(var)
+            self.entry_key[var] = key
+            heapq.heappush(self.heap, (key, var))
+    
+    def on_conflict(self, clause):
+        """Appelée avec la clause falsifiée à chaque conflit"""
+        pass
+    
+    def _update(self, var):
+        """Réinsère une variable dont le score a changé (l'ancienne entrée devient périmée)"""
+        if self.entry_key[var] is not None:
+            key = self.priority(var)
+            self.entry_key[var] = key
+            heapq.heappush(self.heap, (key, var))
+
+
+class FirstUnassignedHeuristic(BranchingHeuristic):
+    """Plus petite variable non affectée (ordre historique de SAT3Solver)"""
+    name = 'first'
+    
+    def priority(self, var):
+        return var
+
+
+class VSIDSHeuristic(BranchingHeuristic):
+    """
+    VSIDS: activité initialisée au nombre d'occurrences, augmentée pour les
+    variables de chaque clause en conflit, avec décroissance exponentielle
+    """
+    name = 'vsids'
+    DECAY = 0.95
+    
+    def initial_scores(self, clauses, num_variables):
+        self.increment = 1.0
+        scores = [0.0] * (num_variables + 1)
+        for clause in clauses:
+            for literal in clause:
+                scores[abs(literal)] += 1.0
+        return scores
+    
+    def reset(self, clauses, num_variables):
+        """Les activités apprises sont conservées d'une recherche à l'autre"""
+        if num_variables > self.num_variables:
+            counts = [0.0] * (num_variables + 1)
+            for clause in clauses:
+                for literal in clause:
+                    counts[abs(literal)] += 1.0
+            self.scores += counts[self.num_variables + 1:]
+        self.num_variables = num_variables
+        self._build_heap()
+    
+    def on_conflict(self, clause):
+        for literal in clause:
+            var = abs(literal)
+            self.scores[var] += self.increment
+            self._update(var)
+        self.increment /= self.DECAY
+        
+        # Renormaliser pour éviter les débordements flottants
+        if self.increment > 1e100:
+            self.scores = [score * 1e-100 for score in self.scores]
+            self.increment *= 1e-100
+            self.heap = [(self.priority(var), var) for var in range(1, self.num_variables + 1)
+                         if self.entry_key[var] is not None]
+            heapq.heapify(self.heap)
+            for _, var in self.heap:
+                self.entry_key[var] = self.priority(var)
+
+
+class MOMsHeuristic(BranchingHeuristic):
+    """
+    MOMs (Maximum Occurrences in clauses of Minimum Size):
+    score = (f(x) + f(¬x)) * 2^k + f(x) * f(¬x), où f compte les occurrences
+    dans les clauses les plus courtes de la formule
+    """
+    name = 'mom'
+    K = 10
+    
+    def initial_scores(self, clauses, num_variables):
+        scores = [0.0] * (num_variables + 1)
+        if not clauses:
+            return scores
+        min_size = min(len(clause) for clause in clauses)
+        positive = [0] * (num_variables + 1)
+        negative = [0] * (num_variables + 1)
+        for clause in clauses:
+            if len(clause) == min_size:
+                for literal in clause:
+                    if literal > 0:
+                        positive[literal] += 1
+                    else:
+                        negative[-literal] += 1
+        for var in range(1, num_variables + 1):
+            scores[var] = ((positive[var] + negative[var]) * 2 ** self.K
+                           + positive[var] * negative[var])
+        return scores
+
+
+class JeroslowWangHeuristic(BranchingHeuristic):
+    """
+    Jeroslow-Wang (version bilatérale): J(x) + J(¬x) avec J(l) = Σ 2^-|C|
+    sur les clauses C contenant l
+    """
+    name = 'jw'
+    
+    def initial_scores(self, clauses, num_variables):
+        scores = [0.0] * (num_variables + 1)
+        for clause in clauses:
+            weight = 2.0 ** -len(clause)
+            for literal in clause:
+                scores[abs(literal)] += weight
+        return scores
+
+
+# Heuristiques disponibles pour SAT3Solver (paramètre heuristic)
+BRANCHING_HEURISTICS = {
+    heuristic.name: heuristic
+    for heuristic in (FirstUnassignedHeuristic, VSIDSHeuristic, MOMsHeuristic, JeroslowWangHeuristic)
+}
+
+
+class SAT3Solver:
+    def __init__(self, clauses, num_variables, heuristic='first', proof=None, metrics=None, budget=None,
+                 constraints=None):
+        self.clauses = list(clauses)  # Complétée par add_clause
+        self.num_variables = num_variables
+        self.assignment = {}  # Affectation courante: {var: True/False}
+        self.solutions_found = []
+        self.backtrack_count = 0  # Pour les statistiques
+        self.failed = []  # Hypothèses responsables du dernier échec de solve()
+        self.assumed = []  # Hypothèses de l'appel en cours (incluses dans les lemmes de la preuve)
+        
+        # Preuve DRAT des réponses INSATISFIABLE (chemin ou DRATWriter, voir drat_3SAT)
+        if isinstance(proof, (str, os.PathLike)):
+            from drat_3SAT import DRATWriter
+            proof = DRATWriter(proof)
+        self.proof = proof
+        
+        # Instrumentation optionnelle (SolverMetrics, voir metrics_3SAT); None: aucun coût
+        self.metrics = metrics
+        
+        # Budget de ressources et annulation (SolverBudget, voir budget_3SAT); None: illimité
+        self.budget = budget
+        
+        # Contraintes natives AtMost / Xor propagées pendant la recherche
+        # (ConstraintPropagator, voir constraints_3SAT); None: CNF seule
+        self.constraints = None
+        self.constraint_list = list(constraints or [])
+        if self.constraint_list:
+            if proof is not None:
+                raise ValueError("Preuve DRAT indisponible avec des contraintes natives")
+            from constraints_3SAT import ConstraintPropagator
+            self.constraints = ConstraintPropagator(self.constraint_list, num_variables)
+            self.num_variables = num_variables = self.constraints.num_variables
+        self.constraint_propagations = 0
+        
+        if heuristic not in BRANCHING_HEURISTICS:
+            raise ValueError(f"Heuristique inconnue: {heuristic} "
+                             f"(disponibles: {', '.join(BRANCHING_HEURISTICS)})")
+        self.heuristic_name = heuristic
+        self.heuristic = BRANCHING_HEURISTICS[heuristic](clauses, num_variables)
+        
+        # Index des occurrences: variable -> [(indice de clause, littéral positif?)]
+        self.occurrences = {}
+        for i, clause in enumerate(clauses):
+            for literal in clause:
+                self.occurrences.setdefault(abs(literal), []).append((i, literal > 0))
+        
+    def evaluate_literal(self, literal):
+        """Évalue un littéral avec l'affectation courante"""
+        var = abs(literal)
+        if var not in self.assignment:
+            return None  # Variable non encore affectée
+        
+        value = self.assignment[var]
+        # Si literal positif, retourne la valeur; si négatif, retourne NOT valeur
+        return value if literal > 0 else not value
+    
+    def evaluate_clause(self, clause):
+        """
+        Évalue une clause (disjonction de littéraux)
+        Retourne: True si satisfaite, False si insatisfaite, None si indéterminée
+        """
+        has_true = False
+        has_unassigned = False
+        
+        for literal in clause:
+            val = self.evaluate_literal(literal)
+            if val is True:
+                return True  # Au moins un littéral vrai → clause satisfaite
+            elif val is None:
+                has_unassigned = True
+        
+        if has_unassigned:
+            return None  # Clause indéterminée
+        return False  # Tous les littéraux sont faux → clause insatisfaite
+    
+    def is_satisfied(self):
+        """Vérifie si toutes les clauses sont satisfaites"""
+        for clause in self.clauses:
+            if self.evaluate_clause(clause) != True:
+                return False
+        return True
+    
+    def has_conflict(self):
+        """Vérifie s'il y a un conflit (une clause insatisfaite)"""
+        return self.find_conflict() is not None
+    
+    def find_conflict(self):
+        """Retourne la première clause insatisfaite, ou None"""
+        for clause in self.clauses:
+            if self.evaluate_clause(clause) == False:
+                return clause
+        return None
+    
+    def add_clause(self, clause):
+        """
+        Ajoute une clause entre deux appels à solve() (l'index des occurrences
+        et l'état de l'heuristique sont conservés)
+        """
+        clause = list(clause)
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        for literal in clause:
+            self.num_variables = max(self.num_variables, abs(literal))
+            self.occurrences.setdefault(abs(literal), []).append((index, literal > 0))
+    
+    def failed_assumptions(self):
+        """
+        Hypothèses du dernier solve() suffisant à rendre la formule
+        insatisfiable (pas forcément un sous-ensemble minimal)
+        """
+        return list(self.failed)
+    
+    def _init_counters(self):
+        """
+        Initialise les compteurs par clause à partir de l'affectation courante:
+        littéraux vrais, littéraux non affectés, clauses satisfaites et
+        clauses en conflit (aucun littéral vrai ni libre)
+        """
+        self.true_count = [0] * len(self.clauses)
+        self.free_count = [0] * len(self.clauses)
+        self.satisfied_count = 0
+        self.conflicts = set()
+        
+        for i, clause in enumerate(self.clauses):
+            for literal in clause:
+                value = self.assignment.get(abs(literal))
+                if value is None:
+                    self.free_count[i] += 1
+                elif value == (literal > 0):
+                    self.true_count[i] += 1
+            if self.true_count[i] > 0:
+                self.satisfied_count += 1
+            elif self.free_count[i] == 0:
+                self.conflicts.add(i)
+    
+    def _assign(self, var, value):
+        """Affecte var et met à jour uniquement les clauses qui la contiennent"""
+        self.assignment[var] = value
+        if self.constraints is not None:
+            self.constraints.assign(var, value)
+        for i, positive in self.occurrences.get(var, ()):
+            self.free_count[i] -= 1
+            if positive == value:
+                self.true_count[i] += 1
+                if self.true_count[i] == 1:
+                    self.satisfied_count += 1
+            elif self.true_count[i] == 0 and self.free_count[i] == 0:
+                self.conflicts.add(i)
+    
+    def _unassign(self, var):
+        """Retire l'affectation de var (opération inverse de _assign)"""
+        value = self.assignment.pop(var)
+        if self.constraints is not None:
+            self.constraints.unassign(var)
+        for i, positive in self.occurrences.get(var, ()):
+            if positive == value:
+                self.true_count[i] -= 1
+                if self.true_count[i] == 0:
+                    self.satisfied_count -= 1
+            elif self.true_count[i] == 0 and self.free_count[i] == 0:
+                self.conflicts.discard(i)
+            self.free_count[i] += 1
+    
+    def _propagate(self):
+        """
+        Affecte les littéraux impliqués par les contraintes natives, jusqu'au
+        point fixe ou au premier conflit
+        
+        Returns:
+            list: variables impliquées (à désaffecter avec la décision)
+        """
+        constraints = self.constraints
+        pending = constraints.pending
+        implied = []
+        while pending and not constraints.conflict:
+            literal = pending.pop()
+            var = abs(literal)
+            if var not in self.assignment:
+                self._assign(var, literal > 0)
+                implied.append(var)
+        pending.clear()
+        self.constraint_propagations += len(implied)
+        if self.metrics is not None:
+            self.metrics.counters['propagations'] += len(implied)
+        return implied
+    
+    def _undo_implied(self, implied):
+        """Désaffecte les variables impliquées d'un niveau, de la plus récente à la plus ancienne"""
+        for var in reversed(implied):
+            self._unassign(var)
+            self.heuristic.unassign(var)
+    
+    def _constraint_conflict(self):
+        """Vrai si une contrainte native est violée (après en avoir informé l'heuristique)"""
+        if self.constraints is None or not self.constraints.conflict:
+            return False
+        self.heuristic.on_conflict(self.constraints.conflict_literals)
+        return True
+    
+    def _proof_clause(self, trail):
+        """Lemme ¬(hypothèses ∧ décisions): le nœud courant n'a pas de solution"""
+        return ([-literal for literal in self.assumed] +
+                [-var if self.assignment[var] else var for var in trail])
+    
+    def select_variable(self):
+        """
+        Sélectionne la prochaine variable non affectée
+        selon l'heuristique de branchement (par défaut: la première non affectée)
+        """
+        return self.heuristic.select(self.assignment)
+    
+    def backtrack(self):
+        """
+        Algorithme de backtracking itératif (pile explicite des décisions)
+        Explore les nœuds dans le même ordre que la version récursive
+        (var = True puis var = False) et compte les mêmes backtracks,
+        sans limite de profondeur de récursion
+        Retourne True si une solution est trouvée, False sinon
+        
+        Les conflits et la satisfaction sont lus sur des compteurs par clause
+        mis à jour à chaque affectation (O(occurrences) par nœud au lieu de
+        réévaluer les m clauses)
+        
+        Avec une preuve DRAT, chaque nœud en échec ajoute le lemme
+        ¬(décisions); quand les deux branches d'une variable ont échoué, le
+        lemme du parent est RUP grâce à ceux des enfants, qui sont supprimés.
+        La racine donne la clause vide (ou ¬hypothèses).
+        
+        Avec metrics: décisions (et leur niveau), propagations (affectations
+        répercutées sur les compteurs des clauses) et conflits
+        
+        Avec budget: contrôlé tous les budget.check_interval nœuds; retourne
+        None (état inconnu) si le budget est épuisé
+        
+        Avec des contraintes natives, chaque décision (ou son inversion) est
+        suivie des affectations qu'elles impliquent, désaffectées avec elle
+        """
+        trail = []  # Variables de décision, de la plus ancienne à la plus récente
+        implied = []  # Variables impliquées par les contraintes, par décision
+        proof = self.proof
+        metrics = self.metrics
+        budget = self.budget
+        constraints = self.constraints
+        if budget is not None:
+            next_check = budget.next_check(self.backtrack_count)
+        self._init_counters()
+        num_clauses = len(self.clauses)
+        if constraints is not None:
+            constraints.reset(self.assignment)
+            self._propagate()  # Implications de niveau 0 (jamais remises en cause)
+        
+        while True:
+            # Visite d'un nœud
+            if budget is not None and self.backtrack_count >= next_check:
+                if budget.exhausted(self.backtrack_count):
+                    return None
+                next_check = budget.next_check(self.backtrack_count)
+            self.backtrack_count += 1
+            if metrics is not None and self.backtrack_count % metrics.sample_interval == 0:
+                metrics.sample(backtracks=self.backtrack_count)
+            
+            if len(self.assignment) == self.num_variables:
+                # Cas de base: toutes les variables sont affectées
+                found = self.satisfied_count == num_clauses and not (constraints is not None
+                                                                     and constraints.conflict)
+            elif self.conflicts:
+                # Détection précoce de conflit (première clause falsifiée)
+                self.heuristic.on_conflict(self.clauses[min(self.conflicts)])
+                found = False
+            elif self._constraint_conflict():
+                found = False
+            else:
+                # Sélectionner la prochaine variable et essayer var = True
+                var = self.select_variable()
+                if var is None:
+                    found = self.satisfied_count == num_clauses
+                else:
+                    self._assign(var, True)
+                    trail.append(var)
+                    if constraints is not None:
+                        implied.append(self._propagate())
+                    if metrics is not None:
+                        metrics.decision(len(trail))
+                        metrics.counters['propagations'] += 1
+                    continue
+            
+            if found:
+                return True
+            if metrics is not None:
+                metrics.counters['conflicts'] += 1
+            if proof is not None:
+                proof.add(self._proof_clause(trail))
+            
+            # Backtrack: remonter jusqu'à une variable encore à True
+            while trail:
+                var = trail[-1]
+                if constraints is not None:
+                    self._undo_implied(implied.pop())
+                if self.assignment[var]:
+                    # Essayer var = False
+                    self._unassign(var)
+                    self._assign(var, False)
+                    if constraints is not None:
+                        implied.append(self._propagate())
+                    if metrics is not None:
+                        metrics.counters['propagations'] += 1
+                    break
+                # Les deux valeurs ont échoué: retirer l'affectation
+                self._unassign(var)
+                self.heuristic.unassign(var)
+                trail.pop()
+                if proof is not None:
+                    parent = self._proof_clause(trail)
+                    proof.add(parent)
+                    proof.delete(parent + [-var])
+                    proof.delete(parent + [var])
+            else:
+                return False
+    
+    def solve(self, parallel=None, assumptions=None):
+        """
+        Lance la résolution
+        
+        Args:
+            parallel: nombre de processus; si > 1, résolution par
+                      cube-and-conquer (voir solve_3SAT_parallel)
+            assumptions: littéraux supposés vrais pour cet appel uniquement
+                         (fixés avant la recherche, jamais remis en cause);
+                         en cas d'échec, voir failed_assumptions()
+        
+        Avec proof, la preuve DRAT est écrite (vidée dans le fichier) à la fin
+        de l'appel; elle n'est pas produite en mode parallèle
+        Avec metrics, les phases 'solve', 'init' et 'search' sont chronométrées
+        et stats['metrics'] contient le résumé (SolverMetrics.to_dict)
+        Avec budget, la recherche s'arrête quand il est épuisé (ou annulé):
+        success vaut None et stats['budget'] donne la raison (en mode
+        parallèle, les cubes reçoivent le temps restant et le pool est arrêté)
+        
+        Returns:
+            tuple: (success, assignment, stats)
+                success: True si solution trouvée, False si insatisfiable,
+                         None si le budget est épuisé
+                assignment: dictionnaire {variable: valeur} ou None
+                stats: dictionnaire avec statistiques (status: 'SAT',
+                       'UNSAT' ou 'UNKNOWN')
+        """
+        assumptions = list(assumptions or [])
+        if parallel and parallel > 1:
+            return self._solve_parallel(parallel, assumptions)
+        
+        metrics = self.metrics
+        if metrics is not None:
+            solve_start = time.perf_counter()
+        if self.budget is not None:
+            self.budget.start()
+        
+        self.assignment = {}
+        self.backtrack_count = 0
+        self.constraint_propagations = 0
+        self.failed = []
+        self.assumed = list(dict.fromkeys(assumptions))
+        for literal in assumptions:
+            self.num_variables = max(self.num_variables, abs(literal))
+        self.heuristic.reset(self.clauses, self.num_variables)
+        
+        # Les hypothèses sont des affectations fixes (hors de la pile de décisions)
+        for literal in assumptions:
+            var, value = abs(literal), literal > 0
+            if self.assignment.get(var, value) != value:
+                self.failed = [-literal, literal]  # Hypothèses contradictoires
+                break
+            self.assignment[var] = value
+        
+        if metrics is not None:
+            search_start = time.perf_counter()
+            metrics.add_time('init', solve_start, search_start)
+        success = not self.failed and self.backtrack()
+        if self.proof is not None:
+            self.proof.flush()
+        if metrics is not None:
+            metrics.add_time('search', search_start)
+        
+        if success is False and assumptions and not self.failed:
+            # Clause falsifiée par les seules hypothèses: ses littéraux suffisent
+            if self.conflicts:
+                clause = self.clauses[min(self.conflicts)]
+                self.failed = [literal for literal in dict.fromkeys(assumptions) if -literal in clause]
+            else:
+                self.failed = list(dict.fromkeys(assumptions))
+        
+        stats = {
+            'backtrack_count': self.backtrack_count,
+            'num_variables': self.num_variables,
+            'num_clauses': len(self.clauses),
+            'heuristic': self.heuristic_name,
+            'status': {True: 'SAT', False: 'UNSAT', None: 'UNKNOWN'}[success],
+            'assumptions': len(assumptions)
+        }
+        if self.constraints is not None:
+            stats['constraints'] = len(self.constraint_list)
+            stats['constraint_propagations'] = self.constraint_propagations
+        if self.budget is not None:
+            stats['budget'] = self.budget.to_dict()
+        if metrics is not None:
+            metrics.add_time('solve', solve_start)
+            metrics.sample(backtracks=self.backtrack_count)
+            stats['metrics'] = metrics.to_dict()
+        
+        if success:
+            return True, dict(self.assignment), stats
+        else:
+            return success, None, stats
+    
+    def _solve_parallel(self, workers, assumptions):
+        """
+        solve(parallel=workers): cube-and-conquer avec l'heuristique, les
+        contraintes natives, les métriques et le budget de ce solveur; les
+        hypothèses deviennent des clauses unitaires
+        """
+        from solve_3SAT_parallel import solve_cube_and_conquer
+        
+        metrics = self.metrics
+        if metrics is not None:
+            solve_start = time.perf_counter()
+        for literal in assumptions:
+            self.num_variables = max(self.num_variables, abs(literal))
+        units = [[literal] for literal in assumptions]
+        success, assignment, stats = solve_cube_and_conquer(
+            self.clauses + units, self.num_variables, workers=workers, heuristic=self.heuristic_name,
+            constraints=self.constraint_list, metrics=metrics, budget=self.budget)
+        
+        # Hypothèses responsables de l'échec: une paire contradictoire, sinon toutes
+        self.failed = []
+        if success is False and assumptions:
+            values = {}
+            for literal in assumptions:
+                if values.setdefault(abs(literal), literal) != literal:
+                    self.failed = [-literal, literal]
+                    break
+            else:
+                self.failed = list(dict.fromkeys(assumptions))
+        
+        stats['assumptions'] = len(assumptions)
+        if self.constraints is not None:
+            stats['constraints'] = len(self.constraint_list)
+        if metrics is not None:
+            metrics.add_time('solve', solve_start)
+            stats['metrics'] = metrics.to_dict()
+        return success, assignment, stats
+    
+    def solve_all(self, max_solutions=10):
+        """
+        Trouve toutes les solutions (ou jusqu'à max_solutions)
+        
+        Returns:
+            list: Liste des affectations solutions
+        """
+        self.solutions_found = list(islice(self.iter_models(), max_solutions))
+        return self.solutions_found
+    
+    def iter_models(self):
+        """
+        Générateur des solutions, produites une par une au fil du backtracking
+        (même ordre que solve_all, sans les garder en mémoire)
+        
+        Yields:
+            dict: affectation {variable: valeur} satisfaisant toutes les clauses
+        """
+        self.assignment = {}
+        self.heuristic.reset(self.clauses, self.num_variables)
+        trail = []
+        implied = []  # Variables impliquées par les contraintes natives, par décision
+        constraints = self.constraints
+        self._init_counters()
+        num_clauses = len(self.clauses)
+        if constraints is not None:
+            constraints.reset(self.assignment)
+            self._propagate()
+        
+        try:
+            while True:
+                # Visite d'un nœud: descendre tant que c'est possible
+                if constraints is not None and constraints.conflict:
+                    pass
+                elif len(self.assignment) == self.num_variables:
+                    if self.satisfied_count == num_clauses:
+                        yield dict(self.assignment)
+                elif not self.conflicts:
+                    var = self.select_variable()
+                    if var is not None:
+                        # Essayer var = True
+                        self._assign(var, True)
+                        trail.append(var)
+                        if constraints is not None:
+                            implied.append(self._propagate())
+                        continue
+                
+                # Backtrack
+                while trail:
+                    var = trail[-1]
+                    if constraints is not None:
+                        self._undo_implied(implied.pop())
+                    if self.assignment[var]:
+                        # Essayer var = False
+                        self._unassign(var)
+                        self._assign(var, False)
+                        if constraints is not None:
+                            implied.append(self._propagate())
+                        break
+                    self._unassign(var)
+                    self.heuristic.unassign(var)
+                    trail.pop()
+                else:
+                    return
+        finally:
+            # Générateur abandonné avant la fin: retirer les décisions en cours
+            while trail:
+                if implied:
+                    self._undo_implied(implied.pop())
+                var = trail.pop()
+                self._unassign(var)
+                self.heuristic.unassign(var)
+    
+    def count_models(self, cache_size=None):
+        """
+        Nombre exact de solutions (#SAT), sans les énumérer
+        (décomposition en composantes connexes + cache LRU, voir solve_3SAT_count)
+        
+        Returns:
+            int: nombre d'affectations de x1..xn satisfaisant la formule
+        """
+        if self.constraints is not None:
+            # Les composantes ne tiennent pas compte des contraintes: énumération
+            return sum(1 for _ in self.iter_models())
+        
+        from solve_3SAT_count import ModelCounter, COMPONENT_CACHE_SIZE
+        
+        counter = ModelCounter(self.clauses, self.num_variables,
+                               cache_size or COMPONENT_CACHE_SIZE)
+        return counter.count()
+
+
+# Moteurs de résolution disponibles (tous exposent solve() -> (success, assignment, stats))
+SOLVER_ENGINES = ('backtracking', 'cdcl', 'walksat', 'probsat')
+# Moteurs complets capables d'écrire une preuve DRAT de l'insatisfiabilité
+# et instrumentés par SolverMetrics
+PROOF_ENGINES = ('backtracking', 'cdcl')
+
+
+def create_solver(clauses, num_variables, engine='backtracking', heuristic='first', preprocess=False,
+                  proof=None, metrics=None, budget=None, constraints=None):
+    """
+    Instancie le moteur de résolution demandé
+
+    Args:
+        clauses: liste de clauses (listes d'entiers signés)
+        num_variables: nombre de variables
+        engine: 'backtracking' (SAT3Solver), 'cdcl' (CDCLSolver), ou
+                'walksat' / 'probsat' (LocalSearchSolver, incomplet: retourne
+                success=None si le budget est épuisé)
+        heuristic: heuristique de branchement du backtracking
+                   ('first', 'vsids', 'mom' ou 'jw', voir BRANCHING_HEURISTICS)
+        preprocess: simplifier la formule avant résolution (voir preprocess_3SAT);
+                    le modèle retourné porte sur les variables d'origine
+        proof: fichier (ou DRATWriter) recevant la preuve DRAT d'une réponse
+               INSATISFIABLE; seulement pour les moteurs de PROOF_ENGINES,
+               sans prétraitement
+        metrics: SolverMetrics recevant compteurs et temps par phase
+                 (moteurs de PROOF_ENGINES; ignoré par la recherche locale)
+        budget: SolverBudget (temps, nœuds, conflits, mémoire, annulation, voir
+                budget_3SAT); épuisé, solve() retourne success=None et
+                stats['status'] = 'UNKNOWN'
+        constraints: contraintes AtMost / Xor (voir constraints_3SAT), propagées
+                     nativement par le backtracking, encodées en CNF pour les
+                     autres moteurs et avec prétraitement (sans preuve DRAT)
+
+    Returns:
+        Un solveur possédant la méthode solve()
+    """
+    if proof is not None and (preprocess or engine not in PROOF_ENGINES):
+        raise ValueError(f"Preuve DRAT disponible seulement pour {', '.join(PROOF_ENGINES)} "
+                         f"sans prétraitement")
+    if constraints and (preprocess or engine != 'backtracking'):
+        if proof is not None:
+            raise ValueError("Preuve DRAT indisponible avec des contraintes natives")
+        from constraints_3SAT import EncodedSolver
+        return EncodedSolver(clauses, num_variables, constraints, engine, heuristic, preprocess,
+                             metrics, budget)
+    if preprocess:
+        if engine not in SOLVER_ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine} (disponibles: {', '.join(SOLVER_ENGINES)})")
+        from preprocess_3SAT import PreprocessedSolver
+        return PreprocessedSolver(clauses, num_variables, engine, heuristic, metrics=metrics,
+                                  budget=budget)
+    if engine == 'backtracking':
+        return SAT3Solver(clauses, num_variables, heuristic, proof, metrics, budget, constraints)
+    if engine == 'cdcl':
+        from solve_3SAT_cdcl import CDCLSolver
+        return CDCLSolver(clauses, num_variables, proof, metrics, budget)
+    if engine in ('walksat', 'probsat'):
+        from solve_3SAT_local import LocalSearchSolver
+        return LocalSearchSolver(clauses, num_variables, algorithm=engine, budget=budget)
+    raise ValueError(f"Moteur inconnu: {engine} (disponibles: {', '.join(SOLVER_ENGINES)})")
+
+
+def read_3sat_from_file(filename, format='auto'):
+    """
+    Lit une instance 3-SAT depuis un fichier
+    Supporte les formats: simple, DIMACS CNF
+    
+    Args:
+        filename: nom du fichier (les fichiers .gz, .xz et .bz2 sont lus en DIMACS)
+        format: 'simple', 'dimacs', ou 'auto' (détection automatique)
+    
+    Format simple:
+    3
+    3
+    1 -2 3
+    -1 2 -3
+    1 2 3
+    
+    Format DIMACS CNF:
+    c Commentaires
+    p cnf 3 3
+    1 -2 3 0
+    -1 2 -3 0
+    1 2 3 0
+    """
+    # Détection automatique du format
+    if format == 'auto' and filename.endswith(('.gz', '.xz', '.bz2')):
+        format = 'dimacs'
+    if format == 'auto':
+        with open(filename, 'r') as f:
+            first_line = f.readline().strip()
+            if first_line.startswith('c') or first_line.startswith('p'):
+                format = 'dimacs'
+            else:
+                format = 'simple'
+    
+    if format == 'dimacs':
+        # Utiliser le lecteur DIMACS
+        try:
+            from dimacs_reader import read_dimacs_cnf
+            clauses, num_variables = read_dimacs_cnf(filename)
+            
+            # Filtrer pour ne garder que les clauses de taille 3
+            clauses_3sat = [c for c in clauses if len(c) == 3]
+            if len(clauses_3sat) < len(clauses):
+                print(f"⚠️  {len(clauses) - len(clauses_3sat)} clauses ignorées (pas 3 littéraux)")
+            
+            return clauses_3sat, num_variables
+        except ImportError:
+            print("⚠️  Module dimacs_reader non trouvé, utilisation du format simple")
+            format = 'simple'
+    
+    if format == 'simple':
+        # Format simple original
+        with open(filename, 'r') as f:
+            lines = f.readlines()
+        
+        num_variables = int(lines[0].strip())
+        num_clauses = int(lines[1].strip())
+        
+        clauses = []
+        for i in range(2, 2 + num_clauses):
+            literals = list(map(int, lines[i].strip().split()))
+            if len(literals) != 3:
+                raise ValueError(f"Clause {i-1} n'a pas exactement 3 littéraux: {literals}")
+            clauses.append(literals)
+        
+        return clauses, num_variables
+
+
+def write_solution_to_file(filename, success, assignment, stats):
+    """Écrit la solution dans un fichier"""
+    with open(filename, 'w') as f:
+        if success:
+            f.write("SATISFIABLE\n")
+            f.write("Affectation:\n")
+            for var in sorted(assignment.keys()):
+                value = "vrai" if assignment[var] else "faux"
+                f.write(f"  x{var} = {value}\n")
+        else:
+            f.write("INSATISFIABLE\n")
+        
+        f.write("\nStatistiques:\n")
+        f.write(f"  Nombre de backtracks: {stats['backtrack_count']}\n")
+        f.write(f"  Nombre de variables: {stats['num_variables']}\n")
+        f.write(f"  Nombre de clauses: {stats['num_clauses']}\n")
+
+
+def write_models_to_file(filename, models, max_models=None):
+    """
+    Écrit les solutions au fil de l'eau, une par ligne au format DIMACS
+    (v 1 -2 3 0), sans les garder en mémoire
+    
+    Args:
+        filename: fichier de sortie
+        models: itérable d'affectations (par exemple solver.iter_models())
+        max_models: nombre maximal de solutions écrites (None: toutes)
+    
+    Returns:
+        int: nombre de solutions écrites
+    """
+    count = 0
+    with open(filename, 'w') as f:
+        for assignment in islice(models, max_models):
+            literals = " ".join(str(var if assignment[var] else -var)
+                                for var in sorted(assignment))
+            f.write(f"v {literals} 0\n")
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    # Exemple d'utilisation
+    print("=== Exemple 3-SAT Solver ===\n")
+    
+    # Exemple de l'énoncé: F = (x₁ ∨ ¬x₂ ∨ x₃) ∧ (¬x₁ ∨ x₂ ∨ ¬x₃) ∧ (x₁ ∨ x₂ ∨ x₃)
+    clauses = [
+        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
+        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
+        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
+    ]
+    num_variables = 3
+    
+    print("Formule:")
+    for i, clause in enumerate(clauses, 1):
+        print(f"  C{i}: {clause}")
+    
+    solver = SAT3Solver(clauses, num_variables)
+    success, assignment, stats = solver.solve()
+    
+    print("\nRésultat:")
+    if success:
+        print("✓ SATISFIABLE")
+        print("\nAffectation trouvée:")
+        for var in sorted(assignment.keys()):
+            value = "vrai" if assignment[var] else "faux"
+            print(f"  x{var} = {value}")
+    else:
+        print("✗ INSATISFIABLE")
+    
+    print(f"\nStatistiques:")
+    print(f"  Backtracks: {stats['backtrack_count']}")
+    print(f"  Variables: {stats['num_variables']}")
+    print(f"  Clauses: {stats['num_clauses']}")
+    
+    # Énumération paresseuse et comptage exact des solutions
+    print(f"\nToutes les solutions:")
+    for model in solver.iter_models():
+        print("  " + ", ".join(f"x{var}={'V' if value else 'F'}" for var, value in sorted(model.items())))
+    print(f"  Nombre de modèles (#SAT): {solver.count_models()}")
@@ -0,0 +1,707 @@
+"""
+Solveur CDCL (Conflict-Driven Clause Learning) pour 3-SAT / SAT
+Même contrat que SAT3Solver: solve() -> (success, assignment, stats)
+
+Techniques utilisées:
+- Propagation unitaire avec deux littéraux surveillés (watched literals)
+- Apprentissage de clauses au premier point d'implication unique (1-UIP),
+  minimisées récursivement (littéraux impliqués par les autres retirés)
+- Retour arrière non chronologique (backjumping)
+- Heuristique VSIDS + sauvegarde de phase
+- Redémarrages selon la suite de Luby
+- Nettoyage périodique des clauses apprises (LBD)
+- Résolution incrémentale: add_clause() et solve(assumptions=[...]) entre
+  deux appels, en conservant clauses apprises et activités
+- Preuve DRAT optionnelle: clauses apprises (RUP) et supprimées, puis la
+  clause vide en cas d'insatisfiabilité (voir drat_3SAT)
+- Instrumentation optionnelle (SolverMetrics, voir metrics_3SAT): niveaux
+  de décision, temps de propagation / analyse / nettoyage, échantillons
+  des compteurs à chaque redémarrage
+- Budget optionnel (SolverBudget, voir budget_3SAT): temps, décisions,
+  conflits, mémoire et annulation, contrôlés tous les check_interval
+  décisions + conflits; épuisé, solve() retourne success=None
+
+Portée mesurée (Python pur, un cœur, 3-SAT aléatoire au ratio 4.26): 100
+variables en moins de 0,2 s, 150 en 0,1 à 2 s, 200 en 0,2 à 8 s. À 250
+variables (taille uf250), certaines instances sont résolues en moins d'une
+seconde et d'autres en 20 à 30 s, mais la moitié dépassent 60 s: uf250
+n'est pas résolu en quelques secondes. La propagation est le poste principal
+(environ 60 % du temps, de l'ordre de 250 000 littéraux propagés par
+seconde); pour les instances satisfiables de cette taille, voir la
+recherche locale (solve_3SAT_local).
+"""
+import os
+import time
+
+
+class CDCLSolver:
+    """
+    Codage interne des littéraux:
+        x_v  → 2*v
+        ¬x_v → 2*v + 1
+    La négation d'un littéral l est donc l ^ 1 et sa variable l >> 1.
+
+    values[l] vaut 1 (vrai), -1 (faux) ou 0 (non affecté) pour chaque littéral.
+    """
+
+    RESTART_BASE = 100       # Nombre de conflits de l'unité de Luby
+    VAR_DECAY = 0.95         # Décroissance des activités VSIDS
+    COMPACT_RATIO = 0.5      # Part de clauses supprimées déclenchant le compactage de db
+
+    def __init__(self, clauses, num_variables, proof=None, metrics=None, budget=None):
+        self.clauses = list(clauses)  # Clauses d'origine (entiers signés), complétées par add_clause
+        self.num_variables = num_variables
+
+        n_lits = 2 * num_variables + 2
+        self.values = [0] * n_lits
+        self.level = [0] * (num_variables + 1)
+        self.reason = [None] * (num_variables + 1)
+        self.phase = [False] * (num_variables + 1)   # Dernière valeur connue
+        self.seen = [False] * (num_variables + 1)
+        self.activity = [0.0] * (num_variables + 1)
+        self.var_inc = 1.0
+
+        self.db = []                            # Clauses internes (listes de littéraux codés)
+        self.lbd = []                           # LBD de chaque clause (0 = clause d'origine)
+        self.watches = [[] for _ in range(n_lits)]
+        self.learnts = []                       # Indices des clauses apprises
+        self.dead = 0                           # Clauses supprimées (None) encore dans db
+        self.max_learnts = max(len(clauses) // 3, 100)
+
+        self.trail = []
+        self.trail_lim = []                     # Début de chaque niveau de décision
+        self.qhead = 0
+        # Tas binaire indexé des variables (activité maximale en tête): au plus
+        # une entrée par variable, heap_index[v] = position de v (-1 si absente)
+        self.heap = list(range(1, num_variables + 1))
+        self.heap_index = [-1] + list(range(num_variables))
+
+        self.unsat = False
+        self.assumptions = []                   # Littéraux codés supposés vrais
+        self.conflict = []                      # Hypothèses responsables du dernier UNSAT
+        self.decisions = 0
+        self.propagations = 0
+        self.conflicts = 0
+        self.restarts = 0
+
+        if isinstance(proof, (str, os.PathLike)):
+            from drat_3SAT import DRATWriter
+            proof = DRATWriter(proof)
+        self.proof = proof
+        self.metrics = metrics
+        self.budget = budget
+
+        for clause in clauses:
+            self._add_clause(clause)
+
+    # ------------------------------------------------------------------
+    # Construction de la base de clauses
+    # ------------------------------------------------------------------
+
+    def _ensure_variable(self, var):
+        """Agrandit les structures si var dépasse le nombre de variables"""
+        while self.num_variables < var:
+            self.num_variables += 1
+            self.values += [0, 0]
+            self.watches += [[], []]
+            self.level.append(0)
+            self.reason.append(None)
+            self.phase.append(False)
+            self.seen.append(False)
+            self.activity.append(0.0)
+            self.heap_index.append(-1)
+            self._heap_insert(self.num_variables)
+
+    def add_clause(self, clause):
+        """
+        Ajoute une clause entre deux appels à solve(); les clauses apprises
+        restent valides puisqu'elles sont impliquées par les clauses existantes
+        """
+        self._cancel_until(0)
+        for literal in clause:
+            self._ensure_variable(abs(literal))
+        self.clauses.append(list(clause))
+        self._add_clause(clause)
+
+    def _add_clause(self, clause):
+        """Ajoute une clause d'origine (simplifiée au niveau 0)"""
+        if self.unsat:
+            return
+        lits = []
+        for literal in clause:
+            lit = 2 * abs(literal) + (literal < 0)
+            if lit ^ 1 in lits or self.values[lit] == 1:
+                return  # Tautologie ou clause déjà satisfaite au niveau 0
+            if lit not in lits and self.values[lit] == 0:
+                lits.append(lit)  # Les littéraux faux au niveau 0 sont retirés
+
+        if not lits:
+            self.unsat = True
+        elif len(lits) == 1:
+            value = self.values[lits[0]]
+            if value == -1:
+                self.unsat = True
+            elif value == 0:
+                self._enqueue(lits[0], None)
+                if self._propagate() is not None:
+                    self.unsat = True
+        else:
+            self._attach(lits, 0)
+
+    @staticmethod
+    def _decode(lits):
+        """Littéraux codés -> entiers signés"""
+        return [(lit >> 1) * (-1 if lit & 1 else 1) for lit in lits]
+
+    def _attach(self, lits, lbd):
+        """Enregistre une clause et surveille ses deux premiers littéraux"""
+        index = len(self.db)
+        self.db.append(lits)
+        self.lbd.append(lbd)
+        self.watches[lits[0]].append(index)
+        self.watches[lits[1]].append(index)
+        return index
+
+    # ------------------------------------------------------------------
+    # Affectation et propagation
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, lit, reason):
+        var = lit >> 1
+        self.values[lit] = 1
+        self.values[lit ^ 1] = -1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _propagate(self):
+        """
+        Propagation unitaire par littéraux surveillés
+        Retourne l'indice de la clause en conflit, ou None
+        """
+        values = self.values
+        watches = self.watches
+        db = self.db
+        trail = self.trail
+        level = self.level
+        reason = self.reason
+        current = len(self.trail_lim)
+
+        while self.qhead < len(trail):
+            false_lit = trail[self.qhead] ^ 1
+            self.qhead += 1
+            self.propagations += 1
+
+            ws = watches[false_lit]
+            i = j = 0
+            n = len(ws)
+            while i < n:
+                ci = ws[i]
+                i += 1
+                c = db[ci]
+                if c is None:
+                    continue  # Clause supprimée: on retire la surveillance
+
+                # Le littéral devenu faux est placé en position 1
+                if c[0] == false_lit:
+                    c[0] = c[1]
+                    c[1] = false_lit
+                first = c[0]
+                if values[first] == 1:
+                    ws[j] = ci
+                    j += 1
+                    continue
+
+                # Chercher un nouveau littéral non faux à surveiller
+                for k in range(2, len(c)):
+                    lit = c[k]
+                    if values[lit] != -1:
+                        c[1] = lit
+                        c[k] = false_lit
+                        watches[lit].append(ci)
+                        break
+                else:
+                    ws[j] = ci
+                    j += 1
+                    if values[first] == -1:
+                        # Conflit: conserver les surveillances restantes
+                        while i < n:
+                            ws[j] = ws[i]
+                            j += 1
+                            i += 1
+                        del ws[j:]
+                        return ci
+                    # Affectation impliquée (équivalent en ligne de _enqueue)
+                    values[first] = 1
+                    values[first ^ 1] = -1
+                    level[first >> 1] = current
+                    reason[first >> 1] = ci
+                    trail.append(first)
+            del ws[j:]
+        return None
+
+    def _cancel_until(self, level):
+        """Annule les affectations au-delà du niveau donné (backjumping)"""
+        if len(self.trail_lim) <= level:
+            return
+        values = self.values
+        limit = self.trail_lim[level]
+        for lit in self.trail[limit:]:
+            var = lit >> 1
+            values[lit] = 0
+            values[lit ^ 1] = 0
+            self.reason[var] = None
+            self.phase[var] = not (lit & 1)
+            if self.heap_index[var] < 0:
+                self._heap_insert(var)
+        del self.trail[limit:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    # ------------------------------------------------------------------
+    # Tas des variables (VSIDS)
+    # ------------------------------------------------------------------
+
+    def _heap_up(self, i):
+        """Remonte heap[i] tant que son activité dépasse celle de son parent"""
+        heap, index, activity = self.heap, self.heap_index, self.activity
+        var = heap[i]
+        act = activity[var]
+        while i:
+            parent = (i - 1) >> 1
+            other = heap[parent]
+            if activity[other] > act or (activity[other] == act and other < var):
+                break
+            heap[i] = other
+            index[other] = i
+            i = parent
+        heap[i] = var
+        index[var] = i
+
+    def _heap_down(self, i):
+        """Descend heap[i] sous ses enfants d'activité supérieure"""
+        heap, index, activity = self.heap, self.heap_index, self.activity
+        size = len(heap)
+        var = heap[i]
+        act = activity[var]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            best = heap[child]
+            if child + 1 < size:
+                right = heap[child + 1]
+                if activity[right] > activity[best] or (activity[right] == activity[best] and right < best):
+                    child += 1
+                    best = right
+            if activity[best] < act or (activity[best] == act and best > var):
+                break
+            heap[i] = best
+            index[best] = i
+            i = child
+        heap[i] = var
+        index[var] = i
+
+    def _heap_insert(self, var):
+        self.heap.append(var)
+        self._heap_up(len(self.heap) - 1)
+
+    def _heap_pop(self):
+        """Retire et retourne la variable d'activité maximale"""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.heap_index[top] = -1
+        if heap:
+            heap[0] = last
+            self._heap_down(0)
+        return top
+
+    # ------------------------------------------------------------------
+    # Analyse de conflit (1-UIP)
+    # ------------------------------------------------------------------
+
+    def _bump(self, var):
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            # Remise à l'échelle pour éviter le dépassement flottant (l'ordre du tas est conservé)
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+        if self.heap_index[var] >= 0:
+            self._heap_up(self.heap_index[var])
+
+    def _analyze(self, confl):
+        """
+        Dérive la clause apprise au premier UIP
+
+        Returns:
+            tuple: (learnt, backjump_level)
+        """
+        seen = self.seen
+        level = self.level
+        current = len(self.trail_lim)
+        learnt = [0]  # learnt[0] sera le littéral UIP (affirmé)
+        path_count = 0
+        lit = None
+        index = len(self.trail) - 1
+
+        while True:
+            clause = self.db[confl]
+            start = 0 if lit is None else 1  # clause[0] est le littéral impliqué
+            for q in clause[start:]:
+                var = q >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = True
+                    self._bump(var)
+                    if level[var] >= current:
+                        path_count += 1
+                    else:
+                        learnt.append(q)
+
+            while not seen[self.trail[index] >> 1]:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            confl = self.reason[lit >> 1]
+            seen[lit >> 1] = False
+            path_count -= 1
+            if path_count == 0:
+                break
+
+        learnt[0] = lit ^ 1
+
+        # Minimisation récursive: retirer les littéraux impliqués par les autres
+        to_clear = [q >> 1 for q in learnt[1:]]
+        abstract = 0
+        for var in to_clear:
+            abstract |= 1 << (level[var] & 31)
+        kept = [learnt[0]]
+        for q in learnt[1:]:
+            if self.reason[q >> 1] is None or not self._redundant(q, abstract, to_clear):
+                kept.append(q)
+        for var in to_clear:
+            seen[var] = False
+
+        # Niveau de retour: le plus haut niveau parmi les autres littéraux
+        if len(kept) == 1:
+            return kept, 0
+        best = 1
+        for k in range(2, len(kept)):
+            if level[kept[k] >> 1] > level[kept[best] >> 1]:
+                best = k
+        kept[1], kept[best] = kept[best], kept[1]
+        return kept, level[kept[1] >> 1]
+
+    def _redundant(self, lit, abstract, to_clear):
+        """
+        Vrai si lit est impliqué par les autres littéraux de la clause apprise
+        (marqués dans seen), en remontant les raisons; abstract est la signature
+        de leurs niveaux, qui écarte les raisons sortant de ces niveaux
+        """
+        seen, level, reason, db = self.seen, self.level, self.reason, self.db
+        top = len(to_clear)
+        stack = [lit]
+        while stack:
+            for q in db[reason[stack.pop() >> 1]][1:]:
+                var = q >> 1
+                if not seen[var] and level[var] > 0:
+                    if reason[var] is None or not (1 << (level[var] & 31)) & abstract:
+                        for other in to_clear[top:]:
+                            seen[other] = False
+                        del to_clear[top:]
+                        return False
+                    seen[var] = True
+                    stack.append(q)
+                    to_clear.append(var)
+        return True
+
+    # ------------------------------------------------------------------
+    # Gestion des clauses apprises
+    # ------------------------------------------------------------------
+
+    def _reduce_db(self):
+        """Supprime la moitié des clauses apprises les moins utiles (LBD élevé)"""
+        candidates = []
+        for ci in self.learnts:
+            c = self.db[ci]
+            locked = self.reason[c[0] >> 1] == ci and self.values[c[0]] == 1
+            if self.lbd[ci] > 2 and not locked:
+                candidates.append(ci)
+        candidates.sort(key=lambda ci: (self.lbd[ci], len(self.db[ci])), reverse=True)
+        removed = set(candidates[:len(candidates) // 2])
+        for ci in removed:
+            if self.proof is not None:
+                self.proof.delete(self._decode(self.db[ci]))
+            self.db[ci] = None  # Les surveillances sont retirées paresseusement
+        self.learnts = [ci for ci in self.learnts if ci not in removed]
+        self.max_learnts = int(self.max_learnts * 1.1)
+        self.dead += len(removed)
+        if self.dead > self.COMPACT_RATIO * len(self.db):
+            self._compact_db()
+
+    def _compact_db(self):
+        """
+        Retire de db les clauses supprimées et renumérote les autres dans les
+        clauses apprises, les raisons et les surveillances
+        """
+        remap = [-1] * len(self.db)
+        db, lbd = [], []
+        for ci, c in enumerate(self.db):
+            if c is not None:
+                remap[ci] = len(db)
+                db.append(c)
+                lbd.append(self.lbd[ci])
+        self.db, self.lbd = db, lbd
+        self.learnts = [remap[ci] for ci in self.learnts]
+        # Les clauses raisons d'une affectation ne sont jamais supprimées
+        self.reason = [None if ci is None else remap[ci] for ci in self.reason]
+        self.watches = [[remap[ci] for ci in ws if remap[ci] >= 0] for ws in self.watches]
+        self.dead = 0
+
+    @staticmethod
+    def _luby(i):
+        """i-ème terme (à partir de 0) de la suite de Luby: 1 1 2 1 1 2 4 ..."""
+        size, seq = 1, 0
+        while size < i + 1:
+            seq += 1
+            size = 2 * size + 1
+        while size - 1 != i:
+            size = (size - 1) >> 1
+            seq -= 1
+            i = i % size
+        return 2 ** seq
+
+    def _pick_branch_variable(self):
+        values = self.values
+        while self.heap:
+            var = self._heap_pop()
+            if values[2 * var] == 0:
+                return var
+        return None
+
+    # ------------------------------------------------------------------
+    # Boucle principale
+    # ------------------------------------------------------------------
+
+    def _analyze_final(self, lit):
+        """
+        Hypothèses responsables de la fausseté de l'hypothèse lit
+        (remontée des raisons depuis ¬lit jusqu'aux décisions)
+        """
+        conflict = [lit]
+        if not self.trail_lim:
+            return conflict
+        seen = self.seen
+        seen[lit >> 1] = True
+        for index in range(len(self.trail) - 1, self.trail_lim[0] - 1, -1):
+            var = self.trail[index] >> 1
+            if seen[var]:
+                reason = self.reason[var]
+                if reason is None:
+                    # Décision: aux premiers niveaux, ce sont des hypothèses
+                    conflict.append(self.trail[index])
+                else:
+                    for q in self.db[reason][1:]:
+                        if self.level[q >> 1] > 0:
+                            seen[q >> 1] = True
+                seen[var] = False
+        seen[lit >> 1] = False
+        return conflict
+
+    def _sync_metrics(self):
+        """Recopie les compteurs internes dans metrics et les échantillonne"""
+        self.metrics.sample(propagations=self.propagations, conflicts=self.conflicts,
+                            restarts=self.restarts, backtracks=self.conflicts)
+
+    def _search(self):
+        """Recherche CDCL; retourne True (SAT), False (UNSAT) ou None (budget épuisé)"""
+        if self.unsat:
+            return False
+        if self._propagate() is not None:
+            self.unsat = True
+            return False
+
+        metrics = self.metrics
+        budget = self.budget
+        if budget is not None:
+            next_check = budget.next_check()
+        clock = time.perf_counter
+        conflicts_until_restart = self.RESTART_BASE * self._luby(self.restarts)
+        while True:
+            if budget is not None and self.decisions + self.conflicts >= next_check:
+                if budget.exhausted(self.decisions, self.conflicts):
+                    return None
+                next_check = budget.next_check(self.decisions, self.conflicts)
+            if metrics is None:
+                confl = self._propagate()
+            else:
+                start = clock()
+                confl = self._propagate()
+                metrics.add_time('propagate', start, event=False)
+            if confl is not None:
+                self.conflicts += 1
+                conflicts_until_restart -= 1
+                if not self.trail_lim:
+                    self.unsat = True  # Conflit au niveau 0: insatisfiable sans hypothèse
+                    return False
+
+                if metrics is not None:
+                    start = clock()
+                learnt, backjump = self._analyze(confl)
+                if metrics is not None:
+                    metrics.add_time('analyze', start, event=False)
+                if self.proof is not None:
+                    self.proof.add(self._decode(learnt))
+                self._cancel_until(backjump)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    lbd = len({self.level[q >> 1] for q in learnt})
+                    ci = self._attach(learnt, lbd)
+                    self.learnts.append(ci)
+                    self._enqueue(learnt[0], ci)
+                self.var_inc /= self.VAR_DECAY
+                continue
+
+            if conflicts_until_restart <= 0:
+                self.restarts += 1
+                conflicts_until_restart = self.RESTART_BASE * self._luby(self.restarts)
+                self._cancel_until(0)
+                if metrics is not None:
+                    self._sync_metrics()
+            if len(self.learnts) - len(self.trail) >= self.max_learnts:
+                if metrics is None:
+                    self._reduce_db()
+                else:
+                    with metrics.phase('reduce_db'):
+                        self._reduce_db()
+
+            # Les hypothèses sont décidées en premier, une par niveau
+            next_lit = None
+            while len(self.trail_lim) < len(self.assumptions):
+                lit = self.assumptions[len(self.trail_lim)]
+                if self.values[lit] == 1:
+                    self.trail_lim.append(len(self.trail))  # Déjà vraie: niveau vide
+                elif self.values[lit] == -1:
+                    self.conflict = self._analyze_final(lit)
+                    return False
+                else:
+                    next_lit = lit
+                    break
+
+            if next_lit is None:
+                var = self._pick_branch_variable()
+                if var is None:
+                    return True  # Toutes les variables sont affectées sans conflit
+                next_lit = 2 * var + (not self.phase[var])
+
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(next_lit, None)
+            if metrics is not None:
+                metrics.decision(len(self.trail_lim))
+
+    def solve(self, assumptions=None):
+        """
+        Lance la résolution CDCL
+
+        Args:
+            assumptions: littéraux (entiers signés) supposés vrais pour cet
+                         appel uniquement; si la formule est insatisfiable sous
+                         ces hypothèses, failed_assumptions() donne les responsables
+
+        Returns:
+            tuple: (success, assignment, stats)
+                success: True si solution trouvée, False si insatisfiable,
+                         None si le budget est épuisé
+                assignment: dictionnaire {variable: valeur} ou None
+                stats: dictionnaire avec statistiques
+                    (compteurs de cet appel seulement; backtrack_count =
+                    nombre de conflits, chacun provoquant un retour arrière; 'metrics' si l'instrumentation est active,
+                    'budget' si un budget est donné)
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            solve_start = time.perf_counter()
+        if self.budget is not None:
+            self.budget.start()
+        self._cancel_until(0)
+        # Compteurs propres à cet appel (la suite de Luby repart du début)
+        self.decisions = self.propagations = self.conflicts = self.restarts = 0
+        self.conflict = []
+        self.assumptions = []
+        for literal in assumptions or []:
+            self._ensure_variable(abs(literal))
+            self.assumptions.append(2 * abs(literal) + (literal < 0))
+
+        if metrics is not None:
+            search_start = time.perf_counter()
+            metrics.add_time('init', solve_start, search_start)
+        success = self._search()
+        if metrics is not None:
+            metrics.add_time('search', search_start)
+        if self.proof is not None:
+            if self.unsat:
+                self.proof.add([])  # Conflit au niveau 0: clause vide
+            self.proof.flush()
+
+        stats = {
+            'backtrack_count': self.conflicts,
+            'num_variables': self.num_variables,
+            'num_clauses': len(self.clauses),
+            'engine': 'cdcl',
+            'status': {True: 'SAT', False: 'UNSAT', None: 'UNKNOWN'}[success],
+            'decisions': self.decisions,
+            'propagations': self.propagations,
+            'conflicts': self.conflicts,
+            'learned_clauses': len(self.learnts),
+            'restarts': self.restarts,
+            'assumptions': len(self.assumptions)
+        }
+        if self.budget is not None:
+            stats['budget'] = self.budget.to_dict()
+        if metrics is not None:
+            metrics.add_time('solve', solve_start)
+            self._sync_metrics()
+            stats['metrics'] = metrics.to_dict()
+
+        if success:
+            assignment = {
+                var: self.values[2 * var] == 1
+                for var in range(1, self.num_variables + 1)
+            }
+            return True, assignment, stats
+        return success, None, stats
+
+    def failed_assumptions(self):
+        """
+        Hypothèses du dernier solve() suffisant à rendre la formule
+        insatisfiable (liste vide si elle l'est sans hypothèse)
+        """
+        return [(lit >> 1) * (-1 if lit & 1 else 1) for lit in self.conflict]
+
+
+if __name__ == "__main__":
+    print("=== Exemple Solveur CDCL ===\n")
+
+    clauses = [
+        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
+        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
+        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
+    ]
+
+    solver = CDCLSolver(clauses, 3)
+    success, assignment, stats = solver.solve()
+
+    print(f"Résultat: {'✓ SATISFIABLE' if success else '✗ INSATISFIABLE'}")
+    if success:
+        for var in sorted(assignment.keys()):
+            value = "vrai" if assignment[var] else "faux"
+            print(f"  x{var} = {value}")
+
+    print(f"\nStatistiques:")
+    print(f"  Décisions: {stats['decisions']}")
+    print(f"  Propagations: {stats['propagations']}")
+    print(f"  Conflits: {stats['conflicts']}")
+    print(f"  Clauses apprises: {stats['learned_clauses']}")
+    print(f"  Redémarrages: {stats['restarts']}")
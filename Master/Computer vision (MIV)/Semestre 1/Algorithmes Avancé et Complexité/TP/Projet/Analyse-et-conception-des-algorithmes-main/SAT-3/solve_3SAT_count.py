@@ -0,0 +1,196 @@
+"""
+Comptage exact de modèles (#SAT) pour 3-SAT / SAT
+
+Recherche DPLL qui compte au lieu de s'arrêter à la première solution:
+1. Propagation unitaire (les littéraux forcés ne multiplient pas le compte)
+2. Variables libres absentes des clauses: facteur 2 chacune
+3. Décomposition en composantes connexes (clauses reliées par une variable
+   commune): le nombre de modèles est le produit des comptes des composantes
+4. Cache des composantes déjà comptées, borné en mode LRU
+5. Branchement sur la variable la plus fréquente: #F = #F|x + #F|¬x
+"""
+from collections import OrderedDict
+
+# Nombre maximal de composantes gardées en cache (les moins récentes sont évincées)
+COMPONENT_CACHE_SIZE = 100000
+
+
+def condition(clauses, literal):
+    """
+    Simplifie les clauses avec literal = vrai
+
+    Returns:
+        list: clauses restantes (tuples triés), ou None si une clause devient vide
+    """
+    result = []
+    for clause in clauses:
+        if literal in clause:
+            continue  # Clause satisfaite
+        if -literal in clause:
+            clause = tuple(lit for lit in clause if lit != -literal)
+            if not clause:
+                return None
+        result.append(clause)
+    return result
+
+
+def _propagate(clauses):
+    """
+    Propagation unitaire
+
+    Returns:
+        tuple: (clauses simplifiées, variables affectées), ou (None, None) en cas de conflit
+    """
+    assigned = set()
+    while True:
+        unit = next((clause[0] for clause in clauses if len(clause) == 1), None)
+        if unit is None:
+            return clauses, assigned
+        clauses = condition(clauses, unit)
+        if clauses is None:
+            return None, None
+        assigned.add(abs(unit))
+
+
+def _components(clauses):
+    """Regroupe les clauses en composantes connexes (union-find sur les variables)"""
+    parent = {}
+
+    def find(var):
+        root = var
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[var] != root:  # Compression des chemins
+            parent[var], var = root, parent[var]
+        return root
+
+    for clause in clauses:
+        first = find(abs(clause[0]))
+        for lit in clause[1:]:
+            other = find(abs(lit))
+            if other != first:
+                parent[other] = first
+
+    groups = {}
+    for clause in clauses:
+        groups.setdefault(find(abs(clause[0])), []).append(clause)
+    return list(groups.values())
+
+
+class ModelCounter:
+    """
+    Compteur exact de modèles sur les variables 1..num_variables
+
+    Statistiques disponibles après count():
+        decisions: nombre de branchements
+        cache_hits: composantes retrouvées dans le cache
+        components: nombre de décompositions en plusieurs composantes
+    """
+
+    def __init__(self, clauses, num_variables, cache_size=COMPONENT_CACHE_SIZE):
+        self.clauses = clauses
+        self.num_variables = num_variables
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.decisions = 0
+        self.cache_hits = 0
+        self.components = 0
+
+    def count(self):
+        """
+        Returns:
+            int: nombre exact d'affectations de x1..xn satisfaisant la formule
+        """
+        clauses = set()
+        for clause in self.clauses:
+            literals = set(clause)
+            if not literals:
+                return 0  # Clause vide: formule insatisfiable
+            if any(-lit in literals for lit in literals):
+                continue  # Tautologie: toujours satisfaite
+            clauses.add(tuple(sorted(literals)))
+
+        variables = set(range(1, self.num_variables + 1))
+        variables |= {abs(lit) for clause in clauses for lit in clause}
+        return self._count(list(clauses), variables)
+
+    def _count(self, clauses, variables):
+        """Nombre de modèles des clauses sur l'ensemble variables"""
+        clauses, assigned = _propagate(clauses)
+        if clauses is None:
+            return 0
+
+        mentioned = {abs(lit) for clause in clauses for lit in clause}
+        result = 2 ** len(variables - assigned - mentioned)
+
+        components = _components(clauses)
+        if len(components) > 1:
+            self.components += 1
+        for component in components:
+            result *= self._count_component(component)
+            if result == 0:
+                return 0
+        return result
+
+    def _count_component(self, clauses):
+        """Compte une composante connexe, avec cache LRU"""
+        key = tuple(sorted(set(clauses)))
+        if key in self.cache:
+            self.cache_hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        # Variable la plus fréquente (les clauses courtes comptent double)
+        occurrences = {}
+        for clause in key:
+            weight = 2 if len(clause) == 2 else 1
+            for lit in clause:
+                occurrences[abs(lit)] = occurrences.get(abs(lit), 0) + weight
+        var = max(occurrences, key=occurrences.get)
+        variables = set(occurrences)
+        variables.discard(var)
+
+        self.decisions += 1
+        total = 0
+        for literal in (var, -var):
+            branch = condition(key, literal)
+            if branch is not None:
+                total += self._count(branch, variables)
+
+        self.cache[key] = total
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return total
+
+
+def count_models(clauses, num_variables, cache_size=COMPONENT_CACHE_SIZE):
+    """Raccourci: ModelCounter(clauses, num_variables, cache_size).count()"""
+    return ModelCounter(clauses, num_variables, cache_size).count()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    print("=== Comptage de modèles 3-SAT (#SAT) ===\n")
+
+    clauses = [
+        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
+        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
+        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
+    ]
+    print(f"Exemple de l'énoncé: {count_models(clauses, 3)} modèles sur 8 affectations\n")
+
+    # Instances aléatoires de la taille des uf20 SATLIB (ratio 4.26)
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    num_clauses = round(4.26 * num_variables)
+    for seed in range(5):
+        rng = random.Random(seed)
+        clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+                   for _ in range(num_clauses)]
+        counter = ModelCounter(clauses, num_variables)
+        start = time.time()
+        models = counter.count()
+        print(f"  Instance {seed}: {models} modèles en {time.time() - start:.4f}s "
+              f"({counter.decisions} décisions, {counter.cache_hits} succès du cache)")
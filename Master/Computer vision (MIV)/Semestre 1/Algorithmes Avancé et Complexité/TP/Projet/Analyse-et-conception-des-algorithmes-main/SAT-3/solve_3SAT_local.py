@@ -0,0 +1,328 @@
+"""
+Solveur par recherche locale stochastique pour 3-SAT / SAT (WalkSAT, ProbSAT)
+Même contrat que SAT3Solver: solve() -> (success, assignment, stats)
+
+La recherche locale est incomplète: elle trouve rapidement une solution des
+grandes instances satisfiables, mais ne peut pas prouver l'insatisfiabilité.
+Si le budget (flips, temps, ou SolverBudget de budget_3SAT) est épuisé,
+solve() retourne success=None et stats['status'] = 'UNKNOWN'.
+
+Structures de données:
+- true_count[c]: nombre de littéraux vrais de la clause c
+- true_sum[c]: somme des variables des littéraux vrais (quand true_count[c]
+  vaut 1, c'est la variable critique de la clause)
+- break_count[v]: nombre de clauses qui deviendraient fausses en inversant v
+- unsat/position: clauses fausses dans une liste, retrait en O(1) par
+  échange avec le dernier élément
+Le calcul initial (et à chaque redémarrage) est vectorisé avec NumPy; les
+mises à jour d'un flip ne touchent que les clauses contenant la variable.
+"""
+import random
+import time
+
+import numpy as np
+
+
+# Paramètres par défaut pour le 3-SAT aléatoire
+WALKSAT_NOISE = 0.567    # Probabilité d'un flip aléatoire (WalkSAT/SKC)
+PROBSAT_CB = 2.38        # ProbSAT, fonction polynomiale (eps + break)^-cb
+PROBSAT_EPS = 1.0
+TIME_CHECK_INTERVAL = 1024  # Flips entre deux vérifications du temps
+
+LOCAL_SEARCH_ALGORITHMS = ('walksat', 'probsat')
+
+
+class LocalSearchSolver:
+    """
+    WalkSAT/SKC et ProbSAT sur des clauses en entiers signés
+
+    Args:
+        clauses: liste de clauses (listes d'entiers signés)
+        num_variables: nombre de variables
+        algorithm: 'walksat' ou 'probsat'
+        noise: probabilité de flip aléatoire de WalkSAT (défaut WALKSAT_NOISE)
+        cb: base de la fonction de probabilité de ProbSAT (défaut PROBSAT_CB)
+        max_flips: nombre maximal de flips (None: illimité)
+        max_time: temps maximal en secondes (None: illimité)
+        restart_flips: flips avant un redémarrage aléatoire (None: jamais)
+        seed: graine du générateur aléatoire
+        budget: SolverBudget (nœuds = flips), en plus de max_flips et max_time
+    """
+
+    def __init__(self, clauses, num_variables, algorithm='walksat', noise=None, cb=None,
+                 max_flips=None, max_time=60, restart_flips=None, seed=None, budget=None):
+        if algorithm not in LOCAL_SEARCH_ALGORITHMS:
+            raise ValueError(f"Algorithme inconnu: {algorithm} "
+                             f"(disponibles: {', '.join(LOCAL_SEARCH_ALGORITHMS)})")
+        self.clauses = clauses
+        self.num_variables = num_variables
+        self.algorithm = algorithm
+        self.noise = WALKSAT_NOISE if noise is None else noise
+        self.cb = PROBSAT_CB if cb is None else cb
+        self.max_flips = max_flips
+        self.max_time = max_time
+        self.restart_flips = restart_flips
+        self.seed = seed
+        self.budget = budget
+
+        # Nettoyage: littéraux dupliqués retirés, tautologies ignorées
+        self.has_empty_clause = False
+        self.clause_literals = []
+        for clause in clauses:
+            literals = list(dict.fromkeys(clause))
+            if any(-literal in literals for literal in literals):
+                continue
+            if not literals:
+                self.has_empty_clause = True
+            self.clause_literals.append(literals)
+
+        self.n = max([num_variables] + [abs(l) for c in self.clause_literals for l in c])
+        self.clause_vars = [[abs(l) for l in c] for c in self.clause_literals]
+
+        # Occurrences: clauses où le littéral v (resp. ¬v) apparaît
+        self.occ_pos = [[] for _ in range(self.n + 1)]
+        self.occ_neg = [[] for _ in range(self.n + 1)]
+        for i, literals in enumerate(self.clause_literals):
+            for literal in literals:
+                if literal > 0:
+                    self.occ_pos[literal].append(i)
+                else:
+                    self.occ_neg[-literal].append(i)
+
+        # Forme CSR pour les calculs vectorisés
+        sizes = [len(c) for c in self.clause_literals]
+        self.csr_literals = np.fromiter((l for c in self.clause_literals for l in c),
+                                        dtype=np.int64, count=sum(sizes))
+        self.csr_offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.csr_offsets[1:])
+
+        self.flips = 0
+        self.restarts = 0
+
+    def _initialize(self, values):
+        """
+        Calcule tous les compteurs pour l'affectation values (tableau NumPy de
+        booléens indexé par variable), en O(taille de la formule) vectorisé
+        """
+        literals = self.csr_literals
+        num_clauses = len(self.clause_literals)
+        if num_clauses == 0:
+            self.true_count, self.true_sum = [], []
+            self.break_count = [0] * (self.n + 1)
+            self.unsat, self.position = [], []
+            return
+
+        variables = np.abs(literals)
+        is_true = values[variables] == (literals > 0)
+        starts = self.csr_offsets[:-1]
+        true_count = np.add.reduceat(is_true.astype(np.int64), starts)
+        true_sum = np.add.reduceat(np.where(is_true, variables, 0), starts)
+        break_count = np.bincount(true_sum[true_count == 1], minlength=self.n + 1)
+        unsat = np.flatnonzero(true_count == 0)
+        position = np.zeros(num_clauses, dtype=np.int64)
+        position[unsat] = np.arange(len(unsat))
+
+        # Listes Python pour la boucle de flips (accès élémentaire plus rapide)
+        self.true_count = true_count.tolist()
+        self.true_sum = true_sum.tolist()
+        self.break_count = break_count.tolist()
+        self.unsat = unsat.tolist()
+        self.position = position.tolist()
+
+    def solve(self):
+        """
+        Lance la recherche locale
+
+        Returns:
+            tuple: (success, assignment, stats)
+                success: True si solution trouvée, False si la formule contient
+                         une clause vide, None si le budget est épuisé
+                assignment: dictionnaire {variable: valeur} ou None
+                stats: dictionnaire avec statistiques
+                    (backtrack_count = nombre de flips)
+        """
+        rng = random.Random(self.seed)
+        np_rng = np.random.default_rng(self.seed)
+        start_time = time.time()
+        if self.budget is not None:
+            self.budget.start()
+        self.flips = 0
+        self.restarts = 0
+
+        success = None
+        values = None
+        if self.has_empty_clause:
+            success = False
+        else:
+            values = np_rng.random(self.n + 1) < 0.5
+            self._initialize(values)
+            success, values = self._search(values, rng, np_rng, start_time)
+
+        elapsed = time.time() - start_time
+        stats = {
+            'backtrack_count': self.flips,
+            'num_variables': self.num_variables,
+            'num_clauses': len(self.clauses),
+            'engine': self.algorithm,
+            'status': {True: 'SAT', False: 'UNSAT', None: 'UNKNOWN'}[success],
+            'flips': self.flips,
+            'restarts': self.restarts,
+            'time': elapsed,
+            'flips_per_second': self.flips / elapsed if elapsed > 0 else 0.0,
+            'seed': self.seed
+        }
+        if self.budget is not None:
+            stats['budget'] = self.budget.to_dict()
+        if self.algorithm == 'walksat':
+            stats['noise'] = self.noise
+        else:
+            stats['cb'] = self.cb
+
+        if success:
+            assignment = {var: bool(values[var]) for var in range(1, self.num_variables + 1)}
+            return True, assignment, stats
+        return success, None, stats
+
+    def _search(self, values, rng, np_rng, start_time):
+        """Boucle de flips; retourne (success, values)"""
+        clause_vars = self.clause_vars
+        occ_pos, occ_neg = self.occ_pos, self.occ_neg
+        true_count, true_sum = self.true_count, self.true_sum
+        break_count = self.break_count
+        unsat, position = self.unsat, self.position
+        values = values.tolist()
+        random_ = rng.random
+        walksat = self.algorithm == 'walksat'
+        noise = self.noise
+
+        # Poids ProbSAT précalculés pour chaque valeur de break possible
+        max_break = max((len(occ_pos[v]) + len(occ_neg[v]) for v in range(self.n + 1)), default=0)
+        weights = [(PROBSAT_EPS + b) ** -self.cb for b in range(max_break + 1)]
+
+        max_flips = self.max_flips
+        deadline = None if self.max_time is None else start_time + self.max_time
+        budget = self.budget
+        if budget is not None:
+            next_check = budget.next_check()
+        next_restart = self.restart_flips
+        flips = 0
+
+        while unsat:
+            # Budgets
+            if max_flips is not None and flips >= max_flips:
+                break
+            if flips % TIME_CHECK_INTERVAL == 0 and deadline is not None and time.time() > deadline:
+                break
+            if budget is not None and flips >= next_check:
+                if budget.exhausted(flips):
+                    break
+                next_check = budget.next_check(flips)
+            if next_restart is not None and flips >= next_restart:
+                self.flips = flips
+                self.restarts += 1
+                next_restart += self.restart_flips
+                fresh = np_rng.random(self.n + 1) < 0.5
+                self._initialize(fresh)
+                true_count, true_sum = self.true_count, self.true_sum
+                break_count = self.break_count
+                unsat, position = self.unsat, self.position
+                values = fresh.tolist()
+                continue
+
+            # Clause fausse choisie au hasard
+            variables = clause_vars[unsat[int(random_() * len(unsat))]]
+
+            if walksat:
+                best = None
+                best_break = -1
+                for v in variables:
+                    b = break_count[v]
+                    if best is None or b < best_break:
+                        best, best_break = [v], b
+                    elif b == best_break:
+                        best.append(v)
+                if best_break == 0 or random_() >= noise:
+                    var = best[0] if len(best) == 1 else rng.choice(best)
+                else:
+                    var = rng.choice(variables)
+            else:
+                probabilities = [weights[break_count[v]] for v in variables]
+                threshold = random_() * sum(probabilities)
+                var = variables[-1]
+                for v, p in zip(variables, probabilities):
+                    threshold -= p
+                    if threshold <= 0:
+                        var = v
+                        break
+
+            # Flip de var: mise à jour des seules clauses qui la contiennent
+            value = not values[var]
+            values[var] = value
+            flips += 1
+            made_true, made_false = (occ_pos[var], occ_neg[var]) if value else (occ_neg[var], occ_pos[var])
+
+            for c in made_true:
+                count = true_count[c]
+                if count == 0:
+                    # La clause devient satisfaite: retrait O(1) de unsat
+                    last = unsat.pop()
+                    if last != c:
+                        pos = position[c]
+                        unsat[pos] = last
+                        position[last] = pos
+                    break_count[var] += 1
+                elif count == 1:
+                    break_count[true_sum[c]] -= 1
+                true_count[c] = count + 1
+                true_sum[c] += var
+
+            for c in made_false:
+                count = true_count[c] - 1
+                true_count[c] = count
+                true_sum[c] -= var
+                if count == 0:
+                    position[c] = len(unsat)
+                    unsat.append(c)
+                    break_count[var] -= 1
+                elif count == 1:
+                    break_count[true_sum[c]] += 1
+
+        self.flips = flips
+        if unsat:
+            return None, None
+        return True, values
+
+
+def solve_walksat(clauses, num_variables, **options):
+    """Raccourci: LocalSearchSolver(..., algorithm='walksat').solve()"""
+    return LocalSearchSolver(clauses, num_variables, algorithm='walksat', **options).solve()
+
+
+def solve_probsat(clauses, num_variables, **options):
+    """Raccourci: LocalSearchSolver(..., algorithm='probsat').solve()"""
+    return LocalSearchSolver(clauses, num_variables, algorithm='probsat', **options).solve()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from verify_3SAT import SAT3Verifier
+
+    print("=== Recherche locale 3-SAT (WalkSAT / ProbSAT) ===\n")
+
+    # Instance aléatoire satisfiable de la taille des uf250 SATLIB (ratio 4.26)
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    num_clauses = round(4.26 * num_variables)
+    rng = random.Random(1)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(num_clauses)]
+    print(f"Instance aléatoire: {num_variables} variables, {num_clauses} clauses\n")
+
+    for algorithm in LOCAL_SEARCH_ALGORITHMS:
+        solver = LocalSearchSolver(clauses, num_variables, algorithm=algorithm, max_time=10, seed=1)
+        success, assignment, stats = solver.solve()
+        print(f"{algorithm}: {stats['status']} en {stats['time']:.3f}s, "
+              f"{stats['flips']} flips ({stats['flips_per_second']:,.0f} flips/s)")
+        if success:
+            is_valid, _ = SAT3Verifier(clauses).verify(assignment)
+            print(f"  Solution vérifiée: {is_valid}")
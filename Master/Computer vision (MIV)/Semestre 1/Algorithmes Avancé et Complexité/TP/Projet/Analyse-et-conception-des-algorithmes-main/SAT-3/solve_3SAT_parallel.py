@@ -0,0 +1,369 @@
+"""
+Résolution 3-SAT parallèle par cube-and-conquer
+
+1. Cube: l'espace de recherche est découpé en affectations partielles
+   (cubes) en branchant sur les variables choisies par lookahead
+   (propagation unitaire sur chaque polarité des variables les plus contraintes)
+2. Conquer: chaque cube est résolu par SAT3Solver dans un pool de processus
+   (avec l'heuristique, les contraintes natives et les métriques de l'appelant);
+   le pool est arrêté dès qu'un cube est satisfiable
+"""
+import math
+import multiprocessing
+import time
+
+from budget_3SAT import SolverBudget
+from solve_3SAT import SAT3Solver
+
+# Nombre de cubes visés par processus (équilibrage de charge)
+CUBES_PER_WORKER = 8
+# Nombre de variables évaluées par lookahead à chaque découpe
+LOOKAHEAD_CANDIDATES = 10
+# Intervalle de contrôle du budget de l'appel pendant l'attente des cubes (secondes)
+POLL_INTERVAL = 0.05
+
+
+def _occurrences(clauses):
+    """Index littéral -> indices des clauses qui le contiennent"""
+    occurrences = {}
+    for i, clause in enumerate(clauses):
+        for literal in clause:
+            occurrences.setdefault(literal, []).append(i)
+    return occurrences
+
+
+def propagate(clauses, occurrences, assignment, literal):
+    """
+    Affecte literal puis applique la propagation unitaire
+
+    Args:
+        clauses: liste de clauses
+        occurrences: index retourné par _occurrences
+        assignment: affectation partielle {variable: True/False} (non modifiée)
+        literal: littéral à rendre vrai
+
+    Returns:
+        dict: nouvelle affectation, ou None en cas de conflit
+    """
+    assignment = dict(assignment)
+    queue = [literal]
+    while queue:
+        literal = queue.pop()
+        var, value = abs(literal), literal > 0
+        if var in assignment:
+            if assignment[var] != value:
+                return None
+            continue
+        assignment[var] = value
+
+        # Seules les clauses contenant le littéral devenu faux peuvent devenir unitaires
+        for i in occurrences.get(-literal, ()):
+            unassigned = None
+            count = 0
+            satisfied = False
+            for lit in clauses[i]:
+                current = assignment.get(abs(lit))
+                if current is None:
+                    unassigned = lit
+                    count += 1
+                elif current == (lit > 0):
+                    satisfied = True
+                    break
+            if satisfied:
+                continue
+            if count == 0:
+                return None  # Clause falsifiée
+            if count == 1:
+                queue.append(unassigned)
+    return assignment
+
+
+def _lookahead_candidates(clauses, assignment, limit):
+    """
+    Variables libres les plus fréquentes dans les clauses non satisfaites
+    """
+    counts = {}
+    for clause in clauses:
+        free = []
+        satisfied = False
+        for lit in clause:
+            value = assignment.get(abs(lit))
+            if value is None:
+                free.append(abs(lit))
+            elif value == (lit > 0):
+                satisfied = True
+                break
+        if not satisfied:
+            # Les clauses courtes sont plus contraignantes
+            weight = 4 ** (3 - min(len(free), 3))
+            for var in free:
+                counts[var] = counts.get(var, 0) + weight
+    return sorted(counts, key=counts.get, reverse=True)[:limit]
+
+
+def generate_cubes(clauses, num_variables, num_cubes):
+    """
+    Découpe l'espace de recherche en cubes par lookahead
+
+    Pour chaque candidat x, les deux branches x et ¬x sont propagées; la
+    variable retenue maximise le produit du nombre de variables fixées dans
+    chaque branche. Si une branche échoue, l'autre est forcée (failed literal).
+
+    Returns:
+        list: cubes (affectations partielles {variable: True/False}),
+              vide si la formule est insatisfiable
+    """
+    occurrences = _occurrences(clauses)
+    depth = max(0, math.ceil(math.log2(max(num_cubes, 1))))
+    cubes = []
+
+    def split(assignment, depth_left):
+        while True:
+            if depth_left == 0 or len(assignment) == num_variables:
+                cubes.append(assignment)
+                return
+
+            candidates = _lookahead_candidates(clauses, assignment, LOOKAHEAD_CANDIDATES)
+            if not candidates:
+                cubes.append(assignment)  # Toutes les clauses sont satisfaites
+                return
+
+            best = None
+            forced = None
+            base = len(assignment)
+            for var in candidates:
+                positive = propagate(clauses, occurrences, assignment, var)
+                negative = propagate(clauses, occurrences, assignment, -var)
+                if positive is None and negative is None:
+                    return  # Cube réfuté
+                if positive is None or negative is None:
+                    forced = positive or negative
+                    break
+                score = (len(positive) - base) * (len(negative) - base)
+                if best is None or score > best[0]:
+                    best = (score, positive, negative)
+
+            if forced is not None:
+                assignment = forced  # Recommencer avec le littéral forcé
+                continue
+
+            split(best[1], depth_left - 1)
+            split(best[2], depth_left - 1)
+            return
+
+    # Propagation initiale des clauses unitaires
+    assignment = {}
+    for clause in clauses:
+        if len(clause) == 1:
+            assignment = propagate(clauses, occurrences, assignment, clause[0])
+            if assignment is None:
+                return []
+    split(assignment, depth)
+    return cubes
+
+
+class _CubeBudget(SolverBudget):
+    """
+    Budget d'un cube: limites restantes de l'appel; résolu dans le processus
+    de l'appelant (workers=1), il suit aussi l'annulation du budget de l'appel
+    """
+
+    def __init__(self, caller=None, **limits):
+        super().__init__(**limits)
+        self.caller = caller
+
+    def exhausted(self, nodes=0, conflicts=0):
+        if self.caller is not None and self.caller.cancelled:
+            self.cancel()
+        return super().exhausted(nodes, conflicts)
+
+
+def _cube_limits(budget):
+    """
+    Limites transmises aux cubes: échéance en temps absolu (time.time(),
+    commun à tous les processus), nœuds et mémoire par processus
+    """
+    if budget is None:
+        return None
+    deadline = None
+    if budget.deadline is not None:
+        deadline = time.time() + budget.deadline - time.perf_counter()
+    return {'deadline': deadline, 'max_nodes': budget.max_nodes, 'max_memory_mb': budget.max_memory_mb}
+
+
+def _solve_cube(task):
+    """
+    Résout un cube dans un processus du pool
+
+    Returns:
+        tuple: (success, assignment, backtrack_count, metrics, reason) avec
+               metrics le résumé SolverMetrics.to_dict du cube (None sans
+               métriques) et reason la raison de l'arrêt si success est None
+    """
+    clauses, num_variables, cube, heuristic, constraints, with_metrics, limits, caller = task
+    metrics = None
+    if with_metrics:
+        from metrics_3SAT import SolverMetrics
+        metrics = SolverMetrics(trace=False)
+    budget = None
+    if limits is not None:
+        max_nodes = limits['max_nodes']
+        if caller is not None and max_nodes is not None:
+            max_nodes -= caller.nodes  # Nœuds déjà consommés par les cubes précédents
+        max_time = None if limits['deadline'] is None else max(limits['deadline'] - time.time(), 0.0)
+        budget = _CubeBudget(caller, max_time=max_time, max_nodes=max_nodes,
+                             max_memory_mb=limits['max_memory_mb'])
+        budget.start()
+    solver = SAT3Solver(clauses, num_variables, heuristic, metrics=metrics, budget=budget,
+                        constraints=constraints)
+    solver.assignment = dict(cube)
+    success = solver.backtrack()
+    return (success, dict(solver.assignment) if success else None, solver.backtrack_count,
+            metrics.to_dict() if metrics is not None else None,
+            budget.reason if budget is not None else None)
+
+
+def _merge_metrics(metrics, data):
+    """Ajoute les compteurs et l'histogramme des niveaux d'un cube aux métriques de l'appelant"""
+    for name, value in data['counters'].items():
+        metrics.count(name, value)
+    for level, count in data['level_histogram'].items():
+        metrics.level_histogram[level] = metrics.level_histogram.get(level, 0) + count
+
+
+def _results(pool, tasks, budget):
+    """
+    Résultats des cubes dans l'ordre d'arrivée; avec un budget, celui de
+    l'appel est contrôlé toutes les POLL_INTERVAL secondes pendant l'attente
+    (annulation, temps) et l'itération s'arrête dès qu'il est épuisé
+    """
+    if pool is None:
+        yield from map(_solve_cube, tasks)
+        return
+    results = pool.imap_unordered(_solve_cube, tasks)
+    while True:
+        try:
+            yield results.next(POLL_INTERVAL if budget is not None else None)
+        except StopIteration:
+            return
+        except multiprocessing.TimeoutError:
+            if budget.exhausted(budget.nodes):
+                return
+
+
+def solve_cube_and_conquer(clauses, num_variables, workers=None, num_cubes=None, heuristic='first',
+                           constraints=None, metrics=None, budget=None):
+    """
+    Résout une instance par cube-and-conquer
+
+    Args:
+        clauses: liste de clauses
+        num_variables: nombre de variables
+        workers: nombre de processus (défaut: nombre de cœurs)
+        num_cubes: nombre de cubes visé (défaut: CUBES_PER_WORKER par processus)
+        heuristic: heuristique de branchement des cubes (voir BRANCHING_HEURISTICS)
+        constraints: contraintes AtMost / Xor propagées nativement dans chaque
+                     cube (les cubes sont découpés sur les clauses seules)
+        metrics: SolverMetrics recevant les compteurs cumulés des cubes et
+                 le temps des phases 'cube' et 'search' (temps mural)
+        budget: SolverBudget de l'appel; chaque cube reçoit le temps restant,
+                la limite de nœuds (nœuds cumulés de tous les cubes, contrôlés
+                à la fin de chacun) et la mémoire par processus; épuisé ou
+                annulé, le pool est arrêté et success vaut None
+
+    Returns:
+        tuple: (success, assignment, stats) comme SAT3Solver.solve
+               (stats['status']: 'SAT', 'UNSAT' ou 'UNKNOWN')
+    """
+    workers = workers or multiprocessing.cpu_count()
+    num_cubes = num_cubes or workers * CUBES_PER_WORKER
+    if budget is not None:
+        budget.start()
+
+    if metrics is not None:
+        start = time.perf_counter()
+    cubes = generate_cubes(clauses, num_variables, num_cubes)
+    if metrics is not None:
+        search_start = time.perf_counter()
+        metrics.add_time('cube', start, search_start)
+
+    stats = {
+        'backtrack_count': 0,
+        'num_variables': num_variables,
+        'num_clauses': len(clauses),
+        'engine': 'cube-and-conquer',
+        'heuristic': heuristic,
+        'workers': workers,
+        'num_cubes': len(cubes),
+        'cubes_solved': 0
+    }
+
+    constraints = list(constraints or [])
+    limits = _cube_limits(budget)
+    # Résolu dans ce processus, un cube suit directement l'annulation du budget de l'appel
+    caller = budget if workers == 1 else None
+    tasks = [(clauses, num_variables, cube, heuristic, constraints, metrics is not None, limits, caller)
+             for cube in cubes]
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+
+    success, assignment = False, None
+    try:
+        if budget is not None and budget.exhausted(0):
+            success = None  # Annulé ou épuisé pendant la découpe
+        else:
+            for cube_success, cube_assignment, backtracks, cube_metrics, reason in _results(pool, tasks, budget):
+                stats['cubes_solved'] += 1
+                stats['backtrack_count'] += backtracks
+                if cube_metrics is not None:
+                    _merge_metrics(metrics, cube_metrics)
+                if cube_success:
+                    success, assignment = True, cube_assignment
+                    break
+                if cube_success is None:
+                    # Cube non résolu: la formule ne peut plus être déclarée insatisfiable
+                    success = None
+                    if budget.reason is None:
+                        budget.reason = reason
+                if budget is not None and budget.exhausted(stats['backtrack_count']):
+                    success = None
+                    break
+            else:
+                if budget is not None and budget.reason is not None:
+                    success = None  # Attente interrompue par le budget de l'appel
+    finally:
+        if pool is not None:
+            # Arrêt immédiat des cubes encore en cours
+            pool.terminate()
+            pool.join()
+        if metrics is not None:
+            metrics.add_time('search', search_start)
+            stats['metrics'] = metrics.to_dict()
+
+    stats['status'] = {True: 'SAT', False: 'UNSAT', None: 'UNKNOWN'}[success]
+    if budget is not None:
+        stats['budget'] = budget.to_dict()
+    return success, assignment, stats
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+
+    # Instance aléatoire au seuil de difficulté (ratio 4.26)
+    num_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    num_clauses = round(4.26 * num_variables)
+    rng = random.Random(42)
+    clauses = [[var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), 3)]
+               for _ in range(num_clauses)]
+
+    print("=== Cube-and-conquer 3-SAT ===\n")
+    print(f"Instance aléatoire: {num_variables} variables, {num_clauses} clauses")
+
+    reference = None
+    for workers in sorted({1, 2, multiprocessing.cpu_count()}):
+        start = time.time()
+        success, assignment, stats = SAT3Solver(clauses, num_variables).solve(parallel=workers)
+        elapsed = time.time() - start
+        reference = reference or elapsed
+        print(f"  {workers} processus: {'SAT' if success else 'UNSAT'} en {elapsed:.3f}s "
+              f"(accélération x{reference / elapsed:.2f}, {stats.get('num_cubes', 1)} cubes)")
@@ -0,0 +1,720 @@
+"""
+Service local de résolution (asyncio)
+
+Un processus serveur garde un pool borné de processus de résolution
+« chauds » (interpréteur démarré et solveurs importés une seule fois) et le
+partage entre tous ses clients: un balayage de benchmark soumet ses
+instances au service au lieu de démarrer un interpréteur par instance.
+
+Protocole: une requête JSON par ligne sur une socket Unix (ou TCP locale),
+une réponse JSON par ligne.
+- {"op": "submit", "kind": "dimacs", ...}: formule 3-SAT donnée par "path"
+  (fichier DIMACS, lu via le cache dimacs_cache), "cnf" (texte DIMACS) ou
+  "clauses" + "num_variables"; options "engine", "heuristic", "preprocess",
+  "time_limit", "max_nodes", "max_conflicts", "memory_limit_mb"
+- {"op": "submit", "kind": "subsetsum", "S": [...], "T": t}: options
+  "method" ('backtracking' ou 'dp'), "time_limit", "max_nodes"
+- {"op": "cancel", "job": id}: annule un travail en attente ou en cours
+- {"op": "status"}: état du pool
+"tag" (facultatif) est recopié dans la réponse "accepted" d'un submit.
+
+Événements envoyés au client (champ "event"): accepted (numéro "job"),
+progress (nodes, conflicts, elapsed, environ toutes les PROGRESS_INTERVAL
+secondes), puis un seul événement final: result, cancelled ou error.
+
+L'annulation est coopérative: le budget du solveur (SolverBudget,
+BudgetRecherche) lit les messages du processus parent à chaque contrôle.
+Un processus qui ne s'arrête pas KILL_GRACE secondes après l'annulation
+(programmation dynamique SUBSETSUM, prétraitement...) est tué et remplacé.
+"""
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from budget_3SAT import SolverBudget
+
+DEFAULT_SOCKET = ".solver_service.sock"
+JOB_KINDS = ('dimacs', 'subsetsum')
+FINAL_EVENTS = ('result', 'cancelled', 'error')
+# Délai minimal entre deux événements progress d'un travail (secondes)
+PROGRESS_INTERVAL = 0.5
+# Délai accordé après une annulation avant de tuer le processus (secondes)
+KILL_GRACE = 2.0
+# Travaux en attente au-delà desquels un submit est refusé
+MAX_QUEUE = 10000
+# Taille maximale d'une ligne du protocole (texte DIMACS compris)
+LINE_LIMIT = 1 << 28
+
+SUBSETSUM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'SUBSETSUM')
+
+
+# ---------------------------------------------------------------------------
+# Processus de résolution
+# ---------------------------------------------------------------------------
+
+class _JobChannel:
+    """
+    Lien d'un travail en cours avec le processus parent: messages
+    d'annulation reçus et événements progress envoyés
+    """
+
+    def __init__(self, tasks, results, job_id):
+        self.tasks = tasks
+        self.results = results
+        self.job_id = job_id
+        self.stopping = False
+        self.start = time.perf_counter()
+        self.last_progress = self.start
+
+    def poll(self, nodes=0, conflicts=0):
+        """
+        Returns:
+            bool: True si le travail doit être annulé
+        """
+        cancelled = False
+        while self.tasks.poll():
+            message = self.tasks.recv()
+            if message[0] == 'stop':
+                self.stopping = cancelled = True
+            elif message[0] == 'cancel' and message[1] == self.job_id:
+                cancelled = True
+        now = time.perf_counter()
+        if now - self.last_progress >= PROGRESS_INTERVAL:
+            self.last_progress = now
+            self.results.send(('progress', self.job_id,
+                               {'nodes': nodes, 'conflicts': conflicts, 'elapsed': now - self.start}))
+        return cancelled
+
+
+class ServiceBudget(SolverBudget):
+    """SolverBudget dont chaque contrôle traite l'annulation et la progression du travail"""
+
+    def __init__(self, channel, **limits):
+        super().__init__(**limits)
+        self.channel = channel
+
+    def exhausted(self, nodes=0, conflicts=0):
+        if self.channel.poll(nodes, conflicts):
+            self.cancel()
+        return super().exhausted(nodes, conflicts)
+
+
+def _solve_dimacs(request, channel):
+    """Résout un travail 'dimacs' dans le processus de résolution"""
+    from dimacs_cache import read_dimacs_cnf_cached
+    from dimacs_reader import parse_dimacs_cnf
+    from solve_3SAT import create_solver
+    from verify_3SAT import SAT3Verifier
+
+    if 'path' in request:
+        clauses, num_variables = read_dimacs_cnf_cached(request['path'])
+    elif 'cnf' in request:
+        clauses, num_variables = parse_dimacs_cnf(request['cnf'])
+    else:
+        clauses, num_variables = request['clauses'], request['num_variables']
+
+    budget = ServiceBudget(channel, max_time=request.get('time_limit'), max_nodes=request.get('max_nodes'),
+                           max_conflicts=request.get('max_conflicts'),
+                           max_memory_mb=request.get('memory_limit_mb'))
+    solver = create_solver(clauses, num_variables, request.get('engine', 'backtracking'),
+                           request.get('heuristic', 'first'), request.get('preprocess', False),
+                           budget=budget)
+    start = time.perf_counter()
+    success, assignment, stats = solver.solve()
+    stats['time'] = time.perf_counter() - start
+
+    model = None
+    if success:
+        model = [var if value else -var for var, value in sorted(assignment.items())]
+        stats['verified'], _ = SAT3Verifier(clauses).verify(assignment)
+    stats.update(num_variables=num_variables, num_clauses=len(clauses))
+    return {'status': stats['status'], 'model': model, 'stats': stats,
+            'cancelled': budget.reason == 'cancelled'}
+
+
+def _solve_subsetsum(request, channel):
+    """Résout un travail 'subsetsum' dans le processus de résolution"""
+    from solve_SUBSETSUM import BudgetRecherche, solve_subsetsum_backtracking_iteratif
+    from solve_SUBSETSUM_dp import solve_SUBSETSUM_DP
+
+    class BudgetService(BudgetRecherche):
+        def epuise(self, noeuds):
+            if channel.poll(noeuds):
+                self.annuler()
+            return super().epuise(noeuds)
+
+    S, T = [int(x) for x in request['S']], int(request['T'])
+    method = request.get('method', 'backtracking')
+    start = time.perf_counter()
+    if method == 'dp':
+        # Pas de contrôle de budget: annulée en tuant le processus
+        found, subset = solve_SUBSETSUM_DP(S, T)
+        status = 'FOUND' if found else 'NOT_FOUND'
+        stats = {'method': method, 'time': time.perf_counter() - start}
+        cancelled = False
+    elif method == 'backtracking':
+        budget = BudgetService(temps_max=request.get('time_limit'), noeuds_max=request.get('max_nodes'))
+        found, subset = solve_subsetsum_backtracking_iteratif(S, T, budget)
+        status = budget.statut
+        stats = {'method': method, 'time': budget.temps, 'nodes': budget.noeuds, 'reason': budget.raison}
+        cancelled = budget.raison == 'annulation'
+    else:
+        raise ValueError(f"Méthode SUBSETSUM inconnue: {method} (backtracking ou dp)")
+    return {'status': status, 'subset': subset, 'stats': stats, 'cancelled': cancelled}
+
+
+def _worker_main(tasks, results):
+    """
+    Boucle d'un processus de résolution: reçoit ('solve', job, requête),
+    renvoie des ('progress', job, dict) puis un ('result' | 'cancelled' | 'error', job, dict)
+    """
+    # Imports faits une seule fois, au démarrage du processus
+    sys.path.append(SUBSETSUM_DIR)
+    import solve_3SAT  # noqa: F401
+    import solve_SUBSETSUM  # noqa: F401
+
+    solvers = {'dimacs': _solve_dimacs, 'subsetsum': _solve_subsetsum}
+    while True:
+        try:
+            message = tasks.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message[0] == 'stop':
+            break
+        if message[0] != 'solve':
+            continue  # Annulation d'un travail déjà terminé
+
+        _, job_id, request = message
+        channel = _JobChannel(tasks, results, job_id)
+        try:
+            payload = solvers[request['kind']](request, channel)
+            event = 'cancelled' if payload.pop('cancelled') else 'result'
+            # Statistiques rendues sérialisables en JSON (tuples, objets...)
+            payload = json.loads(json.dumps(payload, default=str))
+        except MemoryError:
+            event, payload = 'error', {'error': 'mémoire épuisée'}
+        except KeyboardInterrupt:
+            break
+        except Exception as e:
+            event, payload = 'error', {'error': f"{type(e).__name__}: {e}"}
+        results.send((event, job_id, payload))
+        if channel.stopping:
+            break
+
+
+class _Worker:
+    """Processus de résolution et ses deux tubes (travaux, événements)"""
+
+    def __init__(self, context):
+        task_reader, self.tasks = context.Pipe(duplex=False)
+        self.results, result_writer = context.Pipe(duplex=False)
+        self.process = context.Process(target=_worker_main, args=(task_reader, result_writer), daemon=True)
+        self.process.start()
+        # Fermer les extrémités du fils: la fin du processus se lit comme EOFError
+        task_reader.close()
+        result_writer.close()
+        self.job = None
+
+    def send(self, message):
+        try:
+            self.tasks.send(message)
+        except (BrokenPipeError, OSError):
+            pass  # Processus arrêté: l'EOFError des résultats le signalera
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.terminate()
+
+    def close(self, timeout=KILL_GRACE):
+        self.send(('stop',))
+        self.process.join(timeout)
+        self.kill()
+        self.process.join()
+        self.tasks.close()
+        self.results.close()
+
+
+# ---------------------------------------------------------------------------
+# Serveur
+# ---------------------------------------------------------------------------
+
+class Job:
+    """Travail soumis: requête, client destinataire des événements et état"""
+
+    def __init__(self, job_id, request, send):
+        self.id = job_id
+        self.request = request
+        self.send = send
+        self.state = 'queued'   # queued, running, done
+        self.cancel_requested = False
+        self.submitted = time.time()
+
+
+class SolverService:
+    """
+    Args:
+        workers: processus de résolution (défaut: nombre de cœurs)
+        max_queue: travaux en attente au-delà desquels un submit est refusé
+
+    start() démarre le pool, puis serve_unix() / serve_tcp() acceptent les
+    clients; close() arrête les processus.
+    """
+
+    def __init__(self, workers=None, max_queue=MAX_QUEUE):
+        self.num_workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = []
+        self.jobs = {}
+        self.queue = None
+        self.job_ids = itertools.count(1)
+        self.completed = 0
+        self.drivers = []
+        # Un thread par processus pour attendre ses résultats sans bloquer la boucle
+        self.executor = ThreadPoolExecutor(max_workers=self.num_workers)
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        # Démarrage des processus (spawn) hors de la boucle d'événements
+        self.workers = await loop.run_in_executor(
+            None, lambda: [_Worker(self.context) for _ in range(self.num_workers)])
+        self.drivers = [asyncio.create_task(self._drive(index)) for index in range(self.num_workers)]
+
+    async def close(self):
+        for driver in self.drivers:
+            driver.cancel()
+        await asyncio.gather(*self.drivers, return_exceptions=True)
+        for job in self.jobs.values():
+            if job.state != 'done':
+                job.state = 'done'
+                await job.send({'event': 'cancelled', 'job': job.id, 'reason': 'arrêt du service'})
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [worker.close() for worker in self.workers])
+        self.executor.shutdown(wait=False)
+
+    # -- travaux --
+
+    async def submit(self, request, send):
+        """
+        Met un travail en file
+
+        Returns:
+            Job, ou None si la requête est refusée (événement error envoyé)
+        """
+        if request.get('kind') not in JOB_KINDS:
+            await send({'event': 'error', 'tag': request.get('tag'),
+                        'error': f"kind inconnu: {request.get('kind')} ({', '.join(JOB_KINDS)})"})
+            return None
+        if self.queue.qsize() >= self.max_queue:
+            await send({'event': 'error', 'tag': request.get('tag'),
+                        'error': f"file d'attente pleine ({self.max_queue} travaux)"})
+            return None
+        job = Job(next(self.job_ids), request, send)
+        self.jobs[job.id] = job
+        await send({'event': 'accepted', 'job': job.id, 'tag': request.get('tag')})
+        self.queue.put_nowait(job)
+        return job
+
+    async def cancel(self, job_id, send=None):
+        """Annule un travail: retiré s'il est en attente, arrêté s'il est en cours"""
+        job = self.jobs.get(job_id)
+        if job is None or job.state == 'done':
+            if send is not None:
+                await send({'event': 'error', 'job': job_id, 'error': "travail inconnu ou terminé"})
+            return
+        job.cancel_requested = True
+        if job.state == 'queued':
+            # Le pilote l'ignorera en le sortant de la file
+            await self._finish(job, {'event': 'cancelled', 'job': job.id, 'status': None})
+            return
+        worker = self._worker_of(job)
+        if worker is not None:
+            worker.send(('cancel', job.id))
+            asyncio.get_running_loop().call_later(KILL_GRACE, self._kill_if_running, job)
+
+    def _worker_of(self, job):
+        for worker in self.workers:
+            if worker.job is job:
+                return worker
+        return None
+
+    def _kill_if_running(self, job):
+        worker = self._worker_of(job)
+        if worker is not None and job.state == 'running':
+            worker.kill()
+
+    async def _finish(self, job, event):
+        job.state = 'done'
+        self.completed += 1
+        del self.jobs[job.id]
+        await job.send(event)
+
+    async def _drive(self, index):
+        """Pilote du processus index: lui confie les travaux de la file un par un"""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            if job.state != 'queued':
+                continue  # Annulé pendant l'attente
+            worker = self.workers[index]
+            job.state = 'running'
+            job.started = time.time()
+            worker.job = job
+            worker.send(('solve', job.id, job.request))
+            try:
+                while True:
+                    try:
+                        event, job_id, payload = await loop.run_in_executor(self.executor, worker.results.recv)
+                    except (EOFError, OSError):
+                        # Processus tué (annulation) ou arrêté brutalement: le remplacer
+                        await loop.run_in_executor(None, worker.close, 0)
+                        if job.cancel_requested:
+                            event, payload = 'cancelled', {'status': None, 'killed': True}
+                        else:
+                            event, payload = 'error', {'error': "processus de résolution arrêté "
+                                                                f"(code {worker.process.exitcode})"}
+                        self.workers[index] = await loop.run_in_executor(None, _Worker, self.context)
+                        job_id = job.id
+                    if job_id != job.id:
+                        continue
+                    if event == 'progress':
+                        await job.send({'event': 'progress', 'job': job.id, **payload})
+                        continue
+                    await self._finish(job, {'event': event, 'job': job.id,
+                                             'queued_time': job.started - job.submitted, **payload})
+                    break
+            finally:
+                self.workers[index].job = None
+
+    def status(self):
+        running = [job.id for job in self.jobs.values() if job.state == 'running']
+        return {'event': 'status', 'workers': len(self.workers),
+                'alive': sum(worker.process.is_alive() for worker in self.workers),
+                'running': sorted(running), 'queued': len(self.jobs) - len(running),
+                'completed': self.completed}
+
+    # -- clients --
+
+    async def handle_client(self, reader, writer):
+        """Une connexion: requêtes lues ligne par ligne, événements écrits ligne par ligne"""
+        owned = set()
+        closed = False
+
+        async def send(event):
+            nonlocal closed
+            if event.get('event') in FINAL_EVENTS and 'job' in event:
+                owned.discard(event['job'])
+            if closed:
+                return
+            try:
+                writer.write(json.dumps(event).encode() + b'\n')
+                await writer.drain()
+            except (ConnectionError, OSError):
+                closed = True
+
+        try:
+            while not closed:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+                    await send({'event': 'error', 'error': f"requête illisible: {e}"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    op = request.pop('op')
+                except (ValueError, KeyError, AttributeError, TypeError):
+                    await send({'event': 'error', 'error': "requête JSON avec un champ 'op' attendue"})
+                    continue
+                if op == 'submit':
+                    job = await self.submit(request, send)
+                    if job is not None and job.state != 'done':
+                        owned.add(job.id)
+                elif op == 'cancel':
+                    await self.cancel(request.get('job'), send)
+                elif op == 'status':
+                    await send(self.status())
+                else:
+                    await send({'event': 'error', 'error': f"op inconnue: {op} (submit, cancel, status)"})
+        finally:
+            # Client parti: ses travaux ne seront plus lus
+            closed = True
+            for job_id in list(owned):
+                await self.cancel(job_id)
+            writer.close()
+
+    async def serve_unix(self, path=DEFAULT_SOCKET):
+        if os.path.exists(path):
+            os.unlink(path)
+        return await asyncio.start_unix_server(self.handle_client, path, limit=LINE_LIMIT)
+
+    async def serve_tcp(self, host='127.0.0.1', port=8765):
+        return await asyncio.start_server(self.handle_client, host, port, limit=LINE_LIMIT)
+
+
+async def run_service(socket_path=DEFAULT_SOCKET, port=None, workers=None):
+    """Démarre le service et répond aux clients jusqu'à interruption"""
+    service = SolverService(workers)
+    await service.start()
+    if port is not None:
+        server = await service.serve_tcp(port=port)
+        address = f"127.0.0.1:{port}"
+    else:
+        server = await service.serve_unix(socket_path)
+        address = socket_path
+    print(f"✓ Service de résolution sur {address} ({service.num_workers} processus)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+        if port is None and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+class ServiceClient:
+    """
+    Client asyncio du service
+
+        client = await ServiceClient.connect()
+        job = await client.submit(kind='dimacs', path='uf20-01.cnf', engine='cdcl')
+        async for event in client.events(job):
+            ...
+        await client.close()
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.tags = itertools.count(1)
+        self.pending = {}      # tag -> Future du numéro de travail
+        self.queues = {}       # travail -> file de ses événements
+        self.replies = asyncio.Queue()  # status et erreurs sans travail
+        self.listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, socket_path=DEFAULT_SOCKET, port=None, host='127.0.0.1'):
+        if port is not None:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_unix_connection(socket_path, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def _send(self, request):
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+
+    def _queue(self, job):
+        if job not in self.queues:
+            self.queues[job] = asyncio.Queue()
+        return self.queues[job]
+
+    async def _listen(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                event = json.loads(line)
+                future = self.pending.pop(event.get('tag'), None)
+                if future is not None and event['event'] in ('accepted', 'error'):
+                    if event['event'] == 'accepted':
+                        future.set_result(event['job'])
+                    else:
+                        future.set_exception(RuntimeError(event['error']))
+                elif event.get('job') in self.queues or (event.get('job') is not None and event['event'] != 'error'):
+                    self._queue(event['job']).put_nowait(event)
+                else:
+                    self.replies.put_nowait(event)
+        finally:
+            error = ConnectionError("connexion au service fermée")
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            for queue in self.queues.values():
+                queue.put_nowait({'event': 'error', 'error': str(error)})
+
+    async def submit(self, **request):
+        """
+        Soumet un travail (voir le protocole en tête du module)
+
+        Returns:
+            int: numéro du travail
+        """
+        tag = next(self.tags)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[tag] = future
+        await self._send({'op': 'submit', 'tag': tag, **request})
+        job = await future
+        self._queue(job)
+        return job
+
+    async def cancel(self, job):
+        await self._send({'op': 'cancel', 'job': job})
+
+    async def status(self):
+        await self._send({'op': 'status'})
+        while True:
+            reply = await self.replies.get()
+            if reply['event'] == 'status':
+                return reply
+
+    async def events(self, job):
+        """Événements du travail (progress...), jusqu'à l'événement final inclus"""
+        queue = self._queue(job)
+        while True:
+            event = await queue.get()
+            yield event
+            if event['event'] in FINAL_EVENTS:
+                del self.queues[job]
+                return
+
+    async def result(self, job):
+        """Événement final du travail (result, cancelled ou error)"""
+        async for event in self.events(job):
+            pass
+        return event
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        self.listener.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def solve_remote(socket_path=DEFAULT_SOCKET, port=None, **request):
+    """
+    Version synchrone: soumet un travail et attend son événement final
+
+    Returns:
+        dict: événement result, cancelled ou error
+    """
+    async def run():
+        async with await ServiceClient.connect(socket_path, port) as client:
+            return await client.result(await client.submit(**request))
+
+    return asyncio.run(run())
+
+
+async def _demo(workers):
+    """Service dans ce processus et quelques travaux, dont un annulé en cours de route"""
+    import random
+    import tempfile
+
+    from generate_3SAT import generate_random_3sat
+
+    socket_path = os.path.join(tempfile.mkdtemp(), 'solver.sock')
+    service = SolverService(workers)
+    start = time.time()
+    await service.start()
+    print(f"Pool de {service.num_workers} processus démarré en {time.time() - start:.2f}s")
+    server = await service.serve_unix(socket_path)
+
+    async with server, await ServiceClient.connect(socket_path) as client:
+        # Balayage: instances au seuil, réponses dans l'ordre d'arrivée
+        jobs = {}
+        for num_variables in (20, 30, 40):
+            clauses = generate_random_3sat(num_variables, round(4.26 * num_variables), seed=num_variables)
+            job = await client.submit(kind='dimacs', clauses=clauses, num_variables=num_variables, engine='cdcl')
+            jobs[job] = f"3-SAT n={num_variables}"
+        rng = random.Random(0)
+        S = [rng.randint(1, 10**6) for _ in range(20)]
+        job = await client.submit(kind='subsetsum', S=S, T=sum(S[1::3]), time_limit=30)
+        jobs[job] = "SUBSETSUM |S|=20"
+
+        # Travail long annulé après une seconde (progression affichée)
+        clauses = generate_random_3sat(150, round(4.26 * 150), seed=1)
+        long_job = await client.submit(kind='dimacs', clauses=clauses, num_variables=150)
+        jobs[long_job] = "3-SAT n=150 (annulé)"
+
+        async def cancel_later(job, delay):
+            await asyncio.sleep(delay)
+            await client.cancel(job)
+
+        for job, name in jobs.items():
+            if job == long_job:
+                canceller = asyncio.create_task(cancel_later(job, 1.0))
+            async for event in client.events(job):
+                if event['event'] == 'progress':
+                    print(f"  {name}: {event['nodes']} nœuds, {event['elapsed']:.1f}s")
+                elif event['event'] == 'result':
+                    stats = event['stats']
+                    print(f"{name}: {event['status']} en {stats['time']:.3f}s "
+                          f"(attente {event['queued_time']:.3f}s)")
+                else:
+                    print(f"{name}: {event['event']} {event.get('error', '')}")
+        await canceller
+
+        print(f"\nÉtat: {await client.status()}")
+    await service.close()
+    os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    usage = """Usage:
+  python solver_service.py serve [--socket <chemin> | --port <n>] [--workers <n>]
+  python solver_service.py submit <fichier.cnf> [--socket <chemin> | --port <n>] [options]
+      --engine <moteur>  --heuristic <h>  --timeout <s>  --preprocess
+  python solver_service.py demo [--workers <n>]"""
+
+    options = {'--socket': DEFAULT_SOCKET, '--port': None, '--workers': None,
+               '--engine': 'backtracking', '--heuristic': 'first', '--timeout': None}
+    preprocess = False
+    args = sys.argv[1:]
+    command = args.pop(0) if args else None
+    paths = []
+    while args:
+        arg = args.pop(0)
+        if arg in options and args:
+            options[arg] = args.pop(0)
+        elif arg == '--preprocess':
+            preprocess = True
+        elif arg.startswith('--'):
+            command = None
+            break
+        else:
+            paths.append(arg)
+
+    port = int(options['--port']) if options['--port'] else None
+    workers = int(options['--workers']) if options['--workers'] else None
+    if command == 'serve':
+        try:
+            asyncio.run(run_service(options['--socket'], port, workers))
+        except KeyboardInterrupt:
+            print("\nService arrêté")
+    elif command == 'submit' and paths:
+        for path in paths:
+            event = solve_remote(options['--socket'], port, kind='dimacs', path=os.path.abspath(path),
+                                 engine=options['--engine'], heuristic=options['--heuristic'],
+                                 preprocess=preprocess,
+                                 time_limit=float(options['--timeout']) if options['--timeout'] else None)
+            if event['event'] == 'result':
+                print(f"{path}: {event['status']} en {event['stats']['time']:.3f}s")
+            else:
+                print(f"{path}: {event['event']} {event.get('error', '')}")
+    elif command == 'demo':
+        asyncio.run(_demo(workers or 2))
+    else:
+        print(usage)
+        sys.exit(1)
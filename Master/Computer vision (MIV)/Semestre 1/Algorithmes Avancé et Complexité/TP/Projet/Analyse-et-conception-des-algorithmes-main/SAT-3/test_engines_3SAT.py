@@ -0,0 +1,1184 @@
+"""
+TESTS DES MOTEURS 3-SAT
+=======================
+Chaque test compare un moteur à la force brute (énumération des 2^n
+affectations) sur de petites formules aléatoires à graine fixe.
+
+Usage: python test_engines_3SAT.py
+"""
+
+import asyncio
+import contextlib
+import gzip
+import importlib
+import io
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from solve_3SAT import SAT3Solver, BRANCHING_HEURISTICS, SOLVER_ENGINES, create_solver
+from solve_3SAT_cdcl import CDCLSolver
+from verify_3SAT import SAT3Verifier
+from drat_3SAT import DRATWriter, check_drat_proof
+from solve_3SAT_count import count_models
+from preprocess_3SAT import preprocess
+from budget_3SAT import SolverBudget
+from maxsat_3SAT import MaxSATSolver, HARD
+from constraints_3SAT import AtMost, Xor, check_constraints, constraints_to_cnf
+from generate_3SAT import generate_random_3sat, generate_random_ksat, random_assignment, write_random_dimacs
+import dimacs_reader
+from dimacs_reader import read_dimacs_cnf, read_dimacs_csr, parse_dimacs_cnf, write_dimacs_cnf
+from satlib_runner import run_headless_benchmark, load_completed
+from solve_3SAT_parallel import solve_cube_and_conquer
+from result_cache import ResultCache, cached_solve
+from solver_service import SolverService, ServiceClient
+from dimacs_cache import load_dimacs_cached, read_dimacs_cnf_cached, cache_entries, evict_cache, file_sha1
+
+
+def random_formula(rng, num_variables, num_clauses, max_length=3, min_length=1):
+    """Formule aléatoire: clauses de min_length à max_length littéraux sur des variables distinctes"""
+    return [[var * rng.choice([1, -1])
+             for var in rng.sample(range(1, num_variables + 1),
+                                   min(num_variables, rng.randint(min_length, max_length)))]
+            for _ in range(num_clauses)]
+
+
+def brute_force_models(clauses, num_variables):
+    """Toutes les affectations {variable: valeur} de x1..xn satisfaisant les clauses"""
+    models = []
+    for values in itertools.product([False, True], repeat=num_variables):
+        assignment = {var: values[var - 1] for var in range(1, num_variables + 1)}
+        if all(any(assignment[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses):
+            models.append(assignment)
+    return models
+
+
+def test_drat_proofs():
+    """
+    Preuves DRAT: preuves valides acceptées, preuves invalides rejetées,
+    preuves des réponses INSATISFIABLE des deux moteurs vérifiées
+    """
+    print("\n" + "="*70)
+    print("TEST 1: PREUVES DRAT")
+    print("="*70)
+
+    # (x1 ∨ x2) ∧ (¬x1 ∨ x2) ∧ (x1 ∨ ¬x2) ∧ (¬x1 ∨ ¬x2): réfutée par (x1) puis ()
+    formula = [[1, 2], [-1, 2], [1, -2], [-1, -2]]
+    proof = [(False, [1]), (False, [])]
+    valid, stats = check_drat_proof(formula, proof)
+    assert valid, f"❌ Preuve valide rejetée: {stats['error']}"
+    print(f"   ✓ Preuve écrite à la main acceptée ({stats['lemmas']} lemmes)")
+
+    directory = tempfile.mkdtemp()
+    for binary in (True, False):
+        path = os.path.join(directory, 'main.drat')
+        with DRATWriter(path, binary=binary) as writer:
+            writer.add([1])
+            writer.delete([1, 2])
+            writer.add([])
+        valid, stats = check_drat_proof(formula, path)
+        assert valid, f"❌ Fichier {'binaire' if binary else 'texte'} rejeté: {stats['error']}"
+    print(f"   ✓ Même preuve relue depuis un fichier binaire et texte (DRATWriter)")
+
+    invalid = [
+        ("clause vide non RUP", formula, [(False, [])]),
+        ("preuve incomplète", formula + [[3, 4]], [(False, [3, 1])]),
+        ("formule satisfiable", formula[:3], proof),
+        ("lemme non RUP ni RAT", formula, [(False, [1, 3]), (False, [-1, -3]), (False, [])]),
+    ]
+    for name, clauses, steps in invalid:
+        valid, _ = check_drat_proof(clauses, steps)
+        assert not valid, f"❌ Preuve invalide acceptée ({name})"
+    print(f"   ✓ {len(invalid)} preuves invalides rejetées")
+
+    # Réponses INSATISFIABLE des deux moteurs, preuves binaires et texte
+    rng = random.Random(18)
+    checked = {'backtracking': 0, 'cdcl': 0}
+    rejected = 0
+    path = os.path.join(directory, 'solver.drat')
+    while min(checked.values()) < 40:
+        num_variables = rng.randint(3, 10)
+        clauses = random_formula(rng, num_variables, rng.randint(num_variables, 7 * num_variables))
+        expected = bool(brute_force_models(clauses, num_variables))
+        for name, solver_class in (('backtracking', SAT3Solver), ('cdcl', CDCLSolver)):
+            binary = rng.random() < 0.5
+            with DRATWriter(path, binary=binary) as writer:
+                success, _, _ = solver_class(clauses, num_variables, proof=writer).solve()
+            assert success == expected, f"❌ {name}: {success} au lieu de {expected} pour {clauses}"
+            if success:
+                continue
+            valid, stats = SAT3Verifier(clauses).verify_unsat(path)
+            assert valid, f"❌ Preuve {name} rejetée: {stats['error']} pour {clauses}"
+            checked[name] += 1
+
+            # La même preuve ne réfute pas la formule privée d'une clause si elle devient satisfiable
+            weakened = [clause for clause in clauses if clause != clauses[0]]
+            if brute_force_models(weakened, num_variables):
+                valid, _ = check_drat_proof(weakened, path)
+                assert not valid, f"❌ Preuve {name} acceptée pour une formule satisfiable"
+                rejected += 1
+
+    print(f"   ✓ Preuves vérifiées: {checked['backtracking']} backtracking, {checked['cdcl']} CDCL")
+    print(f"   ✓ {rejected} preuves rejetées pour la formule affaiblie (satisfiable)")
+
+    print("\n✅ Test DRAT réussi!")
+    return True
+
+
+def model_key(assignment, num_variables):
+    """Affectation {variable: valeur} sous forme de tuple comparable"""
+    return tuple(assignment[var] for var in range(1, num_variables + 1))
+
+
+def test_model_counting():
+    """
+    Comptage et énumération des modèles: count_models (composantes + cache),
+    SAT3Solver.count_models, iter_models et solve_all comparés à la force brute
+    """
+    print("\n" + "="*70)
+    print("TEST 2: COMPTAGE ET ÉNUMÉRATION DES MODÈLES")
+    print("="*70)
+
+    # Cas limites: formule vide, clause vide, variables absentes des clauses
+    assert count_models([], 4) == 16, "❌ Formule vide: 2^n modèles attendus"
+    assert count_models([[1], []], 3) == 0, "❌ Clause vide: aucun modèle attendu"
+    assert count_models([[1, -2]], 5) == 3 * 8, "❌ Variables libres non comptées"
+    print(f"   ✓ Cas limites (formule vide, clause vide, variables libres)")
+
+    heuristics = sorted(BRANCHING_HEURISTICS)
+    rng = random.Random(15)
+    formulas = 0
+    for _ in range(150):
+        num_variables = rng.randint(1, 12)
+        clauses = random_formula(rng, max(1, num_variables - rng.randint(0, 2)),
+                                 rng.randint(0, 5 * num_variables))
+        expected = brute_force_models(clauses, num_variables)
+        expected_keys = sorted(model_key(model, num_variables) for model in expected)
+
+        # Petit cache pour exercer aussi l'éviction LRU
+        for cache_size in (2, 10000):
+            count = count_models(clauses, num_variables, cache_size)
+            assert count == len(expected), \
+                f"❌ count_models: {count} au lieu de {len(expected)} pour {clauses}"
+        count = SAT3Solver(clauses, num_variables).count_models()
+        assert count == len(expected), f"❌ SAT3Solver.count_models: {count} au lieu de {len(expected)}"
+
+        heuristic = heuristics[formulas % len(heuristics)]
+        solver = SAT3Solver(clauses, num_variables, heuristic)
+        models = sorted(model_key(model, num_variables) for model in solver.iter_models())
+        assert models == expected_keys, f"❌ iter_models ({heuristic}) pour {clauses}"
+
+        limit = rng.randint(1, 5)
+        solutions = solver.solve_all(limit)
+        assert len(solutions) == min(limit, len(expected)), "❌ solve_all: mauvais nombre de solutions"
+        assert all(model_key(model, num_variables) in expected_keys for model in solutions), \
+            "❌ solve_all: affectation qui n'est pas un modèle"
+        formulas += 1
+
+    print(f"   ✓ {formulas} formules: comptes et modèles identiques à la force brute")
+    print(f"   ✓ Heuristiques testées: {', '.join(heuristics)}")
+
+    print("\n✅ Test comptage réussi!")
+    return True
+
+
+def test_preprocessing():
+    """
+    Prétraitement: satisfiabilité préservée, tout modèle de la formule simplifiée
+    reconstruit en un modèle de la formule d'origine, create_solver(preprocess=True)
+    correct pour chaque moteur
+    """
+    print("\n" + "="*70)
+    print("TEST 3: PRÉTRAITEMENT")
+    print("="*70)
+
+    rng = random.Random(17)
+    formulas = 0
+    remaining = 0
+    reconstructed = 0
+    solved = dict.fromkeys(SOLVER_ENGINES, 0)
+    for _ in range(200):
+        num_variables = rng.randint(3, 12)
+        clauses = random_formula(rng, num_variables, rng.randint(num_variables, 6 * num_variables),
+                                 min_length=rng.choice([1, 2, 3]))
+        # Redondances: doublons, clauses subsumées, tautologies
+        clauses += [list(rng.choice(clauses)) for _ in range(rng.randint(0, 3))]
+        clauses += [clause + [-clause[0]] for clause in rng.sample(clauses, min(2, len(clauses)))
+                    if rng.random() < 0.3]
+        rng.shuffle(clauses)
+        verifier = SAT3Verifier(clauses)
+        satisfiable = bool(brute_force_models(clauses, num_variables))
+
+        # Options en alternance: sans élimination, la formule simplifiée reste rarement vide
+        options = ({}, {'eliminate': False}, {'subsume': False}, {'max_occurrences': 4})[formulas % 4]
+        simplified, new_variables, preprocessor = preprocess(clauses, num_variables, **options)
+        if preprocessor.unsat:
+            assert not satisfiable, f"❌ Formule satisfiable déclarée INSAT: {clauses}"
+        else:
+            models = brute_force_models(simplified, new_variables)
+            assert bool(models) == satisfiable, f"❌ Satisfiabilité non préservée: {clauses}"
+            remaining += bool(simplified)
+            for model in models:
+                valid, _ = verifier.verify(preprocessor.reconstruct(model))
+                assert valid, f"❌ Reconstruction invalide ({options}) pour {clauses}, modèle {model}"
+                reconstructed += 1
+
+        for engine in SOLVER_ENGINES:
+            budget = None
+            if engine not in ('backtracking', 'cdcl'):
+                # Recherche locale incomplète: seulement sur les formules satisfiables
+                if not satisfiable:
+                    continue
+                budget = SolverBudget(max_nodes=100000)
+            success, assignment, stats = create_solver(clauses, num_variables, engine,
+                                                       preprocess=True, budget=budget).solve()
+            assert 'preprocess' in stats, f"❌ {engine}: statistiques du prétraitement absentes"
+            assert success is not None, f"❌ {engine}: réponse inconnue pour {clauses}"
+            assert success == satisfiable, f"❌ {engine}: {success} au lieu de {satisfiable} pour {clauses}"
+            if success:
+                valid, _ = verifier.verify(assignment)
+                assert valid, f"❌ {engine}: modèle invalide pour {clauses}"
+                solved[engine] += 1
+        formulas += 1
+
+    print(f"   ✓ {formulas} formules: satisfiabilité préservée ({remaining} non résolues par le prétraitement)")
+    print(f"   ✓ {reconstructed} modèles reconstruits valides sur la formule d'origine")
+    print(f"   ✓ Modèles validés avec prétraitement: " +
+          ", ".join(f"{engine} {count}" for engine, count in solved.items()))
+
+    print("\n✅ Test prétraitement réussi!")
+    return True
+
+
+def falsified_weight(clauses, weights, assignment):
+    """Poids des clauses souples falsifiées, None si une clause dure est falsifiée"""
+    cost = 0
+    for clause, weight in zip(clauses, weights):
+        if not any(assignment[abs(lit)] == (lit > 0) for lit in clause):
+            if weight is HARD:
+                return None
+            cost += weight
+    return cost
+
+
+def brute_force_maxsat(clauses, num_variables, weights):
+    """Coût minimal (poids des clauses souples falsifiées), None si les clauses dures sont INSAT"""
+    best = None
+    for values in itertools.product([False, True], repeat=num_variables):
+        assignment = {var: values[var - 1] for var in range(1, num_variables + 1)}
+        cost = falsified_weight(clauses, weights, assignment)
+        if cost is not None and (best is None or cost < best):
+            best = cost
+    return best
+
+
+def test_maxsat():
+    """
+    MaxSAT: optimum (pondéré, avec clauses dures) comparé à la force brute,
+    améliorations successives strictement décroissantes
+    """
+    print("\n" + "="*70)
+    print("TEST 4: MAXSAT")
+    print("="*70)
+
+    rng = random.Random(22)
+    counts = dict.fromkeys(('unweighted', 'weighted', 'hard', 'unsat'), 0)
+    for formulas in range(200):
+        num_variables = rng.randint(1, 9)
+        clauses = random_formula(rng, num_variables, rng.randint(1, 8 * num_variables))
+        if rng.random() < 0.1:
+            clauses.append([])  # Clause vide: toujours falsifiée
+        kind = ('unweighted', 'weighted', 'hard')[formulas % 3]
+        if kind == 'unweighted':
+            weights = [1] * len(clauses)
+        else:
+            weights = [rng.randint(1, 9) for _ in clauses]
+        if kind == 'hard':
+            weights = [HARD if rng.random() < 0.3 else weight for weight in weights]
+
+        expected = brute_force_maxsat(clauses, num_variables, weights)
+        solver = MaxSATSolver(clauses, num_variables, None if kind == 'unweighted' else weights)
+        costs = [cost for cost, _ in solver.iter_improvements()]
+        assert costs == sorted(costs, reverse=True) and len(set(costs)) == len(costs), \
+            f"❌ Améliorations non strictement décroissantes: {costs}"
+
+        success, assignment, stats = MaxSATSolver(
+            clauses, num_variables, None if kind == 'unweighted' else weights).solve()
+        if expected is None:
+            assert success is False and stats['status'] == 'UNSAT', \
+                f"❌ Clauses dures INSAT non détectées: {clauses} {weights}"
+            counts['unsat'] += 1
+            continue
+        assert success is True and stats['status'] == 'OPTIMUM', f"❌ Statut {stats['status']}"
+        assert stats['cost'] == expected, \
+            f"❌ Coût {stats['cost']} au lieu de {expected} pour {clauses} {weights}"
+        assert falsified_weight(clauses, weights, assignment) == expected, \
+            "❌ L'affectation retournée n'atteint pas le coût annoncé"
+        total = sum(weight for weight in weights if weight is not HARD)
+        assert stats['satisfied_weight'] == total - expected, "❌ satisfied_weight incorrect"
+
+        # Une première borne (affectation aléatoire) ne change pas l'optimum
+        initial = {var: rng.random() < 0.5 for var in range(1, num_variables + 1)}
+        _, _, stats = MaxSATSolver(clauses, num_variables, weights, initial_assignment=initial).solve()
+        assert stats['cost'] == expected, "❌ Optimum différent avec initial_assignment"
+        counts[kind] += 1
+
+    print(f"   ✓ Optimum identique à la force brute: {counts['unweighted']} non pondérées, "
+          f"{counts['weighted']} pondérées, {counts['hard']} avec clauses dures")
+    print(f"   ✓ {counts['unsat']} formules aux clauses dures insatisfiables détectées")
+    print(f"   ✓ Améliorations successives strictement décroissantes")
+
+    print("\n✅ Test MaxSAT réussi!")
+    return True
+
+
+def random_constraints(rng, num_variables):
+    """Contraintes AtMost / Xor aléatoires sur x1..xn"""
+    constraints = []
+    for _ in range(rng.randint(1, 3)):
+        literals = [var * rng.choice([1, -1])
+                    for var in rng.sample(range(1, num_variables + 1), rng.randint(1, num_variables))]
+        if rng.random() < 0.5:
+            constraints.append(AtMost(rng.randint(0, len(literals)), literals))
+        else:
+            constraints.append(Xor(literals, rng.random() < 0.5))
+    return constraints
+
+
+def test_constraints():
+    """
+    Contraintes AtMost / Xor: propagation native du backtracking, encodage CNF
+    (CDCL, prétraitement) et comptage comparés à la force brute
+    """
+    print("\n" + "="*70)
+    print("TEST 5: CONTRAINTES ATMOST / XOR")
+    print("="*70)
+
+    heuristics = sorted(BRANCHING_HEURISTICS)
+    variants = [('backtracking', False), ('cdcl', False), ('backtracking', True), ('cdcl', True)]
+    rng = random.Random(23)
+    satisfiable_count = 0
+    encodings = 0
+    for formulas in range(150):
+        num_variables = rng.randint(2, 8)
+        clauses = random_formula(rng, num_variables, rng.randint(0, 3 * num_variables))
+        constraints = random_constraints(rng, num_variables)
+        expected = [model for model in brute_force_models(clauses, num_variables)
+                    if not check_constraints(constraints, model)]
+        expected_keys = sorted(model_key(model, num_variables) for model in expected)
+        satisfiable_count += bool(expected)
+
+        # Propagation native
+        heuristic = heuristics[formulas % len(heuristics)]
+        solver = SAT3Solver(clauses, num_variables, heuristic, constraints=constraints)
+        success, assignment, stats = solver.solve()
+        assert success == bool(expected), \
+            f"❌ Natif ({heuristic}): {success} au lieu de {bool(expected)} pour {clauses} {constraints}"
+        if success:
+            assert model_key(assignment, num_variables) in expected_keys, \
+                f"❌ Natif ({heuristic}): modèle invalide pour {clauses} {constraints}"
+        models = sorted(model_key(model, num_variables) for model in solver.iter_models())
+        assert models == expected_keys, f"❌ iter_models avec contraintes: {clauses} {constraints}"
+        count = SAT3Solver(clauses, num_variables, constraints=constraints).count_models()
+        assert count == len(expected), f"❌ count_models: {count} au lieu de {len(expected)}"
+
+        # Encodage CNF via create_solver
+        for engine, with_preprocess in variants:
+            success, assignment, _ = create_solver(clauses, num_variables, engine, preprocess=with_preprocess,
+                                                   constraints=constraints).solve()
+            assert success == bool(expected), \
+                f"❌ {engine} (prétraitement={with_preprocess}): {success} pour {clauses} {constraints}"
+            if success:
+                assert model_key(assignment, num_variables) in expected_keys, \
+                    f"❌ {engine} (prétraitement={with_preprocess}): modèle invalide"
+
+        # Les modèles de l'encodage, projetés sur x1..xn, sont exactement ceux des contraintes
+        extra, total = constraints_to_cnf(constraints, num_variables)
+        if total <= 14:
+            projected = {model_key(model, num_variables)
+                         for model in brute_force_models(clauses + extra, total)}
+            assert sorted(projected) == expected_keys, f"❌ Encodage CNF incorrect: {constraints}"
+            encodings += 1
+
+    print(f"   ✓ {formulas + 1} formules ({satisfiable_count} satisfiables): propagation native, "
+          f"iter_models et count_models identiques à la force brute")
+    print(f"   ✓ Encodage CNF correct avec " +
+          ", ".join(f"{engine}{' + prétraitement' if p else ''}" for engine, p in variants))
+    print(f"   ✓ {encodings} encodages: modèles projetés identiques à la force brute")
+
+    print("\n✅ Test contraintes réussi!")
+    return True
+
+
+def test_generator():
+    """
+    Générateur d'instances: déterminisme par graine, forme des clauses, solution
+    plantée, écriture DIMACS (compressée); scripts test_satlib / analyze_complexity
+    importables et génération des instances locales de test_satlib
+    """
+    print("\n" + "="*70)
+    print("TEST 6: GÉNÉRATEUR D'INSTANCES")
+    print("="*70)
+
+    for k in (1, 2, 3, 5):
+        for num_variables, num_clauses in ((k, 7), (20, 85), (50, 2000)):
+            clauses = generate_random_ksat(num_variables, num_clauses, k, seed=21).tolist()
+            assert clauses == generate_random_ksat(num_variables, num_clauses, k, seed=21).tolist(), \
+                "❌ Même graine, instances différentes"
+            assert len(clauses) == num_clauses, "❌ Nombre de clauses incorrect"
+            for clause in clauses:
+                assert len(clause) == k and len({abs(lit) for lit in clause}) == k, \
+                    f"❌ Clause sans {k} variables distinctes: {clause}"
+                assert all(1 <= abs(lit) <= num_variables for lit in clause), f"❌ Variable hors bornes: {clause}"
+
+            planted = random_assignment(num_variables, seed=num_clauses)
+            clauses = generate_random_ksat(num_variables, num_clauses, k, seed=21, planted=planted).tolist()
+            valid, _ = SAT3Verifier(clauses).verify(planted)
+            assert valid, f"❌ Solution plantée violée (k={k}, n={num_variables})"
+    assert generate_random_3sat(20, 85, seed=1) != generate_random_3sat(20, 85, seed=2), \
+        "❌ Graines différentes, instances identiques"
+    try:
+        generate_random_ksat(2, 5, k=3)
+        assert False, "❌ k > n accepté"
+    except ValueError:
+        pass
+    print(f"   ✓ Déterminisme par graine, k variables distinctes par clause, solution plantée satisfaite")
+
+    directory = tempfile.mkdtemp()
+    for extension in ('cnf', 'cnf.gz'):
+        filename = os.path.join(directory, f'random.{extension}')
+        written = write_random_dimacs(filename, 30, 500, seed=5, chunk_size=64)
+        clauses, num_variables = read_dimacs_cnf(filename)
+        assert written == 500 and num_variables == 30, "❌ En-tête DIMACS incorrect"
+        assert clauses == generate_random_ksat(30, 500, seed=5, chunk_size=64).tolist(), \
+            f"❌ Fichier .{extension} différent de l'instance générée"
+    print(f"   ✓ write_random_dimacs (.cnf et .cnf.gz, par blocs) relu identique")
+
+    # Scripts du projet: importables, instances locales générées et relues
+    test_satlib = importlib.import_module('test_satlib')
+    importlib.import_module('analyze_complexity')
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            total = test_satlib.generate_test_instances('gz')
+        files = sorted(os.listdir(test_satlib.INSTANCES_DIR))
+        assert total == len(files) == 15, f"❌ {len(files)} instances générées au lieu de 15"
+        clauses, num_variables = read_dimacs_cnf(os.path.join(test_satlib.INSTANCES_DIR, files[0]))
+        assert clauses == generate_random_3sat(10, 42, seed=1), "❌ Instance générée différente"
+    finally:
+        os.chdir(cwd)
+    print(f"   ✓ test_satlib et analyze_complexity importables, "
+          f"test_satlib.generate_test_instances: {total} instances")
+
+    print("\n✅ Test générateur réussi!")
+    return True
+
+
+def run_analysis(name):
+    """
+    Exécute une analyse de analyze_complexity dans un dossier temporaire
+
+    Returns:
+        tuple: (dossier contenant les graphiques, sortie console de l'analyse)
+    """
+    analyze_complexity = importlib.import_module('analyze_complexity')
+    directory = tempfile.mkdtemp()
+    output = io.StringIO()
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        with contextlib.redirect_stdout(output):
+            getattr(analyze_complexity, name)()
+    finally:
+        os.chdir(cwd)
+    return directory, output.getvalue()
+
+
+def test_heuristics_plot():
+    """Analyse 6 de analyze_complexity: graphique des backtracks par heuristique produit"""
+    print("\n" + "="*70)
+    print("TEST 7: GRAPHIQUE DES HEURISTIQUES (ANALYSE 6)")
+    print("="*70)
+
+    directory, output = run_analysis('analyze_heuristics')
+    path = os.path.join(directory, 'graph6_backtracks_par_heuristique.png')
+    assert os.path.getsize(path) > 0, "❌ graph6_backtracks_par_heuristique.png absent ou vide"
+    header = next(line for line in output.splitlines() if line.strip().startswith('Variables'))
+    assert all(heuristic in header for heuristic in BRANCHING_HEURISTICS), \
+        f"❌ Heuristiques absentes du tableau: {header}"
+    print(f"   ✓ Tableau des backtracks pour {', '.join(sorted(BRANCHING_HEURISTICS))}")
+    print(f"   ✓ graph6_backtracks_par_heuristique.png ({os.path.getsize(path)} octets)")
+
+    print("\n✅ Test graphique des heuristiques réussi!")
+    return True
+
+
+def test_instrumentation_plot():
+    """Analyse 7 de analyze_complexity: graphique de l'instrumentation (SolverMetrics) produit"""
+    print("\n" + "="*70)
+    print("TEST 8: GRAPHIQUE DE L'INSTRUMENTATION (ANALYSE 7)")
+    print("="*70)
+
+    directory, output = run_analysis('analyze_instrumentation')
+    path = os.path.join(directory, 'graph7_instrumentation.png')
+    assert os.path.getsize(path) > 0, "❌ graph7_instrumentation.png absent ou vide"
+    header = next(line for line in output.splitlines() if line.strip().startswith('Variables'))
+    assert 'backtracking prop/s' in header and 'cdcl prop/s' in header, \
+        f"❌ Débits de propagation absents du tableau: {header}"
+    print(f"   ✓ Débits de propagation des moteurs backtracking et cdcl")
+    print(f"   ✓ graph7_instrumentation.png ({os.path.getsize(path)} octets)")
+
+    print("\n✅ Test graphique de l'instrumentation réussi!")
+    return True
+
+
+def test_dimacs_blocks():
+    """
+    Lecture DIMACS par blocs (mmap): commentaires, fin SATLIB '%', lignes plus
+    longues qu'un bloc et fichiers compressés, quelle que soit la taille des blocs
+    """
+    print("\n" + "="*70)
+    print("TEST 9: LECTURE DIMACS PAR BLOCS")
+    print("="*70)
+
+    text = ("c instance de test\np cnf 6 5\n1 -2 3 0\nc commentaire dans le corps\n"
+            "-4 5\n  6 0\n" + " ".join(["1", "-2"] * 40) + " 0\n   c indenté\n-6 0\n2 0\n%\n0\n")
+    expected = [[1, -2, 3], [-4, 5, 6], [1, -2] * 40, [-6], [2]]
+    directory = tempfile.mkdtemp()
+    paths = []
+    for extension, opener in (('cnf', open), ('cnf.gz', gzip.open)):
+        path = os.path.join(directory, f'blocs.{extension}')
+        with opener(path, 'wb') as f:
+            f.write(text.encode())
+        paths.append(path)
+    # Corps sans marge: un bloc de seuls blancs ne doit pas compter un entier
+    tight = os.path.join(directory, 'serre.cnf')
+    with open(tight, 'wb') as f:
+        f.write(b'p cnf 2 2\n1 0\n2 0')
+
+    chunk_size = dimacs_reader.CHUNK_SIZE
+    try:
+        for size in (1, 5, 16, chunk_size):
+            dimacs_reader.CHUNK_SIZE = size
+            for path in paths:
+                assert read_dimacs_cnf(path) == (expected, 6), f"❌ {path} mal lu (blocs de {size} octets)"
+                literals, offsets, _ = read_dimacs_csr(path)
+                assert len(offsets) - 1 == 5 and len(literals) == sum(map(len, expected)), \
+                    f"❌ Forme CSR incorrecte (blocs de {size} octets)"
+            assert parse_dimacs_cnf(text) == (expected, 6), f"❌ parse_dimacs_cnf (blocs de {size} octets)"
+            literals, offsets, _ = read_dimacs_csr(tight)
+            assert literals.tolist() == [1, 2] and offsets.tolist() == [0, 1, 2], \
+                f"❌ Ligne vide lue comme un entier (blocs de {size} octets)"
+    finally:
+        dimacs_reader.CHUNK_SIZE = chunk_size
+    print(f"   ✓ Fichier .cnf (mmap), .cnf.gz et texte en mémoire lus à l'identique (blocs de 1 octet à 1 Mio)")
+
+    # DIMACS étendu: les lignes "x" sont retirées bloc par bloc
+    xtext = "p cnf 4 5\nx1 -2 3 0\nc commentaire\n1 2 0\n  x-4 1\nx2 4 0\n-3 0\n"
+    xexpected = ([[1, 2], [-3]], [[1, -2, 3], [-4, 1], [2, 4]], 4)
+    xpaths = []
+    for extension, opener in (('cnf', open), ('cnf.gz', gzip.open)):
+        path = os.path.join(directory, f'xor.{extension}')
+        with opener(path, 'wb') as f:
+            f.write(xtext.encode())
+        xpaths.append(path)
+    try:
+        for size in (1, 5, 16, chunk_size):
+            dimacs_reader.CHUNK_SIZE = size
+            for path in xpaths:
+                assert dimacs_reader.read_dimacs_xcnf(path) == xexpected, \
+                    f"❌ {path} mal lu (blocs de {size} octets)"
+    finally:
+        dimacs_reader.CHUNK_SIZE = chunk_size
+    print(f"   ✓ Lignes XOR lues par blocs (.cnf et .cnf.gz)")
+
+    empty = os.path.join(directory, 'vide.cnf')
+    open(empty, 'wb').close()
+    assert read_dimacs_cnf(empty) == ([], 0), "❌ Fichier vide mal lu"
+    invalid = os.path.join(directory, 'invalide.cnf')
+    with open(invalid, 'wb') as f:
+        f.write(b'p cnf 2 1\n1 a 0\n')
+    try:
+        read_dimacs_csr(invalid)
+        assert False, "❌ Jeton non entier accepté"
+    except ValueError:
+        pass
+    print(f"   ✓ Fichier vide accepté, jeton non entier rejeté")
+
+    # Clauses sans terminateur 0: une clause par ligne (lecture tolérante)
+    for text in ("p cnf 3 2\n1 -2 3\n-1 2\n", "1 -2 3\n-1 2\n"):
+        path = os.path.join(directory, 'sans_zero.cnf')
+        with open(path, 'w') as f:
+            f.write(text)
+        assert read_dimacs_cnf(path) == ([[1, -2, 3], [-1, 2]], 3), f"❌ Clauses sans 0 fusionnées: {text!r}"
+    print(f"   ✓ Clauses sans terminateur 0 lues une par ligne (avec et sans en-tête)")
+
+    print("\n✅ Test lecture DIMACS réussi!")
+    return True
+
+
+def test_dimacs_cache():
+    """
+    Cache DIMACS (.npy): entrée écrite au premier chargement puis projetée en
+    mémoire, lecture tolérante enregistrée pour les fichiers incohérents avec
+    leur en-tête, entrées d'une ancienne version ignorées, éviction LRU
+    """
+    print("\n" + "="*70)
+    print("TEST 10: CACHE DIMACS")
+    print("="*70)
+
+    directory = tempfile.mkdtemp()
+    cache_dir = os.path.join(directory, 'cache')
+    files = {
+        'regulier.cnf': "c exemple\np cnf 4 3\n1 -2 3 0\n-1 4 0\n2 -3\n -4 0\n",
+        'sans_zero.cnf': "p cnf 3 2\n1 -2 3\n-1 2\n",
+    }
+    for name, text in files.items():
+        path = os.path.join(directory, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        expected = read_dimacs_cnf(path)
+        for call in ('écriture', 'projection'):
+            literals, _, _ = load_dimacs_cached(path, cache_dir)
+            assert isinstance(literals, np.memmap) == (call == 'projection'), \
+                f"❌ {name}: {call} attendue"
+            assert read_dimacs_cnf_cached(path, cache_dir) == expected, \
+                f"❌ {name}: lecture par le cache différente de read_dimacs_cnf ({call})"
+    assert expected == ([[1, -2, 3], [-1, 2]], 3), "❌ Clauses sans 0 fusionnées dans le cache"
+    assert len(cache_entries(cache_dir)) == 2, "❌ Une entrée par fichier attendue"
+    print(f"   ✓ Entrées écrites puis projetées en mémoire, identiques à read_dimacs_cnf")
+    print(f"   ✓ Fichier sans terminateur 0 enregistré avec la lecture tolérante")
+
+    # Entrée d'une version antérieure (clé = SHA-1 seul) contenant une lecture fausse
+    path = os.path.join(directory, 'ancien.cnf')
+    with open(path, 'w') as f:
+        f.write("p cnf 2 2\n1 2\n-1 -2\n")
+    stale = file_sha1(path)
+    for part, array in (('literals', np.array([1, 2, -1, -2], dtype=np.int32)),
+                        ('offsets', np.array([0, 4], dtype=np.int64)),
+                        ('info', np.array([2], dtype=np.int64))):
+        np.save(os.path.join(cache_dir, f'{stale}.{part}.npy'), array)
+    assert read_dimacs_cnf_cached(path, cache_dir) == ([[1, 2], [-1, -2]], 2), \
+        "❌ Entrée d'une ancienne version servie par le cache"
+    print(f"   ✓ Entrée d'une ancienne version ignorée")
+
+    # Éviction: un cache de la taille d'une entrée ne garde que la plus récente
+    entries = cache_entries(cache_dir)
+    newest, size, _ = entries[-1]
+    assert evict_cache(cache_dir, size) == len(entries) - 1, "❌ Nombre d'entrées évincées incorrect"
+    assert [key for key, _, _ in cache_entries(cache_dir)] == [newest], \
+        "❌ L'éviction LRU n'a pas gardé l'entrée la plus récente"
+    print(f"   ✓ Éviction LRU au-delà de max_bytes")
+
+    print("\n✅ Test cache DIMACS réussi!")
+    return True
+
+
+def test_headless_benchmark():
+    """
+    Benchmark non interactif (un processus par instance): réponses comparées à
+    la force brute, sans limite de temps, reprise d'un fichier de résultats
+    """
+    print("\n" + "="*70)
+    print("TEST 11: BENCHMARK NON INTERACTIF")
+    print("="*70)
+
+    directory = tempfile.mkdtemp()
+    rng = random.Random(7)
+    instances = {}
+    for i in range(4):
+        num_variables = rng.randint(4, 8)
+        clauses = random_formula(rng, num_variables, rng.randint(2 * num_variables, 6 * num_variables),
+                                 min_length=2)
+        path = os.path.join(directory, f'instance{i}.cnf')
+        write_dimacs_cnf(clauses, num_variables, path)
+        instances[path] = 'SAT' if brute_force_models(clauses, num_variables) else 'UNSAT'
+
+    output = os.path.join(directory, 'resultats.jsonl')
+    cwd = os.getcwd()
+    os.chdir(directory)  # Cache DIMACS des processus dans le dossier temporaire
+    try:
+        for time_limit in (None, 30):
+            with contextlib.redirect_stdout(io.StringIO()):
+                rows = run_headless_benchmark(list(instances), output, engine='cdcl', time_limit=time_limit,
+                                              workers=2, resume=False, verbose=True)
+            assert len(rows) == len(instances), f"❌ {len(rows)} résultats pour {len(instances)} instances"
+            for row in rows:
+                assert row['status'] == instances[row['path']], \
+                    f"❌ {row['filename']}: {row['status']} au lieu de {instances[row['path']]} " \
+                    f"(limite {time_limit}): {row.get('error')}"
+                assert row['status'] == 'UNSAT' or row['verified'], f"❌ {row['filename']}: modèle non vérifié"
+        rows = run_headless_benchmark(list(instances), output, engine='cdcl', time_limit=None,
+                                      workers=2, verbose=False)
+    finally:
+        os.chdir(cwd)
+    assert rows == [] and set(load_completed(output)) == set(instances), \
+        "❌ Reprise: instances déjà traitées relancées"
+    print(f"   ✓ {len(instances)} instances résolues comme la force brute, avec et sans limite de temps")
+    print(f"   ✓ Reprise: instances déjà présentes dans le fichier de résultats ignorées")
+
+    print("\n✅ Test benchmark non interactif réussi!")
+    return True
+
+
+def test_incremental_cdcl():
+    """
+    CDCL incrémental: solve(assumptions=...), add_clause et failed_assumptions
+    comparés à la force brute, statistiques propres à chaque appel
+    """
+    print("\n" + "="*70)
+    print("TEST 12: CDCL INCRÉMENTAL")
+    print("="*70)
+
+    rng = random.Random(12)
+    calls = unsat_calls = 0
+    for _ in range(40):
+        num_variables = rng.randint(3, 8)
+        clauses = random_formula(rng, num_variables, rng.randint(num_variables, 4 * num_variables),
+                                 min_length=2)
+        solver = CDCLSolver(clauses, num_variables)
+        for step in range(6):
+            if step and rng.random() < 0.5:
+                clause = random_formula(rng, num_variables, 1)[0]
+                if rng.random() < 0.2:
+                    num_variables += 1  # Variable nouvelle: le solveur s'agrandit
+                    clause.append(num_variables * rng.choice([1, -1]))
+                solver.add_clause(clause)
+                clauses.append(clause)
+            assumptions = [var * rng.choice([1, -1])
+                           for var in rng.sample(range(1, num_variables + 1), rng.randint(0, 3))]
+            success, assignment, stats = solver.solve(assumptions=assumptions)
+            models = brute_force_models(clauses + [[lit] for lit in assumptions], num_variables)
+            calls += 1
+            assert success == bool(models), \
+                f"❌ {stats['status']} au lieu de {'SAT' if models else 'UNSAT'} sous {assumptions}"
+            if success:
+                assert all(any(assignment[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses) \
+                    and all(assignment[abs(lit)] == (lit > 0) for lit in assumptions), \
+                    f"❌ Modèle faux sous {assumptions}"
+            else:
+                unsat_calls += 1
+                failed = solver.failed_assumptions()
+                assert set(failed) <= set(assumptions), f"❌ {failed} n'est pas inclus dans {assumptions}"
+                assert not brute_force_models(clauses + [[lit] for lit in failed], num_variables), \
+                    f"❌ Hypothèses {failed} insuffisantes pour l'insatisfiabilité"
+    print(f"   ✓ {calls} appels ({unsat_calls} UNSAT) identiques à la force brute, "
+          f"hypothèses en échec suffisantes")
+
+    # Après une réponse UNSAT sans hypothèse, l'appel suivant ne cherche plus
+    clauses = random_formula(rng, 12, 90, min_length=3)
+    solver = CDCLSolver(clauses, 12)
+    success, _, stats = solver.solve()
+    assert success is False and stats['conflicts'] > 0, "❌ Instance de test non réfutée par des conflits"
+    success, _, stats = solver.solve()
+    assert success is False and stats['conflicts'] == stats['decisions'] == stats['backtrack_count'] == 0, \
+        f"❌ Statistiques cumulées entre deux appels: {stats['conflicts']} conflits"
+    print(f"   ✓ Statistiques remises à zéro à chaque appel")
+
+    # Clauses apprises supprimées au fil des appels: db est compactée
+    clauses = generate_random_3sat(150, 640, seed=3)
+    solver = CDCLSolver(clauses, 150)
+    for _ in range(5):
+        assumptions = [var * rng.choice([1, -1]) for var in rng.sample(range(1, 151), 3)]
+        success, assignment, _ = solver.solve(assumptions=assumptions)
+        expected, _, _ = CDCLSolver(clauses + [[lit] for lit in assumptions], 150).solve()
+        assert success == expected, f"❌ {success} au lieu de {expected} sous {assumptions}"
+        if success:
+            assert SAT3Verifier(clauses + [[lit] for lit in assumptions]).verify(assignment)[0], \
+                f"❌ Modèle faux sous {assumptions}"
+        dead = sum(c is None for c in solver.db)
+        assert dead <= CDCLSolver.COMPACT_RATIO * len(solver.db), \
+            f"❌ {dead} clauses supprimées sur {len(solver.db)} encore dans db"
+    print(f"   ✓ Base de clauses compactée entre les appels ({len(solver.db)} clauses, {dead} supprimées)")
+
+    print("\n✅ Test CDCL incrémental réussi!")
+    return True
+
+
+def test_parallel_solve():
+    """
+    Cube-and-conquer: découpe en cubes et résolution des cubes (dans ce
+    processus, puis par solve(parallel=N) avec un pool de processus)
+    comparées à la force brute, avec contraintes et hypothèses
+    """
+    print("\n" + "="*70)
+    print("TEST 13: RÉSOLUTION PARALLÈLE (CUBE-AND-CONQUER)")
+    print("="*70)
+
+    heuristics = sorted(BRANCHING_HEURISTICS)
+    rng = random.Random(8)
+    satisfiable_count = 0
+    for formulas in range(120):
+        num_variables = rng.randint(2, 10)
+        clauses = random_formula(rng, num_variables, rng.randint(0, 5 * num_variables))
+        constraints = random_constraints(rng, num_variables) if formulas % 3 == 0 else None
+        expected = [model for model in brute_force_models(clauses, num_variables)
+                    if not constraints or not check_constraints(constraints, model)]
+        expected_keys = {model_key(model, num_variables) for model in expected}
+        satisfiable_count += bool(expected)
+        heuristic = heuristics[formulas % len(heuristics)]
+        num_cubes = rng.choice([1, 2, 4, 16])
+        success, assignment, stats = solve_cube_and_conquer(clauses, num_variables, workers=1, num_cubes=num_cubes,
+                                                            heuristic=heuristic, constraints=constraints)
+        assert success == bool(expected), \
+            f"❌ {success} au lieu de {bool(expected)} ({num_cubes} cubes, {heuristic}) pour {clauses} {constraints}"
+        if success:
+            assert model_key(assignment, num_variables) in expected_keys, \
+                f"❌ Modèle invalide ({num_cubes} cubes, {heuristic}) pour {clauses} {constraints}"
+        else:
+            assert stats['cubes_solved'] == stats['num_cubes'], "❌ Réponse UNSAT sans résoudre tous les cubes"
+    print(f"   ✓ {formulas + 1} formules ({satisfiable_count} satisfiables) résolues par cubes comme la force brute")
+
+    calls = 0
+    for _ in range(12):
+        num_variables = rng.randint(4, 10)
+        clauses = random_formula(rng, num_variables, rng.randint(num_variables, 5 * num_variables))
+        assumptions = [var * rng.choice([1, -1]) for var in rng.sample(range(1, num_variables + 1), rng.randint(0, 3))]
+        solver = SAT3Solver(clauses, num_variables, heuristics[calls % len(heuristics)])
+        success, assignment, stats = solver.solve(parallel=2, assumptions=assumptions)
+        expected = brute_force_models(clauses + [[lit] for lit in assumptions], num_variables)
+        calls += 1
+        assert stats['workers'] == 2 and success == bool(expected), \
+            f"❌ solve(parallel=2): {stats['status']} au lieu de {'SAT' if expected else 'UNSAT'} sous {assumptions}"
+        if success:
+            assert model_key(assignment, num_variables) in {model_key(model, num_variables) for model in expected}, \
+                f"❌ solve(parallel=2): modèle invalide sous {assumptions}"
+        else:
+            failed = solver.failed_assumptions()
+            assert set(failed) <= set(assumptions) and \
+                not brute_force_models(clauses + [[lit] for lit in failed], num_variables), \
+                f"❌ solve(parallel=2): hypothèses en échec {failed} incorrectes"
+    print(f"   ✓ {calls} appels solve(parallel=2) avec hypothèses identiques à la force brute")
+
+    print("\n✅ Test résolution parallèle réussi!")
+    return True
+
+
+def test_verify_batch():
+    """
+    Vérification par lots (verify_batch): nombre de clauses insatisfaites de
+    toutes les affectations comparé à une évaluation directe, quelle que soit
+    la taille des paquets
+    """
+    print("\n" + "="*70)
+    print("TEST 14: VÉRIFICATION PAR LOTS")
+    print("="*70)
+
+    rng = random.Random(14)
+    candidates = 0
+    for formulas in range(60):
+        num_variables = rng.randint(1, 8)
+        if formulas % 3 == 0:
+            clauses = random_formula(rng, num_variables, rng.randint(1, 4 * num_variables), 3, 3)  # Largeur fixe
+        else:
+            clauses = random_formula(rng, num_variables, rng.randint(0, 4 * num_variables))
+            if formulas % 3 == 1:
+                clauses.insert(rng.randint(0, len(clauses)), [])  # Clause vide: toujours fausse
+        assignments = np.array(list(itertools.product([False, True], repeat=num_variables)), dtype=bool)
+        expected = np.array([sum(not any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+                             for values in assignments])
+        verifier = SAT3Verifier(clauses)
+        for chunk_size in (None, 1, 7):
+            satisfied, counts = verifier.verify_batch(assignments, chunk_size)
+            assert (counts == expected).all() and (satisfied == (expected == 0)).all(), \
+                f"❌ verify_batch (paquets de {chunk_size}) pour {clauses}"
+        for values, valid in zip(assignments[:4] if clauses else [], satisfied):
+            assignment = {var: bool(values[var - 1]) for var in range(1, num_variables + 1)}
+            assert SAT3Verifier(clauses).verify(assignment)[0] == valid, "❌ verify et verify_batch divergent"
+        candidates += len(assignments)
+    print(f"   ✓ {candidates} affectations de {formulas + 1} formules (largeur fixe, mixte, clause vide), "
+          f"paquets de 1, 7 et par défaut")
+
+    verifier = SAT3Verifier([[1, -3], [2]])
+    for invalid in (np.zeros(3, dtype=bool), np.zeros((4, 2), dtype=bool)):
+        try:
+            verifier.verify_batch(invalid)
+            assert False, f"❌ Tableau de forme {invalid.shape} accepté"
+        except ValueError:
+            pass
+    print(f"   ✓ Tableau à une dimension et colonnes manquantes rejetés")
+
+    print("\n✅ Test vérification par lots réussi!")
+    return True
+
+
+def test_budgets():
+    """
+    Budgets: chaque moteur s'arrête sur UNKNOWN avec la bonne raison (nœuds,
+    conflits, temps, annulation), en mode parallèle aussi; un budget non
+    épuisé laisse les réponses identiques à la force brute
+    """
+    print("\n" + "="*70)
+    print("TEST 15: BUDGETS ET ÉTAT INCONNU")
+    print("="*70)
+
+    # Instance au seuil, hors de portée des budgets ci-dessous
+    clauses = generate_random_3sat(150, 639, seed=4)
+    limits = [('nodes', {'max_nodes': 300}), ('conflicts', {'max_conflicts': 40}),
+              ('time', {'max_time': 0.2}), ('cancelled', {})]
+    for engine in SOLVER_ENGINES:
+        for reason, kwargs in limits:
+            if reason == 'conflicts' and engine != 'cdcl':
+                continue  # Seul CDCL compte des conflits
+            budget = SolverBudget(**kwargs)
+            if reason == 'cancelled':
+                budget.cancel()
+            success, assignment, stats = create_solver(clauses, 150, engine, budget=budget).solve()
+            assert success is None and assignment is None and stats['status'] == 'UNKNOWN', \
+                f"❌ {engine}: {stats['status']} au lieu de UNKNOWN (limite {reason})"
+            assert stats['budget']['reason'] == reason, \
+                f"❌ {engine}: raison {stats['budget']['reason']} au lieu de {reason}"
+            if reason in ('nodes', 'conflicts'):
+                assert stats['budget'][reason] == kwargs['max_' + reason], \
+                    f"❌ {engine}: {stats['budget'][reason]} {reason} au lieu de {kwargs['max_' + reason]}"
+            if reason == 'time':
+                assert stats['budget']['elapsed'] < 1.0, f"❌ {engine}: arrêt après {stats['budget']['elapsed']:.2f}s"
+    print(f"   ✓ {', '.join(SOLVER_ENGINES)}: UNKNOWN sur limite de nœuds, conflits (CDCL), temps et annulation")
+
+    for reason, kwargs in limits[:3:2]:
+        success, _, stats = SAT3Solver(clauses, 150, budget=SolverBudget(**kwargs)).solve(parallel=2)
+        assert success is None and stats['budget']['reason'] == reason, \
+            f"❌ solve(parallel=2): {stats['status']} ({stats['budget']['reason']}) au lieu de UNKNOWN ({reason})"
+    print(f"   ✓ solve(parallel=2): UNKNOWN sur limite de nœuds et de temps")
+
+    # Budget suffisant (réutilisé après un épuisement): réponses exactes
+    rng = random.Random(20)
+    # (la recherche locale épuise son budget de flips sur les formules insatisfiables)
+    max_nodes = {engine: 100000 if engine in ('backtracking', 'cdcl') else 5000 for engine in SOLVER_ENGINES}
+    budgets = {engine: SolverBudget(max_nodes=300, max_time=30) for engine in SOLVER_ENGINES}
+    for engine, budget in budgets.items():
+        create_solver(clauses, 150, engine, budget=budget).solve()
+        budget.max_nodes = max_nodes[engine]
+    for formulas in range(40):
+        num_variables = rng.randint(3, 10)
+        formula = random_formula(rng, num_variables, rng.randint(num_variables, 5 * num_variables))
+        expected = bool(brute_force_models(formula, num_variables))
+        for engine, budget in budgets.items():
+            success, assignment, stats = create_solver(formula, num_variables, engine, budget=budget).solve()
+            if engine in ('backtracking', 'cdcl'):
+                assert success == expected and stats['budget']['reason'] is None, \
+                    f"❌ {engine}: {stats['status']} ({stats['budget']['reason']}) au lieu de {expected}"
+            else:
+                # Recherche locale (incomplète): jamais UNSAT, UNKNOWN seulement sur épuisement
+                assert success is not False and (success or not expected or stats['budget']['reason']), \
+                    f"❌ {engine}: {stats['status']} pour une formule {'SAT' if expected else 'UNSAT'}"
+            if success:
+                assert SAT3Verifier(formula).verify(assignment)[0], f"❌ {engine}: modèle invalide"
+    print(f"   ✓ Budget suffisant réutilisé: {formulas + 1} formules, réponses identiques à la force brute")
+
+    print("\n✅ Test budgets réussi!")
+    return True
+
+
+def test_result_cache():
+    """
+    Cache des résultats (SQLite): défaut puis succès, formule reconnue quel
+    que soit l'ordre des clauses et des littéraux, réponses UNKNOWN non
+    enregistrées, persistance et invalidation par version
+    """
+    print("\n" + "="*70)
+    print("TEST 16: CACHE DES RÉSULTATS")
+    print("="*70)
+
+    path = os.path.join(tempfile.mkdtemp(), 'resultats.sqlite')
+    rng = random.Random(24)
+    formulas = []
+    with ResultCache(path) as cache:
+        for _ in range(30):
+            num_variables = rng.randint(3, 10)
+            clauses = random_formula(rng, num_variables, rng.randint(num_variables, 5 * num_variables))
+            expected = bool(brute_force_models(clauses, num_variables))
+            success, _, first = cached_solve(cache, clauses, num_variables)
+            assert success == expected and not first['cached'], f"❌ Défaut: {success} au lieu de {expected}"
+
+            # Même formule, clauses et littéraux permutés, une clause répétée
+            shuffled = [rng.sample(clause, len(clause)) for clause in clauses + clauses[:1]]
+            rng.shuffle(shuffled)
+            success, assignment, stats = cached_solve(cache, shuffled, num_variables)
+            assert stats['cached'] and success == expected and stats['time'] == first['time'], \
+                "❌ Formule permutée non servie par le cache"
+            if success:
+                assert SAT3Verifier(clauses).verify(assignment)[0], "❌ Modèle du cache invalide"
+            formulas.append((clauses, num_variables, expected))
+
+        _, _, stats = cached_solve(cache, clauses, num_variables, engine='cdcl')
+        assert not stats['cached'], "❌ Configuration différente servie par le cache"
+        assert (cache.hits, cache.misses, len(cache)) == (30, 31, 31), \
+            f"❌ {cache.hits} succès, {cache.misses} défauts, {len(cache)} entrées"
+    print(f"   ✓ {len(formulas)} formules: défaut puis succès (ordre indifférent), moteur distingué")
+
+    hard = generate_random_3sat(150, 639, seed=4)
+    with ResultCache(path) as cache:
+        for clauses, num_variables, expected in formulas:
+            success, _, stats = cached_solve(cache, clauses, num_variables)
+            assert stats['cached'] and success == expected, "❌ Entrée perdue à la réouverture"
+        success, _, stats = cached_solve(cache, hard, 150, budget=SolverBudget(max_nodes=50))
+        assert success is None and len(cache) == 31, "❌ Réponse UNKNOWN enregistrée"
+        _, _, stats = cached_solve(cache, hard, 150, budget=SolverBudget(max_nodes=50))
+        assert not stats['cached'], "❌ Réponse UNKNOWN servie par le cache"
+    print(f"   ✓ Entrées relues après réouverture, réponses UNKNOWN jamais enregistrées")
+
+    with ResultCache(path, version='autre') as cache:
+        clauses, num_variables, _ = formulas[0]
+        _, _, stats = cached_solve(cache, clauses, num_variables)
+        assert not stats['cached'], "❌ Entrée d'une autre version servie"
+        assert cache.invalidate() == 31 and cache.versions() == {'autre': 1}, \
+            f"❌ Invalidation incorrecte: {cache.versions()}"
+    print(f"   ✓ Version de solveur différente ignorée puis invalidée")
+
+    print("\n✅ Test cache des résultats réussi!")
+    return True
+
+
+async def service_scenario(directory):
+    """Scénario du test 17: service à 2 processus et un client sur une socket Unix"""
+    rng = random.Random(25)
+    socket_path = os.path.join(directory, 'service.sock')
+    service = SolverService(workers=2)
+    await service.start()
+    server = await service.serve_unix(socket_path)
+    async with server, await ServiceClient.connect(socket_path) as client:
+        # Formules données par clauses, texte DIMACS ou fichier, moteurs alternés
+        expected = {}
+        for i in range(12):
+            num_variables = rng.randint(4, 9)
+            clauses = random_formula(rng, num_variables, rng.randint(num_variables, 5 * num_variables))
+            request = {'engine': ('backtracking', 'cdcl')[i % 2]}
+            if i % 3 == 0:
+                request.update(clauses=clauses, num_variables=num_variables)
+            elif i % 3 == 1:
+                request['cnf'] = f"p cnf {num_variables} {len(clauses)}\n" + \
+                    "".join(" ".join(map(str, clause)) + " 0\n" for clause in clauses)
+            else:
+                request['path'] = os.path.join(directory, f'formule{i}.cnf')
+                write_dimacs_cnf(clauses, num_variables, request['path'])
+            job = await client.submit(kind='dimacs', **request)
+            expected[job] = (clauses, 'SAT' if brute_force_models(clauses, num_variables) else 'UNSAT')
+        subsetsum = await client.submit(kind='subsetsum', S=[3, 34, 4, 12, 5, 2], T=9)
+
+        hard = generate_random_3sat(150, 639, seed=4)
+        limited = await client.submit(kind='dimacs', clauses=hard, num_variables=150, max_nodes=200)
+        long_job = await client.submit(kind='dimacs', clauses=hard, num_variables=150)
+        missing = await client.submit(kind='dimacs', path=os.path.join(directory, 'absent.cnf'))
+        try:
+            await client.submit(kind='inconnu')
+            assert False, "❌ kind inconnu accepté"
+        except RuntimeError:
+            pass
+
+        for job, (clauses, status) in expected.items():
+            event = await client.result(job)
+            assert event['event'] == 'result' and event['status'] == status, \
+                f"❌ Travail {job}: {event.get('status', event)} au lieu de {status}"
+            if status == 'SAT':
+                assert event['stats']['verified'] and \
+                    SAT3Verifier(clauses).verify({abs(lit): lit > 0 for lit in event['model']})[0], \
+                    f"❌ Travail {job}: modèle invalide"
+        event = await client.result(subsetsum)
+        assert event['status'] == 'FOUND' and sum(event['subset']) == 9, f"❌ SUBSETSUM: {event}"
+        event = await client.result(limited)
+        assert event['status'] == 'UNKNOWN', f"❌ Travail limité à 200 nœuds: {event.get('status', event)}"
+        event = await client.result(missing)
+        assert event['event'] == 'error', f"❌ Fichier absent: {event['event']}"
+
+        await asyncio.sleep(0.5)
+        await client.cancel(long_job)
+        event = await client.result(long_job)
+        assert event['event'] == 'cancelled', f"❌ Travail annulé: {event['event']}"
+
+        status = await client.status()
+        assert status['alive'] == 2 and status['running'] == [] and status['queued'] == 0 and \
+            status['completed'] == len(expected) + 4, f"❌ État du service: {status}"
+    await service.close()
+    return len(expected)
+
+
+def test_solver_service():
+    """
+    Service de résolution (asyncio): travaux 3-SAT (clauses, texte DIMACS,
+    fichier) comparés à la force brute, SUBSETSUM, budget, annulation,
+    erreurs et état du pool, par le client ServiceClient
+    """
+    print("\n" + "="*70)
+    print("TEST 17: SERVICE DE RÉSOLUTION")
+    print("="*70)
+
+    count = asyncio.run(service_scenario(tempfile.mkdtemp()))
+    print(f"   ✓ {count} formules (clauses, texte DIMACS, fichier) résolues comme la force brute")
+    print(f"   ✓ SUBSETSUM, budget épuisé (UNKNOWN), annulation en cours, fichier absent et kind inconnu")
+    print(f"   ✓ État du pool: 2 processus vivants, aucun travail restant")
+
+    print("\n✅ Test service de résolution réussi!")
+    return True
+
+
+def run_all_tests():
+    """Exécute tous les tests"""
+    print("\n" + "╔" + "="*68 + "╗")
+    print("║" + " "*19 + "SUITE DE TESTS - MOTEURS 3-SAT" + " "*19 + "║")
+    print("╚" + "="*68 + "╝")
+
+    tests = [
+        ("Preuves DRAT", test_drat_proofs),
+        ("Comptage de modèles", test_model_counting),
+        ("Prétraitement", test_preprocessing),
+        ("MaxSAT", test_maxsat),
+        ("Contraintes AtMost / Xor", test_constraints),
+        ("Générateur d'instances", test_generator),
+        ("Graphique des heuristiques", test_heuristics_plot),
+        ("Graphique de l'instrumentation", test_instrumentation_plot),
+        ("Lecture DIMACS par blocs", test_dimacs_blocks),
+        ("Cache DIMACS", test_dimacs_cache),
+        ("Benchmark non interactif", test_headless_benchmark),
+        ("CDCL incrémental", test_incremental_cdcl),
+        ("Résolution parallèle", test_parallel_solve),
+        ("Vérification par lots", test_verify_batch),
+        ("Budgets et état inconnu", test_budgets),
+        ("Cache des résultats", test_result_cache),
+        ("Service de résolution", test_solver_service),
+    ]
+
+    passed = 0
+    failed = 0
+    start_time = time.time()
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"❌ Test '{test_name}' échoué")
+        except AssertionError as e:
+            failed += 1
+            print(f"\n❌ Test '{test_name}' échoué: {e}")
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Test '{test_name}' erreur: {e}")
+            import traceback
+            traceback.print_exc()
+
+    elapsed = time.time() - start_time
+
+    print("\n" + "="*70)
+    print("RÉSUMÉ DES TESTS")
+    print("="*70)
+    print(f"\n✅ Tests réussis: {passed}/{len(tests)}")
+    print(f"❌ Tests échoués: {failed}/{len(tests)}")
+    print(f"⏱️  Temps total: {elapsed:.3f}s")
+    if failed:
+        print(f"\n⚠️  {failed} test(s) ont échoué")
+    print()
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -1,268 +1,444 @@
-"""
-Vérificateur pour le problème 3-SAT
-Vérifie si une affectation donnée satisfait une formule 3-SAT
-"""
-
-class SAT3Verifier:
-    def __init__(self, clauses):
-        """
-        Initialise le vérificateur
-        
-        Args:
-            clauses: Liste de clauses, chaque clause est une liste de 3 littéraux
-        """
-        self.clauses = clauses
-    
-    def evaluate_literal(self, literal, assignment):
-        """
-        Évalue un littéral avec une affectation donnée
-        
-        Args:
-            literal: entier (positif ou négatif)
-            assignment: dictionnaire {variable: True/False}
-        
-        Returns:
-            True/False selon l'évaluation du littéral
-        """
-        var = abs(literal)
-        
-        if var not in assignment:
-            raise ValueError(f"Variable x{var} non affectée dans l'assignment")
-        
-        value = assignment[var]
-        
-        # Si littéral positif, retourne la valeur
-        # Si littéral négatif, retourne NOT valeur
-        return value if literal > 0 else not value
-    
-    def evaluate_clause(self, clause, assignment):
-        """
-        Évalue une clause (disjonction de littéraux)
-        
-        Args:
-            clause: liste de 3 littéraux
-            assignment: dictionnaire {variable: True/False}
-        
-        Returns:
-            True si au moins un littéral est vrai, False sinon
-        """
-        for literal in clause:
-            if self.evaluate_literal(literal, assignment):
-                return True  # Au moins un littéral vrai → clause satisfaite
-        
-        return False  # Tous les littéraux sont faux
-    
-    def verify(self, assignment):
-        """
-        Vérifie si l'affectation satisfait toutes les clauses
-        
-        Args:
-            assignment: dictionnaire {variable: True/False}
-        
-        Returns:
-            tuple: (is_valid, details)
-                is_valid: True si toutes les clauses sont satisfaites
-                details: dictionnaire avec les détails de vérification
-        """
-        unsatisfied_clauses = []
-        satisfied_clauses = []
-        
-        for i, clause in enumerate(self.clauses):
-            try:
-                if self.evaluate_clause(clause, assignment):
-                    satisfied_clauses.append(i)
-                else:
-                    unsatisfied_clauses.append(i)
-            except ValueError as e:
-                return False, {
-                    'error': str(e),
-                    'clause_index': i,
-                    'clause': clause
-                }
-        
-        is_valid = len(unsatisfied_clauses) == 0
-        
-        details = {
-            'total_clauses': len(self.clauses),
-            'satisfied_clauses': len(satisfied_clauses),
-            'unsatisfied_clauses': unsatisfied_clauses,
-            'success_rate': len(satisfied_clauses) / len(self.clauses) * 100
-        }
-        
-        return is_valid, details
-    
-    def verify_verbose(self, assignment):
-        """
-        Vérifie avec affichage détaillé de chaque clause
-        
-        Args:
-            assignment: dictionnaire {variable: True/False}
-        
-        Returns:
-            bool: True si toutes les clauses sont satisfaites
-        """
-        print("=== Vérification détaillée ===\n")
-        
-        all_satisfied = True
-        
-        for i, clause in enumerate(self.clauses, 1):
-            print(f"Clause {i}: {clause}")
-            
-            literals_eval = []
-            clause_satisfied = False
-            
-            for literal in clause:
-                var = abs(literal)
-                is_negated = literal < 0
-                var_value = assignment.get(var)
-                
-                if var_value is None:
-                    print(f"  ERREUR: Variable x{var} non affectée!")
-                    all_satisfied = False
-                    break
-                
-                literal_value = (not var_value) if is_negated else var_value
-                literals_eval.append(literal_value)
-                
-                neg_str = "¬" if is_negated else ""
-                val_str = "V" if literal_value else "F"
-                print(f"  {neg_str}x{var} = {val_str}", end="")
-                
-                if literal_value:
-                    clause_satisfied = True
-                    print(" ✓")
-                    break
-                else:
-                    print()
-            
-            if clause_satisfied:
-                print(f"  → Clause SATISFAITE ✓\n")
-            else:
-                print(f"  → Clause INSATISFAITE ✗\n")
-                all_satisfied = False
-        
-        return all_satisfied
-
-
-def read_assignment_from_file(filename):
-    """
-    Lit une affectation depuis un fichier
-    
-    Format:
-    x1 = True
-    x2 = False
-    x3 = True
-    
-    ou format court:
-    1 0 1  (1=True, 0=False)
-    """
-    assignment = {}
-    
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        # Format: x1 = True
-        if '=' in line:
-            parts = line.split('=')
-            var_str = parts[0].strip().replace('x', '')
-            value_str = parts[1].strip().lower()
-            
-            var = int(var_str)
-            value = value_str in ['true', 'vrai', '1', 'yes', 'oui']
-            
-            assignment[var] = value
-        
-        # Format court: 1 0 1
-        else:
-            values = line.split()
-            for i, val in enumerate(values, 1):
-                assignment[i] = (val == '1')
-    
-    return assignment
-
-
-def verify_from_files(clauses_file, assignment_file):
-    """Vérifie une solution à partir de fichiers"""
-    from solver_3sat import read_3sat_from_file
-    
-    clauses, num_variables = read_3sat_from_file(clauses_file)
-    assignment = read_assignment_from_file(assignment_file)
-    
-    verifier = SAT3Verifier(clauses)
-    is_valid, details = verifier.verify(assignment)
-    
-    return is_valid, details
-
-
-if __name__ == "__main__":
-    print("=== Exemple 3-SAT Verifier ===\n")
-    
-    # Exemple de l'énoncé
-    clauses = [
-        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
-        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
-        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
-    ]
-    
-    # Affectation de l'énoncé: x1=faux, x2=faux, x3=vrai
-    assignment_correct = {1: False, 2: False, 3: True}
-    
-    print("Formule:")
-    for i, clause in enumerate(clauses, 1):
-        print(f"  C{i}: {clause}")
-    
-    print(f"\nAffectation à vérifier:")
-    for var in sorted(assignment_correct.keys()):
-        value = "vrai" if assignment_correct[var] else "faux"
-        print(f"  x{var} = {value}")
-    
-    print()
-    
-    verifier = SAT3Verifier(clauses)
-    
-    # Vérification simple
-    is_valid, details = verifier.verify(assignment_correct)
-    
-    print("\nRésultat de vérification:")
-    if is_valid:
-        print("✓ L'affectation est VALIDE")
-    else:
-        print("✗ L'affectation est INVALIDE")
-    
-    print(f"\nDétails:")
-    print(f"  Clauses satisfaites: {details['satisfied_clauses']}/{details['total_clauses']}")
-    print(f"  Taux de succès: {details['success_rate']:.1f}%")
-    
-    if details['unsatisfied_clauses']:
-        print(f"  Clauses insatisfaites: {details['unsatisfied_clauses']}")
-    
-    # Vérification verbose
-    print("\n" + "="*50)
-    verifier.verify_verbose(assignment_correct)
-    
-    # Test avec une mauvaise affectation
-    print("\n" + "="*50)
-    print("=== Test avec une affectation incorrecte ===\n")
-    
-    assignment_wrong = {1: True, 2: True, 3: False}
-    
-    print("Affectation incorrecte:")
-    for var in sorted(assignment_wrong.keys()):
-        value = "vrai" if assignment_wrong[var] else "faux"
-        print(f"  x{var} = {value}")
-    
-    print()
-    
-    is_valid, details = verifier.verify(assignment_wrong)
-    
-    print("Résultat:")
-    if is_valid:
-        print("✓ L'affectation est VALIDE")
-    else:
-        print("✗ L'affectation est INVALIDE")
-        print(f"  Clauses insatisfaites: {details['unsatisfied_clauses']}")
+"""
+Vérificateur pour le problème 3-SAT
+Vérifie si une affectation donnée satisfait une formule 3-SAT
+"""
+
+import numpy as np
+
+# Mémoire maximale du tableau intermédiaire de verify_batch (octets)
+VERIFY_BATCH_MAX_BYTES = 64 * 1024 * 1024
+
+
+class SAT3Verifier:
+    def __init__(self, clauses):
+        """
+        Initialise le vérificateur
+        
+        Args:
+            clauses: Liste de clauses, chaque clause est une liste de 3 littéraux,
+                     ou forme compacte exposant .literals (int32 plat) et
+                     .offsets (la clause i occupe literals[offsets[i]:offsets[i+1]])
+        """
+        self.clauses = clauses
+        self._literals = None
+        self._offsets = None
+        if hasattr(clauses, 'literals') and hasattr(clauses, 'offsets'):
+            self._literals = np.asarray(clauses.literals, dtype=np.int32)
+            self._offsets = np.asarray(clauses.offsets, dtype=np.int64)
+    
+    def _compile(self):
+        """Construit (une seule fois) la forme compacte literals/offsets"""
+        if self._literals is None:
+            self._literals = np.fromiter(
+                (lit for clause in self.clauses for lit in clause), dtype=np.int32)
+            self._offsets = np.zeros(len(self.clauses) + 1, dtype=np.int64)
+            np.cumsum([len(clause) for clause in self.clauses], out=self._offsets[1:])
+        return self._literals, self._offsets
+    
+    def evaluate_literal(self, literal, assignment):
+        """
+        Évalue un littéral avec une affectation donnée
+        
+        Args:
+            literal: entier (positif ou négatif)
+            assignment: dictionnaire {variable: True/False}
+        
+        Returns:
+            True/False selon l'évaluation du littéral
+        """
+        var = abs(literal)
+        
+        if var not in assignment:
+            raise ValueError(f"Variable x{var} non affectée dans l'assignment")
+        
+        value = assignment[var]
+        
+        # Si littéral positif, retourne la valeur
+        # Si littéral négatif, retourne NOT valeur
+        return value if literal > 0 else not value
+    
+    def evaluate_clause(self, clause, assignment):
+        """
+        Évalue une clause (disjonction de littéraux)
+        
+        Args:
+            clause: liste de 3 littéraux
+            assignment: dictionnaire {variable: True/False}
+        
+        Returns:
+            True si au moins un littéral est vrai, False sinon
+        """
+        for literal in clause:
+            if self.evaluate_literal(literal, assignment):
+                return True  # Au moins un littéral vrai → clause satisfaite
+        
+        return False  # Tous les littéraux sont faux
+    
+    def verify(self, assignment):
+        """
+        Vérifie si l'affectation satisfait toutes les clauses
+        
+        Args:
+            assignment: dictionnaire {variable: True/False}, ou vecteur
+                        booléen (bytearray / tableau NumPy) indexé par variable
+        
+        Returns:
+            tuple: (is_valid, details)
+                is_valid: True si toutes les clauses sont satisfaites
+                details: dictionnaire avec les détails de vérification
+        """
+        if self._literals is not None or not isinstance(assignment, dict):
+            return self._verify_compact(assignment)
+        
+        unsatisfied_clauses = []
+        satisfied_clauses = []
+        
+        for i, clause in enumerate(self.clauses):
+            try:
+                if self.evaluate_clause(clause, assignment):
+                    satisfied_clauses.append(i)
+                else:
+                    unsatisfied_clauses.append(i)
+            except ValueError as e:
+                return False, {
+                    'error': str(e),
+                    'clause_index': i,
+                    'clause': clause
+                }
+        
+        is_valid = len(unsatisfied_clauses) == 0
+        
+        details = {
+            'total_clauses': len(self.clauses),
+            'satisfied_clauses': len(satisfied_clauses),
+            'unsatisfied_clauses': unsatisfied_clauses,
+            'success_rate': len(satisfied_clauses) / len(self.clauses) * 100
+        }
+        
+        return is_valid, details
+    
+    def _verify_compact(self, assignment):
+        """
+        Vérification vectorisée sur la forme compacte (mêmes résultats que verify)
+        """
+        literals, offsets = self._compile()
+        variables = np.abs(literals)
+        num_variables = int(variables.max()) if variables.size else 0
+        
+        # Vecteur des valeurs et masque des variables affectées
+        if isinstance(assignment, dict):
+            values = np.zeros(num_variables + 1, dtype=bool)
+            assigned = np.zeros(num_variables + 1, dtype=bool)
+            for var, value in assignment.items():
+                if 0 < var <= num_variables:
+                    values[var] = value
+                    assigned[var] = True
+        else:
+            if isinstance(assignment, (bytes, bytearray)):
+                assignment = np.frombuffer(assignment, dtype=np.uint8)
+            given = np.asarray(assignment, dtype=bool)
+            values = np.zeros(max(num_variables + 1, len(given)), dtype=bool)
+            values[:len(given)] = given
+            assigned = np.arange(len(values)) < len(given)
+        
+        # Une clause est satisfaite si au moins un de ses littéraux est vrai
+        truth = values[variables] != (literals < 0)
+        
+        # Variable non affectée: erreur si elle est atteinte avant un littéral
+        # vrai de sa clause (même ordre d'évaluation que evaluate_clause)
+        missing = np.flatnonzero(~assigned[variables])
+        if missing.size:
+            for i in np.unique(np.searchsorted(offsets, missing, side='right') - 1).tolist():
+                for pos in range(offsets[i], offsets[i + 1]):
+                    if not assigned[variables[pos]]:
+                        return False, {
+                            'error': f"Variable x{int(variables[pos])} non affectée dans l'assignment",
+                            'clause_index': i,
+                            'clause': literals[offsets[i]:offsets[i + 1]].tolist()
+                        }
+                    if truth[pos]:
+                        break
+        
+        total = len(offsets) - 1
+        lengths = np.diff(offsets)
+        satisfied = np.zeros(total, dtype=bool)
+        non_empty = lengths > 0
+        if truth.size:
+            counts = np.add.reduceat(truth.astype(np.int32), offsets[:-1][non_empty])
+            satisfied[non_empty] = counts > 0
+        
+        unsatisfied_clauses = np.flatnonzero(~satisfied).tolist()
+        num_satisfied = total - len(unsatisfied_clauses)
+        
+        details = {
+            'total_clauses': total,
+            'satisfied_clauses': num_satisfied,
+            'unsatisfied_clauses': unsatisfied_clauses,
+            'success_rate': num_satisfied / total * 100 if total else 100.0
+        }
+        
+        return len(unsatisfied_clauses) == 0, details
+    
+    def verify_batch(self, assignments, chunk_size=None):
+        """
+        Vérifie un lot d'affectations en une seule passe vectorisée
+        
+        Args:
+            assignments: tableau booléen (B, n); la colonne j contient la
+                         valeur de la variable x(j+1) pour chaque candidat
+            chunk_size: nombre de candidats traités à la fois (défaut: calculé
+                        pour que le tableau intermédiaire (candidats × littéraux)
+                        reste sous VERIFY_BATCH_MAX_BYTES)
+        
+        Returns:
+            tuple: (satisfied, unsatisfied_counts)
+                satisfied: tableau booléen (B,), True si le candidat satisfait
+                           toutes les clauses
+                unsatisfied_counts: tableau (B,) du nombre de clauses insatisfaites
+        """
+        assignments = np.asarray(assignments, dtype=bool)
+        if assignments.ndim != 2:
+            raise ValueError(f"Tableau (B, n) attendu, reçu de dimension {assignments.ndim}")
+        
+        literals, offsets = self._compile()
+        columns = np.abs(literals).astype(np.intp) - 1
+        if columns.size and columns.max() >= assignments.shape[1]:
+            raise ValueError(f"Variable x{columns.max() + 1} absente des affectations "
+                             f"({assignments.shape[1]} colonnes)")
+        negated = literals < 0
+        
+        num_candidates = assignments.shape[0]
+        num_clauses = len(offsets) - 1
+        lengths = np.diff(offsets)
+        non_empty = lengths > 0
+        num_empty = num_clauses - int(non_empty.sum())  # Clauses vides: toujours fausses
+        
+        # Clauses de même taille (cas 3-SAT): simple reshape au lieu de reduceat
+        width = int(lengths[0]) if num_clauses and num_empty == 0 and (lengths == lengths[0]).all() else None
+        
+        if chunk_size is None:
+            chunk_size = max(1, VERIFY_BATCH_MAX_BYTES // max(len(literals), 1))
+        
+        unsatisfied_counts = np.empty(num_candidates, dtype=np.int64)
+        for start in range(0, num_candidates, chunk_size):
+            chunk = assignments[start:start + chunk_size]
+            # Valeur de chaque littéral pour chaque candidat (indexation avancée)
+            truth = chunk[:, columns] != negated
+            if width is not None:
+                satisfied_clauses = truth.reshape(len(chunk), num_clauses, width).any(axis=2)
+            elif truth.shape[1]:
+                satisfied_clauses = np.logical_or.reduceat(truth, offsets[:-1][non_empty], axis=1)
+            else:
+                satisfied_clauses = np.zeros((len(chunk), 0), dtype=bool)
+            unsatisfied_counts[start:start + len(chunk)] = (
+                num_clauses - satisfied_clauses.sum(axis=1))
+        
+        return unsatisfied_counts == 0, unsatisfied_counts
+    
+    def verify_unsat(self, proof):
+        """
+        Vérifie une réponse INSATISFIABLE à l'aide de sa preuve DRAT
+        (vérification arrière avec core trimming, voir drat_3SAT)
+        
+        Args:
+            proof: fichier de preuve DRAT (binaire ou texte)
+        
+        Returns:
+            tuple: (is_valid, details)
+                is_valid: True si la preuve réfute la formule
+                details: statistiques de la vérification (lemmes vérifiés,
+                         taille du noyau insatisfiable, temps, erreur)
+        """
+        from drat_3SAT import check_drat_proof
+        
+        clauses = self.clauses
+        if self._literals is not None and not isinstance(clauses, list):
+            literals, offsets = self._compile()
+            clauses = [literals[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
+        return check_drat_proof(clauses, proof)
+    
+    def verify_verbose(self, assignment):
+        """
+        Vérifie avec affichage détaillé de chaque clause
+        
+        Args:
+            assignment: dictionnaire {variable: True/False}
+        
+        Returns:
+            bool: True si toutes les clauses sont satisfaites
+        """
+        print("=== Vérification détaillée ===\n")
+        
+        all_satisfied = True
+        
+        for i, clause in enumerate(self.clauses, 1):
+            print(f"Clause {i}: {clause}")
+            
+            literals_eval = []
+            clause_satisfied = False
+            
+            for literal in clause:
+                var = abs(literal)
+                is_negated = literal < 0
+                var_value = assignment.get(var)
+                
+                if var_value is None:
+                    print(f"  ERREUR: Variable x{var} non affectée!")
+                    all_satisfied = False
+                    break
+                
+                literal_value = (not var_value) if is_negated else var_value
+                literals_eval.append(literal_value)
+                
+                neg_str = "¬" if is_negated else ""
+                val_str = "V" if literal_value else "F"
+                print(f"  {neg_str}x{var} = {val_str}", end="")
+                
+                if literal_value:
+                    clause_satisfied = True
+                    print(" ✓")
+                    break
+                else:
+                    print()
+            
+            if clause_satisfied:
+                print(f"  → Clause SATISFAITE ✓\n")
+            else:
+                print(f"  → Clause INSATISFAITE ✗\n")
+                all_satisfied = False
+        
+        return all_satisfied
+
+
+def read_assignment_from_file(filename):
+    """
+    Lit une affectation depuis un fichier
+    
+    Format:
+    x1 = True
+    x2 = False
+    x3 = True
+    
+    ou format court:
+    1 0 1  (1=True, 0=False)
+    """
+    assignment = {}
+    
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+    
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        
+        # Format: x1 = True
+        if '=' in line:
+            parts = line.split('=')
+            var_str = parts[0].strip().replace('x', '')
+            value_str = parts[1].strip().lower()
+            
+            var = int(var_str)
+            value = value_str in ['true', 'vrai', '1', 'yes', 'oui']
+            
+            assignment[var] = value
+        
+        # Format court: 1 0 1
+        else:
+            values = line.split()
+            for i, val in enumerate(values, 1):
+                assignment[i] = (val == '1')
+    
+    return assignment
+
+
+def verify_from_files(clauses_file, assignment_file):
+    """Vérifie une solution à partir de fichiers"""
+    from solver_3sat import read_3sat_from_file
+    
+    clauses, num_variables = read_3sat_from_file(clauses_file)
+    assignment = read_assignment_from_file(assignment_file)
+    
+    verifier = SAT3Verifier(clauses)
+    is_valid, details = verifier.verify(assignment)
+    
+    return is_valid, details
+
+
+if __name__ == "__main__":
+    print("=== Exemple 3-SAT Verifier ===\n")
+    
+    # Exemple de l'énoncé
+    clauses = [
+        [1, -2, 3],   # (x₁ ∨ ¬x₂ ∨ x₃)
+        [-1, 2, -3],  # (¬x₁ ∨ x₂ ∨ ¬x₃)
+        [1, 2, 3]     # (x₁ ∨ x₂ ∨ x₃)
+    ]
+    
+    # Affectation de l'énoncé: x1=faux, x2=faux, x3=vrai
+    assignment_correct = {1: False, 2: False, 3: True}
+    
+    print("Formule:")
+    for i, clause in enumerate(clauses, 1):
+        print(f"  C{i}: {clause}")
+    
+    print(f"\nAffectation à vérifier:")
+    for var in sorted(assignment_correct.keys()):
+        value = "vrai" if assignment_correct[var] else "faux"
+        print(f"  x{var} = {value}")
+    
+    print()
+    
+    verifier = SAT3Verifier(clauses)
+    
+    # Vérification simple
+    is_valid, details = verifier.verify(assignment_correct)
+    
+    print("\nRésultat de vérification:")
+    if is_valid:
+        print("✓ L'affectation est VALIDE")
+    else:
+        print("✗ L'affectation est INVALIDE")
+    
+    print(f"\nDétails:")
+    print(f"  Clauses satisfaites: {details['satisfied_clauses']}/{details['total_clauses']}")
+    print(f"  Taux de succès: {details['success_rate']:.1f}%")
+    
+    if details['unsatisfied_clauses']:
+        print(f"  Clauses insatisfaites: {details['unsatisfied_clauses']}")
+    
+    # Vérification verbose
+    print("\n" + "="*50)
+    verifier.verify_verbose(assignment_correct)
+    
+    # Test avec une mauvaise affectation
+    print("\n" + "="*50)
+    print("=== Test avec une affectation incorrecte ===\n")
+    
+    assignment_wrong = {1: True, 2: True, 3: False}
+    
+    print("Affectation incorrecte:")
+    for var in sorted(assignment_wrong.keys()):
+        value = "vrai" if assignment_wrong[var] else "faux"
+        print(f"  x{var} = {value}")
+    
+    print()
+    
+    is_valid, details = verifier.verify(assignment_wrong)
+    
+    print("Résultat:")
+    if is_valid:
+        print("✓ L'affectation est VALIDE")
+    else:
+        print("✗ L'affectation est INVALIDE")
+        print(f"  Clauses insatisfaites: {details['unsatisfied_clauses']}")
+    
+    # Vérification par lot: les 2^3 affectations possibles d'un coup
+    print("\n" + "="*50)
+    print("=== Vérification par lot (verify_batch) ===\n")
+    
+    candidates = ((np.arange(8)[:, None] >> np.arange(3)) & 1).astype(bool)
+    satisfied, unsatisfied_counts = verifier.verify_batch(candidates)
+    for row, ok, count in zip(candidates, satisfied, unsatisfied_counts):
+        values = ", ".join(f"x{i + 1}={'V' if v else 'F'}" for i, v in enumerate(row))
+        print(f"  {values}: {'✓' if ok else '✗'} ({count} clause(s) insatisfaite(s))")
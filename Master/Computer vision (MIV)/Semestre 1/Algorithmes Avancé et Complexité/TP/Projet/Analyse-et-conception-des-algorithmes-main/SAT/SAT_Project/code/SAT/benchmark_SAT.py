@@ -25,12 +25,14 @@ from memory_profiler import memory_usage
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from solve_SAT import solve_SAT_bruteforce, solve_SAT_backtracking
+    from solve_SAT import solve_SAT_bruteforce, solve_SAT_backtracking, SearchBudget
+    from portfolio_SAT import solve_SAT_portfolio
+    from result_cache_SAT import ResultCache, formula_hash, config_key
 except ImportError:
     print("Erreur: solve_SAT.py non trouve. Execute depuis le dossier code/SAT/")
     sys.exit(1)
 
-def generate_random_SAT_instance(n_vars, n_clauses, literals_per_clause=3):
+def generate_random_SAT_instance(n_vars, n_clauses, literals_per_clause=3, rng=random):
     """
     Genère une instance SAT aleatoire.
     
@@ -38,6 +40,7 @@ def generate_random_SAT_instance(n_vars, n_clauses, literals_per_clause=3):
         n_vars: nombre de variables
         n_clauses: nombre de clauses
         literals_per_clause: nombre de litteraux par clause
+        rng: generateur aleatoire (random.Random(graine) pour des instances reproductibles)
     
         
     Returns:
@@ -48,16 +51,65 @@ def generate_random_SAT_instance(n_vars, n_clauses, literals_per_clause=3):
     
     for _ in range(n_clauses):
         # Choisir k variables distinctes
-        chosen_vars = random.sample(range(1, n_vars + 1), min(literals_per_clause, n_vars))
+        chosen_vars = rng.sample(range(1, n_vars + 1), min(literals_per_clause, n_vars))
         clause = []
         for var in chosen_vars:
-            neg = random.choice([True, False])  # Avec ou sans negation
+            neg = rng.choice([True, False])  # Avec ou sans negation
             clause.append((var, neg))
         clauses.append(clause)
     
     return variables, clauses
 
-def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
+# Temps maximal d'une resolution (secondes): au-dela, le resultat est UNKNOWN.
+# Un algorithme dont toutes les repetitions d'une taille epuisent le budget
+# n'est plus lance pour les tailles suivantes (au lieu de limites fixes en
+# nombre de variables)
+TIME_BUDGET = 2.0
+# Le portfolio contient le bruteforce bitsliced (jusqu'a 30 variables)
+PORTFOLIO_MAX_VARS = 30
+# Graine des instances du benchmark: memes formules d'une execution a l'autre,
+# servies par le cache des resultats (voir result_cache_SAT.py)
+BENCHMARK_SEED = 0
+
+def _run_with_budget(solver, variables, clauses, time_budget, cache=None, **options):
+    """
+    Resout avec un budget de temps.
+
+    Avec cache (ResultCache), une formule deja resolue par la meme
+    configuration n'est pas recalculee: le temps et la memoire mesures lors
+    du calcul sont restitues (UNKNOWN s'ils depassent le budget courant).
+
+    Returns:
+        (temps, memoire) en secondes et MB, ou (None, None) si le budget est epuise
+    """
+    if cache is not None:
+        formula = formula_hash(variables, clauses)
+        config = config_key(solver, options)
+        entry = cache.get(formula, config)
+        if entry is not None:
+            if entry['time'] > time_budget:
+                return None, None
+            return entry['time'], entry['memory']
+
+    budget = SearchBudget(max_time=time_budget)
+    start = time.time()
+    solution = solver(variables, clauses, budget=budget, **options)
+    elapsed = time.time() - start
+    if budget.status == "UNKNOWN":
+        return None, None
+
+    # La mesure memoire relance la resolution (meme budget)
+    memory = memory_usage(
+        (solver, (variables, clauses), dict(options, budget=SearchBudget(max_time=time_budget))),
+        interval=0.01,
+        max_usage=True
+    )
+    if cache is not None:
+        cache.put(formula, config, budget.status, solution, elapsed, memory)
+    return elapsed, memory
+
+def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9, bf_engine="python", portfolio=False,
+                  time_budget=TIME_BUDGET, seed=None, cache=None):
     """
     Execute le benchmark pour differentes tailles.
     
@@ -65,6 +117,16 @@ def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
         max_vars: nombre maximum de variables à tester
         clauses_per_var: nombre de clauses par variable
         repetitions: nombre de repetitions pour chaque taille
+        bf_engine: moteur du bruteforce ("python" ou "bitsliced", qui permet
+                   d'aller jusqu'à ~30 variables)
+        portfolio: ajouter le portfolio (configurations en parallele, voir
+                   portfolio_SAT.py) comme troisieme concurrent; la configuration
+                   gagnante de chaque execution est enregistree
+        time_budget: temps maximal d'une resolution (secondes); les resolutions
+                     qui l'epuisent sont comptees dans 'unknown' sans temps
+        seed: graine des instances (None: instances differentes a chaque appel)
+        cache: ResultCache; les formules deja resolues (meme graine, meme
+               configuration) ne sont pas recalculees (hors portfolio)
     
     Returns:
         dict: resultats du benchmark
@@ -80,9 +142,17 @@ def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
 
     """
     results = {
-        'bruteforce': {'times': [], 'memory': [], 'vars': [], 'clauses': []},
-        'backtracking': {'times': [], 'memory': [], 'vars': [], 'clauses': []}
+        'bruteforce': {'times': [], 'memory': [], 'vars': [], 'clauses': [], 'unknown': [],
+                       'engine': bf_engine},
+        'backtracking': {'times': [], 'memory': [], 'vars': [], 'clauses': [], 'unknown': []},
+        'time_budget': time_budget,
+        'seed': seed
     }
+    rng = random.Random(seed) if seed is not None else random
+    # Algorithmes abandonnes: toutes les repetitions d'une taille ont epuise le budget
+    retired = set()
+    if portfolio:
+        results['portfolio'] = {'times': [], 'vars': [], 'clauses': [], 'winners': []}
 
     
     print("=" * 60)
@@ -98,51 +168,57 @@ def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
         bt_times = []
         bf_memory = []
         bt_memory = []
+        pf_times = []
+        pf_winners = {}
+        unknown = {'bruteforce': 0, 'backtracking': 0}
 
         
         for rep in range(repetitions):
             # Generer une instance aleatoire
-            variables, clauses = generate_random_SAT_instance(n_vars, n_clauses)
+            variables, clauses = generate_random_SAT_instance(n_vars, n_clauses, rng=rng)
            # print("Clauses generer :n", clauses)
             
             # Test bruteforce
-            if n_vars <= 10:  # Limiter bruteforce à 10 variables max
-                
-                start = time.time()
-                solve_SAT_bruteforce(variables, clauses)
-                bf_time = time.time() - start
-
-
-
-                bf_mem = memory_usage(
-                    (solve_SAT_bruteforce, (variables, clauses)),
-                    interval=0.01,
-                    max_usage=True
-                )
-                
-
-                bf_times.append(bf_time)
-                bf_memory.append(bf_mem)
-
+            if 'bruteforce' not in retired:
+                bf_time, bf_mem = _run_with_budget(solve_SAT_bruteforce, variables, clauses,
+                                                   time_budget, cache, engine=bf_engine)
+                if bf_time is None:
+                    unknown['bruteforce'] += 1
             else:
-                bf_times.append(None)
-                bf_memory.append(None)
+                bf_time = None
+                bf_mem = None
+
+            bf_times.append(bf_time)
+            bf_memory.append(bf_mem)
             
             # Test backtracking
-            start = time.time()
-            solve_SAT_bruteforce(variables, clauses)
-            bt_time = time.time() - start
-            bt_mem = memory_usage(
-                (solve_SAT_backtracking, (variables, clauses)),
-                interval=0.01,
-                max_usage=True
-            )
+            if 'backtracking' not in retired:
+                bt_time, bt_mem = _run_with_budget(solve_SAT_backtracking, variables, clauses,
+                                                   time_budget, cache)
+                if bt_time is None:
+                    unknown['backtracking'] += 1
+            else:
+                bt_time = None
+                bt_mem = None
             
 
             bt_times.append(bt_time)
             bt_memory.append(bt_mem)
 
-            print(f"  Repetition {rep+1}: BF={bf_time:.4f}s, BT={bt_time:.4f}s")
+            # Test portfolio (la memoire des processus fils n'est pas mesuree)
+            pf_time = None
+            if portfolio and n_vars <= PORTFOLIO_MAX_VARS:
+                _, report = solve_SAT_portfolio(variables, clauses, timeout=time_budget)
+                if report['status'] != "TIMEOUT":
+                    pf_time = report['time']
+                    pf_times.append(pf_time)
+                    pf_winners[report['winner']] = pf_winners.get(report['winner'], 0) + 1
+
+            if portfolio:
+                print(f"  Repetition {rep+1}: BF={_format_time(bf_time)}, BT={_format_time(bt_time)}, "
+                      f"PF={_format_time(pf_time)}")
+            else:
+                print(f"  Repetition {rep+1}: BF={_format_time(bf_time)}, BT={_format_time(bt_time)}")
         
         # Moyenne des temps
         valid_bf_times = [t for t in bf_times if t is not None]
@@ -151,12 +227,14 @@ def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
         else:
             avg_bf = None
         
-        avg_bt = sum(bt_times) / len(bt_times)
+        valid_bt_times = [t for t in bt_times if t is not None]
+        avg_bt = sum(valid_bt_times) / len(valid_bt_times) if valid_bt_times else None
 
         valid_bf_mem = [m for m in bf_memory if m is not None]
+        valid_bt_mem = [m for m in bt_memory if m is not None]
 
         avg_bf_mem = sum(valid_bf_mem) / len(valid_bf_mem) if valid_bf_mem else None
-        avg_bt_mem = sum(bt_memory) / len(bt_memory)
+        avg_bt_mem = sum(valid_bt_mem) / len(valid_bt_mem) if valid_bt_mem else None
 
         
         # Stocker les resultats
@@ -171,15 +249,41 @@ def run_benchmark(max_vars=10, clauses_per_var=2, repetitions=9):
         results['bruteforce']['memory'].append(avg_bf_mem)
         results['backtracking']['memory'].append(avg_bt_mem)
 
+        for algo, count in unknown.items():
+            results[algo]['unknown'].append(count)
+            if count == repetitions:
+                retired.add(algo)
+
+        if portfolio:
+            avg_pf = sum(pf_times) / len(pf_times) if pf_times else None
+            results['portfolio']['vars'].append(n_vars)
+            results['portfolio']['clauses'].append(n_clauses)
+            results['portfolio']['times'].append(avg_pf)
+            results['portfolio']['winners'].append(pf_winners)
+
         
         
         print(
-            f"  Moyennes: BF={avg_bf:.4f}s, {avg_bf_mem:.2f}MB | "
-            f"BT={avg_bt:.4f}s, {avg_bt_mem:.2f}MB"
+            f"  Moyennes: BF={_format_time(avg_bf)}, {_format_memory(avg_bf_mem)} | "
+            f"BT={_format_time(avg_bt)}, {_format_memory(avg_bt_mem)}"
         )
+        if portfolio:
+            print(f"  Portfolio: {_format_time(results['portfolio']['times'][-1])}, gagnants: {pf_winners}")
+        for algo, count in unknown.items():
+            if count:
+                print(f"  {algo}: {count}/{repetitions} resolution(s) UNKNOWN (budget de {time_budget}s epuise)"
+                      + (", abandonne pour les tailles suivantes" if algo in retired else ""))
 
     return results
 
+def _format_time(value):
+    """Formate un temps en secondes (N/A si la mesure n'a pas ete faite)."""
+    return f"{value:.4f}s" if value is not None else "N/A"
+
+def _format_memory(value):
+    """Formate une memoire en MB (N/A si la mesure n'a pas ete faite)."""
+    return f"{value:.2f}MB" if value is not None else "N/A"
+
 def save_results(results, filename="benchmark_results.json"):
     """Sauvegarde les resultats dans un fichier JSON."""
     # Creer le dossier de resultats s'il n'existe pas
@@ -192,8 +296,12 @@ def save_results(results, filename="benchmark_results.json"):
     serializable_results = {
         'timestamp': datetime.now().isoformat(),
         'bruteforce': results['bruteforce'],
-        'backtracking': results['backtracking']
+        'backtracking': results['backtracking'],
+        'time_budget': results.get('time_budget'),
+        'seed': results.get('seed')
     }
+    if 'portfolio' in results:
+        serializable_results['portfolio'] = results['portfolio']
     
     with open(filepath, 'w') as f:
         json.dump(serializable_results, f, indent=2)
@@ -245,6 +353,10 @@ def plot_performance_comparison(results):
              results['backtracking']['times'], 
              'bs-', linewidth=2, markersize=8, label='Backtracking')
     
+    if 'portfolio' in results:
+        plt.plot(results['portfolio']['vars'], results['portfolio']['times'],
+                 'g^-', linewidth=2, markersize=8, label='Portfolio')
+    
     plt.xlabel('Nombre de variables', fontsize=12)
     plt.ylabel('Temps d\'execution (secondes)', fontsize=12)
     plt.title('Temps d\'execution vs Nombre de variables', fontsize=14, fontweight='bold')
@@ -295,7 +407,7 @@ def plot_growth_rate(results):
     
     # Experimentale (normalisee)
     max_time = max([t for t in results['backtracking']['times'] if t is not None])
-    normalized_bt = [t / max_time for t in results['backtracking']['times']]
+    normalized_bt = [t / max_time if t is not None else None for t in results['backtracking']['times']]
     
     plt.plot(vars_list, theoretical_bf, 'r--', linewidth=2, label='Theorique: O(2ⁿ) (Bruteforce)')
     plt.plot(vars_list, theoretical_bt, 'b--', linewidth=2, label='Theorique: O(1.8ⁿ) (Backtracking)')
@@ -377,14 +489,13 @@ def generate_summary_table(results):
         mem_bf = results['bruteforce']['memory'][i]
         mem_bt = results['backtracking']['memory'][i]
         
-        if time_bf and time_bf > 0:
+        if time_bf and time_bf > 0 and time_bt is not None:
             speedup = time_bf / time_bt if time_bt > 0 else float('inf')
             speedup_str = f"{speedup:.2f}x"
         else:
             speedup_str = "N/A"
-            time_bf = 0
         
-        time_bf_str = f"{time_bf:.4f}" if time_bf != 0 else "N/A"
+        time_bf_str = f"{time_bf:.4f}" if time_bf else "N/A"
         time_bt_str = f"{time_bt:.4f}" if time_bt else "N/A"
         mem_bf_str = f"{mem_bf:.2f}" if mem_bf else "N/A"
         mem_bt_str = f"{mem_bt:.2f}" if mem_bt else "N/A"
@@ -393,6 +504,32 @@ def generate_summary_table(results):
               f"{mem_bf_str:<15} {mem_bt_str:<15} {speedup_str:<12}")
     
     print("=" * 90)
+    
+    if 'portfolio' in results:
+        generate_portfolio_table(results)
+
+def generate_portfolio_table(results):
+    """Tableau du portfolio: temps, acceleration par rapport au backtracking et gagnants."""
+    print("\nPORTFOLIO (premiere reponse parmi plusieurs configurations)")
+    print("-" * 90)
+    print(f"{'Variables':<12} {'Portfolio (s)':<15} {'Acceleration':<14} {'Gagnants'}")
+    print("-" * 90)
+    
+    for i, n_vars in enumerate(results['portfolio']['vars']):
+        time_pf = results['portfolio']['times'][i]
+        time_bt = results['backtracking']['times'][i]
+        winners = results['portfolio']['winners'][i]
+        
+        if time_pf and time_bt is not None:
+            speedup_str = f"{time_bt / time_pf:.2f}x"
+        else:
+            speedup_str = "N/A"
+        winners_str = ", ".join(f"{name} ({count})" for name, count in
+                                sorted(winners.items(), key=lambda item: -item[1]))
+        
+        print(f"{n_vars:<12} {_format_time(time_pf):<15} {speedup_str:<14} {winners_str}")
+    
+    print("=" * 90)
 
 
 def main():
@@ -414,11 +551,11 @@ def main():
         results = load_results()
         if not results:
             print("Generation de nouveaux resultats...")
-            results = run_benchmark(max_vars=10, repetitions=3)
+            results = run_benchmark(max_vars=10, repetitions=3, seed=BENCHMARK_SEED, cache=ResultCache())
             save_results(results)
     else:
-        # Executer le benchmark
-        results = run_benchmark(max_vars=10, repetitions=3)
+        # Executer le benchmark (resolutions deja faites relues dans le cache des resultats)
+        results = run_benchmark(max_vars=10, repetitions=3, seed=BENCHMARK_SEED, cache=ResultCache())
         save_results(results)
     
     # Generer les graphiques
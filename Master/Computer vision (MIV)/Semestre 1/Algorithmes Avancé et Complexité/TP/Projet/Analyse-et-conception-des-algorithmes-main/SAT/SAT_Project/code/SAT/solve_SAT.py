@@ -2,55 +2,314 @@
 import itertools
 import sys
 import os
+import time
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import numpy as np
+
 # Importer la fonction d'évaluation depuis verify_SAT
-from verify_SAT import evaluate_clause, parse_dimacs, verify_SAT_solution
+from verify_SAT import evaluate_clause, parse_dimacs, verify_SAT_solution, CompactCNF
+
+# Motifs des 6 bits de poids faible d'un mot de 64 affectations:
+# le bit j du motif b vaut le bit b du numéro j (0 <= j < 64)
+LANE_PATTERNS = [
+    np.uint64(sum(1 << j for j in range(64) if (j >> b) & 1)) for b in range(6)
+]
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+BLOCK_BITS = 14  # 2^14 mots de 64 affectations évalués par bloc
+BUDGET_CHECK_INTERVAL = 1024  # Noeuds entre deux contrôles du budget
+
+def _memory_mb():
+    """Mémoire résidente du processus en Mo (pic hors Linux, None si inconnue)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 1024
+
+class SearchBudget:
+    """
+    Budget d'une recherche (temps, noeuds, mémoire) et annulation coopérative.
+
+    Les solveurs le contrôlent tous les check_interval noeuds (affectations
+    pour le bruteforce, noeuds de l'arbre pour le backtracking); cancel()
+    depuis un autre thread arrête la recherche au prochain contrôle.
+    Un solveur dont le budget est épuisé retourne None comme pour une formule
+    insatisfiable: status distingue les deux cas ("SAT", "UNSAT", "UNKNOWN").
+
+    Statistiques du dernier appel: status, reason ("time", "nodes", "memory",
+    "cancelled" ou None), nodes, elapsed.
+    """
+
+    def __init__(self, max_time=None, max_nodes=None, max_memory_mb=None,
+                 check_interval=BUDGET_CHECK_INTERVAL):
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.max_memory_mb = max_memory_mb
+        self.check_interval = check_interval
+        self.cancelled = False
+        self.start()
+
+    def start(self):
+        """Début d'une recherche (l'annulation n'est pas remise à zéro)."""
+        self.start_time = time.perf_counter()
+        self.status = None
+        self.reason = None
+        self.nodes = 0
+        self.elapsed = 0.0
+
+    def cancel(self):
+        self.cancelled = True
 
-def solve_SAT_bruteforce(variables, clauses):
+    def exhausted(self, nodes):
+        """Contrôle complet; True si la recherche doit s'arrêter (status "UNKNOWN")."""
+        self.nodes = nodes
+        self.elapsed = time.perf_counter() - self.start_time
+        if self.cancelled:
+            self.reason = "cancelled"
+        elif self.max_nodes is not None and nodes >= self.max_nodes:
+            self.reason = "nodes"
+        elif self.max_time is not None and self.elapsed >= self.max_time:
+            self.reason = "time"
+        elif self.max_memory_mb is not None and (_memory_mb() or 0) >= self.max_memory_mb:
+            self.reason = "memory"
+        else:
+            return False
+        self.status = "UNKNOWN"
+        return True
+
+    def finish(self, solution, nodes):
+        """Fin normale de la recherche: retourne solution et enregistre le statut."""
+        self.nodes = nodes
+        self.elapsed = time.perf_counter() - self.start_time
+        self.status = "SAT" if solution is not None else "UNSAT"
+        return solution
+
+    def next_check(self, nodes):
+        """Prochain contrôle: check_interval noeuds plus loin, sans dépasser max_nodes."""
+        step = self.check_interval
+        if self.max_nodes is not None:
+            step = min(step, self.max_nodes - nodes)
+        return nodes + max(step, 1)
+
+def solve_SAT_bruteforce(variables, clauses, engine="python", budget=None):
     """
     Résout SAT par recherche exhaustive (bruteforce).
     Retourne la première affectation trouvée ou None.
+
+    engine:
+        "python"    → une affectation (dictionnaire) à la fois
+        "bitsliced" → 64 affectations par mot uint64, évaluées par blocs
+                      avec des AND/OR vectorisés NumPy (même résultat)
+    budget: SearchBudget optionnel (noeuds = affectations essayées, contrôlé
+            à chaque bloc pour "bitsliced"); épuisé, retourne None et
+            budget.status vaut "UNKNOWN"
     """
+    if engine == "bitsliced":
+        return _solve_SAT_bruteforce_bitsliced(variables, clauses, budget)
+    if engine != "python":
+        raise ValueError(f"Moteur inconnu: {engine} (attendu: 'python' ou 'bitsliced')")
+
     n = len(variables)
+    if budget is not None:
+        budget.start()
+        next_check = budget.next_check(0)
+    tried = 0
     for bits in itertools.product([False, True], repeat=n):
+        if budget is not None and tried >= next_check:
+            if budget.exhausted(tried):
+                return None
+            next_check = budget.next_check(tried)
+        tried += 1
         assignment = {variables[i]: bits[i] for i in range(n)}
         # Vérification simplifiée avec verify_SAT_solution
         if verify_SAT_solution(variables, clauses, assignment):
-            return assignment
-    return None
+            return assignment if budget is None else budget.finish(assignment, tried)
+    return None if budget is None else budget.finish(None, tried)
 
-def solve_SAT_backtracking(variables, clauses, assignment=None, index=0):
+def _solve_SAT_bruteforce_bitsliced(variables, clauses, budget=None):
+    """
+    Recherche exhaustive bit-parallèle.
+
+    L'affectation numéro k (ordre de itertools.product) donne à variables[i]
+    le bit (n-1-i) de k. Les 6 bits de poids faible de k indexent le bit
+    dans un mot uint64, les bits suivants indexent le mot: chaque clause est
+    évaluée pour 64 affectations par opération.
+    """
+    n = len(variables)
+    if budget is not None:
+        budget.start()
+    position = {name: n - 1 - i for i, name in enumerate(variables)}
+    if isinstance(clauses, CompactCNF):
+        clauses = [[(abs(lit), lit < 0) for lit in clause] for clause in clauses]
+
+    # Compiler les clauses en listes (bit, négation)
+    compiled = []
+    for clause in clauses:
+        literals = []
+        always_true = False
+        for var, neg in clause:
+            name = var if isinstance(var, str) else f'x{var}'
+            bit = position.get(name)
+            if bit is None:
+                # Variable absente: vaut False (comme verify_SAT_solution)
+                if neg:
+                    always_true = True
+                    break
+                continue
+            literals.append((bit, neg))
+        if always_true:
+            continue
+        if not literals:
+            # Clause toujours fausse
+            return None if budget is None else budget.finish(None, 0)
+        compiled.append(literals)
+
+    block_bits = min(BLOCK_BITS, max(n - 6, 0))
+    block_words = 1 << block_bits
+    total_words = max(1 << max(n - 6, 0), 1)
+
+    # Motifs des bits qui varient à l'intérieur d'un bloc (identiques pour tous les blocs)
+    word_index = np.arange(block_words, dtype=np.uint64)
+    patterns = {b: LANE_PATTERNS[b] for b in range(min(n, 6))}
+    for b in range(6, 6 + block_bits):
+        patterns[b] = np.where((word_index >> np.uint64(b - 6)) & np.uint64(1), ALL_ONES, np.uint64(0))
+
+    # Pour n < 6, seuls les 2^n premiers bits du mot sont des affectations valides
+    valid = ALL_ONES if n >= 6 else np.uint64((1 << (1 << n)) - 1)
+
+    clause_acc = np.empty(block_words, dtype=np.uint64)
+    for start in range(0, total_words, block_words):
+        if budget is not None and budget.exhausted(start * 64):
+            return None
+        satisfied = np.full(block_words, valid, dtype=np.uint64)
+
+        for literals in compiled:
+            clause_acc.fill(0)
+            constant_true = False
+            for bit, neg in literals:
+                if bit >= 6 + block_bits:
+                    # Bit constant sur tout le bloc
+                    value = ((start >> (bit - 6)) & 1) == 1
+                    if value != neg:
+                        constant_true = True
+                        break
+                    continue
+                pattern = patterns[bit]
+                np.bitwise_or(clause_acc, ~pattern if neg else pattern, out=clause_acc)
+            if constant_true:
+                continue
+            np.bitwise_and(satisfied, clause_acc, out=satisfied)
+
+        found = np.flatnonzero(satisfied)
+        if found.size:
+            word = int(satisfied[found[0]])
+            lane = (word & -word).bit_length() - 1
+            k = (start + int(found[0])) * 64 + lane
+            solution = {variables[i]: bool((k >> (n - 1 - i)) & 1) for i in range(n)}
+            return solution if budget is None else budget.finish(solution, k + 1)
+
+    return None if budget is None else budget.finish(None, total_words * 64)
+
+def solve_SAT_backtracking(variables, clauses, assignment=None, index=0, budget=None):
     """
     Résout SAT par backtracking.
+    Avec une CompactCNF, l'affectation courante est un vecteur booléen
+    indexé par numéro de variable (voir _solve_SAT_backtracking_compact).
+
+    budget: SearchBudget optionnel (noeuds de l'arbre de recherche); épuisé,
+            retourne None et budget.status vaut "UNKNOWN"
     """
+    if isinstance(clauses, CompactCNF):
+        return _solve_SAT_backtracking_compact(variables, clauses, budget)
     if assignment is None:
         assignment = {}
+    if budget is not None:
+        budget.start()
+        next_check = budget.next_check(0)
+    nodes = 0
+    
+    # Version itérative: la pile values contient les valeurs des variables
+    # variables[index], variables[index+1], ... dans l'ordre d'affectation
+    # (même ordre d'exploration que la récursion, sans limite de profondeur)
+    values = []
     
-    if index == len(variables):
+    while True:
+        if budget is not None and nodes >= next_check:
+            if budget.exhausted(nodes):
+                # Retirer les affectations faites par la recherche
+                for i in range(len(values)):
+                    del assignment[variables[index + i]]
+                return None
+            next_check = budget.next_check(nodes)
+        nodes += 1
+        depth = index + len(values)
+        if depth < len(variables):
+            # Essayer var = True
+            values.append(True)
+            assignment[variables[depth]] = True
+            continue
+        
         # Vérifier si l'affectation satisfait toutes les clauses
         if verify_SAT_solution(variables, clauses, assignment):
-            return assignment.copy()
-        else:
-            return None
-    
-    var = variables[index]
-    
-    # Essayer var = True
-    assignment[var] = True
-    res = solve_SAT_backtracking(variables, clauses, assignment, index + 1)
-    if res is not None:
-        return res
-    
-    # Essayer var = False
-    assignment[var] = False
-    res = solve_SAT_backtracking(variables, clauses, assignment, index + 1)
-    if res is not None:
-        return res
-    
-    # Backtrack
-    del assignment[var]
-    return None
+            return assignment.copy() if budget is None else budget.finish(assignment.copy(), nodes)
+        
+        # Backtrack: retirer les variables déjà essayées à False
+        while values and not values[-1]:
+            values.pop()
+            del assignment[variables[index + len(values)]]
+        if not values:
+            return None if budget is None else budget.finish(None, nodes)
+        
+        # Essayer var = False
+        values[-1] = False
+        assignment[variables[index + len(values) - 1]] = False
+
+def _solve_SAT_backtracking_compact(variables, formula, budget=None):
+    """
+    Backtracking sur la forme compacte: même ordre d'exploration que
+    solve_SAT_backtracking, sans dictionnaire ni nom de variable dans la
+    boucle interne. Retourne l'affectation {nom: valeur} ou None.
+    """
+    if budget is not None:
+        budget.start()
+        next_check = budget.next_check(0)
+    nodes = 0
+    indices = [int(name[1:]) if isinstance(name, str) else name for name in variables]
+    size = max([formula.num_vars] + indices) + 1
+    values = np.zeros(size, dtype=bool)
+
+    # Pile explicite: depth variables affectées, tried[i] indique si la
+    # variable i a déjà été essayée à True puis remise à False
+    tried = []
+    while True:
+        if budget is not None and nodes >= next_check:
+            if budget.exhausted(nodes):
+                return None
+            next_check = budget.next_check(nodes)
+        nodes += 1
+        depth = len(tried)
+        if depth < len(indices):
+            # Essayer var = True
+            values[indices[depth]] = True
+            tried.append(False)
+            continue
+        if np.all(formula.evaluate(values)):
+            solution = {name: bool(values[var]) for name, var in zip(variables, indices)}
+            return solution if budget is None else budget.finish(solution, nodes)
+        # Backtrack puis essayer var = False
+        while tried and tried[-1]:
+            tried.pop()
+        if not tried:
+            return None if budget is None else budget.finish(None, nodes)
+        tried[-1] = True
+        values[indices[len(tried) - 1]] = False
 
 def main():
     print("=== Solveur SAT ===")
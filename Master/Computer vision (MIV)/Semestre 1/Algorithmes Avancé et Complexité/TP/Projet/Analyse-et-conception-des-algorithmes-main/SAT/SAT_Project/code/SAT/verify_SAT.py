@@ -1,14 +1,126 @@
 # verify_SAT.py
 import sys
 import os
+import bz2
+import gzip
+import lzma
+import numpy as np
+
+# Fichiers CNF compressés reconnus d'après leur extension
+COMPRESSION_CODECS = {'.gz': gzip, '.xz': lzma, '.bz2': bz2}
+
+def open_cnf(filepath, mode='r'):
+    """
+    Ouvre un fichier CNF en mode texte, compressé ou non selon l'extension
+    (.cnf, .cnf.gz, .cnf.xz, .cnf.bz2). La décompression se fait au fil de la lecture.
+    """
+    for ext, codec in COMPRESSION_CODECS.items():
+        if filepath.endswith(ext):
+            return codec.open(filepath, mode + 't', encoding='utf-8')
+    return open(filepath, mode, encoding='utf-8')
+
+class CompactCNF:
+    """
+    Représentation compacte d'une formule CNF indexée par entiers.
+
+    literals: tableau int32 plat des littéraux signés (v pour xv, -v pour ¬xv)
+    offsets:  tableau int64 de taille m+1, la clause i occupe
+              literals[offsets[i]:offsets[i+1]]
+    num_vars: nombre de variables, numérotées de 1 à num_vars
+
+    Une affectation associée est un vecteur booléen (bytearray ou tableau
+    NumPy) de taille num_vars+1 indexé par le numéro de variable (case 0 inutilisée).
+    """
+
+    def __init__(self, literals, offsets, num_vars):
+        self.literals = np.asarray(literals, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.num_vars = int(num_vars)
+        # Pré-calculs pour l'évaluation vectorisée
+        self.var_index = np.abs(self.literals)
+        self.negated = self.literals < 0
+        self.has_empty_clause = bool(np.any(np.diff(self.offsets) == 0))
+
+    @classmethod
+    def from_clauses(cls, clauses, num_vars=None):
+        """
+        Construit la forme compacte depuis une liste de clauses.
+        Accepte les littéraux (var, neg) avec var entier ou 'x1',
+        ainsi que les entiers signés.
+        """
+        literals = []
+        offsets = [0]
+        for clause in clauses:
+            for item in clause:
+                if isinstance(item, tuple):
+                    var, neg = item
+                    var = int(var[1:]) if isinstance(var, str) else var
+                    literals.append(-var if neg else var)
+                else:
+                    literals.append(item)
+            offsets.append(len(literals))
+        if num_vars is None:
+            num_vars = max((abs(lit) for lit in literals), default=0)
+        return cls(literals, offsets, num_vars)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def clause(self, i):
+        """Retourne la clause i sous forme de liste d'entiers signés."""
+        return self.literals[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.clause(i)
+
+    def variables(self):
+        """Noms des variables ['x1', ..., 'xn'] (format de parse_dimacs)."""
+        return [f'x{v}' for v in range(1, self.num_vars + 1)]
+
+    def evaluate(self, values):
+        """
+        Retourne le tableau booléen des clauses satisfaites par le vecteur
+        d'affectation values (indexé par numéro de variable).
+        """
+        truth = values[self.var_index] != self.negated
+        if len(self) == 0:
+            return np.zeros(0, dtype=bool)
+        if self.has_empty_clause:
+            # Une clause vide est toujours fausse; reduceat sur les autres seulement
+            satisfied = np.zeros(len(self), dtype=bool)
+            non_empty = np.diff(self.offsets) > 0
+            if truth.size:
+                satisfied[non_empty] = np.logical_or.reduceat(truth, self.offsets[:-1][non_empty])
+            return satisfied
+        return np.logical_or.reduceat(truth, self.offsets[:-1])
+
+def to_assignment_array(assignment, num_vars):
+    """
+    Convertit une affectation en vecteur booléen indexé par numéro de variable.
+    Accepte un dictionnaire ({'x1': True} ou {1: True}), un bytearray ou un
+    tableau NumPy. Les variables absentes d'un dictionnaire valent False.
+    """
+    if isinstance(assignment, dict):
+        values = np.zeros(num_vars + 1, dtype=bool)
+        for var, val in assignment.items():
+            var = int(var[1:]) if isinstance(var, str) else var
+            if var <= num_vars:
+                values[var] = bool(val)
+        return values
+    if isinstance(assignment, (bytes, bytearray)):
+        return np.frombuffer(assignment, dtype=np.uint8).astype(bool)
+    return np.asarray(assignment, dtype=bool)
 
 def evaluate_clause(clause, assignment):
     """
     Évalue une clause avec l'affectation donnée.
     Retourne True si au moins un littéral est vrai.
+    Les littéraux sont des couples (var, neg) où var est un numéro (1)
+    ou un nom de variable ('x1').
     """
     for var, neg in clause:
-        var_name = f'x{var}'
+        var_name = var if isinstance(var, str) else f'x{var}'
         val = assignment.get(var_name, False)
         if neg:
             val = not val
@@ -20,20 +132,35 @@ def verify_SAT_solution(variables, clauses, assignment):
     """
     Vérifie si une affectation donnée satisfait toutes les clauses.
     Retourne True si oui, False sinon.
+
+    clauses peut être une liste de clauses ou une CompactCNF; assignment un
+    dictionnaire ou un vecteur booléen indexé par numéro de variable.
     """
+    if isinstance(clauses, CompactCNF) or not isinstance(assignment, dict):
+        if not isinstance(clauses, CompactCNF):
+            clauses = CompactCNF.from_clauses(clauses)
+        values = to_assignment_array(assignment, clauses.num_vars)
+        if len(values) <= clauses.num_vars:
+            values = np.concatenate([values, np.zeros(clauses.num_vars + 1 - len(values), dtype=bool)])
+        return bool(np.all(clauses.evaluate(values)))
+
     for clause in clauses:
         if not evaluate_clause(clause, assignment):
             return False
     return True
 
-def parse_dimacs(filepath):
+def parse_dimacs(filepath, compact=False):
     """
-    Lit un fichier DIMACS et retourne (variables, clauses).
+    Lit un fichier DIMACS (éventuellement .gz, .xz ou .bz2) et retourne (variables, clauses).
+    Avec compact=True, clauses est une CompactCNF (aucun tuple ni nom de
+    variable n'est créé par littéral).
     """
     clauses = []
     variables = set()
+    flat_literals = []
+    offsets = [0]
     try:
-        with open(filepath, 'r') as f:
+        with open_cnf(filepath, 'r') as f:
             for line in f:
                 line = line.strip()
                 if not line or line.startswith('c'):
@@ -41,7 +168,10 @@ def parse_dimacs(filepath):
                 if line.startswith('p'):
                     continue  # On ignore la ligne d'en-tête pour simplifier
                 literals = list(map(int, line.split()))
-                if literals:
+                if literals and compact:
+                    flat_literals.extend(lit for lit in literals if lit != 0)
+                    offsets.append(len(flat_literals))
+                elif literals:
                     clause = []
                     for lit in literals:
                         if lit == 0:
@@ -55,6 +185,12 @@ def parse_dimacs(filepath):
         print(f"Erreur: Fichier {filepath} non trouvé.")
         return None, None
     
+    if compact:
+        formula = CompactCNF(flat_literals, offsets,
+                             max((abs(lit) for lit in flat_literals), default=0))
+        used = np.unique(formula.var_index)
+        return [f'x{v}' for v in used.tolist()], formula
+    
     variables = sorted(variables, key=lambda x: int(x[1:]))
     return variables, clauses
 
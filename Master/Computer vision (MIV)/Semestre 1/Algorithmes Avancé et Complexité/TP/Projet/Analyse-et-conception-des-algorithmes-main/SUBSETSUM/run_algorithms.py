@@ -4,7 +4,7 @@ import csv
 from memory_profiler import memory_usage
 
 from solve_SUBSETSUM_dp import solve_SUBSETSUM_DP
-from solve_SUBSETSUM import solve_subsetsum_backtracking_recursif
+from solve_SUBSETSUM import solve_subsetsum_backtracking_iteratif, BudgetRecherche
 from verify_SUBSETSUM import verifier_solution
 
 # Dossier du projet (racine SUBSETSUM)
@@ -16,6 +16,9 @@ DATA = os.path.join(BASE_DIR, "data")
 # Dossier où on sauvegarde les résultats
 RESULTS = os.path.join(BASE_DIR, "tests")
 
+# Temps maximal du backtracking par dataset (secondes) : au-delà, résultat "inconnu"
+BUDGET_BACKTRACKING = 10.0
+
 # Créer les dossiers s’ils n’existent pas
 os.makedirs(DATA, exist_ok=True)
 os.makedirs(RESULTS, exist_ok=True)
@@ -47,14 +50,20 @@ def readDataset(id):
     return S, T, V, dtype
 
 
-def runAlgo(algo, S, T):
-    """Exécute un algorithme SUBSETSUM et mesure temps et mémoire"""
+def runAlgo(algo, S, T, timeBudget=None):
+    """
+    Exécute un algorithme SUBSETSUM et mesure temps et mémoire
+    timeBudget : budget de temps (secondes) du backtracking ; épuisé, found vaut None
+    """
 
+    kwargs = {} if timeBudget is None else {"budget": BudgetRecherche(temps_max=timeBudget)}
     start = time.time()
-    mem = memory_usage((algo, (S, T)), max_iterations=1)
+    mem = memory_usage((algo, (S, T), kwargs), max_iterations=1)
     end = time.time()
 
-    found, solution = algo(S, T)
+    if timeBudget is not None:
+        kwargs = {"budget": BudgetRecherche(temps_max=timeBudget)}
+    found, solution = algo(S, T, **kwargs)
 
     timeMs = (end - start) * 1000
     memKb = max(mem) * 1024
@@ -115,8 +124,8 @@ def main():
             dpWriter.writerow([id, dtype, n, T, f"{t:.3f}", f"{m:.1f}", ok])
 
             # --- Backtracking ---
-            ok, sol, t, m = runAlgo(solve_subsetsum_backtracking_recursif, S, T)
-            bfWriter.writerow([id, dtype, n, T, f"{t:.3f}", f"{m:.1f}", ok])
+            ok, sol, t, m = runAlgo(solve_subsetsum_backtracking_iteratif, S, T, BUDGET_BACKTRACKING)
+            bfWriter.writerow([id, dtype, n, T, f"{t:.3f}", f"{m:.1f}", "inconnu" if ok is None else ok])
 
             # --- Verify ---
             if V is not None:
@@ -7,6 +7,88 @@
 from typing import List, Tuple, Optional     
 import os                                  
 import random                               
+import sys
+import time
+
+# nombre de noeuds entre deux controles du budget
+INTERVALLE_CONTROLE = 1024
+
+
+'''
+  mémoire résidente du processus en Mo (pic de mémoire hors Linux, None si inconnue)
+'''
+def memoire_mb() -> Optional[float]:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None         # Windows
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pic / 2**20 if sys.platform == 'darwin' else pic / 1024
+
+
+'''
+  budget d'une recherche : temps max (secondes), nombre max de noeuds, mémoire max (Mo)
+  et annulation coopérative (annuler() depuis un autre thread)
+  le backtracking le controle tous les INTERVALLE_CONTROLE noeuds ; quand il est épuisé
+  la recherche retourne (None, None) : statut = "UNKNOWN" et raison, noeuds, temps
+  donnent les statistiques partielles
+'''
+class BudgetRecherche:
+
+    def __init__(self, temps_max: Optional[float] = None, noeuds_max: Optional[int] = None,
+                 memoire_max_mb: Optional[float] = None, intervalle: int = INTERVALLE_CONTROLE):
+        self.temps_max = temps_max
+        self.noeuds_max = noeuds_max
+        self.memoire_max_mb = memoire_max_mb
+        self.intervalle = intervalle
+        self.annule = False
+        self.demarrer()
+
+    # début d'une recherche (l'annulation n'est pas remise à zéro)
+    def demarrer(self):
+        self.debut = time.perf_counter()
+        self.statut = None
+        self.raison = None
+        self.noeuds = 0
+        self.temps = 0.0
+
+    def annuler(self):
+        self.annule = True
+
+    # prochain controle : intervalle noeuds plus loin, sans dépasser noeuds_max
+    def prochain_controle(self, noeuds: int) -> int:
+        pas = self.intervalle
+        if self.noeuds_max is not None:
+            pas = min(pas, self.noeuds_max - noeuds)
+        return noeuds + max(pas, 1)
+
+    # controle complet : True si la recherche doit s'arreter
+    def epuise(self, noeuds: int) -> bool:
+        self.noeuds = noeuds
+        self.temps = time.perf_counter() - self.debut
+        if self.annule:
+            self.raison = "annulation"
+        elif self.noeuds_max is not None and noeuds >= self.noeuds_max:
+            self.raison = "noeuds"
+        elif self.temps_max is not None and self.temps >= self.temps_max:
+            self.raison = "temps"
+        elif self.memoire_max_mb is not None and (memoire_mb() or 0) >= self.memoire_max_mb:
+            self.raison = "memoire"
+        else:
+            return False
+        self.statut = "UNKNOWN"
+        return True
+
+    # fin normale de la recherche
+    def terminer(self, trouve: bool, noeuds: int):
+        self.noeuds = noeuds
+        self.temps = time.perf_counter() - self.debut
+        self.statut = "FOUND" if trouve else "NOT_FOUND"
 
 
 '''
@@ -55,6 +137,60 @@ def solve_subsetsum_backtracking_recursif(S: List[int], T: int,
       # Retourner le résultat final
     return resultat, solution                
 
+
+'''
+  version itérative du backtracking : meme ordre d'exploration et meme résultat que
+  solve_subsetsum_backtracking_recursif, mais avec une pile explicite de décisions
+  (True = élément inclus, False = élément exclu) au lieu d'un appel récursif par élément,
+  donc sans RecursionError quand S contient des milliers d'éléments
+  avec un budget (BudgetRecherche) la recherche s'arrete quand il est épuisé et
+  retourne (None, None) : budget.statut = "UNKNOWN"
+'''
+def solve_subsetsum_backtracking_iteratif(S: List[int], T: int,
+                                          budget: Optional[BudgetRecherche] = None
+                                          ) -> Tuple[Optional[bool], Optional[List[int]]]:
+
+    decisions = []              # pile des décisions, len(decisions) = index courant
+    sous_ensemble_actuel = []
+    somme_actuelle = 0
+    noeuds = 0
+    if budget is not None:
+        budget.demarrer()
+        prochain = budget.prochain_controle(0)
+
+    while True:
+        # Controle du budget (tous les budget.intervalle noeuds)
+        if budget is not None and noeuds >= prochain:
+            if budget.epuise(noeuds):
+                return None, None
+            prochain = budget.prochain_controle(noeuds)
+        noeuds += 1
+
+        # Vérification de la solution
+        if somme_actuelle == T:
+            if budget is not None:
+                budget.terminer(True, noeuds)
+            return True, sous_ensemble_actuel.copy()
+
+        index = len(decisions)
+        if index < len(S):
+            # inclure l'élément actuel
+            decisions.append(True)
+            sous_ensemble_actuel.append(S[index])
+            somme_actuelle += S[index]
+            continue
+
+        # on a traité tous les éléments : remonter jusqu'au dernier élément inclus
+        while decisions and not decisions[-1]:
+            decisions.pop()
+        if not decisions:
+            if budget is not None:
+                budget.terminer(False, noeuds)
+            return False, None
+
+        decisions[-1] = False                               #  BACKTRACK
+        somme_actuelle -= sous_ensemble_actuel.pop()
+
 """
     Lit un dataset  depuis Data
     ici en utilise seulement les ficheir S ET T 